@@ -5,11 +5,14 @@ import warnings
 from libcpp.map cimport map
 from libcpp.vector cimport vector
 from libcpp.string cimport string
-from libc.stdlib cimport malloc
+from libc.stdlib cimport malloc, free
+from libcpp cimport bool as cpp_bool
 
-from cyvpr.Place cimport PlaceState, cPlaceState
+from cyvpr.Place cimport (PlaceState, cPlaceState, PlaceStats, cPlaceStats,
+                          copy_place_stats)
 from cyvpr.Route cimport (RouteState, cRouteState, RouteResult, cRouteResult,
-                          s_router_opts, cRouterOpts)
+                          s_router_opts, cRouterOpts, copy_route_state)
+from cyvpr.State cimport cArrayView
 
 
 ctypedef unsigned int uint
@@ -18,6 +21,7 @@ ctypedef unsigned int uint
 cdef extern from "Main.h":
     int __main__(int argc, char *argv[]) except +
     vector[vector[uint]] extract_block_positions() except +
+    void extract_block_positions(uint *block_positions) except +
 
 
 cdef extern from "stats.h":
@@ -26,12 +30,126 @@ cdef extern from "stats.h":
                                   vector[uint] segments) except +
 
 
+cdef extern from "place.h":
+    ctypedef cpp_bool (*t_place_stats_callback)(const PlaceStats &stats,
+                                                void *data)
+
+    void set_place_stats_callback(t_place_stats_callback callback,
+                                  void *data)
+
+
+cdef extern from "route_export.h":
+    ctypedef cpp_bool (*t_route_iteration_callback)(const RouteState &state,
+                                                    void *data)
+
+    void set_route_iteration_callback(t_route_iteration_callback callback,
+                                      void *data)
+
+
+cdef extern from "vpr_types.h":
+    ctypedef struct t_rr_node:
+        short capacity
+        short occ
+
+    ctypedef struct t_rr_indexed_data:
+        float saved_base_cost
+
+
+cdef extern from "rr_graph_csr.h":
+    ctypedef struct t_rr_node_box:
+        short xlow
+        short xhigh
+        short ylow
+        short yhigh
+
+    ctypedef struct t_rr_graph_csr:
+        int num_nodes
+        int num_edges
+        int *edge_start
+        int *edge_sink
+        short *edge_switch
+        t_rr_node_box *box
+        short *type
+        short *cost_index
+        float *R
+        float *C
+        int *num_refs
+
+    void hold_rr_graph_csr(t_rr_graph_csr *csr)
+    void release_rr_graph_csr(t_rr_graph_csr *csr)
+
+
+cdef extern from "FileMd5Cache.hpp":
+    cdef cppclass FileMd5Cache:
+        string cache_path_
+        size_t hits_
+        size_t misses_
+
+        string hexdigest(string path) except +
+        size_t size()
+        void clear()
+        void set_cache_path(string cache_path) except +
+
+
+cdef extern from "ParseCache.hpp":
+    cdef cppclass ParseCache:
+        bint enabled_
+        size_t hits_
+        size_t misses_
+
+        size_t size()
+        void clear()
+
+
+cdef extern from "RrGraphCache.hpp":
+    cdef cppclass RrGraphCache:
+        string cache_dir_
+        size_t hits_
+        size_t misses_
+        size_t stores_
+
+        void clear_counters()
+
+
+cdef extern from "NetlistCache.hpp":
+    cdef cppclass NetlistCache:
+        bint enabled_
+        bint write_enabled_
+        size_t hits_
+        size_t misses_
+        size_t stores_
+
+        @staticmethod
+        string path(string net_file)
+        void clear_counters()
+
+
+cdef extern from "PlaceDelayCache.hpp":
+    cdef cppclass PlaceDelayCache:
+        string cache_dir_
+        bint enabled_
+        size_t hits_
+        size_t misses_
+
+        size_t size()
+        void clear()
+
+
 cdef extern from "globals.h":
     vector[string] g_args
     RouteResult g_route_result
     PlaceState g_place_state
     vector[RouteState] g_route_states
     int pins_per_clb
+    int num_rr_nodes
+    t_rr_node *rr_node
+    int num_rr_indexed_data
+    t_rr_indexed_data *rr_indexed_data
+    FileMd5Cache g_file_md5_cache
+    ParseCache g_parse_cache
+    RrGraphCache g_rr_graph_cache
+    NetlistCache g_netlist_cache
+    PlaceDelayCache g_place_delay_cache
 
 
 cdef inline vpr(args):
@@ -59,7 +177,11 @@ cdef extern from "Main.h":
         Main()
         void init(int argc, char **argv) except +
         void do_place_and_route() except +
+        void do_place_and_route(const uint *block_positions) except +
         void do_read_place() except +
         bint route(int width_fac) except +
+        void begin_route_session() except +
+        void end_route_session() except +
+        void reset() except +
         size_t block_count()
         size_t net_count()
@@ -2,15 +2,240 @@
 from collections import OrderedDict
 import numpy as np
 import os.path
+import sys
+
+from path import path
+
+
+def md5_cache_info():
+    '''
+    Return the hit/miss counters, the number of entries and the on-disk path
+    _(or `None`)_ of the process-wide cache of input file MD5 hashes used by
+    `cMain.init` to fill `cMain.file_md5s`.
+    '''
+    cache_path = str(g_file_md5_cache.cache_path_)
+    return OrderedDict([('hits', g_file_md5_cache.hits_),
+                        ('misses', g_file_md5_cache.misses_),
+                        ('size', g_file_md5_cache.size()),
+                        ('path', cache_path if cache_path else None)])
+
+
+def set_md5_cache_path(cache_path):
+    '''
+    Store the input file MD5 cache on disk at `cache_path`, loading any
+    entries already stored there, e.g., by other processes.  Set `cache_path`
+    to `None` to only cache in memory.
+    '''
+    g_file_md5_cache.set_cache_path(str(cache_path) if cache_path else '')
+
+
+def clear_md5_cache():
+    '''
+    Clear the in-memory input file MD5 cache and reset its counters.
+    '''
+    g_file_md5_cache.clear()
+
+
+def parse_cache_info():
+    '''
+    Return the hit/miss counters and the number of entries of the
+    process-wide cache of parsed netlist and architecture files, which
+    `cMain.init` uses to avoid parsing the same input files again.
+    '''
+    return OrderedDict([('enabled', g_parse_cache.enabled_),
+                        ('hits', g_parse_cache.hits_),
+                        ('misses', g_parse_cache.misses_),
+                        ('size', g_parse_cache.size())])
+
+
+def set_parse_cache_enabled(enabled):
+    '''
+    Enable or disable the parse cache _(enabled by default)_.
+    '''
+    g_parse_cache.enabled_ = bool(enabled)
+
+
+def clear_parse_cache():
+    '''
+    Free all parsed netlist and architecture snapshots and reset the counters.
+    '''
+    g_parse_cache.clear()
+
+
+def rr_graph_cache_info():
+    '''
+    Return the hit/miss/store counters and the directory _(or `None`)_ of the
+    process-wide on-disk cache of routing resource graphs, which routing
+    attempts use to avoid rebuilding the graph for an architecture, grid size
+    and channel width that has already been built.
+    '''
+    cache_dir = str(g_rr_graph_cache.cache_dir_)
+    return OrderedDict([('hits', g_rr_graph_cache.hits_),
+                        ('misses', g_rr_graph_cache.misses_),
+                        ('stores', g_rr_graph_cache.stores_),
+                        ('dir', cache_dir if cache_dir else None)])
+
+
+def set_rr_graph_cache_dir(cache_dir):
+    '''
+    Store routing resource graphs in _(and load them from)_ the directory
+    `cache_dir`, which is created if it does not exist.  Set `cache_dir` to
+    `None` to disable the cache _(the default)_.
+
+    __NB__ Cached graphs are keyed by the MD5 hash of the architecture file,
+    so the directory may be shared by processes routing different netlists
+    and architectures.
+    '''
+    if cache_dir:
+        cache_dir = os.path.abspath(str(cache_dir))
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+    g_rr_graph_cache.cache_dir_ = cache_dir if cache_dir else ''
+    g_rr_graph_cache.clear_counters()
+
+
+def netlist_cache_info():
+    '''
+    Return the hit/miss/store counters of the process-wide on-disk cache of
+    compiled netlists _(`.netc` files, written next to each netlist file)_,
+    which `cMain.init` uses to load a netlist without parsing it.
+    '''
+    return OrderedDict([('enabled', g_netlist_cache.enabled_),
+                        ('write_enabled', g_netlist_cache.write_enabled_),
+                        ('hits', g_netlist_cache.hits_),
+                        ('misses', g_netlist_cache.misses_),
+                        ('stores', g_netlist_cache.stores_)])
+
+
+def set_netlist_cache_enabled(enabled):
+    '''
+    Enable or disable loading compiled netlists _(enabled by default)_.
+
+    A compiled netlist is only loaded if it was compiled from a netlist file
+    with the same MD5 hash as the netlist file being loaded.
+    '''
+    g_netlist_cache.enabled_ = bool(enabled)
+    g_netlist_cache.clear_counters()
+
+
+def set_netlist_cache_write_enabled(enabled):
+    '''
+    Enable or disable writing compiled netlists _(disabled by default)_.
+
+    __NB__ While writing is enabled, `cMain.init` writes a compiled netlist
+    next to each netlist file it parses, so only enable it for netlists in
+    writable directories _(see `cyvpr.bin.compile_netlists`)_.
+    '''
+    g_netlist_cache.write_enabled_ = bool(enabled)
+    g_netlist_cache.clear_counters()
+
+
+def compiled_netlist_path(net_path):
+    '''
+    Return the path of the compiled netlist for `net_path` _(i.e., with the
+    `.net` extension replaced by `.netc`)_.
+    '''
+    return path(NetlistCache.path(str(net_path)))
+
+
+def place_delay_cache_info():
+    '''
+    Return the hit/miss counters, the number of entries and the directory
+    _(or `None`)_ of the process-wide cache of the delay lookup matrices
+    computed before each timing-driven placement.
+    '''
+    cache_dir = str(g_place_delay_cache.cache_dir_)
+    return OrderedDict([('enabled', g_place_delay_cache.enabled_),
+                        ('hits', g_place_delay_cache.hits_),
+                        ('misses', g_place_delay_cache.misses_),
+                        ('size', g_place_delay_cache.size()),
+                        ('dir', cache_dir if cache_dir else None)])
+
+
+def set_place_delay_cache_enabled(enabled):
+    '''
+    Enable or disable the placement delay lookup cache _(enabled by
+    default)_.
+    '''
+    g_place_delay_cache.enabled_ = bool(enabled)
+
+
+def set_place_delay_cache_dir(cache_dir):
+    '''
+    Also store placement delay lookup matrices in _(and load them from)_ the
+    directory `cache_dir`, which is created if it does not exist, so they may
+    be reused by later processes.  Set `cache_dir` to `None` to only cache in
+    memory _(the default)_.
+    '''
+    if cache_dir:
+        cache_dir = os.path.abspath(str(cache_dir))
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+    g_place_delay_cache.cache_dir_ = cache_dir if cache_dir else ''
+
+
+def clear_place_delay_cache():
+    '''
+    Free all in-memory placement delay lookup matrices and reset the
+    counters.  Matrices stored on disk are kept.
+    '''
+    g_place_delay_cache.clear()
+
+
+cdef cpp_bool place_stats_callback(const PlaceStats &stats, void *data) with gil:
+    '''
+    Pass the statistics of one annealing temperature to the `stats_callback`
+    of the `cMain` instance `data`, returning `False` to stop the anneal if
+    the callback returns a false value other than `None` _(e.g.,
+    `numpy.False_`)_.
+
+    __NB__ Exceptions cannot propagate through VPR, so an exception raised by
+    the callback stops the anneal and is re-raised once placement returns.
+    '''
+    cdef cMain vpr_main = <cMain>data
+
+    try:
+        result = vpr_main._stats_callback(copy_place_stats(stats))
+        return result is None or bool(result)
+    except:
+        vpr_main._callback_error = sys.exc_info()
+        return False
+
+
+cdef cpp_bool route_iteration_callback(const RouteState &state,
+                                       void *data) with gil:
+    '''
+    Pass the route in progress, after one PathFinder iteration, to the
+    `iteration_callback` of the `cMain` instance `data`, returning `False` to
+    cancel the route if the callback returns a false value other than `None`
+    _(e.g., `numpy.False_`)_.
+
+    __NB__ As for `place_stats_callback`, an exception raised by the callback
+    cancels the route and is re-raised once routing returns.
+    '''
+    cdef cMain vpr_main = <cMain>data
+
+    try:
+        result = vpr_main._iteration_callback(copy_route_state(state))
+        return result is None or bool(result)
+    except:
+        vpr_main._callback_error = sys.exc_info()
+        return False
 
 
 cdef class cMain:
     cdef Main *thisptr
     cdef bint _initialized
+    cdef object _stats_callback
+    cdef object _iteration_callback
+    cdef object _callback_error
 
     def __cinit__(self):
         self.thisptr = new Main()
         self._initialized = False
+        self._stats_callback = None
+        self._iteration_callback = None
+        self._callback_error = None
 
     def read_placement(self, net_file, arch_file, place_file):
         args = [net_file, arch_file, place_file, 'routed.out',
@@ -30,18 +255,20 @@ cdef class cMain:
 
     def extract_block_positions(self):
         '''
-        Extract block-positions from VPR data structures and convert the
-        positions to a Numpy array, with dimensions indexed as follows:
+        Extract block-positions from VPR data structures into a `uint32`
+        Numpy array, with dimensions indexed as follows:
 
             block-index, x=0/y=1/slot-index=2
+
+        __NB__ The positions are written by VPR directly into the array
+        buffer.
         '''
-        block_positions = np.empty((self.block_count, 3), dtype='uint')
-        cdef int i
-        cdef int j
-        block_position_vectors = extract_block_positions()
-        for i in xrange(self.block_count):
-            for j in xrange(3):
-                block_positions[i, j] = block_position_vectors[i][j]
+        cdef uint[:, ::1] positions_view
+
+        block_positions = np.empty((self.block_count, 3), dtype=np.uint32)
+        if block_positions.size > 0:
+            positions_view = block_positions
+            extract_block_positions(&positions_view[0, 0])
         return block_positions
 
     def init(self, args):
@@ -56,22 +283,129 @@ cdef class cMain:
         cdef int i
         for i in xrange(args_.size()):
             argv[i] = <char *>args_[i].c_str()
-        self.thisptr.init(argc, argv)
+        try:
+            self.thisptr.init(argc, argv)
+        finally:
+            # The arguments are only read during `init`.
+            free(argv)
         self._initialized = True
 
     def place(self, net_path, arch_file, output_path,
-              place_algorithm='bounding_box', fast=True, seed=0):
+              place_algorithm='bounding_box', fast=True, seed=0,
+              stats_callback=None):
+        '''
+        Place the netlist, returning the resulting `(place_state,
+        block_positions)`.
+
+        If `stats_callback` is not `None`, it is called with the `cPlaceStats`
+        of each annealing temperature as soon as the temperature is done.  If
+        it returns a false value other than `None` _(e.g., `False` or
+        `numpy.False_`)_, the anneal stops, keeping the current placement.
+        '''
+        args = [net_path, arch_file, output_path, 'routed.out', '-place_only',
+                '-place_algorithm', place_algorithm, '-nodisp', '-seed',
+                str(seed)]
+
+        if fast:
+            args += ['-fast']
+
+        self.init(args)
+        self._place_and_route(NULL, stats_callback, None)
+        return self.most_recent_place_state(), self.extract_block_positions()
+
+    def refine(self, net_path, arch_file, block_positions,
+               output_path='placed.out', start_temperature=None, rlim=None,
+               place_algorithm='bounding_box', fast=True, seed=0,
+               stats_callback=None):
+        '''
+        Refine the placement given by `block_positions` _(e.g., as returned
+        by `place`, or loaded from a `placements` table)_, by annealing from
+        that placement, rather than from a random one, starting at
+        `start_temperature` with range limit `rlim`.
+
+        By default, only the low-temperature end of an anneal is run: the
+        temperature starts at 20 times the temperature at which the automatic
+        schedule stops, and the range limit at 3.  Like `place`, return the
+        resulting `(place_state, block_positions)`, and call `stats_callback`
+        _(if it is not `None`)_ with the statistics of each temperature.
+
+        __NB__ A high `start_temperature` will scramble the placement, since
+        almost every move is accepted.
+        '''
+        cdef uint[:, ::1] positions_view
+
         args = [net_path, arch_file, output_path, 'routed.out', '-place_only',
                 '-place_algorithm', place_algorithm, '-nodisp', '-seed',
                 str(seed)]
 
+        if start_temperature is not None:
+            args += ['-start_t', start_temperature]
+
+        if rlim is not None:
+            args += ['-start_rlim', rlim]
+
         if fast:
             args += ['-fast']
 
         self.init(args)
-        self.thisptr.do_place_and_route()
+        positions_view = self._block_positions_array(block_positions)
+        self._place_and_route(&positions_view[0, 0], stats_callback, None)
         return self.most_recent_place_state(), self.extract_block_positions()
 
+    cdef _place_and_route(self, const uint *block_positions, stats_callback,
+                          iteration_callback):
+        '''
+        Run the placement and/or routing set up by `init`, using the
+        placement given by `block_positions` unless it is `NULL`, and calling
+        `stats_callback` with the statistics of each annealing temperature
+        and `iteration_callback` with the route after each PathFinder
+        iteration _(unless they are `None`)_.
+        '''
+        self._set_callbacks(stats_callback, iteration_callback)
+        try:
+            if block_positions == NULL:
+                self.thisptr.do_place_and_route()
+            else:
+                self.thisptr.do_place_and_route(block_positions)
+        finally:
+            self._clear_callbacks()
+
+    cdef _set_callbacks(self, stats_callback, iteration_callback):
+        self._callback_error = None
+        if stats_callback is not None:
+            self._stats_callback = stats_callback
+            set_place_stats_callback(place_stats_callback, <void *>self)
+        if iteration_callback is not None:
+            self._iteration_callback = iteration_callback
+            set_route_iteration_callback(route_iteration_callback,
+                                         <void *>self)
+
+    cdef _clear_callbacks(self):
+        '''
+        Stop calling the callbacks set by `_set_callbacks`, re-raising any
+        exception raised by a callback.
+        '''
+        set_place_stats_callback(NULL, NULL)
+        set_route_iteration_callback(NULL, NULL)
+        self._stats_callback = None
+        self._iteration_callback = None
+        if self._callback_error is not None:
+            error, self._callback_error = self._callback_error, None
+            raise error[0], error[1], error[2]
+
+    def _block_positions_array(self, block_positions):
+        '''
+        Return `block_positions` as a contiguous `uint32` array, checking
+        that it has one `(x, y, slot-index)` row per block.
+        '''
+        block_positions = np.ascontiguousarray(block_positions,
+                                               dtype=np.uint32)
+        if block_positions.shape != (self.block_count, 3):
+            raise ValueError, ('Expected block positions with shape %s, got '
+                               '%s.' % ((self.block_count, 3),
+                                        block_positions.shape))
+        return block_positions
+
     property router_opts:
         def __get__(self):
             return cRouterOpts(<size_t>&self.thisptr.router_opts_)
@@ -96,7 +430,12 @@ cdef class cMain:
 
     def route(self, net_path, arch_file, placed_path, output_path,
               timing_driven=True, fast=False, route_chan_width=None,
-              max_router_iterations=None):
+              max_router_iterations=None, heap_type=None,
+              rr_graph_layout=None, route_threads=None,
+              incremental_reroute=None,
+              reroute_crit_change=None, route_abort=None,
+              abort_iterations=None, export_traceback=None,
+              route_file_format=None, iteration_callback=None):
         '''
         Router Options:
             [-max_router_iterations <int>] [-bb_factor <int>]
@@ -106,11 +445,90 @@ cdef class cMain:
             [-verify_binary_search] [-route_chan_width <int>]
             [-router_algorithm breadth_first | timing_driven]
             [-base_cost_type intrinsic_delay | delay_normalized | demand_only]
+            [-heap_type binary | 4ary] [-route_threads <int>]
+            [-rr_graph_layout structs | csr]
+            [-incremental_reroute on | off]
+            [-route_abort never | stalled | extrapolated]
+            [-abort_iterations <int>]
+            [-export_traceback on | off] [-route_file_format text | binary]
 
         Routing options valid only for timing-driven routing:
             [-astar_fac <float>] [-max_criticality <float>]
-            [-criticality_exp <float>]
+            [-criticality_exp <float>] [-reroute_crit_change <float>]
+
+        __NB__ `incremental_reroute` and `export_traceback` may be given as
+        booleans.  With `export_traceback`, the routing of each net is kept
+        in the `cRouteState` of each successful route _(see
+        `cRouteState.trace_nodes`)_.
+
+        If `iteration_callback` is not `None`, it is called with the
+        `cRouteState` of the route in progress after each PathFinder
+        iteration _(see `cRouteState.iterations`)_.  If it returns a false
+        value other than `None` _(e.g., `False` or `numpy.False_`)_, the route
+        is cancelled and fails, unless that iteration found a feasible
+        routing _(i.e., the route has already succeeded)_.  A cancelled route
+        also ends the search for the minimum channel width, keeping the best
+        routing found so far.
+        '''
+        args = self._route_args(net_path, arch_file, placed_path,
+                                output_path, timing_driven, fast,
+                                route_chan_width, max_router_iterations,
+                                heap_type, rr_graph_layout, route_threads,
+                                incremental_reroute, reroute_crit_change,
+                                route_abort, abort_iterations,
+                                export_traceback, route_file_format)
+        self.init(args)
+        self._place_and_route(NULL, None, iteration_callback)
+        return OrderedDict([
+            ('result', self.most_recent_route_result()),
+            ('states', self.most_recent_route_states()),
+        ])
+
+    def route_placement(self, net_path, arch_file, block_positions,
+                        output_path='routed.out', timing_driven=True,
+                        fast=False, route_chan_width=None,
+                        max_router_iterations=None, heap_type=None,
+                        rr_graph_layout=None, route_threads=None,
+                        incremental_reroute=None,
+                        reroute_crit_change=None, route_abort=None,
+                        abort_iterations=None, export_traceback=None,
+                        route_file_format=None, iteration_callback=None):
         '''
+        Same as `route`, but route the placement given by `block_positions`,
+        an array with one `(x, y, slot-index)` row per block _(as returned
+        by `extract_block_positions`)_, rather than a placement file.
+
+        The positions are loaded directly into the VPR block structures, so no
+        placement file is written or parsed.
+        '''
+        cdef uint[:, ::1] positions_view
+
+        # No placement file is read, so use a placeholder path that will
+        # never be opened.
+        args = self._route_args(net_path, arch_file, '<block_positions>',
+                                output_path, timing_driven, fast,
+                                route_chan_width, max_router_iterations,
+                                heap_type, rr_graph_layout, route_threads,
+                                incremental_reroute, reroute_crit_change,
+                                route_abort, abort_iterations,
+                                export_traceback, route_file_format)
+        self.init(args)
+        positions_view = self._block_positions_array(block_positions)
+        self._place_and_route(&positions_view[0, 0], None,
+                              iteration_callback)
+        return OrderedDict([
+            ('result', self.most_recent_route_result()),
+            ('states', self.most_recent_route_states()),
+        ])
+
+    def _route_args(self, net_path, arch_file, placed_path, output_path,
+                    timing_driven, fast, route_chan_width,
+                    max_router_iterations, heap_type=None,
+                    rr_graph_layout=None, route_threads=None,
+                    incremental_reroute=None,
+                    reroute_crit_change=None, route_abort=None,
+                    abort_iterations=None, export_traceback=None,
+                    route_file_format=None):
         args = [net_path, arch_file, placed_path,
                 output_path, '-route_only', '-nodisp', '-router_algorithm']
         if timing_driven:
@@ -124,15 +542,38 @@ cdef class cMain:
         if max_router_iterations is not None:
             args += ['-max_router_iterations', max_router_iterations]
 
+        if heap_type is not None:
+            args += ['-heap_type', heap_type]
+
+        if rr_graph_layout is not None:
+            args += ['-rr_graph_layout', rr_graph_layout]
+
+        if route_threads is not None:
+            args += ['-route_threads', route_threads]
+
+        if incremental_reroute is not None:
+            args += ['-incremental_reroute',
+                     'on' if incremental_reroute else 'off']
+
+        if reroute_crit_change is not None:
+            args += ['-reroute_crit_change', reroute_crit_change]
+
+        if route_abort is not None:
+            args += ['-route_abort', route_abort]
+
+        if abort_iterations is not None:
+            args += ['-abort_iterations', abort_iterations]
+
+        if export_traceback is not None:
+            args += ['-export_traceback',
+                     'on' if export_traceback else 'off']
+
+        if route_file_format is not None:
+            args += ['-route_file_format', route_file_format]
+
         if fast:
             args += ['-fast']
-
-        self.init(args)
-        self.thisptr.do_place_and_route()
-        return OrderedDict([
-            ('result', self.most_recent_route_result()),
-            ('states', self.most_recent_route_states()),
-        ])
+        return args
 
     property net_count:
         def __get__(self):
@@ -180,3 +621,229 @@ cdef class cMain:
             state.init(g_route_states[i])
             states.append(state)
         return states
+
+    def rr_graph(self):
+        '''
+        Return an `OrderedDict` of Numpy arrays viewing, without copying, the
+        routing-resource graph of the most recent route _(except for
+        `capacity`, `occ` and `base_cost`, which are copied)_:
+
+         - `type`: `SOURCE`, `SINK`, `IPIN`, `OPIN`, `CHANX` or `CHANY`
+           _(0-5)_ of each node.
+         - `xlow`, `xhigh`, `ylow`, `yhigh`: Extent of each node.
+         - `capacity`, `occ`: Capacity and occupancy of each node.
+         - `cost_index`: Index of each node into `base_cost`.
+         - `base_cost`: Base cost of each cost index, when the graph was
+           built.
+         - `R`, `C`: Resistance and capacitance of each node.
+         - `edge_start`: Index of the first edge of each node into
+           `edge_sink` and `edge_switch`, with a final entry for the total
+           number of edges.  The edges of node `i` are
+           `edge_start[i]:edge_start[i + 1]`.
+         - `edge_sink`, `edge_switch`: Node and switch type of each edge.
+
+        __NB__ The arrays keep the graph's memory alive after VPR frees it
+        _(e.g., on `reset` or when the next graph is built)_.  `occ` holds
+        the occupancies at the time of the call.
+        '''
+        return cRrGraph().arrays()
+
+    def reset(self):
+        '''
+        Free all of the state held by VPR: the netlist, architecture and
+        routing resource graph, any open routing session, and the results of
+        the most recent placement and routing.  For example, to keep a
+        long-lived worker process at a bounded size between jobs:
+
+            with cMain() as vpr_main:
+                vpr_main.place(net, arch, 'placed.out')
+                routed = vpr_main.route(net, arch, 'placed.out', 'routed.out')
+
+        __NB__ The process-wide caches _(see `parse_cache_info`,
+        `md5_cache_info`, etc.)_ are kept, since they only grow with the
+        number of distinct input files.  Use `clear_parse_cache`, etc., to
+        free them.
+        '''
+        self.thisptr.reset()
+        self._initialized = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.reset()
+
+
+cdef class cRrGraph:
+    '''
+    Hold the arrays of the current routing-resource graph _(see
+    `cMain.rr_graph`)_ for as long as any view of them is referenced.
+    '''
+    cdef t_rr_graph_csr csr
+    cdef object capacity
+    cdef object occ
+    cdef object base_cost
+
+    def __cinit__(self):
+        cdef int i
+        cdef short[::1] capacity
+        cdef short[::1] occ
+        cdef float[::1] base_cost
+
+        hold_rr_graph_csr(&self.csr)
+        if self.csr.num_refs == NULL:
+            return
+        # The capacity and occupancy of each node, and the base costs, are
+        # not part of the compact copy of the graph, so copy them from
+        # `rr_node` and `rr_indexed_data`, which are current while `rr_csr`
+        # is.
+        self.capacity = np.empty(num_rr_nodes, dtype=np.short)
+        self.occ = np.empty(num_rr_nodes, dtype=np.short)
+        self.base_cost = np.empty(num_rr_indexed_data, dtype=np.float32)
+        capacity = self.capacity
+        occ = self.occ
+        base_cost = self.base_cost
+        for i in xrange(num_rr_nodes):
+            capacity[i] = rr_node[i].capacity
+            occ[i] = rr_node[i].occ
+        for i in xrange(num_rr_indexed_data):
+            base_cost[i] = rr_indexed_data[i].saved_base_cost
+        for array in (self.capacity, self.occ, self.base_cost):
+            array.flags.writeable = False
+
+    def __dealloc__(self):
+        release_rr_graph_csr(&self.csr)
+
+    cdef view(self, void *data, format, Py_ssize_t itemsize,
+              Py_ssize_t size, Py_ssize_t stride):
+        cdef cArrayView view = cArrayView()
+        view.owner = self
+        view.data = <char *>data
+        view.format = format
+        view.itemsize = itemsize
+        view.shape[0] = size
+        view.strides[0] = stride
+        return np.asarray(view)
+
+    def arrays(self):
+        cdef int num_nodes = self.csr.num_nodes
+        cdef int num_edges = self.csr.num_edges
+        cdef Py_ssize_t box_size = sizeof(t_rr_node_box)
+        cdef t_rr_node_box *box = self.csr.box
+
+        if self.csr.num_refs == NULL:
+            raise RuntimeError, 'No routing-resource graph has been built.'
+        return OrderedDict([
+            ('type', self.view(self.csr.type, 'h', sizeof(short),
+                               num_nodes, sizeof(short))),
+            ('xlow', self.view(&box.xlow, 'h', sizeof(short), num_nodes,
+                               box_size)),
+            ('xhigh', self.view(&box.xhigh, 'h', sizeof(short), num_nodes,
+                                box_size)),
+            ('ylow', self.view(&box.ylow, 'h', sizeof(short), num_nodes,
+                               box_size)),
+            ('yhigh', self.view(&box.yhigh, 'h', sizeof(short), num_nodes,
+                                box_size)),
+            ('capacity', self.capacity),
+            ('occ', self.occ),
+            ('cost_index', self.view(self.csr.cost_index, 'h',
+                                     sizeof(short), num_nodes,
+                                     sizeof(short))),
+            ('base_cost', self.base_cost),
+            ('R', self.view(self.csr.R, 'f', sizeof(float), num_nodes,
+                            sizeof(float))),
+            ('C', self.view(self.csr.C, 'f', sizeof(float), num_nodes,
+                            sizeof(float))),
+            ('edge_start', self.view(self.csr.edge_start, 'i', sizeof(int),
+                                     num_nodes + 1, sizeof(int))),
+            ('edge_sink', self.view(self.csr.edge_sink, 'i', sizeof(int),
+                                    num_edges, sizeof(int))),
+            ('edge_switch', self.view(self.csr.edge_switch, 'h',
+                                      sizeof(short), num_edges,
+                                      sizeof(short)))])
+
+
+cdef class RoutingSession:
+    '''
+    Route a single placement at any number of channel widths, parsing the
+    netlist, architecture and placement only once.
+
+    The route structures and timing graph, which do not depend on the channel
+    width, are also kept resident between calls to `route`, so only the
+    routing-resource graph is rebuilt for each width.  For example:
+
+        with RoutingSession(net, arch, 'placed.out') as session:
+            for width in (10, 12, 14):
+                state = session.route(width)
+
+    __NB__ VPR keeps its netlist in global variables, so only one session (or
+    other `cMain` operation) may be active in a process at a time.
+    '''
+    cdef readonly cMain vpr_main
+    cdef bint _open
+
+    def __cinit__(self, net_path, arch_file, placed_path, timing_driven=True,
+                  fast=False, max_router_iterations=None,
+                  output_path='routed.out', heap_type=None,
+                  rr_graph_layout=None, route_threads=None,
+                  incremental_reroute=None,
+                  reroute_crit_change=None, route_abort=None,
+                  abort_iterations=None, export_traceback=None):
+        self.vpr_main = cMain()
+        self._open = False
+        args = self.vpr_main._route_args(net_path, arch_file, placed_path,
+                                         output_path, timing_driven, fast,
+                                         None, max_router_iterations,
+                                         heap_type, rr_graph_layout,
+                                         route_threads, incremental_reroute,
+                                         reroute_crit_change, route_abort,
+                                         abort_iterations, export_traceback)
+        self.vpr_main.init(args)
+        self.vpr_main.do_read_place()
+        self.vpr_main.thisptr.begin_route_session()
+        self._open = True
+
+    def route(self, int width_fac, iteration_callback=None):
+        '''
+        Try to route the placement with the specified channel width, returning
+        the corresponding `cRouteState`.
+
+        If `iteration_callback` is not `None`, it is called after each
+        PathFinder iteration, and may cancel the route _(see
+        `cMain.route`)_.
+        '''
+        cdef cRouteState state
+
+        if not self._open:
+            raise RuntimeError, 'Routing session has been closed.'
+        self.vpr_main._set_callbacks(None, iteration_callback)
+        try:
+            self.vpr_main.thisptr.route(width_fac)
+        finally:
+            self.vpr_main._clear_callbacks()
+        state = cRouteState()
+        state.init(g_route_states.back())
+        return state
+
+    def close(self):
+        if self._open:
+            self.vpr_main.thisptr.end_route_session()
+            self._open = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __dealloc__(self):
+        if self._open:
+            self.vpr_main.thisptr.end_route_session()
+
+    property result:
+        def __get__(self):
+            return self.vpr_main.most_recent_route_result()
+
+    property states:
+        def __get__(self):
+            return self.vpr_main.most_recent_route_states()
@@ -7,6 +7,12 @@ from cyvpr.State cimport cStateBase, StateBase
 ctypedef unsigned int uint
 
 
+cdef extern from "util.h":
+    ctypedef enum boolean:
+        FALSE
+        TRUE
+
+
 cdef extern from "vpr_types.h":
     enum e_place_algorithm:
         BOUNDING_BOX_PLACE
@@ -28,6 +34,8 @@ cdef extern from "vpr_types.h":
         int inner_loop_recompute_divider
         float td_place_exp_first
         float td_place_exp_last
+        float start_t
+        float start_rlim
         place_c_types place_cost_type
         e_place_algorithm place_algorithm
 
@@ -55,6 +63,8 @@ cdef extern from "State.hpp":
         float criticality_exponent
         int total_iteration_count
 
+        void set(PlaceStats other)
+
     cdef cppclass PlaceState:
         timespec start
         timespec end
@@ -74,6 +84,10 @@ cdef datetime_from_timespec_tuple(timespec t)
 
 cdef class cPlaceStats(cStateBase):
     cdef PlaceStats *thisptr
+    cdef bint _owned
+
+
+cdef cPlaceStats copy_place_stats(const PlaceStats &stats)
 
 
 cdef class cPlaceState(cStateBase):
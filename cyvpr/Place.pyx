@@ -14,6 +14,35 @@ PLACE_ALGORITHMS = {BOUNDING_BOX_PLACE: 'BOUNDING_BOX_PLACE',
 PLACE_COST_TYPES = {LINEAR_CONG: 'LINEAR_CONG',
                     NONLINEAR_CONG: 'NONLINEAR_CONG'}
 
+PLACER_OPTS_FIELDS = ('timing_tradeoff', 'block_dist', 'place_cost_exp',
+                      'place_chan_width', 'num_regions', 'recompute_crit_iter',
+                      'enable_timing_computations',
+                      'inner_loop_recompute_divider', 'td_place_exp_first',
+                      'td_place_exp_last', 'place_cost_type',
+                      'place_algorithm', 'start_t', 'start_rlim')
+
+PLACE_STATS_FIELDS = ('start', 'end', 'temperature', 'mean_cost',
+                      'mean_bounding_box_cost', 'mean_timing_cost',
+                      'mean_delay_cost', 'place_delay_value', 'success_ratio',
+                      'std_dev', 'radius_limit', 'criticality_exponent',
+                      'total_iteration_count')
+
+
+def rebuild_state(data):
+    cdef cPlaceState r = cPlaceState()
+    cdef int i
+
+    r.thisptr.start = data['start']
+    r.thisptr.end = data['end']
+    placer_opts = r.placer_opts
+    for k, v in data['placer_opts'].iteritems():
+        setattr(placer_opts, k, v)
+    r.thisptr.stats.resize(len(data['stats']))
+    for i, stats_data in enumerate(data['stats']):
+        stats = cPlaceStats(<size_t>&r.thisptr.stats[i])
+        for k, v in stats_data.iteritems():
+            setattr(stats, k, v)
+    return r
 
 
 def unix_time(datetime_):
@@ -29,62 +58,119 @@ cdef datetime_from_timespec_tuple(timespec t):
     return datetime.fromtimestamp(timestamp)
 
 
+cdef cPlaceStats copy_place_stats(const PlaceStats &stats):
+    '''
+    Return a `cPlaceStats` holding its own copy of `stats`.
+    '''
+    cdef PlaceStats *copy = new PlaceStats()
+    cdef cPlaceStats py_stats
+
+    copy.set(stats)
+    py_stats = cPlaceStats(<size_t>copy)
+    py_stats._owned = True
+    return py_stats
+
+
 cdef class cPlaceStats:
     def __cinit__(self, size_t data):
         self.thisptr = <PlaceStats *>data
+        self._owned = False
+
+    def __dealloc__(self):
+        if self._owned:
+            del self.thisptr
 
     property start:
         def __get__(self):
             return self.thisptr.start
 
+        def __set__(self, value):
+            self.thisptr.start = value
+
     property end:
         def __get__(self):
             return self.thisptr.end
 
+        def __set__(self, value):
+            self.thisptr.end = value
+
     property temperature:
         def __get__(self):
             return self.thisptr.temperature
 
+        def __set__(self, value):
+            self.thisptr.temperature = value
+
     property mean_cost:
         def __get__(self):
             return self.thisptr.mean_cost
 
+        def __set__(self, value):
+            self.thisptr.mean_cost = value
+
     property mean_bounding_box_cost:
         def __get__(self):
             return self.thisptr.mean_bounding_box_cost
 
+        def __set__(self, value):
+            self.thisptr.mean_bounding_box_cost = value
+
     property mean_timing_cost:
         def __get__(self):
             return self.thisptr.mean_timing_cost
 
+        def __set__(self, value):
+            self.thisptr.mean_timing_cost = value
+
     property mean_delay_cost:
         def __get__(self):
             return self.thisptr.mean_delay_cost
 
+        def __set__(self, value):
+            self.thisptr.mean_delay_cost = value
+
     property place_delay_value:
         def __get__(self):
             return self.thisptr.place_delay_value
 
+        def __set__(self, value):
+            self.thisptr.place_delay_value = value
+
     property success_ratio:
         def __get__(self):
             return self.thisptr.success_ratio
 
+        def __set__(self, value):
+            self.thisptr.success_ratio = value
+
     property std_dev:
         def __get__(self):
             return self.thisptr.std_dev
 
+        def __set__(self, value):
+            self.thisptr.std_dev = value
+
     property radius_limit:
         def __get__(self):
             return self.thisptr.radius_limit
 
+        def __set__(self, value):
+            self.thisptr.radius_limit = value
+
     property criticality_exponent:
         def __get__(self):
             return self.thisptr.criticality_exponent
 
+        def __set__(self, value):
+            self.thisptr.criticality_exponent = value
+
     property total_iteration_count:
         def __get__(self):
             return self.thisptr.total_iteration_count
 
+        def __set__(self, value):
+            self.thisptr.total_iteration_count = value
+
 
 cdef class cPlacerOpts:
     def __cinit__(self, size_t data):
@@ -94,56 +180,128 @@ cdef class cPlacerOpts:
         def __get__(self):
             return self.thisptr.timing_tradeoff
 
+        def __set__(self, value):
+            self.thisptr.timing_tradeoff = value
+
     property block_dist:
         def __get__(self):
             return self.thisptr.block_dist
 
+        def __set__(self, value):
+            self.thisptr.block_dist = value
+
     property place_cost_exp:
         def __get__(self):
             return self.thisptr.place_cost_exp
 
+        def __set__(self, value):
+            self.thisptr.place_cost_exp = value
+
     property place_chan_width:
         def __get__(self):
             return self.thisptr.place_chan_width
 
+        def __set__(self, value):
+            self.thisptr.place_chan_width = value
+
     property num_regions:
         def __get__(self):
             return self.thisptr.num_regions
 
+        def __set__(self, value):
+            self.thisptr.num_regions = value
+
     property recompute_crit_iter:
         def __get__(self):
             return self.thisptr.recompute_crit_iter
 
+        def __set__(self, value):
+            self.thisptr.recompute_crit_iter = value
+
     property enable_timing_computations:
         def __get__(self):
             return self.thisptr.enable_timing_computations
 
+        def __set__(self, value):
+            self.thisptr.enable_timing_computations = (<boolean>TRUE if value
+                                                       else <boolean>FALSE)
+
     property inner_loop_recompute_divider:
         def __get__(self):
             return self.thisptr.inner_loop_recompute_divider
 
+        def __set__(self, value):
+            self.thisptr.inner_loop_recompute_divider = value
+
     property td_place_exp_first:
         def __get__(self):
             return self.thisptr.td_place_exp_first
 
+        def __set__(self, value):
+            self.thisptr.td_place_exp_first = value
+
     property td_place_exp_last:
         def __get__(self):
             return self.thisptr.td_place_exp_last
 
+        def __set__(self, value):
+            self.thisptr.td_place_exp_last = value
+
+    property start_t:
+        '''
+        Temperature the anneal starts at, or a negative value to find the
+        starting temperature automatically.
+        '''
+        def __get__(self):
+            return self.thisptr.start_t
+
+        def __set__(self, value):
+            self.thisptr.start_t = value
+
+    property start_rlim:
+        '''
+        Range limit the anneal starts with, or a non-positive value to start
+        with the whole chip.
+        '''
+        def __get__(self):
+            return self.thisptr.start_rlim
+
+        def __set__(self, value):
+            self.thisptr.start_rlim = value
+
     property place_cost_type:
         def __get__(self):
             return self.thisptr.place_cost_type
 
+        def __set__(self, value):
+            self.thisptr.place_cost_type = <place_c_types>value
+
     property place_algorithm:
         def __get__(self):
             return self.thisptr.place_algorithm
 
+        def __set__(self, value):
+            self.thisptr.place_algorithm = <e_place_algorithm>value
+
 
 cdef class cPlaceState(cStateBase):
     def __cinit__(self):
         self.thisptr = new PlaceState()
         self.baseptr = <StateBase *>self.thisptr
 
+    def __reduce__(self):
+        placer_opts = self.placer_opts
+        data = OrderedDict([('start', self.thisptr.start),
+                            ('end', self.thisptr.end),
+                            ('placer_opts',
+                             OrderedDict([(k, getattr(placer_opts, k))
+                                          for k in PLACER_OPTS_FIELDS])),
+                            ('stats',
+                             [OrderedDict([(k, getattr(stats, k))
+                                           for k in PLACE_STATS_FIELDS])
+                              for stats in self.stats])])
+        return (rebuild_state, (data, ))
+
     def __str__(self):
         return self.thisptr.str()
 
@@ -7,7 +7,30 @@ from cyvpr.State cimport cStateBase, StateBase
 ctypedef unsigned int uint
 
 
+cdef extern from "util.h":
+    ctypedef enum boolean:
+        FALSE
+        TRUE
+
+
 cdef extern from "vpr_types.h":
+    enum e_heap_type:
+        BINARY_HEAP
+        FOUR_ARY_HEAP
+
+    enum e_rr_graph_layout:
+        RR_GRAPH_STRUCTS
+        RR_GRAPH_CSR
+
+    enum e_route_file_format:
+        ROUTE_FILE_TEXT
+        ROUTE_FILE_BINARY
+
+    enum e_route_abort:
+        ABORT_NEVER
+        ABORT_STALLED
+        ABORT_EXTRAPOLATED
+
     struct s_router_opts:
         float first_iter_pres_fac
         float initial_pres_fac
@@ -20,6 +43,15 @@ cdef extern from "vpr_types.h":
         float astar_fac
         float max_criticality
         float criticality_exp
+        e_heap_type heap_type
+        e_rr_graph_layout rr_graph_layout
+        int route_threads
+        bint incremental_reroute
+        float reroute_crit_change
+        e_route_abort route_abort
+        int abort_iterations
+        bint export_traceback
+        e_route_file_format route_file_format
         #enum e_router_algorithm router_algorithm
         #enum e_base_cost_type base_cost_type
         #enum e_route_type route_type
@@ -51,7 +83,39 @@ cdef extern from "State.hpp":
         vector[uint] bends
         vector[uint] wire_lengths
         vector[uint] segments
+        # Final traceback of each net, if `router_opts.export_traceback`.
+        vector[uint] trace_net_offsets
+        vector[int] trace_nodes
+        vector[short] trace_switches
+        # Number of nets routed in each PathFinder iteration.
+        vector[uint] nets_rerouted
+        # Number of nets in each level of the schedule used to route the
+        # nets on several threads, or empty for one thread.
+        vector[uint] nets_per_level
+        # Number of overused routing resources, and their total overuse,
+        # after each PathFinder iteration.
+        vector[uint] overused_nodes
+        vector[uint] total_overuse
+        # Present congestion factor used by each PathFinder iteration, and
+        # wall-clock seconds from the start of the route to the end of each
+        # iteration.
+        vector[float] pres_facs
+        vector[double] iteration_times
+        # Why the router gave up before `max_router_iterations` (empty if it
+        # did not).
+        string abort_reason
+        # Was the route cancelled by the routing iteration callback?
+        bint cancelled
         s_router_opts router_opts
+        # Number of maze router heap insertions and removals.
+        long long heap_pushes
+        long long heap_pops
+        # Number of heap, traceback and linked_f_pointer structures
+        # allocated, number of arena chunks malloced to hold them, and the
+        # bytes owned by the arenas at the end of the route.
+        long long node_allocs
+        long long arena_chunk_allocs
+        long long arena_bytes
 
         string str()
         string csv()
@@ -83,10 +147,25 @@ cdef class cRouteState(cStateBase):
     cdef object _bends
     cdef object _wire_lengths
     cdef object _segments
+    cdef object _trace_net_offsets
+    cdef object _trace_nodes
+    cdef object _trace_switches
+    cdef object _nets_rerouted
+    cdef object _nets_per_level
+    cdef object _overused_nodes
+    cdef object _total_overuse
+    cdef object _iterations
 
     cdef inline init(self, RouteState state):
         self.thisptr.set(state)
 
+    cdef vector_array(self, vector[uint] *data)
+    cdef typed_vector_array(self, void *data, format, Py_ssize_t itemsize,
+                            Py_ssize_t size)
+
+
+cdef cRouteState copy_route_state(const RouteState &state)
+
 
 cdef class cRouteResult(cStateBase):
     cdef RouteResult *thisptr
@@ -6,8 +6,10 @@ import numpy as np
 from libcpp.vector cimport vector
 from libcpp.string cimport string
 from libc.stdlib cimport malloc
+from libc.string cimport memcpy
 
 from cyvpr.Place cimport datetime_from_timespec_tuple
+from cyvpr.State cimport cUIntVectorView, cArrayView
 from cyvpr.Place import unix_time
 
 
@@ -25,6 +27,36 @@ def rebuild_state(data):
     return r
 
 
+ITERATION_DTYPE = np.dtype([('iteration', np.uint32),
+                            ('overused_nodes', np.uint32),
+                            ('total_overuse', np.uint32),
+                            ('nets_rerouted', np.uint32),
+                            ('pres_fac', np.float32),
+                            ('seconds', np.float64)])
+
+
+cdef copy_array(void *data, values):
+    '''
+    Copy the contiguous Numpy array `values` to `data`.
+    '''
+    cdef signed char[::1] view
+
+    if values.nbytes:
+        view = values.view(np.int8)
+        memcpy(data, &view[0], values.nbytes)
+
+
+cdef cRouteState copy_route_state(const RouteState &state):
+    '''
+    Return a `cRouteState` holding a copy of `state`, e.g., to pass a route in
+    progress to Python.
+    '''
+    cdef cRouteState route_state = cRouteState()
+
+    route_state.thisptr.set(state)
+    return route_state
+
+
 cdef class cRouterOpts:
     def __cinit__(self, size_t data):
         self.thisptr = <s_router_opts *>data
@@ -73,6 +105,160 @@ cdef class cRouterOpts:
         def __get__(self):
             return self.thisptr.criticality_exp
 
+    property heap_type:
+        '''
+        Priority queue used by the maze router: `'binary'` _(the original
+        binary heap)_ or `'4ary'` _(a 4-ary heap)_.
+        '''
+        def __get__(self):
+            if self.thisptr.heap_type == FOUR_ARY_HEAP:
+                return '4ary'
+            return 'binary'
+
+        def __set__(self, value):
+            if value == 'binary':
+                self.thisptr.heap_type = BINARY_HEAP
+            elif value == '4ary':
+                self.thisptr.heap_type = FOUR_ARY_HEAP
+            else:
+                raise ValueError, ('Heap type must be `binary` or `4ary`, '
+                                   'not %r.' % value)
+
+    property rr_graph_layout:
+        '''
+        Copy of the routing-resource graph walked by the maze router:
+        `'structs'` _(the `rr_node` structures)_ or `'csr'` _(compact
+        arrays, with the edges of all nodes in one array)_.  The routing does
+        not depend on the layout.
+        '''
+        def __get__(self):
+            if self.thisptr.rr_graph_layout == RR_GRAPH_CSR:
+                return 'csr'
+            return 'structs'
+
+        def __set__(self, value):
+            if value == 'structs':
+                self.thisptr.rr_graph_layout = RR_GRAPH_STRUCTS
+            elif value == 'csr':
+                self.thisptr.rr_graph_layout = RR_GRAPH_CSR
+            else:
+                raise ValueError, ('rr-graph layout must be `structs` or '
+                                   '`csr`, not %r.' % value)
+
+    property route_file_format:
+        '''
+        Format of the routing written to the route file: `'text'` _(the
+        original VPR format)_ or `'binary'` _(a compact format that is much
+        faster to write, see `cyvpr.result.route_file`)_.
+        '''
+        def __get__(self):
+            if self.thisptr.route_file_format == ROUTE_FILE_BINARY:
+                return 'binary'
+            return 'text'
+
+        def __set__(self, value):
+            if value == 'text':
+                self.thisptr.route_file_format = ROUTE_FILE_TEXT
+            elif value == 'binary':
+                self.thisptr.route_file_format = ROUTE_FILE_BINARY
+            else:
+                raise ValueError, ('Route file format must be `text` or '
+                                   '`binary`, not %r.' % value)
+
+    property route_threads:
+        '''
+        Number of threads used to route the nets of each PathFinder
+        iteration.
+
+        __NB__ Only nets that cannot use any of the same routing resources
+        are routed at the same time, so the routing does not depend on the
+        number of threads.
+        '''
+        def __get__(self):
+            return self.thisptr.route_threads
+
+        def __set__(self, value):
+            if value < 1:
+                raise ValueError, 'At least one routing thread is required.'
+            self.thisptr.route_threads = value
+
+    property incremental_reroute:
+        '''
+        If `True`, after the first PathFinder iteration only the nets that
+        use an overused routing resource are ripped up and rerouted.
+        '''
+        def __get__(self):
+            return self.thisptr.incremental_reroute
+
+        def __set__(self, value):
+            self.thisptr.incremental_reroute = (<boolean>TRUE if value
+                                                else <boolean>FALSE)
+
+    property route_abort:
+        '''
+        When the router gives up on a channel width before
+        `max_router_iterations`:
+
+         - `'never'`: never.
+         - `'stalled'`: if the total overuse has not improved in the last
+           `abort_iterations` PathFinder iterations.
+         - `'extrapolated'`: if, at the rate it fell over the last
+           `abort_iterations` iterations, the total overuse would not reach
+           zero within `max_router_iterations`.
+        '''
+        def __get__(self):
+            if self.thisptr.route_abort == ABORT_STALLED:
+                return 'stalled'
+            elif self.thisptr.route_abort == ABORT_EXTRAPOLATED:
+                return 'extrapolated'
+            return 'never'
+
+        def __set__(self, value):
+            if value == 'never':
+                self.thisptr.route_abort = ABORT_NEVER
+            elif value == 'stalled':
+                self.thisptr.route_abort = ABORT_STALLED
+            elif value == 'extrapolated':
+                self.thisptr.route_abort = ABORT_EXTRAPOLATED
+            else:
+                raise ValueError, ('Route abort policy must be `never`, '
+                                   '`stalled` or `extrapolated`, not %r.' %
+                                   value)
+
+    property abort_iterations:
+        def __get__(self):
+            return self.thisptr.abort_iterations
+
+        def __set__(self, value):
+            if value < 1:
+                raise ValueError, 'At least one abort iteration is required.'
+            self.thisptr.abort_iterations = value
+
+    property reroute_crit_change:
+        '''
+        With `incremental_reroute`, also reroute nets whose largest sink
+        criticality has changed by more than this since they were last routed
+        _(timing-driven router only)_.  Negative values disable this.
+        '''
+        def __get__(self):
+            return self.thisptr.reroute_crit_change
+
+        def __set__(self, value):
+            self.thisptr.reroute_crit_change = value
+
+    property export_traceback:
+        '''
+        If `True`, the final traceback of each net is kept in the
+        `cRouteState` of each successful route _(see
+        `cRouteState.trace_nodes`)_.
+        '''
+        def __get__(self):
+            return self.thisptr.export_traceback
+
+        def __set__(self, value):
+            self.thisptr.export_traceback = (<boolean>TRUE if value
+                                             else <boolean>FALSE)
+
 
 cdef class cRouteState(cStateBase):
     def __cinit__(self):
@@ -81,6 +267,14 @@ cdef class cRouteState(cStateBase):
         self._bends = None
         self._wire_lengths = None
         self._segments = None
+        self._trace_net_offsets = None
+        self._trace_nodes = None
+        self._trace_switches = None
+        self._nets_rerouted = None
+        self._nets_per_level = None
+        self._overused_nodes = None
+        self._total_overuse = None
+        self._iterations = None
 
     def __reduce__(self):
         start = self.start
@@ -95,7 +289,18 @@ cdef class cRouteState(cStateBase):
                             ('global_nets_on_crit_path',
                              self.global_nets_on_crit_path),
                             ('total_logic_delay', self.total_logic_delay),
-                            ('total_net_delay', self.total_net_delay)])
+                            ('total_net_delay', self.total_net_delay),
+                            ('heap_pushes', self.heap_pushes),
+                            ('heap_pops', self.heap_pops),
+                            ('node_allocs', self.node_allocs),
+                            ('arena_chunk_allocs', self.arena_chunk_allocs),
+                            ('arena_bytes', self.arena_bytes),
+                            ('abort_reason', self.abort_reason),
+                            ('cancelled', self.cancelled),
+                            ('iterations', self.iterations),
+                            ('trace_net_offsets', self.trace_net_offsets),
+                            ('trace_nodes', self.trace_nodes),
+                            ('trace_switches', self.trace_switches)])
         return (rebuild_state, (data, ))
 
     def __str__(self):
@@ -185,29 +390,276 @@ cdef class cRouteState(cStateBase):
         def __set__(self, value):
             self.thisptr.total_net_delay = value
 
+    property heap_pushes:
+        def __get__(self):
+            return self.thisptr.heap_pushes
+
+        def __set__(self, value):
+            self.thisptr.heap_pushes = value
+
+    property heap_pops:
+        def __get__(self):
+            return self.thisptr.heap_pops
+
+        def __set__(self, value):
+            self.thisptr.heap_pops = value
+
+    property node_allocs:
+        def __get__(self):
+            return self.thisptr.node_allocs
+
+        def __set__(self, value):
+            self.thisptr.node_allocs = value
+
+    property arena_chunk_allocs:
+        def __get__(self):
+            return self.thisptr.arena_chunk_allocs
+
+        def __set__(self, value):
+            self.thisptr.arena_chunk_allocs = value
+
+    property arena_bytes:
+        def __get__(self):
+            return self.thisptr.arena_bytes
+
+        def __set__(self, value):
+            self.thisptr.arena_bytes = value
+
     def __dealloc__(self):
         del self.thisptr
 
+    cdef vector_array(self, vector[uint] *data):
+        '''
+        Return a Numpy array wrapping `data`, which is owned by
+        `self.thisptr`, without copying.
+        '''
+        cdef cUIntVectorView view = cUIntVectorView()
+        view.owner = self
+        view.data = data
+        return np.asarray(view)
+
+    cdef typed_vector_array(self, void *data, format, Py_ssize_t itemsize,
+                            Py_ssize_t size):
+        '''
+        Same as `vector_array`, but for the `size` items of any type,
+        described by the buffer-protocol `format` and `itemsize`, at `data`.
+        '''
+        cdef cArrayView view = cArrayView()
+        view.owner = self
+        view.data = <char *>data
+        view.format = format
+        view.itemsize = itemsize
+        view.shape[0] = size
+        view.strides[0] = itemsize
+        return np.asarray(view)
+
     property bends:
         def __get__(self):
             if self._bends is None:
-                self._bends = np.asarray(self.thisptr.bends, dtype='uint')
+                self._bends = self.vector_array(&self.thisptr.bends)
             return self._bends
 
     property wire_lengths:
         def __get__(self):
             if self._wire_lengths is None:
-                self._wire_lengths = np.asarray(self.thisptr.wire_lengths,
-                                                dtype='uint')
+                self._wire_lengths = self.vector_array(
+                    &self.thisptr.wire_lengths)
             return self._wire_lengths
 
     property segments:
         def __get__(self):
             if self._segments is None:
-                self._segments = np.asarray(self.thisptr.segments,
-                                            dtype='uint')
+                self._segments = self.vector_array(&self.thisptr.segments)
             return self._segments
 
+    property trace_net_offsets:
+        '''
+        Offset of the traceback of each net into `trace_nodes` and
+        `trace_switches`, with a final entry for the total number of
+        traceback elements.  The traceback of net `i` is
+        `trace_net_offsets[i]:trace_net_offsets[i + 1]`.
+
+        __NB__ The traceback is only kept for successful routes with
+        `cRouterOpts.export_traceback` set _(e.g., `cMain.route(...,
+        export_traceback=True)`)_.  Otherwise, the arrays are empty.
+        '''
+        def __get__(self):
+            if self._trace_net_offsets is None:
+                self._trace_net_offsets = self.vector_array(
+                    &self.thisptr.trace_net_offsets)
+            return self._trace_net_offsets
+
+        def __set__(self, value):
+            # Resizing the vector would invalidate any array wrapping it.
+            if self._trace_net_offsets is not None:
+                raise ValueError, ('Cannot set `trace_net_offsets` once it '
+                                   'has been read.')
+            values = np.ascontiguousarray(value, dtype=np.uint32)
+            self.thisptr.trace_net_offsets.resize(values.size)
+            copy_array(self.thisptr.trace_net_offsets.data(), values)
+
+    property trace_nodes:
+        '''
+        Routing-resource node of each traceback element, in the order written
+        to `routed.out` _(see `cMain.rr_graph`)_.  Each branch of a net ends
+        at a `SINK` node, and the next branch starts from a node already in
+        the net's routing.
+        '''
+        def __get__(self):
+            if self._trace_nodes is None:
+                self._trace_nodes = self.typed_vector_array(
+                    self.thisptr.trace_nodes.data(), 'i', sizeof(int),
+                    self.thisptr.trace_nodes.size())
+            return self._trace_nodes
+
+        def __set__(self, value):
+            if self._trace_nodes is not None:
+                raise ValueError, ('Cannot set `trace_nodes` once it has been '
+                                   'read.')
+            values = np.ascontiguousarray(value, dtype=np.intc)
+            self.thisptr.trace_nodes.resize(values.size)
+            copy_array(self.thisptr.trace_nodes.data(), values)
+
+    property trace_switches:
+        '''
+        Switch type from each traceback element to the next, or -1 after a
+        `SINK` node.
+        '''
+        def __get__(self):
+            if self._trace_switches is None:
+                self._trace_switches = self.typed_vector_array(
+                    self.thisptr.trace_switches.data(), 'h', sizeof(short),
+                    self.thisptr.trace_switches.size())
+            return self._trace_switches
+
+        def __set__(self, value):
+            if self._trace_switches is not None:
+                raise ValueError, ('Cannot set `trace_switches` once it has '
+                                   'been read.')
+            values = np.ascontiguousarray(value, dtype=np.short)
+            self.thisptr.trace_switches.resize(values.size)
+            copy_array(self.thisptr.trace_switches.data(), values)
+
+    property nets_rerouted:
+        '''
+        Number of nets routed in each PathFinder iteration.
+        '''
+        def __get__(self):
+            if self._nets_rerouted is None:
+                self._nets_rerouted = self.vector_array(
+                    &self.thisptr.nets_rerouted)
+            return self._nets_rerouted
+
+    property nets_per_level:
+        '''
+        Number of nets in each level of the schedule used to route the nets
+        on several threads _(see `cRouterOpts.route_threads`)_, or empty if
+        the nets were routed on one thread.  The nets of a level are routed
+        at the same time, so the number of levels bounds the speedup.
+        '''
+        def __get__(self):
+            if self._nets_per_level is None:
+                self._nets_per_level = self.vector_array(
+                    &self.thisptr.nets_per_level)
+            return self._nets_per_level
+
+    property overused_nodes:
+        '''
+        Number of overused routing resources after each PathFinder
+        iteration.
+        '''
+        def __get__(self):
+            if self._overused_nodes is None:
+                self._overused_nodes = self.vector_array(
+                    &self.thisptr.overused_nodes)
+            return self._overused_nodes
+
+    property total_overuse:
+        '''
+        Total occupancy in excess of capacity, over all routing resources,
+        after each PathFinder iteration.
+        '''
+        def __get__(self):
+            if self._total_overuse is None:
+                self._total_overuse = self.vector_array(
+                    &self.thisptr.total_overuse)
+            return self._total_overuse
+
+    property abort_reason:
+        '''
+        Why the router gave up before `max_router_iterations` _(see
+        `cRouterOpts.route_abort`)_, or an empty string if it did not.
+        '''
+        def __get__(self):
+            return self.thisptr.abort_reason
+
+        def __set__(self, value):
+            self.thisptr.abort_reason = value
+
+    property cancelled:
+        '''
+        Was the route cancelled by an `iteration_callback` _(see
+        `cMain.route`)_?
+        '''
+        def __get__(self):
+            return self.thisptr.cancelled
+
+        def __set__(self, value):
+            self.thisptr.cancelled = value
+
+    property iterations:
+        '''
+        Record array with one row per PathFinder iteration, holding the
+        iteration number _(starting at 1)_, the number of overused routing
+        resources and their total overuse after the iteration, the number of
+        nets routed, the present congestion factor used, and the wall-clock
+        seconds from the start of the route to the end of the iteration.
+
+        __NB__ Unlike `overused_nodes`, etc., the records are a copy.
+        Setting the records _(e.g., when a pickled state is loaded)_ sets
+        `overused_nodes`, etc., too.
+        '''
+        def __get__(self):
+            cdef size_t i
+            cdef size_t count
+
+            if self._iterations is None:
+                count = self.thisptr.iteration_times.size()
+                iterations = np.empty(count, dtype=ITERATION_DTYPE)
+                for i in xrange(count):
+                    iterations[i] = (i + 1, self.thisptr.overused_nodes[i],
+                                     self.thisptr.total_overuse[i],
+                                     self.thisptr.nets_rerouted[i],
+                                     self.thisptr.pres_facs[i],
+                                     self.thisptr.iteration_times[i])
+                self._iterations = iterations.view(np.recarray)
+            return self._iterations
+
+        def __set__(self, value):
+            cdef size_t i
+            cdef size_t count
+
+            # Resizing the vectors would invalidate any arrays wrapping them.
+            if (self._nets_rerouted is not None or
+                    self._overused_nodes is not None or
+                    self._total_overuse is not None):
+                raise ValueError, ('Cannot set `iterations` once the '
+                                   'per-iteration arrays have been read.')
+            iterations = np.asarray(value, dtype=ITERATION_DTYPE)
+            count = len(iterations)
+            self.thisptr.overused_nodes.resize(count)
+            self.thisptr.total_overuse.resize(count)
+            self.thisptr.nets_rerouted.resize(count)
+            self.thisptr.pres_facs.resize(count)
+            self.thisptr.iteration_times.resize(count)
+            for i in xrange(count):
+                self.thisptr.overused_nodes[i] = iterations[i]['overused_nodes']
+                self.thisptr.total_overuse[i] = iterations[i]['total_overuse']
+                self.thisptr.nets_rerouted[i] = iterations[i]['nets_rerouted']
+                self.thisptr.pres_facs[i] = iterations[i]['pres_fac']
+                self.thisptr.iteration_times[i] = iterations[i]['seconds']
+            self._iterations = None
+
 
 cdef class cRouteResult(cStateBase):
     def __cinit__(self):
@@ -14,3 +14,22 @@ cdef extern from "State.hpp":
 
 cdef class cStateBase:
     cdef StateBase *baseptr
+
+
+cdef class cUIntVectorView:
+    # Object that owns `data`, kept alive as long as the view is referenced.
+    cdef object owner
+    cdef vector[unsigned int] *data
+    cdef Py_ssize_t shape[1]
+    cdef Py_ssize_t strides[1]
+
+
+cdef class cArrayView:
+    # Object that owns `data`, kept alive as long as the view is referenced.
+    cdef object owner
+    cdef char *data
+    # Buffer-protocol format string of the items, e.g., `'h'` or `'f'`.
+    cdef bytes format
+    cdef Py_ssize_t itemsize
+    cdef Py_ssize_t shape[1]
+    cdef Py_ssize_t strides[1]
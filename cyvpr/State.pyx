@@ -1,3 +1,6 @@
+from cpython.buffer cimport PyBUF_WRITABLE, PyBUF_STRIDES
+
+
 cdef class cStateBase:
     def __str__(self):
         return self.baseptr.str()
@@ -18,3 +21,70 @@ cdef class cStateBase:
     property csv_fieldnames:
         def __get__(self):
             return self.baseptr.csv_fieldnames()
+
+
+cdef class cUIntVectorView:
+    '''
+    Expose the contents of a C++ `vector<unsigned int>` through the buffer
+    protocol, e.g., to create a Numpy array using `np.asarray(view)` without
+    copying the data.
+
+    __NB__ The vector must not be resized while any buffer of the view is in
+    use.  The view is read-only.
+    '''
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError, 'Vector view is read-only.'
+        self.shape[0] = self.data.size()
+        self.strides[0] = sizeof(unsigned int)
+        buffer.buf = <char *>self.data.data()
+        buffer.format = 'I'
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(unsigned int)
+        buffer.len = self.shape[0] * sizeof(unsigned int)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 1
+        buffer.shape = self.shape
+        if flags & PyBUF_STRIDES:
+            buffer.strides = self.strides
+        else:
+            buffer.strides = NULL
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+
+cdef class cArrayView:
+    '''
+    Expose a one-dimensional, possibly strided, C array through the buffer
+    protocol, e.g., to create a Numpy array using `np.asarray(view)` without
+    copying the data.
+
+    __NB__ The array must stay allocated as long as `owner` is alive.  The
+    view is read-only, and a strided view may only be requested along with
+    its strides _(i.e., with `PyBUF_STRIDES`)_.
+    '''
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError, 'Array view is read-only.'
+        if not flags & PyBUF_STRIDES and self.strides[0] != self.itemsize:
+            raise BufferError, 'Array view is not contiguous.'
+        buffer.buf = self.data
+        buffer.format = self.format
+        buffer.internal = NULL
+        buffer.itemsize = self.itemsize
+        buffer.len = self.shape[0] * self.itemsize
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 1
+        buffer.shape = self.shape
+        if flags & PyBUF_STRIDES:
+            buffer.strides = self.strides
+        else:
+            buffer.strides = NULL
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
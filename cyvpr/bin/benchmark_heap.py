@@ -0,0 +1,85 @@
+'''
+Benchmark the priority queue _(heap)_ implementations of the maze router.
+
+Each netlist is placed once, and the placement is then routed at a fixed
+channel width using each heap type.  For each route, the number of heap
+insertions and removals and the routing time are reported, e.g.:
+
+    python -m cyvpr.bin.benchmark_heap cyvpr/data/4lut_sanitized.arch \
+        cyvpr/data/mcnc/*.net
+
+__NB__ The heap types may break ties between entries of equal cost in a
+different order, so the routings _(and heap counts)_ may differ slightly.
+'''
+import shutil
+import tempfile
+
+from path import path
+from cyvpr.Main import cMain, RoutingSession
+from cyvpr.Place import unix_time
+
+
+HEAP_TYPES = ('binary', '4ary')
+
+
+def benchmark_heap(net_path, arch_path, channel_width=None, repeat=1,
+                   heap_types=HEAP_TYPES, fast=True, seed=0):
+    '''
+    Place `net_path` once, then route the placement at `channel_width`
+    _(defaults to twice the number of pins per logic block)_ `repeat` times
+    using each heap type.
+
+    Return a list with one `(heap_type, route_state, seconds)` tuple per heap
+    type, where `seconds` is the shortest routing time over all repeats.
+    '''
+    output_dir = path(tempfile.mkdtemp(prefix='benchmark-heap-'))
+    try:
+        placed_path = output_dir.joinpath('placed.out')
+        vpr_main = cMain()
+        vpr_main.place(net_path, arch_path, placed_path, fast=fast, seed=seed)
+        if channel_width is None:
+            channel_width = 2 * vpr_main.pins_per_clb
+
+        results = []
+        for heap_type in heap_types:
+            with RoutingSession(str(net_path), str(arch_path),
+                                str(placed_path), fast=fast,
+                                output_path=output_dir.joinpath('routed.out'),
+                                heap_type=heap_type) as session:
+                times = []
+                for i in xrange(repeat):
+                    state = session.route(channel_width)
+                    times.append(unix_time(state.end) -
+                                 unix_time(state.start))
+            results.append((heap_type, state, min(times)))
+    finally:
+        shutil.rmtree(output_dir)
+    return results
+
+
+def parse_args():
+    """Parses arguments, returns (options, args)."""
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Compare the heap push/pop counts '
+                            'and routing time of each maze router heap type.')
+
+    parser.add_argument(dest='arch_path', type=path)
+    parser.add_argument(nargs='+', dest='net_path', type=path)
+    parser.add_argument('-w', '--channel_width', type=int)
+    parser.add_argument('-r', '--repeat', type=int, default=1)
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    print '%-12s %-7s %-8s %12s %12s %10s' % ('net', 'heap', 'success',
+                                             'pushes', 'pops', 'seconds')
+    for net_path in args.net_path:
+        for heap_type, state, seconds in benchmark_heap(
+                net_path, args.arch_path, channel_width=args.channel_width,
+                repeat=args.repeat, seed=args.seed):
+            print '%-12s %-7s %-8s %12d %12d %10.3f' % (
+                net_path.namebase, heap_type, state.success,
+                state.heap_pushes, state.heap_pops, seconds)
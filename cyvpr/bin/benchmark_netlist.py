@@ -0,0 +1,81 @@
+'''
+Benchmark the time taken to parse netlist files.
+
+Each netlist is parsed `repeat` times, along with the architecture, by
+`cMain.init` with the parse cache disabled, and the shortest time is
+reported, e.g.:
+
+    python -m cyvpr.bin.benchmark_netlist cyvpr/data/4lut_sanitized.arch \
+        cyvpr/data/mcnc/*.net
+
+With `--compiled`, the time taken to load each compiled netlist _(see
+`cyvpr.bin.compile_netlists`)_ is reported instead.
+
+__NB__ The time includes parsing the architecture file, which is small
+compared to any of the MCNC netlists.
+'''
+import time
+
+from path import path
+from cyvpr.Main import (cMain, parse_cache_info, set_parse_cache_enabled,
+                        netlist_cache_info, set_netlist_cache_enabled,
+                        set_netlist_cache_write_enabled)
+
+
+def benchmark_netlist(net_path, arch_path, repeat=5, compiled=False):
+    '''
+    Return the shortest time, in seconds, taken by `cMain.init` to parse
+    `net_path` and `arch_path` over `repeat` runs.
+
+    If `compiled` is `True`, the netlist is loaded from its compiled netlist
+    _(which is written first, if necessary)_ rather than parsed.
+    '''
+    enabled = parse_cache_info()['enabled']
+    netlist_cache = netlist_cache_info()
+    set_parse_cache_enabled(False)
+    set_netlist_cache_enabled(compiled)
+    set_netlist_cache_write_enabled(compiled)
+    try:
+        vpr_main = cMain()
+        args = [net_path, arch_path, 'placed.out', 'routed.out',
+                '-route_only', '-nodisp']
+        if compiled:
+            vpr_main.init(args)
+        times = []
+        for i in xrange(repeat):
+            start = time.time()
+            vpr_main.init(args)
+            times.append(time.time() - start)
+        vpr_main.reset()
+    finally:
+        set_parse_cache_enabled(enabled)
+        set_netlist_cache_enabled(netlist_cache['enabled'])
+        set_netlist_cache_write_enabled(netlist_cache['write_enabled'])
+    return min(times)
+
+
+def parse_args():
+    """Parses arguments, returns (options, args)."""
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Report the time taken to parse '
+                            'each netlist.')
+
+    parser.add_argument(dest='arch_path', type=path)
+    parser.add_argument(nargs='+', dest='net_path', type=path)
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-c', '--compiled', action='store_true',
+                        help='Load compiled netlists, rather than parsing.')
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    print '%-12s %10s %10s %10s' % ('net', 'bytes', 'seconds', 'MB/second')
+    for net_path in args.net_path:
+        seconds = benchmark_netlist(net_path, args.arch_path,
+                                    repeat=args.repeat,
+                                    compiled=args.compiled)
+        size = net_path.getsize()
+        print '%-12s %10d %10.4f %10.1f' % (net_path.namebase, size, seconds,
+                                            size / seconds / 1e6)
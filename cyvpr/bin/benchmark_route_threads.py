@@ -0,0 +1,91 @@
+'''
+Benchmark routing on several threads _(see `cRouterOpts.route_threads`)_.
+
+Each netlist is placed once, and then routed at a fixed channel width
+`repeat` times with each number of threads.  The shortest time taken by each
+number of threads is reported, along with its speedup over one thread and the
+number of nets in the levels of the routing schedule, which bounds the
+speedup, e.g.:
+
+    python -m cyvpr.bin.benchmark_route_threads \
+        cyvpr/data/4lut_sanitized.arch cyvpr/data/mcnc/alu4.net \
+        cyvpr/data/mcnc/clma.net -t 1 2 4 8
+
+__NB__ By default, each netlist is routed at the minimum channel width found
+by a binary search, plus 20%, as for the "low-stress" routing of the VPR
+benchmarks.  The routing does not depend on the number of threads, so every
+route of a netlist takes the same number of PathFinder iterations.
+'''
+from path import path
+import numpy as np
+from cyvpr.Main import cMain
+
+
+def benchmark_route_threads(net_path, arch_path, thread_counts=(1, 2, 4, 8),
+                            repeat=3, route_chan_width=None, seed=0):
+    '''
+    Return the channel width used, the `nets_per_level` of the routing
+    schedule, and an ordered list of `(route_threads, seconds)` pairs, with
+    the shortest time taken to route `net_path` over `repeat` runs with each
+    number of threads.
+    '''
+    vpr_main = cMain()
+    vpr_main.place(net_path, arch_path, 'placed.out', seed=seed)
+    if route_chan_width is None:
+        states = vpr_main.route(net_path, arch_path, 'placed.out',
+                                'routed.out')['states']
+        min_width = min(s.width_fac for s in states if s.success)
+        route_chan_width = int(round(1.2 * min_width))
+
+    times = []
+    nets_per_level = None
+    for route_threads in thread_counts:
+        seconds = []
+        for i in xrange(repeat):
+            state = vpr_main.route(net_path, arch_path, 'placed.out',
+                                   'routed.out',
+                                   route_chan_width=route_chan_width,
+                                   route_threads=route_threads)['states'][-1]
+            seconds.append((state.end - state.start).total_seconds())
+            if route_threads > 1:
+                nets_per_level = np.array(state.nets_per_level)
+        times.append((route_threads, min(seconds)))
+    vpr_main.reset()
+    return route_chan_width, nets_per_level, times
+
+
+def parse_args():
+    """Parses arguments, returns (options, args)."""
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Report the time taken to route '
+                            'each netlist with each number of threads.')
+
+    parser.add_argument(dest='arch_path', type=path)
+    parser.add_argument(nargs='+', dest='net_path', type=path)
+    parser.add_argument('-t', '--thread_counts', type=int, nargs='+',
+                        default=[1, 2, 4, 8])
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    parser.add_argument('-w', '--route_chan_width', type=int, default=None)
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    for net_path in args.net_path:
+        width, nets_per_level, times = benchmark_route_threads(
+            net_path, args.arch_path, thread_counts=args.thread_counts,
+            repeat=args.repeat, route_chan_width=args.route_chan_width,
+            seed=args.seed)
+        print '%s (channel width %d)' % (net_path.namebase, width)
+        if nets_per_level is not None:
+            print ('  %d nets in %d levels: %.1f nets per level on average, '
+                   '%d at most, %d levels of one net' %
+                   (nets_per_level.sum(), len(nets_per_level),
+                    nets_per_level.mean(), nets_per_level.max(),
+                    (nets_per_level == 1).sum()))
+        print '  %8s %10s %8s' % ('threads', 'seconds', 'speedup')
+        for route_threads, seconds in times:
+            print '  %8d %10.3f %8.2f' % (route_threads, seconds,
+                                          times[0][1] / seconds)
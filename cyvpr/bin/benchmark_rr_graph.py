@@ -0,0 +1,95 @@
+'''
+Benchmark the routing-resource graph layouts walked by the maze router.
+
+Each netlist is placed once, and the placement is then routed at a fixed
+channel width walking each rr-graph layout: the `rr_node` structures
+_(`structs`)_ or the compact arrays of `rr_csr` _(`csr`)_.  For each route,
+the number of heap insertions _(one for each neighbour expanded)_, the
+routing time and the expansion throughput are reported, e.g.:
+
+    python -m cyvpr.bin.benchmark_rr_graph cyvpr/data/4lut_sanitized.arch \
+        cyvpr/data/mcnc/*.net
+
+The routing does not depend on the layout, so the heap counts of the layouts
+are the same.
+'''
+import shutil
+import tempfile
+
+from path import path
+from cyvpr.Main import cMain, RoutingSession
+from cyvpr.Place import unix_time
+
+
+RR_GRAPH_LAYOUTS = ('structs', 'csr')
+
+
+def benchmark_rr_graph(net_path, arch_path, channel_width=None, repeat=1,
+                       rr_graph_layouts=RR_GRAPH_LAYOUTS, fast=True, seed=0,
+                       timing_driven=True):
+    '''
+    Place `net_path` once, then route the placement at `channel_width`
+    _(defaults to twice the number of pins per logic block)_ `repeat` times
+    walking each rr-graph layout.
+
+    Return a list with one `(rr_graph_layout, route_state, seconds)` tuple
+    per layout, where `seconds` is the shortest routing time over all
+    repeats.
+    '''
+    output_dir = path(tempfile.mkdtemp(prefix='benchmark-rr-graph-'))
+    try:
+        placed_path = output_dir.joinpath('placed.out')
+        vpr_main = cMain()
+        vpr_main.place(net_path, arch_path, placed_path, fast=fast, seed=seed)
+        if channel_width is None:
+            channel_width = 2 * vpr_main.pins_per_clb
+
+        results = []
+        for rr_graph_layout in rr_graph_layouts:
+            with RoutingSession(str(net_path), str(arch_path),
+                                str(placed_path), timing_driven=timing_driven,
+                                fast=fast,
+                                output_path=output_dir.joinpath('routed.out'),
+                                rr_graph_layout=rr_graph_layout) as session:
+                times = []
+                for i in xrange(repeat):
+                    state = session.route(channel_width)
+                    times.append(unix_time(state.end) -
+                                 unix_time(state.start))
+            results.append((rr_graph_layout, state, min(times)))
+    finally:
+        shutil.rmtree(output_dir)
+    return results
+
+
+def parse_args():
+    """Parses arguments, returns (options, args)."""
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Compare the routing time and '
+                            'neighbour expansion throughput of each '
+                            'rr-graph layout.')
+
+    parser.add_argument(dest='arch_path', type=path)
+    parser.add_argument(nargs='+', dest='net_path', type=path)
+    parser.add_argument('-w', '--channel_width', type=int)
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-b', '--breadth_first', action='store_true',
+                        help='Use the breadth-first router.')
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    print '%-12s %-8s %-8s %12s %10s %14s' % ('net', 'layout', 'success',
+                                             'pushes', 'seconds',
+                                             'pushes/second')
+    for net_path in args.net_path:
+        for rr_graph_layout, state, seconds in benchmark_rr_graph(
+                net_path, args.arch_path, channel_width=args.channel_width,
+                repeat=args.repeat, seed=args.seed,
+                timing_driven=not args.breadth_first):
+            print '%-12s %-8s %-8s %12d %10.3f %14.0f' % (
+                net_path.namebase, rr_graph_layout, state.success,
+                state.heap_pushes, seconds, state.heap_pushes / seconds)
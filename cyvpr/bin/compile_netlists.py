@@ -0,0 +1,78 @@
+'''
+Compile netlist files to `.netc` files, next to each netlist, which
+`cMain.init` loads instead of parsing the netlist _(unless loading compiled
+netlists is disabled, see `cyvpr.Main.set_netlist_cache_enabled`)_, e.g.:
+
+    python -m cyvpr.bin.compile_netlists cyvpr/data/mcnc
+
+Each directory argument is expanded to the `*.net` files it contains.
+
+__NB__ Parsing a netlist depends on the architecture _(e.g., the number of
+pins per clb)_, so netlists are compiled for the architecture given by
+`--arch_path` _(`4lut_sanitized.arch` from the `cyvpr` data root by
+default)_.  A compiled netlist is also loaded along with any other
+architecture that parses the netlist the same way.
+'''
+from path import path
+from cyvpr.Main import (cMain, parse_cache_info, set_parse_cache_enabled,
+                        netlist_cache_info, set_netlist_cache_write_enabled,
+                        compiled_netlist_path)
+import cyvpr
+
+
+def compile_netlist(net_path, arch_path):
+    '''
+    Compile `net_path` for the architecture `arch_path`, unless its compiled
+    netlist is already up to date.  Return `True` if the compiled netlist was
+    written.
+    '''
+    parse_cache_enabled = parse_cache_info()['enabled']
+    write_enabled = netlist_cache_info()['write_enabled']
+    # Parse the netlist _(or load its compiled netlist)_, rather than
+    # restoring it from the in-memory parse cache.
+    set_parse_cache_enabled(False)
+    set_netlist_cache_write_enabled(True)
+    try:
+        vpr_main = cMain()
+        vpr_main.init([net_path, arch_path, 'placed.out', 'routed.out',
+                       '-route_only', '-nodisp'])
+        vpr_main.reset()
+        info = netlist_cache_info()
+    finally:
+        set_parse_cache_enabled(parse_cache_enabled)
+        set_netlist_cache_write_enabled(write_enabled)
+    if not info['stores'] and not info['hits']:
+        raise IOError, ('Could not write compiled netlist: %s' %
+                        compiled_netlist_path(net_path))
+    return info['stores'] > 0
+
+
+def parse_args():
+    """Parses arguments, returns (options, args)."""
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Compile netlist files to `.netc` '
+                            'files, which are loaded instead of parsing the '
+                            'netlists.')
+
+    parser.add_argument(nargs='+', dest='net_path', type=path,
+                        help='Netlist files, or directories of netlist files.')
+    parser.add_argument('-a', '--arch_path', type=path,
+                        default=path(cyvpr.get_data_root()[0])
+                        .joinpath('4lut_sanitized.arch'))
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    net_paths = []
+    for net_path in args.net_path:
+        if net_path.isdir():
+            net_paths.extend(sorted(net_path.files('*.net')))
+        else:
+            net_paths.append(net_path)
+    for net_path in net_paths:
+        if compile_netlist(net_path, args.arch_path):
+            print 'compiled   %s' % compiled_netlist_path(net_path)
+        else:
+            print 'up to date %s' % compiled_netlist_path(net_path)
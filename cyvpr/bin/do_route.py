@@ -1,29 +1,39 @@
 import tempfile
 import hashlib
 
+import numpy as np
 from cyvpr.Main import cMain
 from cyvpr.Route import unix_time
 import tables as ts
 from path import path
-from cyvpr.manager.table_layouts import get_ROUTE_TABLE_LAYOUT
+from cyvpr.manager.table_layouts import (get_ROUTE_TABLE_LAYOUT,
+                                         get_ROUTE_TRACEBACK_TABLE_LAYOUT)
 
 
 def route(net_path, arch_path, placement_path, output_path=None,
           output_dir=None, fast=True, clbs_per_pin_factor=None,
-          channel_width=None, timing_driven=True, max_router_iterations=None):
+          channel_width=None, timing_driven=True, max_router_iterations=None,
+          block_positions=None, traceback=False):
     '''
     Perform VPR routing and write result to HDF file with the following
     structure:
 
         <net-file_namebase _(e.g., `ex5p`, `clma`, etc.)_> (Group)
             \--> `route_states` (Table)
+            \--> `route_traceback` (Table, only if `traceback` is `True`)
 
     The intention here is to structure the results such that they can be merged
     together with the results from other routings.
+
+    If `block_positions` is provided, the placement is loaded directly from
+    the block-positions array and `placement_path` is ignored.
+
+    If `traceback` is `True`, the routing of each net of each successful
+    route is also written, one row per traceback element, to the
+    `route_traceback` table _(see `get_ROUTE_TRACEBACK_TABLE_LAYOUT`)_.
     '''
     net_path = path(net_path)
     arch_path = path(arch_path)
-    placement_path = path(placement_path)
     vpr_main = cMain()
 
     routed_temp_dir = path(tempfile.mkdtemp(prefix='routed-'))
@@ -34,10 +44,20 @@ def route(net_path, arch_path, placement_path, output_path=None,
         # the output file.  Instead, the routing results and states are returned
         # from the `route` method, as an `OrderedDict` with the keys `result` and
         # `states`.
-        route_results = vpr_main.route(net_path, arch_path, placement_path,
-                                    routed_path, timing_driven=timing_driven,
-                                    fast=fast, route_chan_width=channel_width,
-                                    max_router_iterations=max_router_iterations)
+        if block_positions is not None:
+            route_results = vpr_main.route_placement(
+                net_path, arch_path, block_positions, routed_path,
+                timing_driven=timing_driven, fast=fast,
+                route_chan_width=channel_width,
+                max_router_iterations=max_router_iterations,
+                export_traceback=traceback)
+        else:
+            route_results = vpr_main.route(
+                net_path, arch_path, path(placement_path), routed_path,
+                timing_driven=timing_driven, fast=fast,
+                route_chan_width=channel_width,
+                max_router_iterations=max_router_iterations,
+                export_traceback=traceback)
     finally:
         routed_temp_dir.rmtree()
 
@@ -101,6 +121,12 @@ def route(net_path, arch_path, placement_path, output_path=None,
     route_states.cols.success.createIndex()
     route_states.cols.width_fac.createCSIndex()
 
+    if traceback:
+        route_traceback = h5f.createTable(
+            net_file_results, 'route_traceback',
+            get_ROUTE_TRACEBACK_TABLE_LAYOUT(),
+            title='Routing traceback for %s' % net_path.namebase)
+
     for i, route_state in enumerate(route_results['states']):
         state_row = route_states.row
         state_row['block_positions_sha1'] = block_positions_sha1
@@ -134,7 +160,20 @@ def route(net_path, arch_path, placement_path, output_path=None,
             state_row['net_data'][1][:] = route_state.wire_lengths[:]
             state_row['net_data'][2][:] = route_state.segments[:]
         state_row.append()
+
+        if traceback and len(route_state.trace_nodes) > 0:
+            offsets = route_state.trace_net_offsets
+            rows = np.empty(len(route_state.trace_nodes),
+                            dtype=route_traceback.dtype)
+            rows['route_index'] = i
+            rows['net_index'] = np.repeat(np.arange(len(offsets) - 1),
+                                          np.diff(offsets))
+            rows['node'] = route_state.trace_nodes
+            rows['switch'] = route_state.trace_switches
+            route_traceback.append(rows)
     route_states.flush()
+    if traceback:
+        route_traceback.flush()
 
     h5f.close()
     return route_results
@@ -152,6 +191,8 @@ def parse_args():
     parser.add_argument('-o', '--output_path', type=path)
     parser.add_argument('-D', '--output_dir', type=path)
     parser.add_argument('-m', '--max_router_iterations', type=int)
+    parser.add_argument('-T', '--traceback', action='store_true',
+                        default=False)
     mutex_group1 = parser.add_mutually_exclusive_group()
     mutex_group1.add_argument('-b', '--breadth_first', action='store_true', default=False)
     mutex_group1.add_argument('-t', '--timing_driven', action='store_true', default=True)
@@ -171,4 +212,5 @@ if __name__ == '__main__':
           fast=args.fast, clbs_per_pin_factor=args.clbs_per_pin_factor,
           channel_width=args.channel_width,
           timing_driven=(not args.breadth_first),
-          max_router_iterations=args.max_router_iterations)
+          max_router_iterations=args.max_router_iterations,
+          traceback=args.traceback)
@@ -0,0 +1,25 @@
+'''
+Convert a binary routing file, written by VPR with `-route_file_format
+binary`, to the original VPR text format.
+'''
+from path import path
+
+from cyvpr.result.route_file import RouteFile
+
+
+def parse_args():
+    """Parses arguments, returns (options, args)."""
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description='Convert a binary routing file to '
+                            'the VPR text routing format.')
+
+    parser.add_argument(dest='route_file', type=path)
+    parser.add_argument(dest='output_path', type=path)
+    args = parser.parse_args()
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    with RouteFile(args.route_file) as routing:
+        routing.write_text(args.output_path)
@@ -7,7 +7,6 @@ of block-positions for a placement within the placement HDF file.
 '''
 from path import path
 import tables as ts
-from .place import create_placement_file
 from .do_route import route
 
 
@@ -61,18 +60,10 @@ def route_from_hdf(net_file_paths, arch_path, h5f, block_positions_sha1,
         raise KeyError, ('No net-file found with name `%s`' %
                          net_file_namebase)
 
-    # Write a VPR-compatible placement output file based on the block-positions
-    # read from the HDF placements table.  This file is needed to pass into the
-    # VPR routing call.
-    placed_file = create_placement_file(net_file_path,
-                                        placement['block_positions'],
-                                        prefix="placed-")
-    try:
-        route_results = route(net_file_path, arch_path, placed_file, **kwargs)
-    finally:
-        # Remove the temporary VPR-compatible placement file we created.
-        placed_file.parent.rmtree()
-    return route_results
+    # Route using the block-positions read from the HDF placements table
+    # directly, rather than writing a VPR-compatible placement file.
+    return route(net_file_path, arch_path, None,
+                 block_positions=placement['block_positions'], **kwargs)
 
 
 def parse_args():
@@ -1,3 +1,5 @@
+from multiprocessing import Pipe, Process, cpu_count
+import select
 import types
 import sys
 
@@ -204,6 +206,157 @@ class UpperBoundBisectFinder(UpperBoundFinderBase):
         return next_value
 
 
+def _evaluate_worker(evaluate, value, connection):
+    '''
+    Evaluate `value` and send the `(result, error)` pair through `connection`.
+    '''
+    try:
+        connection.send((bool(evaluate(value)), None))
+    except Exception, exception:
+        connection.send((None, '%s: %s' % (type(exception).__name__,
+                                           exception)))
+    finally:
+        connection.close()
+
+
+class KaryLowerBoundFinder(LowerBoundFinderBase):
+    '''
+    Find the lower-bound of values for which the method `evaluate` returns
+    `True`, evaluating `k` candidate values in parallel worker processes in
+    each round.
+
+    Until a successful value has been found, each round tries the `k` values
+    `v, 2v, 4v, ...` above the most-recently-failed value `v`.  After that,
+    each round tries `k` values evenly spaced within the bracket between the
+    highest failed value and the lowest successful value, so the bracket
+    narrows by a factor of `k + 1` per round.
+
+    Since `evaluate` is assumed to be monotonic, any evaluation still running
+    once a completed evaluation has moved its value outside of the bracket is
+    irrelevant, and its worker process is terminated.  The values evaluated
+    and cancelled are recorded in `history` and `cancelled`, respectively.
+
+    __NB__ Each evaluation runs in a forked process, so `evaluate` may not
+    modify state in the calling process.
+    '''
+    def __init__(self, k=None, **kwargs):
+        self.k = k if k is not None else cpu_count()
+        if self.k < 1:
+            raise ValueError, 'k must be at least 1.'
+        self.history = []
+        self.cancelled = []
+        super(KaryLowerBoundFinder, self).__init__(**kwargs)
+
+    def _reset(self, max_iterations):
+        super(KaryLowerBoundFinder, self)._reset(max_iterations)
+        self.history = []
+        self.cancelled = []
+
+    def _relevant(self, value):
+        '''
+        Return `True` if evaluating `value` could still narrow the bracket.
+        '''
+        return self.bad < value < self.good
+
+    def _candidates(self, start_value):
+        if not self._good_found and start_value < self.good:
+            # We haven't processed a successful evaluation yet, so try
+            # successive doublings of the start-value.
+            values = [start_value * 2 ** i for i in xrange(self.k)]
+        else:
+            span = self.good - self.bad
+            values = [self.bad + span * i // (self.k + 1)
+                      for i in xrange(1, self.k + 1)]
+        return sorted(set(v for v in values if self._relevant(v)))
+
+    def _record(self, value, result):
+        self.history.append((value, result))
+        if result:
+            if not self._good_found or value < self.good:
+                self.good = value
+            self._good_found = True
+        elif value > self.bad:
+            self.bad = value
+
+    def _evaluate_round(self, values):
+        '''
+        Evaluate each of `values` in a separate worker process, updating the
+        bracket as results arrive and cancelling evaluations of any values that
+        fall outside of the updated bracket.
+        '''
+        pending = {}
+
+        try:
+            for value in values:
+                reader, writer = Pipe(duplex=False)
+                process = Process(target=_evaluate_worker,
+                                  args=(self.evaluate, value, writer))
+                process.daemon = True
+                process.start()
+                writer.close()
+                pending[value] = (process, reader)
+
+            while pending:
+                values_by_fd = dict((reader.fileno(), value)
+                                    for value, (process, reader)
+                                    in pending.iteritems())
+                ready, _, _ = select.select(values_by_fd.keys(), [], [])
+                for fd in ready:
+                    value = values_by_fd[fd]
+                    process, reader = pending.pop(value)
+                    try:
+                        result, error = reader.recv()
+                    except EOFError:
+                        result, error = None, ('worker exited with code %s' %
+                                               process.exitcode)
+                    reader.close()
+                    process.join()
+                    if error is not None:
+                        raise RuntimeError, ('Evaluation of %s failed: %s' %
+                                             (value, error))
+                    self._record(value, result)
+
+                for value in [v for v in pending if not self._relevant(v)]:
+                    process, reader = pending.pop(value)
+                    process.terminate()
+                    process.join()
+                    reader.close()
+                    self.cancelled.append(value)
+        finally:
+            for process, reader in pending.itervalues():
+                process.terminate()
+                process.join()
+                reader.close()
+
+    def _run(self, start_value, verbose=False):
+        next_value = max(start_value, 1)
+        while self.good - self.bad > 1:
+            self._iteration += 1
+            if self._iteration >= self.max_iterations:
+                raise IndexError, ('Maximum number of iterations (%d) '
+                                   'reached.' % self._iteration)
+            candidates = self._candidates(next_value)
+            if verbose:
+                print ('[bound-finder] i=%d, good=%s, bad=%s, candidates=%s' %
+                       (self._iteration, self.good, self.bad, candidates))
+            self._evaluate_round(candidates)
+            if not self._good_found:
+                next_value = max(self.bad, next_value) * 2
+        return self.good
+
+    def start(self, start_value, max_iterations=50, verbose=False):
+        '''
+        Reset the state of the current instance to prepare for a new search and
+        run rounds of parallel evaluations until the boundary is found.
+
+        __NB__ An optional number of maximum rounds may be specified.  If the
+        search takes more than the specified number of rounds before finding
+        the boundary-of-interest, an `IndexError` is raised.
+        '''
+        self._reset(max_iterations)
+        return self._run(start_value, verbose)
+
+
 class LowerBoundStepFinder(LowerBoundFinderBase):
     def __init__(self, *args, **kwargs):
         self.step = kwargs.pop('step', 1)
@@ -106,3 +106,16 @@ def get_ROUTE_TABLE_LAYOUT(net_count):
                                 ts.Float32Col(pos=8),
                                 'criticality_exp':
                                 ts.Float32Col(pos=9), }}
+
+
+def get_ROUTE_TRACEBACK_TABLE_LAYOUT():
+    '''
+    This table layout holds the routing of each net, with one row per
+    traceback element _(see `cRouteState.trace_nodes`)_.  `route_index` is
+    the row of the corresponding route state in the route-states table, and
+    the rows of each net of a route are contiguous, in traceback order.
+    '''
+    return {'route_index': ts.UInt32Col(pos=0),
+            'net_index': ts.UInt32Col(pos=1),
+            'node': ts.Int32Col(pos=2),
+            'switch': ts.Int16Col(pos=3)}
@@ -0,0 +1,122 @@
+'''
+Run independent VPR operations in a pool of worker processes.
+
+VPR stores the netlist, architecture and placement in global variables _(see
+`globals.h`)_, so operations cannot run concurrently in threads.  Instead, each
+operation is run in a separate worker process, and the results are pickled back
+to the parent process.
+'''
+from multiprocessing import Pool
+import tempfile
+
+from path import path
+from cyvpr.Main import cMain, RoutingSession
+from cyvpr.bisect import KaryLowerBoundFinder
+
+
+def place_seed(net_path, arch_path, seed, **kwargs):
+    '''
+    Perform a single VPR placement using the specified seed, returning a
+    `(seed, place_state, block_positions)` tuple.
+
+    VPR always writes the placement to a file, so a temporary directory is
+    used to keep concurrent workers from clobbering each other's output.
+    '''
+    output_dir = path(tempfile.mkdtemp(prefix='placed-'))
+    try:
+        vpr_main = cMain()
+        place_state, block_positions = vpr_main.place(
+            net_path, arch_path, output_dir.joinpath('placed.out'), seed=seed,
+            **kwargs)
+    finally:
+        output_dir.rmtree()
+    return seed, place_state, block_positions
+
+
+def _place_seed(args):
+    net_path, arch_path, seed, kwargs = args
+    return place_seed(net_path, arch_path, seed, **kwargs)
+
+
+def iter_place_many(net_path, arch_path, seeds, workers=None, **kwargs):
+    '''
+    Perform one VPR placement per seed using a pool of `workers` processes
+    _(defaults to the number of CPUs)_, yielding a `(seed, place_state,
+    block_positions)` tuple as soon as each placement finishes.
+
+    __NB__ Results are yielded in order of completion, _not_ in the order of
+    `seeds`.  Any additional keyword arguments are passed to `cMain.place`.
+    '''
+    pool = Pool(processes=workers)
+    try:
+        jobs = [(str(net_path), str(arch_path), seed, kwargs)
+                for seed in seeds]
+        for result in pool.imap_unordered(_place_seed, jobs):
+            yield result
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def place_many(net_path, arch_path, seeds, workers=None, stream=False,
+               **kwargs):
+    '''
+    Perform one VPR placement per seed using a pool of `workers` processes
+    _(defaults to the number of CPUs)_.
+
+    Return a list of `(place_state, block_positions)` pairs, in the same order
+    as `seeds`.  If `stream` is `True`, return an iterator over `(seed,
+    place_state, block_positions)` tuples instead, in order of completion
+    _(see `iter_place_many`)_.
+
+    Any additional keyword arguments _(e.g., `fast`, `place_algorithm`)_ are
+    passed to `cMain.place`.
+    '''
+    seeds = list(seeds)
+    results = iter_place_many(net_path, arch_path, seeds, workers=workers,
+                              **kwargs)
+    if stream:
+        return results
+    results_by_seed = dict((seed, (place_state, block_positions))
+                           for seed, place_state, block_positions in results)
+    return [results_by_seed[seed] for seed in seeds]
+
+
+def min_channel_width(net_path, arch_path, placed_path, k=None,
+                      start_width=None, max_width=None, verbose=False,
+                      **kwargs):
+    '''
+    Find the minimum channel width that routes the specified placement, using
+    a speculative k-ary search that tries `k` channel widths at a time
+    _(defaults to the number of CPUs)_.  See `KaryLowerBoundFinder` for
+    details.
+
+    The netlist, architecture and placement are loaded once, in a
+    `RoutingSession` in this process.  Each routing attempt runs in a forked
+    worker process, which inherits the loaded state, so no input files are
+    parsed again during the search.
+
+    By default, the search starts at a channel width of twice the number of
+    pins per logic block, as in VPR's own binary search.  If `max_width` is
+    provided, it is assumed to be routable.  Any additional keyword arguments
+    _(e.g., `fast`, `timing_driven`)_ are passed to `RoutingSession`.
+
+    Return a `(channel_width, finder)` tuple, where `finder` holds the history
+    of evaluated and cancelled channel widths.
+    '''
+    finder_kwargs = {}
+    if max_width is not None:
+        finder_kwargs['known_good'] = max_width
+
+    with RoutingSession(str(net_path), str(arch_path), str(placed_path),
+                        **kwargs) as session:
+        if start_width is None:
+            start_width = 2 * session.vpr_main.pins_per_clb
+        finder = KaryLowerBoundFinder(
+            k=k, evaluate=lambda width: session.route(width).success,
+            **finder_kwargs)
+        channel_width = finder.start(start_width, verbose=verbose)
+    return channel_width, finder
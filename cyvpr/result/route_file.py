@@ -0,0 +1,214 @@
+'''
+# Binary routing files #
+
+Read the binary routing files written by VPR with `-route_file_format binary`
+_(e.g., `cMain.route(..., route_file_format='binary')`)_, which are much
+faster to write than the original text format.  For example:
+
+    with RouteFile('routed.bin') as routing:
+        for i in xrange(len(routing)):
+            net = routing.net(i)
+            if not net.is_global:
+                print net.name, net.nodes['inode']
+
+        # Rewrite the routing in the original VPR text format.
+        routing.write_text('routed.out')
+
+The file is memory-mapped, and the node records are Numpy record arrays
+viewing the mapping, so only the nets that are read are decoded.  See
+`src/route_file.h` for the layout of the file.
+'''
+from collections import namedtuple
+import mmap
+
+import numpy as np
+
+
+MAGIC = 'CYVPRRTE'
+VERSION = 1
+HEADER_DTYPE = np.dtype([('magic', 'S8'), ('version', np.int32),
+                         ('nx', np.int32), ('ny', np.int32),
+                         ('num_nets', np.int32), ('num_nodes', np.int32),
+                         ('padding', np.int32),
+                         ('net_data_size', np.int64)])
+NODE_DTYPE = np.dtype([('inode', np.int32), ('xlow', np.int16),
+                       ('xhigh', np.int16), ('ylow', np.int16),
+                       ('yhigh', np.int16), ('ptc_num', np.int16),
+                       ('type', np.int8), ('is_pad', np.int8)])
+RR_TYPE_NAMES = ('SOURCE', 'SINK', 'IPIN', 'OPIN', 'CHANX', 'CHANY')
+SOURCE, SINK, IPIN, OPIN, CHANX, CHANY = range(len(RR_TYPE_NAMES))
+
+# `nodes` holds the node record of each traceback element of a routed net,
+# and `pins` holds a `GlobalPin` for each pin of a global net.
+Net = namedtuple('Net', 'name is_global nodes pins')
+GlobalPin = namedtuple('GlobalPin', 'block_name block_index x y pin_class')
+
+
+def aligned(size):
+    return (size + 7) & ~7
+
+
+def read_varint(data, offset):
+    '''
+    Return the unsigned varint at `offset` in `data`, along with the offset
+    of the byte following it.
+    '''
+    value = 0
+    shift = 0
+    while True:
+        byte = ord(data[offset])
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def zigzag_decode(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def decode_varints(data):
+    '''
+    Return an array of the unsigned varints packed in the `uint8` array
+    `data`.
+    '''
+    data = np.asarray(data, dtype=np.uint8)
+    if len(data) == 0:
+        return np.empty(0, dtype=np.int64)
+    ends = np.flatnonzero(data < 0x80)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+
+    # Shift the bits of each byte by its position within its varint.
+    shifts = np.arange(len(data)) - np.repeat(starts, ends - starts + 1)
+    values = (data & 0x7f).astype(np.int64) << (7 * shifts)
+    return np.add.reduceat(values, starts)
+
+
+class RouteFile(object):
+    def __init__(self, route_path):
+        with open(route_path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        offset = aligned(HEADER_DTYPE.itemsize)
+        if len(self._data) < offset:
+            raise ValueError, 'Not a binary routing file: %s' % route_path
+        self.header = np.frombuffer(self._data, dtype=HEADER_DTYPE,
+                                    count=1).copy()[0]
+        if self.header['magic'] != MAGIC:
+            raise ValueError, 'Not a binary routing file: %s' % route_path
+        elif self.header['version'] != VERSION:
+            raise ValueError, ('Unsupported binary routing file version: %d'
+                               % self.header['version'])
+
+        num_nets = self.header['num_nets']
+        num_nodes = self.header['num_nodes']
+        self.nodes = np.frombuffer(self._data, dtype=NODE_DTYPE,
+                                   count=num_nodes, offset=offset)
+        offset += aligned(num_nodes * NODE_DTYPE.itemsize)
+        self.net_offsets = np.frombuffer(self._data, dtype=np.int64,
+                                         count=num_nets + 1, offset=offset)
+        offset += aligned((num_nets + 1) * 8)
+        self._net_data_offset = offset
+        if (len(self._data) != offset +
+                aligned(self.header['net_data_size'])):
+            raise ValueError, 'Truncated binary routing file: %s' % route_path
+
+    @property
+    def nx(self):
+        return int(self.header['nx'])
+
+    @property
+    def ny(self):
+        return int(self.header['ny'])
+
+    def __len__(self):
+        return int(self.header['num_nets'])
+
+    def net(self, inet):
+        '''
+        Return the `Net` at index `inet`.
+        '''
+        if inet < 0 or inet >= len(self):
+            raise IndexError, 'Net index out of range: %d' % inet
+        data = self._data
+        offset = self._net_data_offset + int(self.net_offsets[inet])
+
+        length, offset = read_varint(data, offset)
+        name = data[offset:offset + length]
+        offset += length
+        is_global, offset = read_varint(data, offset)
+
+        if not is_global:
+            size, offset = read_varint(data, offset)
+            deltas = zigzag_decode(decode_varints(
+                np.frombuffer(data, dtype=np.uint8, count=size,
+                              offset=offset)))
+            return Net(name, False, self.nodes[np.cumsum(deltas)], [])
+
+        num_pins, offset = read_varint(data, offset)
+        pins = []
+        for i in xrange(num_pins):
+            length, offset = read_varint(data, offset)
+            block_name = data[offset:offset + length]
+            offset += length
+            values = []
+            for j in xrange(4):
+                value, offset = read_varint(data, offset)
+                values.append(value)
+            block_index, x, y, pin_class = values
+            pins.append(GlobalPin(block_name, block_index, x, y,
+                                  zigzag_decode(pin_class)))
+        return Net(name, True, np.empty(0, dtype=NODE_DTYPE), pins)
+
+    def write_text(self, output):
+        '''
+        Write the routing to `output` _(a path or file object)_ in the text
+        format written by VPR with `-route_file_format text`.
+        '''
+        if isinstance(output, basestring):
+            with open(output, 'wb') as f:
+                return self.write_text(f)
+
+        output.write('Array size: %d x %d logic blocks.\n' % (self.nx,
+                                                              self.ny))
+        output.write('\nRouting:')
+        for inet in xrange(len(self)):
+            net = self.net(inet)
+            if net.is_global:
+                output.write('\n\nNet %d (%s): global net connecting:\n\n' %
+                             (inet, net.name))
+                for pin in net.pins:
+                    output.write('Block %s (#%d) at (%d, %d), Pin class %d.\n'
+                                 % pin)
+                continue
+
+            output.write('\n\nNet %d (%s)\n\n' % (inet, net.name))
+            for (inode, xlow, xhigh, ylow, yhigh, ptc_num, rr_type,
+                 is_pad) in net.nodes.tolist():
+                line = '%6s (%d,%d) ' % (RR_TYPE_NAMES[rr_type], xlow, ylow)
+                if xlow != xhigh or ylow != yhigh:
+                    line += 'to (%d,%d) ' % (xhigh, yhigh)
+                if rr_type in (CHANX, CHANY):
+                    line += ' Track: '
+                elif is_pad:
+                    line += ' Pad: '
+                elif rr_type in (IPIN, OPIN):
+                    line += ' Pin: '
+                else:
+                    line += ' Class: '
+                output.write('%s%d  \n' % (line, ptc_num))
+
+    def close(self):
+        # Drop the arrays viewing the mapping before closing it.
+        self.nodes = None
+        self.net_offsets = None
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
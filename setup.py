@@ -12,7 +12,7 @@ sys.path += include_dirs
 cy_config = dict(include_dirs=include_dirs, language='c++',
                  extra_compile_args=['-O3', '-Wfatal-errors', ],
                                      #'-DIGNORE_PRINTF'],
-                 libraries=['X11', 'm', 'rt'])
+                 libraries=['X11', 'm', 'rt', 'pthread'])
 c_files = map(str, path('src').abspath().files('*.c'))
 cpp_files = map(str, path('src').abspath().files('*.cpp'))
 vpr_ext = Extension('cyvpr.Main',  ['cyvpr/Main.pyx'] + c_files + cpp_files,
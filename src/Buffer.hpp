@@ -5,6 +5,7 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include "VprError.hpp"
 
 
 class BufferBase {
@@ -15,6 +16,9 @@ public:
     size_t linenum_;
 
     BufferBase() : continue_(0), tokens_(NULL), linenum_(0) {}
+    /* Buffers are deleted through `BufferBase` pointers, e.g., so that a
+     * `FileBuffer` closes its file. */
+    virtual ~BufferBase() {}
 
     virtual char *get_string(int max_size) = 0;
 
@@ -39,12 +43,11 @@ public:
            if (this->buffer_[i] == '\n')
               break;
            if (this->buffer_[i] == '\0') {
-              printf("Error on line %d -- line is too long for input buffer.\n",
-                 this->linenum_);
-              printf("All lines must be at most %d characters long.\n",
-                     BUFSIZE - 2);
-              printf("The problem could also be caused by a missing newline.\n");
-              exit (1);
+              throw ParseError (Formatter () << "Error on line "
+                    << this->linenum_ << " -- line is too long for input "
+                    "buffer.  All lines must be at most " << BUFSIZE - 2
+                    << " characters long.  The problem could also be caused "
+                    "by a missing newline.");
            }
         }
 
@@ -0,0 +1,152 @@
+#ifndef ___FILE_MD5_CACHE__HPP___
+#define ___FILE_MD5_CACHE__HPP___
+
+#include <fstream>
+#include <map>
+#include <sstream>
+#include <string>
+#include <stdio.h>
+#include <sys/stat.h>
+#include <sys/types.h>
+#include <unistd.h>
+#include "md5.hpp"
+
+using std::string;
+
+
+/*
+ * # File MD5 cache #
+ *
+ * Cache of the MD5 hash of the contents of each file, keyed by path.  A
+ * cached hash is only used if the size, modification time _(in
+ * nanoseconds)_ and inode of the file are unchanged since the hash was
+ * computed.
+ *
+ * If a cache file-path is set, the cache is loaded from that file, and the
+ * file is rewritten each time a new hash is computed.  Each line of the cache
+ * file holds the tab-separated fields:
+ *
+ *     path, size, mtime_ns, inode, md5
+ */
+class FileMd5Cache {
+public:
+    struct Entry {
+        long long size;
+        long long mtime_ns;
+        long long inode;
+        string md5;
+
+        bool matches(Entry const &other) const {
+            return (this->size == other.size &&
+                    this->mtime_ns == other.mtime_ns &&
+                    this->inode == other.inode);
+        }
+    };
+
+    std::map<string, Entry> entries_;
+    string cache_path_;
+    size_t hits_;
+    size_t misses_;
+
+    FileMd5Cache() : hits_(0), misses_(0) {}
+
+    static bool stat_entry(string const &path, Entry &entry) {
+        struct stat info;
+
+        if (stat(path.c_str(), &info) != 0 || !S_ISREG(info.st_mode)) {
+            return false;
+        }
+        entry.size = info.st_size;
+        entry.mtime_ns = (long long)info.st_mtim.tv_sec * 1000000000LL +
+            info.st_mtim.tv_nsec;
+        entry.inode = info.st_ino;
+        return true;
+    }
+
+    string hexdigest(string const &path) {
+        /* Return the MD5 hash of the contents of the file at `path`, or an
+         * empty string if there is no regular file at `path`. */
+        Entry entry;
+
+        if (!stat_entry(path, entry)) { return ""; }
+
+        std::map<string, Entry>::const_iterator cached = entries_.find(path);
+        if (cached != entries_.end() && cached->second.matches(entry)) {
+            this->hits_++;
+            return cached->second.md5;
+        }
+        this->misses_++;
+
+        std::ifstream infile(path.c_str());
+        entry.md5 = MD5(infile).hexdigest();
+        infile.close();
+        entries_[path] = entry;
+
+        if (!this->cache_path_.empty()) { this->save(); }
+        return entry.md5;
+    }
+
+    size_t size() const { return this->entries_.size(); }
+
+    void clear() {
+        this->entries_.clear();
+        this->hits_ = 0;
+        this->misses_ = 0;
+    }
+
+    void set_cache_path(string const &cache_path) {
+        /* Set the path of the on-disk cache _(or disable the on-disk cache,
+         * if `cache_path` is empty)_, loading any entries already stored. */
+        this->cache_path_ = cache_path;
+        if (!this->cache_path_.empty()) { this->load(false); }
+    }
+
+    void load(bool keep_existing) {
+        /* Load entries from the on-disk cache.  If `keep_existing` is `true`,
+         * entries already in memory take precedence. */
+        std::ifstream infile(this->cache_path_.c_str());
+        string line;
+
+        while (std::getline(infile, line)) {
+            std::istringstream fields(line);
+            string path;
+            Entry entry;
+
+            if (!std::getline(fields, path, '\t')) { continue; }
+            if (!(fields >> entry.size >> entry.mtime_ns >> entry.inode
+                  >> entry.md5)) {
+                continue;
+            }
+            if (keep_existing && entries_.count(path)) { continue; }
+            entries_[path] = entry;
+        }
+    }
+
+    void save() {
+        /* Write all entries to the on-disk cache, merging in any entries
+         * written by other processes in the meantime.  The cache file is
+         * replaced atomically, so concurrent readers never see a partially
+         * written file. */
+        std::ostringstream temp_path;
+
+        this->load(true);
+        temp_path << this->cache_path_ << ".tmp" << getpid();
+        {
+            std::ofstream outfile(temp_path.str().c_str());
+            std::map<string, Entry>::const_iterator i = entries_.begin();
+
+            for (; i != entries_.end(); i++) {
+                outfile << i->first << "\t" << i->second.size << "\t"
+                    << i->second.mtime_ns << "\t" << i->second.inode << "\t"
+                    << i->second.md5 << "\n";
+            }
+            if (!outfile) {
+                remove(temp_path.str().c_str());
+                return;
+            }
+        }
+        rename(temp_path.str().c_str(), this->cache_path_.c_str());
+    }
+};
+
+#endif
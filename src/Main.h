@@ -9,13 +9,17 @@
 
 int __main__ (int argc, char *argv[]);
 std::vector<std::vector<unsigned int> > extract_block_positions();
+void extract_block_positions(unsigned int *block_positions);
 
 
 class Main {
 protected:
     void attach_signals();
     void reset_buffer();
+    void free_input();
     void extract_arg_strings();
+    void do_place_and_route(BufferBase *buffer,
+                            const unsigned int *block_positions);
 public:
     int argc_;
     char **argv_;
@@ -45,11 +49,24 @@ public:
     std::map<std::string, std::string> filepath_;
     /* The MD5 hash of each file-path in the `g_filepath` map. */
     std::map<std::string, std::string> file_md5_;
+    /* Routing structures that do not depend on the channel width.  These are
+     * only allocated while a routing session is open _(see
+     * `begin_route_session`)_, so that they may be reused across calls to
+     * `route`. */
+    bool route_session_open_;
+    t_ivec **clb_opins_used_locally_;
+    float **net_slack_;
+    float **net_delay_;
+    struct s_linked_vptr *net_delay_chunk_list_head_;
 
-    Main() : buffer_(NULL) {
+    Main() : segment_inf_(NULL), timing_inf_(), subblock_data_(),
+             buffer_(NULL), route_session_open_(false) {
         attach_signals();
     }
-    Main(int argc, char **argv) : argc_(argc), argv_(argv), buffer_(NULL) {
+    Main(int argc, char **argv) : argc_(argc), argv_(argv),
+                                  segment_inf_(NULL), timing_inf_(),
+                                  subblock_data_(), buffer_(NULL),
+                                  route_session_open_(false) {
         attach_signals();
     }
 
@@ -61,8 +78,12 @@ public:
     void init();
     void initialize_graphics();
     void do_place_and_route();
+    void do_place_and_route(const unsigned int *block_positions);
     bool route(int width_fac);
+    void begin_route_session();
+    void end_route_session();
     void do_read_place();
+    void reset();
     ~Main();
 };
 
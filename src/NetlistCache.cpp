@@ -0,0 +1,488 @@
+#include <sstream>
+#include <vector>
+#include <stdio.h>
+#include <string.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#include "util.h"
+#include "vpr_types.h"
+#include "globals.h"
+#include "read_netlist.h"
+#include "NetlistCache.hpp"
+
+
+#define NETLIST_CACHE_MAGIC "CYVPRNET"
+#define NETLIST_CACHE_VERSION 1
+
+/* Packed arrays following the header, in file order. */
+
+enum e_netlist_section {PIN_TYPES = 0, PIN_IS_GLOBAL, NET_PIN_START,
+      NET_BLOCKS, NET_BLK_PINS, NET_NAMES, NET_IS_GLOBAL, BLOCK_NAMES,
+      BLOCK_TYPES, BLOCK_NETS, NUM_SUBBLOCKS, SUBBLOCK_NAMES, SUBBLOCK_PINS,
+      STRING_POOL, NUM_NETLIST_SECTIONS};
+
+static size_t aligned (size_t size);
+static size_t get_section_offsets (NetlistCache::Header const &header,
+      size_t *offsets);
+static bool valid_header_counts (NetlistCache::Header const &header);
+static bool valid_string (char const *strings, int string_pool_size,
+      int offset);
+static bool valid_sections (NetlistCache::Header const &header,
+      char const *data, size_t const *offsets);
+static int add_string (string &pool, char const *value);
+static void write_aligned (FILE *fp, void const *data, size_t size);
+
+
+/************************* Subroutine Definitions ****************************/
+
+static size_t aligned (size_t size) {
+
+/* Rounds size up to the next multiple of 8 bytes. */
+
+ return ((size + 7) & ~((size_t) 7));
+}
+
+
+static size_t get_section_offsets (NetlistCache::Header const &header,
+      size_t *offsets) {
+
+/* Loads offsets[0..NUM_NETLIST_SECTIONS-1] with the file offset of each   *
+ * section described by header, and returns the size of the whole file.   */
+
+ size_t sizes[NUM_NETLIST_SECTIONS], offset;
+ int i;
+
+ sizes[PIN_TYPES] = header.pins_per_clb * sizeof (char);
+ sizes[PIN_IS_GLOBAL] = header.pins_per_clb * sizeof (char);
+ sizes[NET_PIN_START] = (header.num_nets + 1) * sizeof (int);
+ sizes[NET_BLOCKS] = header.num_net_pins * sizeof (int);
+ sizes[NET_BLK_PINS] = header.num_net_pins * sizeof (int);
+ sizes[NET_NAMES] = header.num_nets * sizeof (int);
+ sizes[NET_IS_GLOBAL] = header.num_nets * sizeof (char);
+ sizes[BLOCK_NAMES] = header.num_blocks * sizeof (int);
+ sizes[BLOCK_TYPES] = header.num_blocks * sizeof (int);
+ sizes[BLOCK_NETS] = (size_t) header.num_blocks * header.pins_per_clb *
+       sizeof (int);
+ sizes[NUM_SUBBLOCKS] = header.num_blocks * sizeof (int);
+ sizes[SUBBLOCK_NAMES] = header.num_subblocks * sizeof (int);
+ sizes[SUBBLOCK_PINS] = (size_t) header.num_subblocks *
+       (header.subblock_lut_size + 2) * sizeof (int);
+ sizes[STRING_POOL] = header.string_pool_size * sizeof (char);
+
+ offset = aligned (sizeof (NetlistCache::Header));
+ for (i=0;i<NUM_NETLIST_SECTIONS;i++) {
+    offsets[i] = offset;
+    offset += aligned (sizes[i]);
+ }
+ return (offset);
+}
+
+
+static bool valid_header_counts (NetlistCache::Header const &header) {
+
+/* Returns true if none of the counts in header is negative, so that the *
+ * section sizes computed by get_section_offsets cannot overflow.        */
+
+ return (header.pins_per_clb >= 0 && header.subblock_lut_size >= 0 &&
+       header.max_subblocks_per_block >= 0 && header.num_nets >= 0 &&
+       header.num_blocks >= 0 && header.num_net_pins >= 0 &&
+       header.num_subblocks >= 0 && header.string_pool_size >= 0);
+}
+
+
+static bool valid_string (char const *strings, int string_pool_size,
+      int offset) {
+
+/* Returns true if offset is within the string pool and the string at that *
+ * offset is NUL-terminated within the pool.                               */
+
+ if (offset < 0 || offset >= string_pool_size)
+    return (false);
+ return (memchr (strings + offset, '\0', string_pool_size - offset) != NULL);
+}
+
+
+static bool valid_sections (NetlistCache::Header const &header,
+      char const *data, size_t const *offsets) {
+
+/* Returns true if the pin ranges, string offsets and subblock counts in   *
+ * the sections of a compiled netlist all lie within their sections, so    *
+ * that loading it cannot read past the end of the file.                   */
+
+ int i, total_subblocks;
+ int const *net_pin_start, *net_names, *block_names, *num_subblocks;
+ int const *subblock_names;
+ char const *strings;
+
+ net_pin_start = (int const *) (data + offsets[NET_PIN_START]);
+ net_names = (int const *) (data + offsets[NET_NAMES]);
+ block_names = (int const *) (data + offsets[BLOCK_NAMES]);
+ num_subblocks = (int const *) (data + offsets[NUM_SUBBLOCKS]);
+ subblock_names = (int const *) (data + offsets[SUBBLOCK_NAMES]);
+ strings = data + offsets[STRING_POOL];
+
+ if (net_pin_start[0] != 0 ||
+       net_pin_start[header.num_nets] != header.num_net_pins)
+    return (false);
+ for (i=0;i<header.num_nets;i++) {
+    if (net_pin_start[i+1] < net_pin_start[i] ||
+          !valid_string (strings, header.string_pool_size, net_names[i]))
+       return (false);
+ }
+
+ total_subblocks = 0;
+ for (i=0;i<header.num_blocks;i++) {
+    if (!valid_string (strings, header.string_pool_size, block_names[i]) ||
+          num_subblocks[i] < 0 ||
+          num_subblocks[i] > header.max_subblocks_per_block)
+       return (false);
+    total_subblocks += num_subblocks[i];
+ }
+ if (total_subblocks != header.num_subblocks)
+    return (false);
+
+ for (i=0;i<header.num_subblocks;i++) {
+    if (!valid_string (strings, header.string_pool_size, subblock_names[i]))
+       return (false);
+ }
+ return (true);
+}
+
+
+static int add_string (string &pool, char const *value) {
+
+/* Appends value (with its NUL) to the string pool, returning its offset. */
+
+ int offset;
+
+ offset = pool.size();
+ pool.append (value, strlen (value) + 1);
+ return (offset);
+}
+
+
+static void write_aligned (FILE *fp, void const *data, size_t size) {
+
+/* Writes size bytes of data, padded with zeros to a multiple of 8 bytes. */
+
+ static const char padding[8] = {0};
+
+ if (size > 0)
+    fwrite (data, 1, size, fp);
+ fwrite (padding, 1, aligned (size) - size, fp);
+}
+
+
+string NetlistCache::path(string const &net_file) {
+
+/* Returns the path of the compiled netlist for net_file. */
+
+ size_t length;
+
+ length = net_file.size();
+ if (length >= 4 && net_file.compare(length - 4, 4, ".net") == 0)
+    return (net_file + "c");
+ return (net_file + ".netc");
+}
+
+
+bool NetlistCache::load(string const &net_file,
+                        t_subblock_data *subblock_data_ptr) {
+
+/* Loads the net and block arrays and the subblock data (allocated the same *
+ * way read_net allocates them) from the compiled netlist for net_file, if  *
+ * it exists and was compiled from the current contents of net_file for a   *
+ * compatible architecture.  Returns false, leaving the netlist unloaded,   *
+ * otherwise, in which case the caller should parse net_file.  read_arch    *
+ * must have been called first.                                             */
+
+ int i, j, k, lut_size, *block_nets_ptr, subblock_bytes_avail;
+ size_t offsets[NUM_NETLIST_SECTIONS], file_size;
+ struct stat info;
+ char *data, *subblock_next_avail_mem;
+ FILE *fp;
+ Header header;
+ char const *pin_types, *pin_is_global, *net_is_global, *strings;
+ int const *net_pin_start, *net_blocks, *net_blk_pins, *net_names;
+ int const *block_names, *block_types, *block_nets, *num_subblocks;
+ int const *subblock_names, *subblock_pins;
+ t_subblock *subblock;
+
+ if (!this->enabled()) { return false; }
+
+ fp = fopen (NetlistCache::path(net_file).c_str(), "rb");
+ if (fp == NULL) {
+    this->misses_++;
+    return false;
+ }
+ if (fstat (fileno (fp), &info) != 0 ||
+       (size_t) info.st_size < aligned (sizeof (Header))) {
+    fclose (fp);
+    this->misses_++;
+    return false;
+ }
+
+/* Read the whole file at once. */
+
+ file_size = info.st_size;
+ data = (char *) my_malloc (file_size);
+ if (fread (data, 1, file_size, fp) != file_size) {
+    fclose (fp);
+    free (data);
+    this->misses_++;
+    return false;
+ }
+ fclose (fp);
+
+/* Check that the file was compiled by this build, from this netlist, for *
+ * an architecture that parses it the same way as this one, and that its   *
+ * sections are consistent, so a truncated or corrupt file is a miss.      */
+
+ memcpy (&header, data, sizeof (Header));
+ if (strncmp (header.magic, NETLIST_CACHE_MAGIC, 8) != 0 ||
+       header.version != NETLIST_CACHE_VERSION ||
+       this->net_md5_.compare(0, 32, header.net_md5, 32) != 0 ||
+       header.pins_per_clb != ::pins_per_clb ||
+       header.subblock_lut_size != subblock_data_ptr->subblock_lut_size ||
+       header.max_subblocks_per_block !=
+          subblock_data_ptr->max_subblocks_per_block ||
+       !valid_header_counts (header) ||
+       file_size != get_section_offsets (header, offsets) ||
+       !valid_sections (header, data, offsets)) {
+    free (data);
+    this->misses_++;
+    return false;
+ }
+
+ pin_types = data + offsets[PIN_TYPES];
+ pin_is_global = data + offsets[PIN_IS_GLOBAL];
+ for (i=0;i<::pins_per_clb;i++) {
+    if (pin_types[i] != class_inf[clb_pin_class[i]].type ||
+          pin_is_global[i] != is_global_clb_pin[i]) {
+       free (data);
+       this->misses_++;
+       return false;
+    }
+ }
+
+ net_pin_start = (int const *) (data + offsets[NET_PIN_START]);
+ net_blocks = (int const *) (data + offsets[NET_BLOCKS]);
+ net_blk_pins = (int const *) (data + offsets[NET_BLK_PINS]);
+ net_names = (int const *) (data + offsets[NET_NAMES]);
+ net_is_global = data + offsets[NET_IS_GLOBAL];
+ block_names = (int const *) (data + offsets[BLOCK_NAMES]);
+ block_types = (int const *) (data + offsets[BLOCK_TYPES]);
+ block_nets = (int const *) (data + offsets[BLOCK_NETS]);
+ num_subblocks = (int const *) (data + offsets[NUM_SUBBLOCKS]);
+ subblock_names = (int const *) (data + offsets[SUBBLOCK_NAMES]);
+ subblock_pins = (int const *) (data + offsets[SUBBLOCK_PINS]);
+ strings = data + offsets[STRING_POOL];
+
+ ::num_nets = header.num_nets;
+ ::num_blocks = header.num_blocks;
+ ::num_p_inputs = header.num_p_inputs;
+ ::num_p_outputs = header.num_p_outputs;
+ ::num_clbs = header.num_clbs;
+ ::num_globals = header.num_globals;
+
+/* Like read_net, allocate the small net and block allocations as netlist *
+ * storage, so that free_netlist releases them.                            */
+
+ ::net = (struct s_net *) my_malloc (::num_nets * sizeof (struct s_net));
+ ::is_global = (boolean *) my_malloc (::num_nets * sizeof (boolean));
+ for (i=0;i<::num_nets;i++) {
+    ::net[i].num_pins = net_pin_start[i+1] - net_pin_start[i];
+    ::net[i].name = (char *) alloc_netlist_storage ((strlen (strings +
+          net_names[i]) + 1) * sizeof (char));
+    strcpy (::net[i].name, strings + net_names[i]);
+    ::net[i].blocks = (int *) alloc_netlist_storage (::net[i].num_pins *
+          sizeof (int));
+    ::net[i].blk_pin = (int *) alloc_netlist_storage (::net[i].num_pins *
+          sizeof (int));
+    memcpy (::net[i].blocks, net_blocks + net_pin_start[i],
+          ::net[i].num_pins * sizeof (int));
+    memcpy (::net[i].blk_pin, net_blk_pins + net_pin_start[i],
+          ::net[i].num_pins * sizeof (int));
+    ::is_global[i] = net_is_global[i] ? TRUE : FALSE;
+ }
+
+ ::block = (struct s_block *) my_malloc (::num_blocks *
+                                         sizeof (struct s_block));
+ block_nets_ptr = (int *) my_malloc (::pins_per_clb * ::num_blocks *
+                                     sizeof (int));
+ memcpy (block_nets_ptr, block_nets, ::pins_per_clb * ::num_blocks *
+       sizeof (int));
+ for (i=0;i<::num_blocks;i++) {
+    ::block[i].name = (char *) alloc_netlist_storage ((strlen (strings +
+          block_names[i]) + 1) * sizeof (char));
+    strcpy (::block[i].name, strings + block_names[i]);
+    ::block[i].type = (enum e_block_types) block_types[i];
+    ::block[i].nets = block_nets_ptr + i * ::pins_per_clb;
+    ::block[i].x = OPEN;
+    ::block[i].y = OPEN;
+ }
+
+/* Subblock storage is chunked on subblock_data.chunk_head_ptr, so that it *
+ * can be released by free_subblock_data.                                  */
+
+ subblock_data_ptr->num_ff = header.num_ff;
+ subblock_data_ptr->num_const_gen = header.num_const_gen;
+ subblock_data_ptr->chunk_head_ptr = NULL;
+ subblock_bytes_avail = 0;
+ subblock_next_avail_mem = NULL;
+ lut_size = header.subblock_lut_size;
+
+ subblock_data_ptr->num_subblocks_per_block = (int *) my_malloc (
+       ::num_blocks * sizeof (int));
+ subblock_data_ptr->subblock_inf = (t_subblock **) my_malloc (::num_blocks *
+       sizeof (t_subblock *));
+
+ k = 0;   /* Subblock index over all blocks. */
+ for (i=0;i<::num_blocks;i++) {
+    subblock_data_ptr->num_subblocks_per_block[i] = num_subblocks[i];
+    if (num_subblocks[i] == 0) {
+       subblock_data_ptr->subblock_inf[i] = NULL;
+       continue;
+    }
+    subblock_data_ptr->subblock_inf[i] = (t_subblock *) my_chunk_malloc (
+          num_subblocks[i] * sizeof (t_subblock),
+          &subblock_data_ptr->chunk_head_ptr, &subblock_bytes_avail,
+          &subblock_next_avail_mem);
+    for (j=0;j<num_subblocks[i];j++, k++) {
+       subblock = &subblock_data_ptr->subblock_inf[i][j];
+       subblock->name = (char *) my_chunk_malloc ((strlen (strings +
+             subblock_names[k]) + 1) * sizeof (char),
+             &subblock_data_ptr->chunk_head_ptr, &subblock_bytes_avail,
+             &subblock_next_avail_mem);
+       strcpy (subblock->name, strings + subblock_names[k]);
+       subblock->inputs = (int *) my_chunk_malloc (lut_size * sizeof (int),
+             &subblock_data_ptr->chunk_head_ptr, &subblock_bytes_avail,
+             &subblock_next_avail_mem);
+       memcpy (subblock->inputs, subblock_pins + k * (lut_size + 2),
+             lut_size * sizeof (int));
+       subblock->output = subblock_pins[k * (lut_size + 2) + lut_size];
+       subblock->clock = subblock_pins[k * (lut_size + 2) + lut_size + 1];
+    }
+ }
+
+ free (data);
+ this->hits_++;
+ return true;
+}
+
+
+bool NetlistCache::save(string const &net_file,
+                        t_subblock_data const &subblock_data) {
+
+/* Writes the netlist just loaded by read_net to the compiled netlist for *
+ * net_file.  The file is replaced atomically, so concurrent processes     *
+ * never load a partially written netlist.  Returns true if the file was   *
+ * written.                                                                */
+
+ int i, j, k, lut_size;
+ Header header;
+ FILE *fp;
+ string path, temp_path, pool;
+ std::ostringstream temp_path_stream;
+ std::vector<char> pin_types, pin_is_global, net_is_global;
+ std::vector<int> net_pin_start, net_blocks, net_blk_pins, net_names;
+ std::vector<int> block_names, block_types, subblock_names, subblock_pins;
+ bool success;
+
+ if (!this->write_enabled()) { return false; }
+
+ lut_size = subblock_data.subblock_lut_size;
+
+ for (i=0;i<::pins_per_clb;i++) {
+    pin_types.push_back (class_inf[clb_pin_class[i]].type);
+    pin_is_global.push_back (is_global_clb_pin[i]);
+ }
+
+ for (i=0;i<::num_nets;i++) {
+    net_pin_start.push_back (net_blocks.size());
+    net_blocks.insert (net_blocks.end(), ::net[i].blocks, ::net[i].blocks +
+          ::net[i].num_pins);
+    net_blk_pins.insert (net_blk_pins.end(), ::net[i].blk_pin,
+          ::net[i].blk_pin + ::net[i].num_pins);
+    net_names.push_back (add_string (pool, ::net[i].name));
+    net_is_global.push_back (::is_global[i]);
+ }
+ net_pin_start.push_back (net_blocks.size());
+
+ for (i=0;i<::num_blocks;i++) {
+    block_names.push_back (add_string (pool, ::block[i].name));
+    block_types.push_back (::block[i].type);
+ }
+
+ for (i=0;i<::num_blocks;i++) {
+    for (j=0;j<subblock_data.num_subblocks_per_block[i];j++) {
+       t_subblock const &subblock = subblock_data.subblock_inf[i][j];
+
+       subblock_names.push_back (add_string (pool, subblock.name));
+       for (k=0;k<lut_size;k++)
+          subblock_pins.push_back (subblock.inputs[k]);
+       subblock_pins.push_back (subblock.output);
+       subblock_pins.push_back (subblock.clock);
+    }
+ }
+
+ memset (&header, 0, sizeof (Header));
+ memcpy (header.magic, NETLIST_CACHE_MAGIC, 8);
+ header.version = NETLIST_CACHE_VERSION;
+ memcpy (header.net_md5, this->net_md5_.c_str(), 32);
+ header.pins_per_clb = ::pins_per_clb;
+ header.subblock_lut_size = lut_size;
+ header.max_subblocks_per_block = subblock_data.max_subblocks_per_block;
+ header.num_nets = ::num_nets;
+ header.num_blocks = ::num_blocks;
+ header.num_p_inputs = ::num_p_inputs;
+ header.num_p_outputs = ::num_p_outputs;
+ header.num_clbs = ::num_clbs;
+ header.num_globals = ::num_globals;
+ header.num_ff = subblock_data.num_ff;
+ header.num_const_gen = subblock_data.num_const_gen;
+ header.num_net_pins = net_blocks.size();
+ header.num_subblocks = subblock_names.size();
+ header.string_pool_size = pool.size();
+
+ path = NetlistCache::path(net_file);
+ temp_path_stream << path << ".tmp" << getpid();
+ temp_path = temp_path_stream.str();
+
+ fp = fopen (temp_path.c_str(), "wb");
+ if (fp == NULL) { return false; }
+
+#define WRITE_VECTOR(values) \
+ write_aligned (fp, (values).empty() ? NULL : &(values)[0], \
+       (values).size() * sizeof ((values)[0]))
+
+ write_aligned (fp, &header, sizeof (Header));
+ WRITE_VECTOR (pin_types);
+ WRITE_VECTOR (pin_is_global);
+ WRITE_VECTOR (net_pin_start);
+ WRITE_VECTOR (net_blocks);
+ WRITE_VECTOR (net_blk_pins);
+ WRITE_VECTOR (net_names);
+ WRITE_VECTOR (net_is_global);
+ WRITE_VECTOR (block_names);
+ WRITE_VECTOR (block_types);
+ write_aligned (fp, ::num_blocks > 0 ? ::block[0].nets : NULL,
+       (size_t) ::num_blocks * ::pins_per_clb * sizeof (int));
+ write_aligned (fp, subblock_data.num_subblocks_per_block,
+       ::num_blocks * sizeof (int));
+ WRITE_VECTOR (subblock_names);
+ WRITE_VECTOR (subblock_pins);
+ write_aligned (fp, pool.data(), pool.size());
+
+#undef WRITE_VECTOR
+
+ success = !ferror (fp);
+ if (fclose (fp) != 0) success = false;
+
+ if (!success || rename (temp_path.c_str(), path.c_str()) != 0) {
+    remove (temp_path.c_str());
+    return false;
+ }
+ this->stores_++;
+ return true;
+}
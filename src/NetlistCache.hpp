@@ -0,0 +1,110 @@
+#ifndef ___NETLIST_CACHE__HPP___
+#define ___NETLIST_CACHE__HPP___
+
+#include <string>
+#include "vpr_types.h"
+
+using std::string;
+
+
+/*
+ * # Compiled netlist cache #
+ *
+ * On-disk cache of parsed netlists, so that `Main::init` can load the `net`
+ * and `block` arrays and the subblock data of a netlist with a single read,
+ * rather than parsing the netlist file again _(e.g., on a freshly started
+ * worker, where the in-memory `ParseCache` is empty)_.
+ *
+ * Each compiled netlist is stored next to its netlist file, with the `.net`
+ * extension replaced by `.netc` _(or `.netc` appended)_.  The file records
+ * the MD5 hash of the netlist file it was compiled from, so a compiled
+ * netlist is ignored _(and replaced)_ once the netlist file changes.
+ *
+ * Parsing a netlist also depends on a few properties of the architecture
+ * _(the number of pins per clb, the type of each pin, which pins are
+ * global, the subblock LUT size and the maximum number of subblocks per
+ * block)_, which are recorded too, so a compiled netlist is only loaded
+ * along with an architecture that would parse the netlist the same way.
+ *
+ * Each file holds a fixed-size header, followed by packed arrays _(each
+ * aligned to 8 bytes)_:
+ *
+ *  - The class `type` of each clb pin _(`char`)_.
+ *  - `is_global_clb_pin` of each clb pin _(`char`)_.
+ *  - The index of the first pin of each net _(plus one past the last pin
+ *    of the last net)_ in the two pin arrays below.
+ *  - The `blocks` of all nets, concatenated.
+ *  - The `blk_pin` of all nets, concatenated.
+ *  - The offset of the name of each net in the string pool.
+ *  - `is_global` of each net _(`char`)_.
+ *  - The offset of the name of each block in the string pool.
+ *  - The `type` of each block.
+ *  - The `nets` of all blocks _(`pins_per_clb` per block)_.
+ *  - The number of subblocks of each block.
+ *  - The offset of the name of each subblock in the string pool.
+ *  - The `inputs`, `output` and `clock` of each subblock.
+ *  - The string pool, holding NUL-terminated names.
+ *
+ * Loading compiled netlists is enabled by default, so that `Main::init`
+ * picks up netlists compiled ahead of time _(e.g., by the `compile_netlists`
+ * script)_.  Writing compiled netlists is disabled by default, so that
+ * `Main::init` never writes into the directories of its input files unless
+ * asked to.  Compiled netlists that cannot be written _(e.g., to a read-only
+ * directory)_ are simply not cached.
+ */
+class NetlistCache {
+public:
+    struct Header {
+        char magic[8];
+        int version;
+        char net_md5[32];
+        int pins_per_clb;
+        int subblock_lut_size;
+        int max_subblocks_per_block;
+        int num_nets;
+        int num_blocks;
+        int num_p_inputs;
+        int num_p_outputs;
+        int num_clbs;
+        int num_globals;
+        int num_ff;
+        int num_const_gen;
+        int num_net_pins;
+        int num_subblocks;
+        int string_pool_size;
+    };
+
+    /* Load compiled netlists. */
+    bool enabled_;
+    /* Write a compiled netlist for each netlist that is parsed. */
+    bool write_enabled_;
+    /* MD5 hash of the netlist file loaded by `Main::init`. */
+    string net_md5_;
+    size_t hits_;
+    size_t misses_;
+    size_t stores_;
+
+    NetlistCache() : enabled_(true), write_enabled_(false), hits_(0),
+                     misses_(0), stores_(0) {}
+
+    bool enabled() const {
+        return this->enabled_ && this->net_md5_.size() == 32;
+    }
+
+    bool write_enabled() const {
+        return this->write_enabled_ && this->net_md5_.size() == 32;
+    }
+
+    static string path(string const &net_file);
+
+    bool load(string const &net_file, t_subblock_data *subblock_data_ptr);
+    bool save(string const &net_file, t_subblock_data const &subblock_data);
+
+    void clear_counters() {
+        this->hits_ = 0;
+        this->misses_ = 0;
+        this->stores_ = 0;
+    }
+};
+
+#endif
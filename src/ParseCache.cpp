@@ -0,0 +1,342 @@
+#include <sstream>
+#include <string.h>
+#include "util.h"
+#include "vpr_types.h"
+#include "globals.h"
+#include "read_arch.h"
+#include "read_netlist.h"
+#include "ParseCache.hpp"
+
+
+static char *copy_string (string const &value, struct s_linked_vptr
+      **chunk_head_ptr, int *mem_avail_ptr, char **next_mem_loc_ptr);
+static char *copy_netlist_string (string const &value);
+
+
+/************************* Subroutine Definitions ****************************/
+
+static char *copy_string (string const &value, struct s_linked_vptr
+      **chunk_head_ptr, int *mem_avail_ptr, char **next_mem_loc_ptr) {
+
+/* Returns a copy of value, allocated with my_chunk_malloc. */
+
+ char *result;
+
+ result = (char *) my_chunk_malloc ((value.size() + 1) * sizeof (char),
+          chunk_head_ptr, mem_avail_ptr, next_mem_loc_ptr);
+ strcpy (result, value.c_str());
+ return (result);
+}
+
+
+static char *copy_netlist_string (string const &value) {
+
+/* Returns a copy of value, allocated as netlist storage (see free_netlist). */
+
+ char *result;
+
+ result = (char *) alloc_netlist_storage ((value.size() + 1) * sizeof (char));
+ strcpy (result, value.c_str());
+ return (result);
+}
+
+
+void ParseSnapshot::save(struct s_det_routing_arch const &det_routing_arch,
+                         t_segment_inf const *segment_inf,
+                         t_timing_inf const &timing_inf,
+                         t_subblock_data const &subblock_data,
+                         t_chan_width_dist const &chan_width_dist) {
+
+/* Copies the structures loaded by read_arch and read_net, along with the *
+ * corresponding globals, into this snapshot.                             */
+
+ int i, j, k;
+
+ this->io_rat = ::io_rat;
+ this->pins_per_clb = ::pins_per_clb;
+
+ this->pinloc.resize(4 * ::pins_per_clb);
+ for (i=0;i<=3;i++)
+    for (j=0;j<::pins_per_clb;j++)
+       this->pinloc[i * ::pins_per_clb + j] = ::pinloc[i][j];
+
+ this->clb_pin_class.assign(::clb_pin_class, ::clb_pin_class + ::pins_per_clb);
+ this->is_global_clb_pin.assign(::is_global_clb_pin,
+                                ::is_global_clb_pin + ::pins_per_clb);
+
+ this->class_inf.assign(::class_inf, ::class_inf + ::num_class);
+ this->class_pinlists.resize(::num_class);
+ for (i=0;i<::num_class;i++)
+    this->class_pinlists[i].assign(::class_inf[i].pinlist,
+                                   ::class_inf[i].pinlist +
+                                   ::class_inf[i].num_pins);
+
+ this->switch_inf.assign(::switch_inf,
+                         ::switch_inf + det_routing_arch.num_switch);
+ this->det_routing_arch = det_routing_arch;
+ this->segment_inf.assign(segment_inf,
+                          segment_inf + det_routing_arch.num_segment);
+
+ this->timing_inf = timing_inf;
+ this->has_T_subblock = (timing_inf.T_subblock != NULL);
+ if (this->has_T_subblock)
+    this->T_subblock.assign(timing_inf.T_subblock, timing_inf.T_subblock +
+                            get_num_T_subblock ());
+ else
+    this->T_subblock.clear();
+ this->chan_width_dist = chan_width_dist;
+
+ this->num_nets = ::num_nets;
+ this->num_blocks = ::num_blocks;
+ this->num_p_inputs = ::num_p_inputs;
+ this->num_p_outputs = ::num_p_outputs;
+ this->num_clbs = ::num_clbs;
+ this->num_globals = ::num_globals;
+
+ this->net_names.resize(::num_nets);
+ this->net_blocks.resize(::num_nets);
+ this->net_blk_pins.resize(::num_nets);
+ for (i=0;i<::num_nets;i++) {
+    this->net_names[i] = ::net[i].name;
+    this->net_blocks[i].assign(::net[i].blocks,
+                               ::net[i].blocks + ::net[i].num_pins);
+    this->net_blk_pins[i].assign(::net[i].blk_pin,
+                                 ::net[i].blk_pin + ::net[i].num_pins);
+ }
+ this->is_global.assign(::is_global, ::is_global + ::num_nets);
+
+ this->block_names.resize(::num_blocks);
+ this->block_types.resize(::num_blocks);
+ this->block_nets.resize(::num_blocks * ::pins_per_clb);
+ for (i=0;i<::num_blocks;i++) {
+    this->block_names[i] = ::block[i].name;
+    this->block_types[i] = ::block[i].type;
+    for (j=0;j<::pins_per_clb;j++)
+       this->block_nets[i * ::pins_per_clb + j] = ::block[i].nets[j];
+ }
+
+ this->subblock_data = subblock_data;
+ this->num_subblocks_per_block.assign(subblock_data.num_subblocks_per_block,
+                                      subblock_data.num_subblocks_per_block +
+                                      ::num_blocks);
+ this->subblock_names.clear();
+ this->subblocks.clear();
+ this->subblock_inputs.clear();
+ for (i=0;i<::num_blocks;i++) {
+    for (j=0;j<subblock_data.num_subblocks_per_block[i];j++) {
+       t_subblock const &subblock = subblock_data.subblock_inf[i][j];
+
+       this->subblock_names.push_back(subblock.name);
+       this->subblocks.push_back(subblock);
+       for (k=0;k<subblock_data.subblock_lut_size;k++)
+          this->subblock_inputs.push_back(subblock.inputs[k]);
+    }
+ }
+}
+
+
+void ParseSnapshot::restore(struct s_det_routing_arch *det_routing_arch,
+                            t_segment_inf **segment_inf_ptr,
+                            t_timing_inf *timing_inf,
+                            t_subblock_data *subblock_data_ptr,
+                            t_chan_width_dist *chan_width_dist) const {
+
+/* Loads freshly allocated copies of the structures held by this snapshot *
+ * into the globals and the structures passed in, allocated the same way  *
+ * read_arch and read_net allocate them.                                  */
+
+ int i, j, k, isubblock, lut_size, *block_nets_ptr;
+ int subblock_bytes_avail;
+ char *subblock_next_avail_mem;
+ boolean timing_analysis_enabled;
+ t_subblock *subblock;
+
+ ::io_rat = this->io_rat;
+ ::pins_per_clb = this->pins_per_clb;
+
+ ::pinloc = (int **) alloc_matrix (0, 3, 0, ::pins_per_clb-1, sizeof (int));
+ for (i=0;i<=3;i++)
+    for (j=0;j<::pins_per_clb;j++)
+       ::pinloc[i][j] = this->pinloc[i * ::pins_per_clb + j];
+
+ ::clb_pin_class = (int *) my_malloc (::pins_per_clb * sizeof (int));
+ ::is_global_clb_pin = (boolean *) my_malloc (::pins_per_clb *
+                                              sizeof (boolean));
+ for (i=0;i<::pins_per_clb;i++) {
+    ::clb_pin_class[i] = this->clb_pin_class[i];
+    ::is_global_clb_pin[i] = this->is_global_clb_pin[i];
+ }
+
+ ::num_class = this->class_inf.size();
+ ::class_inf = (struct s_class *) my_malloc (::num_class *
+                                             sizeof (struct s_class));
+ for (i=0;i<::num_class;i++) {
+    ::class_inf[i] = this->class_inf[i];
+    ::class_inf[i].pinlist = (int *) my_malloc (::class_inf[i].num_pins *
+                                                sizeof (int));
+    for (j=0;j<::class_inf[i].num_pins;j++)
+       ::class_inf[i].pinlist[j] = this->class_pinlists[i][j];
+ }
+
+ ::switch_inf = (struct s_switch_inf *) my_malloc (this->switch_inf.size() *
+                                                   sizeof (struct s_switch_inf));
+ for (i=0;i<(int)this->switch_inf.size();i++)
+    ::switch_inf[i] = this->switch_inf[i];
+
+ *det_routing_arch = this->det_routing_arch;
+ *segment_inf_ptr = (t_segment_inf *) my_malloc (this->segment_inf.size() *
+                                                 sizeof (t_segment_inf));
+ for (i=0;i<(int)this->segment_inf.size();i++)
+    (*segment_inf_ptr)[i] = this->segment_inf[i];
+
+ /* Timing analysis is enabled from the command line, not the architecture. */
+ timing_analysis_enabled = timing_inf->timing_analysis_enabled;
+ *timing_inf = this->timing_inf;
+ timing_inf->timing_analysis_enabled = timing_analysis_enabled;
+ if (this->has_T_subblock) {
+    timing_inf->T_subblock = (t_T_subblock *) my_malloc (
+          this->T_subblock.size() * sizeof (t_T_subblock));
+    for (i=0;i<(int)this->T_subblock.size();i++)
+       timing_inf->T_subblock[i] = this->T_subblock[i];
+ }
+ else {
+    timing_inf->T_subblock = NULL;
+ }
+ *chan_width_dist = this->chan_width_dist;
+
+ ::num_nets = this->num_nets;
+ ::num_blocks = this->num_blocks;
+ ::num_p_inputs = this->num_p_inputs;
+ ::num_p_outputs = this->num_p_outputs;
+ ::num_clbs = this->num_clbs;
+ ::num_globals = this->num_globals;
+
+/* Like read_net, allocate the small net and block allocations as netlist *
+ * storage, so that free_netlist releases them.                            */
+
+ ::net = (struct s_net *) my_malloc (::num_nets * sizeof (struct s_net));
+ ::is_global = (boolean *) my_malloc (::num_nets * sizeof (boolean));
+ for (i=0;i<::num_nets;i++) {
+    ::net[i].num_pins = this->net_blocks[i].size();
+    ::net[i].name = copy_netlist_string (this->net_names[i]);
+    ::net[i].blocks = (int *) alloc_netlist_storage (::net[i].num_pins *
+          sizeof (int));
+    ::net[i].blk_pin = (int *) alloc_netlist_storage (::net[i].num_pins *
+          sizeof (int));
+    for (j=0;j<::net[i].num_pins;j++) {
+       ::net[i].blocks[j] = this->net_blocks[i][j];
+       ::net[i].blk_pin[j] = this->net_blk_pins[i][j];
+    }
+    ::is_global[i] = this->is_global[i];
+ }
+
+ ::block = (struct s_block *) my_malloc (::num_blocks *
+                                         sizeof (struct s_block));
+ block_nets_ptr = (int *) my_malloc (::pins_per_clb * ::num_blocks *
+                                     sizeof (int));
+ for (i=0;i<::num_blocks;i++) {
+    ::block[i].name = copy_netlist_string (this->block_names[i]);
+    ::block[i].type = this->block_types[i];
+    ::block[i].nets = block_nets_ptr + i * ::pins_per_clb;
+    for (j=0;j<::pins_per_clb;j++)
+       ::block[i].nets[j] = this->block_nets[i * ::pins_per_clb + j];
+    ::block[i].x = OPEN;
+    ::block[i].y = OPEN;
+ }
+
+/* Subblock storage is chunked on subblock_data.chunk_head_ptr, so that it *
+ * can be released by free_subblock_data.                                  */
+
+ *subblock_data_ptr = this->subblock_data;
+ subblock_data_ptr->chunk_head_ptr = NULL;
+ subblock_bytes_avail = 0;
+ subblock_next_avail_mem = NULL;
+ lut_size = subblock_data_ptr->subblock_lut_size;
+
+ subblock_data_ptr->num_subblocks_per_block = (int *) my_malloc (
+       ::num_blocks * sizeof (int));
+ subblock_data_ptr->subblock_inf = (t_subblock **) my_malloc (::num_blocks *
+       sizeof (t_subblock *));
+
+ isubblock = 0;
+ for (i=0;i<::num_blocks;i++) {
+    subblock_data_ptr->num_subblocks_per_block[i] =
+          this->num_subblocks_per_block[i];
+    if (this->num_subblocks_per_block[i] == 0) {
+       subblock_data_ptr->subblock_inf[i] = NULL;
+       continue;
+    }
+    subblock_data_ptr->subblock_inf[i] = (t_subblock *) my_chunk_malloc (
+          this->num_subblocks_per_block[i] * sizeof (t_subblock),
+          &subblock_data_ptr->chunk_head_ptr, &subblock_bytes_avail,
+          &subblock_next_avail_mem);
+    for (j=0;j<this->num_subblocks_per_block[i];j++, isubblock++) {
+       subblock = &subblock_data_ptr->subblock_inf[i][j];
+       *subblock = this->subblocks[isubblock];
+       subblock->name = copy_string (this->subblock_names[isubblock],
+             &subblock_data_ptr->chunk_head_ptr, &subblock_bytes_avail,
+             &subblock_next_avail_mem);
+       subblock->inputs = (int *) my_chunk_malloc (lut_size * sizeof (int),
+             &subblock_data_ptr->chunk_head_ptr, &subblock_bytes_avail,
+             &subblock_next_avail_mem);
+       for (k=0;k<lut_size;k++)
+          subblock->inputs[k] = this->subblock_inputs[isubblock * lut_size + k];
+    }
+ }
+}
+
+
+string ParseCache::key(string const &net_md5, string const &arch_md5,
+                       enum e_route_type route_type,
+                       boolean timing_analysis_enabled) {
+
+/* Returns the cache key for the specified input file hashes and parse     *
+ * options, or an empty string if either file hash is unknown.             */
+
+ std::ostringstream result;
+
+ if (net_md5.empty() || arch_md5.empty()) return ("");
+ result << net_md5 << ":" << arch_md5 << ":" << route_type << ":"
+        << timing_analysis_enabled;
+ return (result.str());
+}
+
+
+bool ParseCache::restore(string const &key,
+                         struct s_det_routing_arch *det_routing_arch,
+                         t_segment_inf **segment_inf_ptr,
+                         t_timing_inf *timing_inf,
+                         t_subblock_data *subblock_data_ptr,
+                         t_chan_width_dist *chan_width_dist) {
+
+/* Restores the snapshot stored under key, returning false if there is none. */
+
+ if (!this->enabled_ || key.empty()) return (false);
+
+ std::map<string, ParseSnapshot>::const_iterator snapshot =
+       this->snapshots_.find(key);
+ if (snapshot == this->snapshots_.end()) {
+    this->misses_++;
+    return (false);
+ }
+ this->hits_++;
+ snapshot->second.restore(det_routing_arch, segment_inf_ptr, timing_inf,
+                          subblock_data_ptr, chan_width_dist);
+ return (true);
+}
+
+
+void ParseCache::save(string const &key,
+                      struct s_det_routing_arch const &det_routing_arch,
+                      t_segment_inf const *segment_inf,
+                      t_timing_inf const &timing_inf,
+                      t_subblock_data const &subblock_data,
+                      t_chan_width_dist const &chan_width_dist) {
+
+/* Stores a snapshot of the freshly parsed structures under key. */
+
+ if (!this->enabled_ || key.empty()) return;
+
+ this->snapshots_[key].save(det_routing_arch, segment_inf, timing_inf,
+                            subblock_data, chan_width_dist);
+}
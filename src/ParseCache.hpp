@@ -0,0 +1,112 @@
+#ifndef ___PARSE_CACHE__HPP___
+#define ___PARSE_CACHE__HPP___
+
+#include <map>
+#include <string>
+#include <vector>
+#include "vpr_types.h"
+
+using std::string;
+
+
+/*
+ * # Parse cache #
+ *
+ * `ParseSnapshot` holds a copy of everything loaded by parsing an
+ * architecture file _(`read_arch`)_ and a netlist file _(`read_net`)_: the
+ * `net`, `block` and architecture globals, along with the
+ * `s_det_routing_arch`, `t_segment_inf`, `t_timing_inf`, `t_subblock_data`
+ * and `t_chan_width_dist` structures.
+ *
+ * `ParseCache` maps a key _(built from the MD5 hashes of the input files and
+ * the options that affect parsing)_ to a snapshot, so that repeated
+ * `Main::init` calls on the same input files restore the parsed structures
+ * by copying, rather than parsing the files again.
+ *
+ * Restored structures are allocated the same way as the parser allocates
+ * them, so they may be modified or freed _(e.g., by `free_subblock_data`)_
+ * without affecting the snapshot.
+ */
+class ParseSnapshot {
+public:
+    /* Architecture. */
+    int io_rat;
+    int pins_per_clb;
+    std::vector<int> pinloc;                /* [0..3][0..pins_per_clb-1] */
+    std::vector<int> clb_pin_class;
+    std::vector<boolean> is_global_clb_pin;
+    std::vector<struct s_class> class_inf;  /* `pinlist` not valid. */
+    std::vector<std::vector<int> > class_pinlists;
+    std::vector<struct s_switch_inf> switch_inf;
+    struct s_det_routing_arch det_routing_arch;
+    std::vector<t_segment_inf> segment_inf;
+    t_timing_inf timing_inf;                /* `T_subblock` not valid. */
+    std::vector<t_T_subblock> T_subblock;
+    bool has_T_subblock;
+    t_chan_width_dist chan_width_dist;
+
+    /* Netlist. */
+    int num_nets;
+    int num_blocks;
+    int num_p_inputs;
+    int num_p_outputs;
+    int num_clbs;
+    int num_globals;
+    std::vector<string> net_names;
+    std::vector<std::vector<int> > net_blocks;
+    std::vector<std::vector<int> > net_blk_pins;
+    std::vector<boolean> is_global;
+    std::vector<string> block_names;
+    std::vector<enum e_block_types> block_types;
+    std::vector<int> block_nets;            /* [0..num_blocks*pins_per_clb-1] */
+    t_subblock_data subblock_data;          /* Pointers not valid. */
+    std::vector<int> num_subblocks_per_block;
+    std::vector<string> subblock_names;     /* Flattened over blocks. */
+    std::vector<t_subblock> subblocks;      /* `name`, `inputs` not valid. */
+    std::vector<int> subblock_inputs;
+
+    void save(struct s_det_routing_arch const &det_routing_arch,
+              t_segment_inf const *segment_inf, t_timing_inf const &timing_inf,
+              t_subblock_data const &subblock_data,
+              t_chan_width_dist const &chan_width_dist);
+    void restore(struct s_det_routing_arch *det_routing_arch,
+                 t_segment_inf **segment_inf_ptr, t_timing_inf *timing_inf,
+                 t_subblock_data *subblock_data_ptr,
+                 t_chan_width_dist *chan_width_dist) const;
+};
+
+
+class ParseCache {
+public:
+    std::map<string, ParseSnapshot> snapshots_;
+    bool enabled_;
+    size_t hits_;
+    size_t misses_;
+
+    ParseCache() : enabled_(true), hits_(0), misses_(0) {}
+
+    static string key(string const &net_md5, string const &arch_md5,
+                      enum e_route_type route_type,
+                      boolean timing_analysis_enabled);
+
+    bool restore(string const &key,
+                 struct s_det_routing_arch *det_routing_arch,
+                 t_segment_inf **segment_inf_ptr, t_timing_inf *timing_inf,
+                 t_subblock_data *subblock_data_ptr,
+                 t_chan_width_dist *chan_width_dist);
+    void save(string const &key,
+              struct s_det_routing_arch const &det_routing_arch,
+              t_segment_inf const *segment_inf, t_timing_inf const &timing_inf,
+              t_subblock_data const &subblock_data,
+              t_chan_width_dist const &chan_width_dist);
+
+    size_t size() const { return this->snapshots_.size(); }
+
+    void clear() {
+        this->snapshots_.clear();
+        this->hits_ = 0;
+        this->misses_ = 0;
+    }
+};
+
+#endif
@@ -0,0 +1,213 @@
+#include <iomanip>
+#include <sstream>
+#include <stdio.h>
+#include <string.h>
+#include <unistd.h>
+#include "util.h"
+#include "vpr_types.h"
+#include "globals.h"
+#include "timing_place_lookup.h"
+#include "PlaceDelayCache.hpp"
+
+
+#define PLACE_DELAY_CACHE_MAGIC "CYVPRPDL"
+#define PLACE_DELAY_CACHE_VERSION 1
+
+static void save_matrix (float **matrix, int x_max, int y_max,
+      std::vector<float> &values);
+static float **restore_matrix (std::vector<float> const &values, int x_max,
+      int y_max);
+
+
+/************************* Subroutine Definitions ****************************/
+
+static void save_matrix (float **matrix, int x_max, int y_max,
+      std::vector<float> &values) {
+
+/* Copies matrix [0..x_max][0..y_max] into values, in row-major order. */
+
+ int i;
+
+ values.resize ((x_max + 1) * (y_max + 1));
+ for (i=0;i<=x_max;i++)
+    memcpy (&values[i * (y_max + 1)], matrix[i], (y_max + 1) * sizeof (float));
+}
+
+
+static float **restore_matrix (std::vector<float> const &values, int x_max,
+      int y_max) {
+
+/* Returns a new matrix [0..x_max][0..y_max], allocated the same way as in *
+ * alloc_delta_arrays, holding the row-major values.                       */
+
+ int i;
+ float **matrix;
+
+ matrix = (float **) alloc_matrix (0, x_max, 0, y_max, sizeof (float));
+ for (i=0;i<=x_max;i++)
+    memcpy (matrix[i], &values[i * (y_max + 1)], (y_max + 1) * sizeof (float));
+ return (matrix);
+}
+
+
+string PlaceDelayCache::key(int width_fac,
+                            struct s_router_opts const &router_opts) const {
+
+/* Returns the cache key for the current architecture and grid size, the    *
+ * channel width used to compute the lookup tables and the router options  *
+ * used to route the lookup nets.  Returns an empty key (i.e. do not cache) *
+ * if no architecture hash is available.                                    */
+
+ std::ostringstream key;
+
+ if (this->arch_md5_.empty()) return ("");
+
+ key << std::setprecision (9) << this->arch_md5_ << "-" << nx << "x" << ny
+     << "-w" << width_fac << "-r" << (int) router_opts.route_type
+     << "-c" << (int) router_opts.base_cost_type
+     << "-a" << router_opts.astar_fac
+     << "-m" << router_opts.max_criticality
+     << "-e" << router_opts.criticality_exp
+     << "-b" << router_opts.bend_cost
+     << "-h" << (int) router_opts.heap_type;
+ return (key.str());
+}
+
+
+bool PlaceDelayCache::restore(string const &key) {
+
+/* Allocates and loads the delta arrays from the tables cached for key, in *
+ * memory or on disk.  Returns false if no tables are cached for key.      */
+
+ std::map<string, Tables>::iterator cached;
+
+ if (!this->enabled_ || key.empty()) return (false);
+
+ cached = this->tables_.find(key);
+ if (cached == this->tables_.end()) {
+    Tables tables;
+
+    if (!this->read(key, tables)) {
+       this->misses_++;
+       return (false);
+    }
+    cached = this->tables_.insert(std::make_pair(key, tables)).first;
+ }
+
+ delta_clb_to_clb = restore_matrix (cached->second.clb_to_clb, nx-1, ny-1);
+ delta_inpad_to_clb = restore_matrix (cached->second.inpad_to_clb, nx, ny);
+ delta_clb_to_outpad = restore_matrix (cached->second.clb_to_outpad, nx, ny);
+ delta_inpad_to_outpad = restore_matrix (cached->second.inpad_to_outpad,
+       nx+1, ny+1);
+ this->hits_++;
+ return (true);
+}
+
+
+void PlaceDelayCache::save(string const &key) {
+
+/* Copies the current delta arrays into the cache, and writes them to disk *
+ * if a cache directory is set.                                            */
+
+ if (!this->enabled_ || key.empty()) return;
+
+ Tables &tables = this->tables_[key];
+
+ tables.nx = nx;
+ tables.ny = ny;
+ save_matrix (delta_clb_to_clb, nx-1, ny-1, tables.clb_to_clb);
+ save_matrix (delta_inpad_to_clb, nx, ny, tables.inpad_to_clb);
+ save_matrix (delta_clb_to_outpad, nx, ny, tables.clb_to_outpad);
+ save_matrix (delta_inpad_to_outpad, nx+1, ny+1, tables.inpad_to_outpad);
+
+ this->write(key, tables);
+}
+
+
+string PlaceDelayCache::path(string const &key) const {
+ return (this->cache_dir_ + "/" + key + ".pdl");
+}
+
+
+bool PlaceDelayCache::read(string const &key, Tables &tables) const {
+
+/* Reads the tables for key from the cache directory.  Returns false if no *
+ * cache directory is set or there is no valid file for key.               */
+
+ FILE *fp;
+ Header header;
+ bool success;
+
+ if (this->cache_dir_.empty()) return (false);
+
+ fp = fopen (this->path(key).c_str(), "rb");
+ if (fp == NULL) return (false);
+
+ success = (fread (&header, sizeof (Header), 1, fp) == 1 &&
+       strncmp (header.magic, PLACE_DELAY_CACHE_MAGIC, 8) == 0 &&
+       header.version == PLACE_DELAY_CACHE_VERSION &&
+       header.nx == nx && header.ny == ny);
+
+ if (success) {
+    tables.nx = nx;
+    tables.ny = ny;
+    tables.clb_to_clb.resize (nx * ny);
+    tables.inpad_to_clb.resize ((nx + 1) * (ny + 1));
+    tables.clb_to_outpad.resize ((nx + 1) * (ny + 1));
+    tables.inpad_to_outpad.resize ((nx + 2) * (ny + 2));
+    success = (
+       fread (&tables.clb_to_clb[0], sizeof (float), tables.clb_to_clb.size(),
+          fp) == tables.clb_to_clb.size() &&
+       fread (&tables.inpad_to_clb[0], sizeof (float),
+          tables.inpad_to_clb.size(), fp) == tables.inpad_to_clb.size() &&
+       fread (&tables.clb_to_outpad[0], sizeof (float),
+          tables.clb_to_outpad.size(), fp) == tables.clb_to_outpad.size() &&
+       fread (&tables.inpad_to_outpad[0], sizeof (float),
+          tables.inpad_to_outpad.size(), fp) == tables.inpad_to_outpad.size()
+       && fgetc (fp) == EOF);
+ }
+ fclose (fp);
+ return (success);
+}
+
+
+void PlaceDelayCache::write(string const &key, Tables const &tables) const {
+
+/* Writes the tables for key to the cache directory (if set).  The file is *
+ * replaced atomically, so concurrent processes never read partial tables. */
+
+ FILE *fp;
+ Header header;
+ string path;
+ std::ostringstream temp_path;
+ bool success;
+
+ if (this->cache_dir_.empty()) return;
+
+ memset (&header, 0, sizeof (Header));
+ memcpy (header.magic, PLACE_DELAY_CACHE_MAGIC, 8);
+ header.version = PLACE_DELAY_CACHE_VERSION;
+ header.nx = tables.nx;
+ header.ny = tables.ny;
+
+ path = this->path(key);
+ temp_path << path << ".tmp" << getpid();
+
+ fp = fopen (temp_path.str().c_str(), "wb");
+ if (fp == NULL) return;
+
+ fwrite (&header, sizeof (Header), 1, fp);
+ fwrite (&tables.clb_to_clb[0], sizeof (float), tables.clb_to_clb.size(), fp);
+ fwrite (&tables.inpad_to_clb[0], sizeof (float), tables.inpad_to_clb.size(),
+       fp);
+ fwrite (&tables.clb_to_outpad[0], sizeof (float),
+       tables.clb_to_outpad.size(), fp);
+ fwrite (&tables.inpad_to_outpad[0], sizeof (float),
+       tables.inpad_to_outpad.size(), fp);
+
+ success = !ferror (fp);
+ if (fclose (fp) != 0) success = false;
+
+ if (!success || rename (temp_path.str().c_str(), path.c_str()) != 0)
+    remove (temp_path.str().c_str());
+}
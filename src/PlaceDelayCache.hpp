@@ -0,0 +1,79 @@
+#ifndef ___PLACE_DELAY_CACHE__HPP___
+#define ___PLACE_DELAY_CACHE__HPP___
+
+#include <map>
+#include <string>
+#include <vector>
+#include "vpr_types.h"
+
+using std::string;
+
+
+/*
+ * # Placement delay lookup cache #
+ *
+ * Cache of the delay lookup matrices computed by
+ * `compute_delay_lookup_tables` _(`delta_clb_to_clb`, `delta_inpad_to_clb`,
+ * `delta_clb_to_outpad` and `delta_inpad_to_outpad`)_ before each
+ * timing-driven placement.
+ *
+ * The matrices only depend on the architecture, the size of the FPGA grid,
+ * the channel width used to compute them and the router options used to
+ * route the lookup nets, so `PlaceDelayCache` maps a key built from these to
+ * a copy of the matrices.  Repeated timing-driven placements _(e.g., with
+ * different seeds)_ restore the matrices by copying, rather than routing the
+ * lookup nets again.
+ *
+ * If a cache directory is set, each set of matrices is also stored in the
+ * file `<key>.pdl` in that directory, so later processes can load them.  The
+ * file holds a fixed-size header followed by the four matrices, each stored
+ * as a row-major array of `float` values.
+ */
+class PlaceDelayCache {
+public:
+    struct Header {
+        char magic[8];
+        int version;
+        int nx;
+        int ny;
+    };
+
+    struct Tables {
+        int nx;
+        int ny;
+        std::vector<float> clb_to_clb;        /* [0..nx-1][0..ny-1] */
+        std::vector<float> inpad_to_clb;      /* [0..nx][0..ny] */
+        std::vector<float> clb_to_outpad;     /* [0..nx][0..ny] */
+        std::vector<float> inpad_to_outpad;   /* [0..nx+1][0..ny+1] */
+    };
+
+    std::map<string, Tables> tables_;
+    string cache_dir_;
+    /* MD5 hash of the architecture file loaded by `Main::init`. */
+    string arch_md5_;
+    bool enabled_;
+    size_t hits_;
+    size_t misses_;
+
+    PlaceDelayCache() : enabled_(true), hits_(0), misses_(0) {}
+
+    string key(int width_fac, struct s_router_opts const &router_opts) const;
+
+    bool restore(string const &key);
+    void save(string const &key);
+
+    size_t size() const { return this->tables_.size(); }
+
+    void clear() {
+        this->tables_.clear();
+        this->hits_ = 0;
+        this->misses_ = 0;
+    }
+
+private:
+    string path(string const &key) const;
+    bool read(string const &key, Tables &tables) const;
+    void write(string const &key, Tables const &tables) const;
+};
+
+#endif
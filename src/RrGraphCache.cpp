@@ -0,0 +1,272 @@
+#include <sstream>
+#include <stdio.h>
+#include <string.h>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#include "util.h"
+#include "vpr_types.h"
+#include "globals.h"
+#include "rr_graph.h"
+#include "rr_graph_csr.h"
+#include "RrGraphCache.hpp"
+
+
+#define RR_GRAPH_CACHE_MAGIC "CYVPRRRG"
+#define RR_GRAPH_CACHE_VERSION 1
+
+static size_t aligned (size_t size);
+
+
+/************************* Subroutine Definitions ****************************/
+
+static size_t aligned (size_t size) {
+
+/* Rounds size up to the next multiple of 8 bytes. */
+
+ return ((size + 7) & ~((size_t) 7));
+}
+
+
+string RrGraphCache::path(int width_fac, enum e_route_type route_type,
+                          enum e_base_cost_type base_cost_type) const {
+
+/* Returns the path of the cache file for the current architecture and grid *
+ * size and the specified channel width factor and router options.          */
+
+ std::ostringstream path;
+
+ path << this->cache_dir_ << "/" << this->arch_md5_ << "-" << nx << "x" << ny
+      << "-w" << width_fac << "-r" << (int) route_type << "-c"
+      << (int) base_cost_type << ".rrg";
+ return (path.str());
+}
+
+
+bool RrGraphCache::load(int width_fac, enum e_route_type route_type,
+                        struct s_det_routing_arch const &det_routing_arch,
+                        t_segment_inf *segment_inf,
+                        enum e_base_cost_type base_cost_type) {
+
+/* Loads rr_node, rr_indexed_data and switch_inf from the cache file for    *
+ * this key, if one exists, along with the placement-dependent structures   *
+ * for the current placement.  Returns false (leaving no rr_graph           *
+ * allocated) if there is no valid cache file, in which case the caller     *
+ * should build the graph.  free_rr_graph must have been called first.      */
+
+ int fd, inode, iedge;
+ size_t offset, file_size;
+ struct stat info;
+ char *data;
+ Header header;
+ Node const *nodes;
+ int const *edges;
+ short const *switches;
+
+ if (!this->enabled()) { return false; }
+
+ fd = open (this->path(width_fac, route_type, base_cost_type).c_str(),
+            O_RDONLY);
+ if (fd < 0) {
+    this->misses_++;
+    return false;
+ }
+ if (fstat (fd, &info) != 0 || (size_t) info.st_size < sizeof (Header)) {
+    close (fd);
+    this->misses_++;
+    return false;
+ }
+ file_size = info.st_size;
+ data = (char *) mmap (NULL, file_size, PROT_READ, MAP_PRIVATE, fd, 0);
+ close (fd);
+ if (data == MAP_FAILED) {
+    this->misses_++;
+    return false;
+ }
+
+/* Check that the file was written by this build, for this architecture.  */
+
+ memcpy (&header, data, sizeof (Header));
+ offset = aligned (sizeof (Header));
+ if (strncmp (header.magic, RR_GRAPH_CACHE_MAGIC, 8) != 0 ||
+       header.version != RR_GRAPH_CACHE_VERSION ||
+       header.node_size != (int) sizeof (Node) ||
+       header.indexed_data_size != (int) sizeof (t_rr_indexed_data) ||
+       header.switch_size != (int) sizeof (struct s_switch_inf) ||
+       header.num_switch != det_routing_arch.num_switch ||
+       file_size != offset +
+          aligned (header.num_rr_nodes * sizeof (Node)) +
+          aligned (header.num_edges * sizeof (int)) +
+          aligned (header.num_edges * sizeof (short)) +
+          aligned (header.num_rr_indexed_data * sizeof (t_rr_indexed_data)) +
+          aligned (header.num_switch * sizeof (struct s_switch_inf))) {
+    munmap (data, file_size);
+    this->misses_++;
+    return false;
+ }
+
+ nodes = (Node const *) (data + offset);
+ offset += aligned (header.num_rr_nodes * sizeof (Node));
+ edges = (int const *) (data + offset);
+ offset += aligned (header.num_edges * sizeof (int));
+ switches = (short const *) (data + offset);
+ offset += aligned (header.num_edges * sizeof (short));
+
+/* The router modifies the graph (e.g. occ), so copy it out of the mapping *
+ * into memory allocated the same way as build_rr_graph allocates it.      */
+
+ num_rr_nodes = header.num_rr_nodes;
+ if (load_rr_graph_terminals (route_type, det_routing_arch, segment_inf) !=
+       num_rr_nodes) {
+    munmap (data, file_size);
+    free_rr_graph ();
+    this->misses_++;
+    return false;
+ }
+
+ rr_node = (t_rr_node *) my_malloc (num_rr_nodes * sizeof (t_rr_node));
+ iedge = 0;
+ for (inode=0;inode<num_rr_nodes;inode++) {
+    rr_node[inode].xlow = nodes[inode].xlow;
+    rr_node[inode].xhigh = nodes[inode].xhigh;
+    rr_node[inode].ylow = nodes[inode].ylow;
+    rr_node[inode].yhigh = nodes[inode].yhigh;
+    rr_node[inode].ptc_num = nodes[inode].ptc_num;
+    rr_node[inode].cost_index = nodes[inode].cost_index;
+    rr_node[inode].occ = nodes[inode].occ;
+    rr_node[inode].capacity = nodes[inode].capacity;
+    rr_node[inode].num_edges = nodes[inode].num_edges;
+    rr_node[inode].type = (t_rr_type) nodes[inode].type;
+    rr_node[inode].R = nodes[inode].R;
+    rr_node[inode].C = nodes[inode].C;
+
+    if (nodes[inode].num_edges > 0) {
+       rr_node[inode].edges = (int *) alloc_rr_graph_chunk (
+             nodes[inode].num_edges * sizeof (int));
+       rr_node[inode].switches = (short *) alloc_rr_graph_chunk (
+             nodes[inode].num_edges * sizeof (short));
+       memcpy (rr_node[inode].edges, edges + iedge,
+             nodes[inode].num_edges * sizeof (int));
+       memcpy (rr_node[inode].switches, switches + iedge,
+             nodes[inode].num_edges * sizeof (short));
+       iedge += nodes[inode].num_edges;
+    }
+    else {
+       rr_node[inode].edges = NULL;
+       rr_node[inode].switches = NULL;
+    }
+ }
+
+ num_rr_indexed_data = header.num_rr_indexed_data;
+ rr_indexed_data = (t_rr_indexed_data *) my_malloc (num_rr_indexed_data *
+       sizeof (t_rr_indexed_data));
+ memcpy (rr_indexed_data, data + offset,
+       num_rr_indexed_data * sizeof (t_rr_indexed_data));
+ offset += aligned (num_rr_indexed_data * sizeof (t_rr_indexed_data));
+
+ memcpy (switch_inf, data + offset,
+       header.num_switch * sizeof (struct s_switch_inf));
+
+ munmap (data, file_size);
+ alloc_and_load_rr_graph_csr ();
+ this->hits_++;
+ return true;
+}
+
+
+bool RrGraphCache::save(int width_fac, enum e_route_type route_type,
+                        struct s_det_routing_arch const &det_routing_arch,
+                        enum e_base_cost_type base_cost_type) {
+
+/* Writes the current rr_node, rr_indexed_data and switch_inf to the cache *
+ * file for this key.  The file is replaced atomically, so concurrent      *
+ * processes never load a partially written graph.  Returns true if the    *
+ * file was written.                                                       */
+
+ int inode, num_edges;
+ Header header;
+ Node node;
+ FILE *fp;
+ string path, temp_path;
+ std::ostringstream temp_path_stream;
+ static const char padding[8] = {0};
+ bool success;
+
+ if (!this->enabled()) { return false; }
+
+ num_edges = 0;
+ for (inode=0;inode<num_rr_nodes;inode++)
+    num_edges += rr_node[inode].num_edges;
+
+ memset (&header, 0, sizeof (Header));
+ memcpy (header.magic, RR_GRAPH_CACHE_MAGIC, 8);
+ header.version = RR_GRAPH_CACHE_VERSION;
+ header.node_size = sizeof (Node);
+ header.indexed_data_size = sizeof (t_rr_indexed_data);
+ header.switch_size = sizeof (struct s_switch_inf);
+ header.num_rr_nodes = num_rr_nodes;
+ header.num_rr_indexed_data = num_rr_indexed_data;
+ header.num_switch = det_routing_arch.num_switch;
+ header.num_edges = num_edges;
+
+ path = this->path(width_fac, route_type, base_cost_type);
+ temp_path_stream << path << ".tmp" << getpid();
+ temp_path = temp_path_stream.str();
+
+ fp = fopen (temp_path.c_str(), "wb");
+ if (fp == NULL) { return false; }
+
+#define WRITE_ALIGNED(ptr, size) \
+ fwrite ((ptr), 1, (size), fp); \
+ fwrite (padding, 1, aligned (size) - (size), fp)
+
+ WRITE_ALIGNED (&header, sizeof (Header));
+
+ memset (&node, 0, sizeof (Node));
+ for (inode=0;inode<num_rr_nodes;inode++) {
+    node.xlow = rr_node[inode].xlow;
+    node.xhigh = rr_node[inode].xhigh;
+    node.ylow = rr_node[inode].ylow;
+    node.yhigh = rr_node[inode].yhigh;
+    node.ptc_num = rr_node[inode].ptc_num;
+    node.cost_index = rr_node[inode].cost_index;
+    node.occ = rr_node[inode].occ;
+    node.capacity = rr_node[inode].capacity;
+    node.num_edges = rr_node[inode].num_edges;
+    node.type = rr_node[inode].type;
+    node.R = rr_node[inode].R;
+    node.C = rr_node[inode].C;
+    fwrite (&node, sizeof (Node), 1, fp);
+ }
+ fwrite (padding, 1, aligned (num_rr_nodes * sizeof (Node)) -
+       num_rr_nodes * sizeof (Node), fp);
+
+ for (inode=0;inode<num_rr_nodes;inode++)
+    fwrite (rr_node[inode].edges, sizeof (int), rr_node[inode].num_edges, fp);
+ fwrite (padding, 1, aligned (num_edges * sizeof (int)) -
+       num_edges * sizeof (int), fp);
+
+ for (inode=0;inode<num_rr_nodes;inode++)
+    fwrite (rr_node[inode].switches, sizeof (short),
+          rr_node[inode].num_edges, fp);
+ fwrite (padding, 1, aligned (num_edges * sizeof (short)) -
+       num_edges * sizeof (short), fp);
+
+ WRITE_ALIGNED (rr_indexed_data, num_rr_indexed_data *
+       sizeof (t_rr_indexed_data));
+ WRITE_ALIGNED (switch_inf, det_routing_arch.num_switch *
+       sizeof (struct s_switch_inf));
+
+#undef WRITE_ALIGNED
+
+ success = !ferror (fp);
+ if (fclose (fp) != 0) success = false;
+
+ if (!success || rename (temp_path.c_str(), path.c_str()) != 0) {
+    remove (temp_path.c_str());
+    return false;
+ }
+ this->stores_++;
+ return true;
+}
@@ -0,0 +1,100 @@
+#ifndef ___RR_GRAPH_CACHE__HPP___
+#define ___RR_GRAPH_CACHE__HPP___
+
+#include <string>
+#include "vpr_types.h"
+
+using std::string;
+
+
+/*
+ * # Routing resource graph cache #
+ *
+ * On-disk cache of routing resource graphs, so that `try_route` can load a
+ * graph that has already been built, rather than calling `build_rr_graph`
+ * again for every routing attempt.
+ *
+ * The graph only depends on the architecture, the size of the FPGA grid, the
+ * channel width factor and the router options that are passed to
+ * `build_rr_graph`, so each cached graph is stored in a file named after the
+ * key:
+ *
+ *     <arch MD5>-<nx>x<ny>-w<width_fac>-r<route_type>-c<base_cost_type>.rrg
+ *
+ * Each file holds a fixed-size header, followed by packed arrays _(each
+ * aligned to 8 bytes)_ that can be read directly from a memory-mapped file:
+ *
+ *  - One `Node` record per `rr_node`.
+ *  - The `edges` of all `rr_node` entries, concatenated.
+ *  - The `switches` of all `rr_node` entries, concatenated.
+ *  - The `rr_indexed_data` array.
+ *  - The `switch_inf` array.
+ *
+ * __NB__ The placement-dependent structures built along with the graph
+ * _(`net_rr_terminals` and `rr_clb_source`)_ are not cached.  They are
+ * recomputed for the current placement each time a graph is loaded.
+ *
+ * The cache is disabled until a cache directory is set.
+ */
+class RrGraphCache {
+public:
+    struct Header {
+        char magic[8];
+        int version;
+        int node_size;
+        int indexed_data_size;
+        int switch_size;
+        int num_rr_nodes;
+        int num_rr_indexed_data;
+        int num_switch;
+        int num_edges;
+    };
+
+    struct Node {
+        short xlow;
+        short xhigh;
+        short ylow;
+        short yhigh;
+        short ptc_num;
+        short cost_index;
+        short occ;
+        short capacity;
+        short num_edges;
+        short padding;
+        int type;
+        float R;
+        float C;
+    };
+
+    string cache_dir_;
+    /* MD5 hash of the architecture file loaded by `Main::init`. */
+    string arch_md5_;
+    size_t hits_;
+    size_t misses_;
+    size_t stores_;
+
+    RrGraphCache() : hits_(0), misses_(0), stores_(0) {}
+
+    bool enabled() const {
+        return !this->cache_dir_.empty() && !this->arch_md5_.empty();
+    }
+
+    string path(int width_fac, enum e_route_type route_type,
+                enum e_base_cost_type base_cost_type) const;
+
+    bool load(int width_fac, enum e_route_type route_type,
+              struct s_det_routing_arch const &det_routing_arch,
+              t_segment_inf *segment_inf,
+              enum e_base_cost_type base_cost_type);
+    bool save(int width_fac, enum e_route_type route_type,
+              struct s_det_routing_arch const &det_routing_arch,
+              enum e_base_cost_type base_cost_type);
+
+    void clear_counters() {
+        this->hits_ = 0;
+        this->misses_ = 0;
+        this->stores_ = 0;
+    }
+};
+
+#endif
@@ -124,10 +124,46 @@ public:
     /* Total net delay. */
     float total_net_delay;
     s_router_opts router_opts;
+    /* Number of maze router heap insertions and removals. */
+    long long heap_pushes;
+    long long heap_pops;
+    /* Number of heap, traceback and linked_f_pointer structures allocated,
+     * number of arena chunks malloced to hold them, and the bytes owned by
+     * the arenas at the end of the route. */
+    long long node_allocs;
+    long long arena_chunk_allocs;
+    long long arena_bytes;
 
     std::vector<unsigned int> bends;
     std::vector<unsigned int> wire_lengths;
     std::vector<unsigned int> segments;
+    /* Final traceback of each net, if router_opts.export_traceback: the
+     * elements of net i are [trace_net_offsets[i], trace_net_offsets[i + 1])
+     * of trace_nodes (rr_node index) and trace_switches (switch type to the
+     * next element, OPEN after a SINK). */
+    std::vector<unsigned int> trace_net_offsets;
+    std::vector<int> trace_nodes;
+    std::vector<short> trace_switches;
+    /* Number of nets routed in each Pathfinder iteration. */
+    std::vector<unsigned int> nets_rerouted;
+    /* Number of nets in each level of the schedule used to route the nets
+     * on several threads (see route_parallel.cpp), or empty if the nets
+     * were routed on one thread. */
+    std::vector<unsigned int> nets_per_level;
+    /* Number of overused rr_nodes, and their total overuse (occupancy in
+     * excess of capacity), after each Pathfinder iteration. */
+    std::vector<unsigned int> overused_nodes;
+    std::vector<unsigned int> total_overuse;
+    /* Present congestion factor (pres_fac) used by each Pathfinder
+     * iteration, and wall-clock seconds from the start of the route to the
+     * end of each iteration. */
+    std::vector<float> pres_facs;
+    std::vector<double> iteration_times;
+    /* Why the router gave up before max_router_iterations (empty if it
+     * did not). */
+    string abort_reason;
+    /* Was the route cancelled by the routing iteration callback? */
+    bool cancelled;
 
     virtual string label() const { return "RouteState"; }
 
@@ -145,7 +181,23 @@ public:
         this->bends = other.bends;
         this->wire_lengths = other.wire_lengths;
         this->segments = other.segments;
+        this->trace_net_offsets = other.trace_net_offsets;
+        this->trace_nodes = other.trace_nodes;
+        this->trace_switches = other.trace_switches;
+        this->nets_rerouted = other.nets_rerouted;
+        this->nets_per_level = other.nets_per_level;
+        this->overused_nodes = other.overused_nodes;
+        this->total_overuse = other.total_overuse;
+        this->pres_facs = other.pres_facs;
+        this->iteration_times = other.iteration_times;
+        this->abort_reason = other.abort_reason;
+        this->cancelled = other.cancelled;
         this->router_opts = other.router_opts;
+        this->heap_pushes = other.heap_pushes;
+        this->heap_pops = other.heap_pops;
+        this->node_allocs = other.node_allocs;
+        this->arena_chunk_allocs = other.arena_chunk_allocs;
+        this->arena_bytes = other.arena_bytes;
     }
 
     virtual std::vector<std::pair<string, string> > fieldname_value_pairs() const {
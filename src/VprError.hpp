@@ -0,0 +1,48 @@
+#ifndef ___VPR_ERROR__HPP___
+#define ___VPR_ERROR__HPP___
+
+#include <stdexcept>
+#include <string>
+#include "Formatter.hpp"
+
+
+/* Errors thrown by VPR in place of calling `exit`, so that the process
+ * _(e.g., a Python worker using the `cyvpr` bindings)_ survives them.
+ *
+ * Each error derives from the standard exception that Cython `except +`
+ * translates to the closest Python exception:
+ *
+ *  - `ParseError` _(`ValueError`)_: An input file or command-line option is
+ *    invalid.
+ *  - `UnroutableError` _(`RuntimeError`)_: The circuit cannot be routed with
+ *    the current router options.
+ *  - `InternalError` _(`RuntimeError`)_: An internal consistency check
+ *    failed.
+ *
+ * For example:
+ *
+ *     throw ParseError(Formatter() << "Error on line " << linenum
+ *                      << " of netlist file.");
+ */
+
+class ParseError : public std::invalid_argument {
+public:
+    explicit ParseError(const std::string &message)
+        : std::invalid_argument(message) {}
+};
+
+
+class UnroutableError : public std::runtime_error {
+public:
+    explicit UnroutableError(const std::string &message)
+        : std::runtime_error(message) {}
+};
+
+
+class InternalError : public std::logic_error {
+public:
+    explicit InternalError(const std::string &message)
+        : std::logic_error(message) {}
+};
+
+#endif
@@ -5,6 +5,7 @@
 #include "hash.h"
 #include "vpr_utils.h"
 #include "check_netlist.h"
+#include "VprError.hpp"
 
 
 /**************** Subroutines local to this module **************************/
@@ -110,8 +111,8 @@ void check_netlist (t_subblock_data *subblock_data_ptr, int *num_driver) {
  free (num_uses_of_sblk_opin);
 
  if (error != 0) {
-    printf("Found %d fatal Errors in the input netlist.\n",error);
-    exit(1);
+    throw ParseError (Formatter () << "Found " << error << " fatal Errors "
+          "in the input netlist.");
  }
 }
 
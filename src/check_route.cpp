@@ -5,6 +5,7 @@
 #include "route_export.h"
 #include "check_route.h"
 #include "check_rr_graph.h"
+#include "VprError.hpp"
 
 
 /******************** Subroutines local to this module **********************/
@@ -49,8 +50,8 @@ void check_route (enum e_route_type route_type, int num_switch,
  recompute_occupancy_from_scratch (clb_opins_used_locally);
  valid = feasible_routing ();
  if (valid == FALSE) {
-    printf("Error in check_route -- routing resources are overused.\n");
-    exit(1);
+    throw InternalError (Formatter () << "Error in check_route -- routing "
+          "resources are overused.");
  }
 
  check_locally_used_clb_opins (clb_opins_used_locally, route_type);
@@ -77,8 +78,8 @@ void check_route (enum e_route_type route_type, int num_switch,
 
     tptr = trace_head[inet];
     if (tptr == NULL) {
-       printf ("Error in check_route:  net %d has no routing.\n", inet);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_route:  net "
+             << inet << " has no routing.");
     }
 
     inode = tptr->index;
@@ -101,19 +102,18 @@ void check_route (enum e_route_type route_type, int num_switch,
 
        if (rr_node[prev_node].type == SINK) {
           if (connected_to_route[inode] == FALSE) {
-             printf ("Error in check_route.  Node %d does not link "
-                     "into the existing routing for net %d.\n", inode, inet);
-             exit(1);
+             throw InternalError (Formatter () << "Error in check_route.  "
+                   "Node " << inode << " does not link into the existing "
+                   "routing for net " << inet << ".");
           }
        }
 
        else {
           connects = check_adjacent (prev_node, inode);
           if (!connects) {
-             printf("Error in check_route while checking net %d.\n",
-                inet);
-             my_printf("Non-adjacent segments in traceback.\n");
-             exit (1);
+             throw InternalError (Formatter () << "Error in check_route "
+                   "while checking net " << inet << ".  Non-adjacent "
+                   "segments in traceback.");
           }
 
           if (connected_to_route[inode] && rr_node[inode].type != SINK) {
@@ -121,9 +121,8 @@ void check_route (enum e_route_type route_type, int num_switch,
  /* Note:  Can get multiple connections to the same logically-equivalent     *
   * SINK in some logic blocks.                                               */
 
-             printf ("Error in check_route:  net %d routing is not a tree.\n",
-                      inet);
-             exit (1);
+             throw InternalError (Formatter () << "Error in check_route:  "
+                   "net " << inet << " routing is not a tree.");
           }
 
           connected_to_route[inode] = TRUE;  /* Mark as in path. */
@@ -137,16 +136,14 @@ void check_route (enum e_route_type route_type, int num_switch,
     }  /* End while */
 
     if (rr_node[prev_node].type != SINK) {
-       printf("Error in check_route.  Net %d does not end\n", inet);
-       my_printf("with a SINK.\n");
-       exit(1);
+       throw InternalError (Formatter () << "Error in check_route.  Net "
+             << inet << " does not end with a SINK.");
     }
 
     for (ipin=0;ipin<net[inet].num_pins;ipin++) {
        if (pin_done[ipin] == FALSE) {
-          printf("Error in check_route.  Net %d does not \n",inet);
-          my_printf("connect to pin %d.\n",ipin);
-          exit(1);
+          throw InternalError (Formatter () << "Error in check_route.  Net "
+                << inet << " does not connect to pin " << ipin << ".");
        }
     }
 
@@ -206,15 +203,15 @@ static void check_sink (int inode, int inet, boolean *pin_done) {
  }
 
  if (ifound > 1) {
-    printf ("Error in check_sink:  found %d terminals of net %d of class/pad"
-            "\n %d at location (%d, %d).\n", ifound, inet, ptc_num, i, j);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_sink:  found "
+          << ifound << " terminals of net " << inet << " of class/pad "
+          << ptc_num << " at location (" << i << ", " << j << ").");
  }
 
  if (ifound < 1) {
-    printf ("Error in check_sink:  node %d does not connect to any terminal "
-            "\n of net %d.\n", inode, inet);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_sink:  node "
+          << inode << " does not connect to any terminal of net " << inet
+          << ".");
  }
 }
 
@@ -228,9 +225,8 @@ static void check_source (int inode, int inet) {
 
  rr_type = rr_node[inode].type;
  if (rr_type != SOURCE) {
-    printf ("Error in check_source:  net %d begins with a node of type %d.\n",
-            inet, rr_type);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_source:  net "
+          << inet << " begins with a node of type " << rr_type << ".");
  }
 
  i = rr_node[inode].xlow;
@@ -239,9 +235,8 @@ static void check_source (int inode, int inet) {
  bnum = net[inet].blocks[0];
 
  if (block[bnum].x != i || block[bnum].y != j) {
-    printf ("Error in check_source:  net SOURCE is in wrong location (%d,%d)."
-            "\n", i, j);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_source:  net "
+          "SOURCE is in wrong location (" << i << "," << j << ").");
  }
 
  if (block[bnum].type == CLB) {
@@ -249,16 +244,14 @@ static void check_source (int inode, int inet) {
     iclass = clb_pin_class[blk_pin];
 
     if (ptc_num != iclass) {
-       printf ("Error in check_source:  net SOURCE is of wrong class (%d).\n",
-              ptc_num);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_source:  net "
+             "SOURCE is of wrong class (" << ptc_num << ").");
     }
  }
  else {    /* IO Pad.  NB:  check_node ensured ptc_num < occ of this pad.  */
     if (clb[i][j].u.io_blocks[ptc_num] != bnum) {
-       printf ("Error in check_source:  net SOURCE is at wrong pad (pad #%d)."
-               "\n", ptc_num);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_source:  net "
+             "SOURCE is at wrong pad (pad #" << ptc_num << ").");
     }
  }
 }
@@ -277,10 +270,9 @@ static void check_switch (struct s_trace *tptr, int num_switch) {
 
  if (rr_node[inode].type != SINK) {
     if (switch_type < 0 || switch_type >= num_switch) {
-       printf ("Error in check_switch: rr_node %d left via switch type %d.\n",
-               inode, switch_type);
-       my_printf ("Switch type is out of range.\n");
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_switch: rr_node "
+             << inode << " left via switch type " << switch_type << ".  "
+             "Switch type is out of range.");
     }
  }
 
@@ -290,9 +282,9 @@ static void check_switch (struct s_trace *tptr, int num_switch) {
  * allowed, change to treat a SINK like any other node (as above).          */
 
     if (switch_type != OPEN) {
-       printf ("Error in check_switch:  rr_node %d is a SINK, but attempts \n"
-               "to use a switch of type %d.\n", inode, switch_type);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_switch:  "
+             "rr_node " << inode << " is a SINK, but attempts to use a "
+             "switch of type " << switch_type << ".");
     }
  }
 }
@@ -446,8 +438,8 @@ static boolean check_adjacent (int from_node, int to_node) {
  else if (num_adj == 0)
     return (FALSE);
 
- printf ("Error in check_adjacent: num_adj = %d. Expected 0 or 1.\n", num_adj);
- exit (1);
+ throw InternalError (Formatter () << "Error in check_adjacent: num_adj = "
+       << num_adj << ". Expected 0 or 1.");
 }
 
 
@@ -630,20 +622,20 @@ static void check_locally_used_clb_opins (t_ivec **clb_opins_used_locally,
 
           rr_type = rr_node[inode].type;
           if (rr_type != OPIN) {
-             printf ("Error in check_locally_used_opins:  Block #%d (%s)\n"
-                    "\tclass %d locally used OPIN is of the wrong rr_type --\n"
-                    "\tit is rr_node #%d of type %d.\n", iblk,
-                    block[iblk].name, iclass, inode, rr_type);
-             exit (1);
+             throw InternalError (Formatter () << "Error in "
+                   "check_locally_used_opins:  Block #" << iblk << " ("
+                   << block[iblk].name << ") class " << iclass << " locally "
+                   "used OPIN is of the wrong rr_type -- it is rr_node #"
+                   << inode << " of type " << rr_type << ".");
           }
 
           ipin = rr_node[inode].ptc_num;
           if (clb_pin_class[ipin] != iclass) {
-             printf ("Error in check_locally_used_opins:  Block #%d (%s):\n"
-                    "\tExpected class %d locally used OPIN, got class %d."
-                    "\trr_node #: %d.\n", iblk, block[iblk].name, iclass,
-                    clb_pin_class[ipin], inode);
-             exit (1);
+             throw InternalError (Formatter () << "Error in "
+                   "check_locally_used_opins:  Block #" << iblk << " ("
+                   << block[iblk].name << "):  Expected class " << iclass
+                   << " locally used OPIN, got class " << clb_pin_class[ipin]
+                   << ". rr_node #: " << inode << ".");
           }
        }
     }
@@ -657,9 +649,9 @@ static void check_node_and_range (int inode, enum e_route_type route_type) {
  * check that everything else about the node is OK.                         */
 
  if (inode < 0 || inode >= num_rr_nodes) {
-    printf ("Error in check_node_and_range:  rr_node #%d is out of legal "
-            "\trange (0 to %d).\n", inode, num_rr_nodes-1);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_node_and_range:  "
+          "rr_node #" << inode << " is out of legal  range (0 to "
+          << num_rr_nodes-1 << ").");
  }
  check_node (inode, route_type);
 }
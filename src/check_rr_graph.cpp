@@ -3,6 +3,7 @@
 #include "globals.h"
 #include "rr_graph.h"
 #include "check_rr_graph.h"
+#include "VprError.hpp"
 
 
 /********************** Local defines and types *****************************/
@@ -54,9 +55,9 @@ void check_rr_graph (enum e_route_type route_type, int num_switch) {
        to_node = rr_node[inode].edges[iedge];
 
        if (to_node < 0 || to_node >= num_rr_nodes) {
-          printf ("Error in check_rr_graph:  node %d has an edge %d.\n"
-                  "Edge is out of range.\n", inode, to_node);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_rr_graph:  "
+                "node " << inode << " has an edge " << to_node << ".  Edge "
+                "is out of range.");
        }
 
        num_edges_from_current_to_node[to_node]++;
@@ -65,9 +66,9 @@ void check_rr_graph (enum e_route_type route_type, int num_switch) {
        switch_type = rr_node[inode].switches[iedge];
 
        if (switch_type < 0 || switch_type >= num_switch) {
-          printf ("Error in check_rr_graph:  node %d has a switch type %d.\n"
-                  "Switch type is out of range.\n", inode, switch_type);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_rr_graph:  "
+                "node " << inode << " has a switch type " << switch_type
+                << ".  Switch type is out of range.");
        }
 
        if (switch_inf[switch_type].buffered) 
@@ -86,10 +87,10 @@ void check_rr_graph (enum e_route_type route_type, int num_switch) {
 
           if ((to_rr_type != CHANX && to_rr_type != CHANY) ||
                  (rr_type != CHANX && rr_type != CHANY)) {
-             printf ("Error in check_rr_graph:  node %d connects to node %d "
-                     "%d times.\n", inode, to_node, 
-                     num_edges_from_current_to_node[to_node]);
-             exit (1);
+             throw InternalError (Formatter () << "Error in "
+                   "check_rr_graph:  node " << inode << " connects to node "
+                   << to_node << " "
+                   << num_edges_from_current_to_node[to_node] << " times.");
           }
 
          /* Between two wire segments.  Two connections are legal only if  *
@@ -98,10 +99,10 @@ void check_rr_graph (enum e_route_type route_type, int num_switch) {
           else if (num_edges_from_current_to_node[to_node] != 2 || 
                       switch_types_from_current_to_node[to_node] != 
                        BUF_AND_PTRANS_FLAG) {
-             printf ("Error in check_rr_graph:  node %d connects to node %d "
-                     "%d times.\n", inode, to_node, 
-                     num_edges_from_current_to_node[to_node]);
-             exit (1);
+             throw InternalError (Formatter () << "Error in "
+                   "check_rr_graph:  node " << inode << " connects to node "
+                   << to_node << " "
+                   << num_edges_from_current_to_node[to_node] << " times.");
           }
        }
 
@@ -131,16 +132,16 @@ void check_rr_graph (enum e_route_type route_type, int num_switch) {
      /* A global CLB input pin will not have any edges, and neither will  *
       * a SOURCE.  Anything else is an error.                             */
 
-          printf ("Error in check_rr_graph:  node %d has no fanin.\n", inode);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_rr_graph:  "
+                "node " << inode << " has no fanin.");
        }
     }
 
     else {   /* SOURCE.  No fanin for now; change if feedthroughs allowed. */
        if (total_edges_to_node[inode] != 0) {
-          printf ("Error in check_rr_graph:  SOURCE node %d has a fanin\n"
-                  "\tof %d, expected 0.\n", inode, total_edges_to_node[inode]);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_rr_graph:  "
+                "SOURCE node " << inode << " has a fanin of "
+                << total_edges_to_node[inode] << ", expected 0.");
        }
     }
  }
@@ -189,21 +190,21 @@ void check_node (int inode, enum e_route_type route_type) {
  capacity = rr_node[inode].capacity;
 
  if (xlow > xhigh || ylow > yhigh) {
-    printf ("Error in check_node:  rr endpoints are (%d,%d) and (%d,%d).\n",
-            xlow, ylow, xhigh, yhigh);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_node:  rr "
+          "endpoints are (" << xlow << "," << ylow << ") and (" << xhigh
+          << "," << yhigh << ").");
  }
 
  if (xlow < 0 || xhigh > nx+1 || ylow < 0 || yhigh > ny+1) {
-    printf ("Error in check_node:  rr endpoints, (%d,%d) and (%d,%d), \n"
-            "are out of range.\n", xlow, ylow, xhigh, yhigh);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_node:  rr "
+          "endpoints, (" << xlow << "," << ylow << ") and (" << xhigh << ","
+          << yhigh << "), are out of range.");
  }
 
  if (ptc_num < 0) {
-    printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-            "of %d.\n", inode, rr_type, ptc_num);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_node.  Inode "
+          << inode << " (type " << rr_type << ") had a ptc_num of "
+          << ptc_num << ".");
  }
 
 /* Check that the segment is within the array and such. */
@@ -212,44 +213,47 @@ void check_node (int inode, enum e_route_type route_type) {
 
  case SOURCE: case SINK: case IPIN: case OPIN:
     if (xlow != xhigh || ylow != yhigh) {
-       printf ("Error in check_node:  Node %d (type %d) has endpoints of\n"
-            "(%d,%d) and (%d,%d)\n", inode, rr_type, xlow, ylow, xhigh, yhigh);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  Node "
+             << inode << " (type " << rr_type << ") has endpoints of ("
+             << xlow << "," << ylow << ") and (" << xhigh << "," << yhigh
+             << ")");
     }
     if (clb[xlow][ylow].type != CLB && clb[xlow][ylow].type != IO) {
-       printf ("Error in check_node:  Node %d (type %d) is at an illegal\n"
-               " clb location (%d, %d).\n", inode, rr_type, xlow, ylow);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  Node "
+             << inode << " (type " << rr_type << ") is at an illegal clb "
+             "location (" << xlow << ", " << ylow << ").");
     }
     break;
  
  case CHANX:
     if (xlow < 1 || xhigh > nx || yhigh > ny || yhigh != ylow) {
-       printf("Error in check_node:  CHANX out of range.\n");
-       my_printf("Endpoints: (%d,%d) and (%d,%d)\n", xlow, ylow, xhigh, yhigh);
-       exit(1);
+       throw InternalError (Formatter () << "Error in check_node:  CHANX "
+             "out of range.  Endpoints: (" << xlow << "," << ylow << ") and "
+             "(" << xhigh << "," << yhigh << ")");
     }
     if (route_type == GLOBAL && xlow != xhigh) {
-       printf ("Error in check_node:  node %d spans multiple channel segments\n"               "which is not allowed with global routing.\n", inode);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  node "
+             << inode << " spans multiple channel segments which is not "
+             "allowed with global routing.");
     }
     break;
  
  case CHANY:
     if (xhigh > nx || ylow < 1 || yhigh > ny || xlow != xhigh) {
-       printf("Error in check_node:  CHANY out of range.\n");
-       my_printf("Endpoints: (%d,%d) and (%d,%d)\n", xlow, ylow, xhigh, yhigh);
-       exit(1);
+       throw InternalError (Formatter () << "Error in check_node:  CHANY "
+             "out of range.  Endpoints: (" << xlow << "," << ylow << ") and "
+             "(" << xhigh << "," << yhigh << ")");
     }
     if (route_type == GLOBAL && ylow != yhigh) {
-       printf ("Error in check_node:  node %d spans multiple channel segments\n"               "which is not allowed with global routing.\n", inode);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  node "
+             << inode << " spans multiple channel segments which is not "
+             "allowed with global routing.");
     }
     break;
  
  default:
-    printf("Error in check_node:  Unexpected segment type: %d\n", rr_type);
-    exit(1);
+    throw InternalError (Formatter () << "Error in check_node:  Unexpected "
+          "segment type: " << rr_type);
  }
  
 /* Check that it's capacities and such make sense. */
@@ -259,26 +263,26 @@ void check_node (int inode, enum e_route_type route_type) {
  case SOURCE:
     if (clb[xlow][ylow].type == CLB) {
        if (ptc_num >= num_class || class_inf[ptc_num].type != DRIVER) {
-          printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a ptc_num of "
+                << ptc_num << ".");
        }
        if (class_inf[ptc_num].num_pins != capacity) {
-          printf ("Error in check_node.  Inode %d (type %d) had a capacity\n"
-                  "of %d.\n", inode, rr_type, capacity);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a capacity of "
+                << capacity << ".");
        }
     }
     else {   /* IO block */
        if (ptc_num >= io_rat) {
-          printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a ptc_num of "
+                << ptc_num << ".");
        }
        if (capacity != 1) {
-          printf ("Error in check_node:  Inode %d (type %d) had a capacity\n"
-                  "of %d.\n", inode, rr_type, capacity);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node:  Inode "
+                << inode << " (type " << rr_type << ") had a capacity of "
+                << capacity << ".");
        }
     }
     break;
@@ -286,26 +290,26 @@ void check_node (int inode, enum e_route_type route_type) {
  case SINK:
     if (clb[xlow][ylow].type == CLB) {
        if (ptc_num >= num_class || class_inf[ptc_num].type != RECEIVER) {
-          printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a ptc_num of "
+                << ptc_num << ".");
        }
        if (class_inf[ptc_num].num_pins != capacity) {
-          printf ("Error in check_node.  Inode %d (type %d) has a capacity\n"
-                  "of %d.\n", inode, rr_type, capacity);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") has a capacity of "
+                << capacity << ".");
        }
     }
     else {   /* IO block */
        if (ptc_num >= io_rat) {
-          printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a ptc_num of "
+                << ptc_num << ".");
        }
        if (capacity != 1) {
-          printf ("Error in check_node:  Inode %d (type %d) has a capacity\n"
-                  "of %d.\n", inode, rr_type, capacity);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node:  Inode "
+                << inode << " (type " << rr_type << ") has a capacity of "
+                << capacity << ".");
        }
     }
     break;
@@ -314,24 +318,24 @@ void check_node (int inode, enum e_route_type route_type) {
     if (clb[xlow][ylow].type == CLB) {
        if (ptc_num >= pins_per_clb || class_inf[clb_pin_class[ptc_num]].type
                 != DRIVER) {
-          printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a ptc_num of "
+                << ptc_num << ".");
        }
     }
 
     else {  /* IO block */
        if (ptc_num >= io_rat) {
-          printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a ptc_num of "
+                << ptc_num << ".");
        }
     }
 
     if (capacity != 1) {
-      printf ("Error in check_node:  Inode %d (type %d) has a capacity\n"
-                  "of %d.\n", inode, rr_type, capacity);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  Inode "
+             << inode << " (type " << rr_type << ") has a capacity of "
+             << capacity << ".");
     }
     break;
  
@@ -339,22 +343,22 @@ void check_node (int inode, enum e_route_type route_type) {
     if (clb[xlow][ylow].type == CLB) {
        if (ptc_num >= pins_per_clb || class_inf[clb_pin_class[ptc_num]].type
                 != RECEIVER) {
-          printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a ptc_num of "
+                << ptc_num << ".");
        }
     }
     else {   /* IO block */
        if (ptc_num >= io_rat) {
-          printf ("Error in check_node.  Inode %d (type %d) had a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-          exit (1);
+          throw InternalError (Formatter () << "Error in check_node.  Inode "
+                << inode << " (type " << rr_type << ") had a ptc_num of "
+                << ptc_num << ".");
        }
     }
     if (capacity != 1) {
-      printf ("Error in check_node:  Inode %d (type %d) has a capacity\n"
-                  "of %d.\n", inode, rr_type, capacity);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  Inode "
+             << inode << " (type " << rr_type << ") has a capacity of "
+             << capacity << ".");
     }
     break;
  
@@ -369,15 +373,15 @@ void check_node (int inode, enum e_route_type route_type) {
     }
  
     if (ptc_num >= nodes_per_chan) {
-      printf ("Error in check_node:  Inode %d (type %d) has a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  Inode "
+             << inode << " (type " << rr_type << ") has a ptc_num of "
+             << ptc_num << ".");
     }
  
     if (capacity != tracks_per_node) {
-      printf ("Error in check_node:  Inode %d (type %d) has a capacity\n"
-                  "of %d.\n", inode, rr_type, capacity);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  Inode "
+             << inode << " (type " << rr_type << ") has a capacity of "
+             << capacity << ".");
     }
     break;
  
@@ -392,21 +396,21 @@ void check_node (int inode, enum e_route_type route_type) {
     }
  
     if (ptc_num >= nodes_per_chan) {
-      printf ("Error in check_node:  Inode %d (type %d) has a ptc_num\n"
-                  "of %d.\n", inode, rr_type, ptc_num);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  Inode "
+             << inode << " (type " << rr_type << ") has a ptc_num of "
+             << ptc_num << ".");
     }
  
     if (capacity != tracks_per_node) {
-      printf ("Error in check_node:  Inode %d (type %d) has a capacity\n"
-                  "of %d.\n", inode, rr_type, capacity);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node:  Inode "
+             << inode << " (type " << rr_type << ") has a capacity of "
+             << capacity << ".");
     }
     break;
  
  default:
-    printf("Error in check_node:  Unexpected segment type: %d\n", rr_type);
-    exit(1);
+    throw InternalError (Formatter () << "Error in check_node:  Unexpected "
+          "segment type: " << rr_type);
  
  }
 
@@ -416,16 +420,15 @@ void check_node (int inode, enum e_route_type route_type) {
  
  if (rr_type != SINK) {
     if (num_edges <= 0) {
-       printf ("Error in check_node: node %d has no edges.\n", inode);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node: node "
+             << inode << " has no edges.");
     }    
  }
 
  else {   /* SINK -- remove this check if feedthroughs allowed */
     if (num_edges != 0) {
-       printf ("Error in check_node: node %d is a sink, but has "
-               "%d edges.\n", inode, num_edges);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node: node "
+             << inode << " is a sink, but has " << num_edges << " edges.");
     }
  }
 
@@ -436,25 +439,24 @@ void check_node (int inode, enum e_route_type route_type) {
 
  if (rr_type == CHANX || rr_type == CHANY) {
     if (C < 0. || R < 0.) {
-       printf ("Error in check_node: node %d of type %d has R = %g "
-               "and C = %g.\n", inode, rr_type, R, C);
-       exit (1);
+       throw InternalError (Formatter () << "Error in check_node: node "
+             << inode << " of type " << rr_type << " has R = " << R
+             << " and C = " << C << ".");
     }
  }
    
  else {
     if (C != 0. || R != 0.) {
-       printf ("Error in check_node: node %d of type %d has R = %g "
-               "and C = %g.\n", inode, rr_type, R, C);
-       exit (1); 
+       throw InternalError (Formatter () << "Error in check_node: node "
+             << inode << " of type " << rr_type << " has R = " << R
+             << " and C = " << C << ".");
     }
  }
 
  cost_index = rr_node[inode].cost_index;
  if (cost_index < 0 || cost_index >= num_rr_indexed_data) {
-    printf ("Error in check_node:  node %d cost index (%d) is out of "
-            "range.\n", inode, cost_index);
-    exit (1);
+    throw InternalError (Formatter () << "Error in check_node:  node "
+          << inode << " cost index (" << cost_index << ") is out of range.");
  }
 }
 
@@ -504,11 +506,11 @@ static void check_pass_transistors (int from_node) {
     }
 
     if (trans_matched == FALSE) {
-       printf ("Error in check_pass_transistors:  Connection from node %d to\n"
-            "node %d uses a pass transistor (switch type %d), but there is\n"
-            "no corresponding pass transistor edge in the other direction.\n",
-            from_node, to_node, from_switch_type);
-       exit (1);
+       throw InternalError (Formatter () << "Error in "
+             "check_pass_transistors:  Connection from node " << from_node
+             << " to node " << to_node << " uses a pass transistor (switch "
+             "type " << from_switch_type << "), but there is no "
+             "corresponding pass transistor edge in the other direction.");
     }
 
  }   /* End for all from_node edges */
@@ -7,6 +7,7 @@
 #include "graphics.h"
 #include "path_delay.h"
 #include "draw.h"
+#include "VprError.hpp"
 
 
 /*************** Types local to this module *********************************/
@@ -631,9 +632,8 @@ static void draw_rr (void) {
        break;
 
     default:
-       printf("Error in draw_rr:  Unexpected rr_node type: %d.\n",
-               rr_node[inode].type);
-       exit (1);
+       throw std::runtime_error (Formatter () << "Error in draw_rr:  "
+             "Unexpected rr_node type: " << rr_node[inode].type << ".");
     }
  }
 
@@ -706,9 +706,10 @@ static void draw_rr_edges (int inode) {
           break;
 
        default:
-          printf("Error in draw_rr_edges:  node %d (type: %d) connects to \n"
-             "node %d (type: %d).\n", inode, from_type, to_node, to_type);
-          exit (1);
+          throw std::runtime_error (Formatter () << "Error in "
+                "draw_rr_edges:  node " << inode << " (type: " << from_type
+                << ") connects to node " << to_node << " (type: " << to_type
+                << ").");
           break;
        }
 
@@ -741,9 +742,10 @@ static void draw_rr_edges (int inode) {
           break;
 
        default:
-          printf("Error in draw_rr_edges:  node %d (type: %d) connects to \n"
-             "node %d (type: %d).\n", inode, from_type, to_node, to_type);
-          exit (1);
+          throw std::runtime_error (Formatter () << "Error in "
+                "draw_rr_edges:  node " << inode << " (type: " << from_type
+                << ") connects to node " << to_node << " (type: " << to_type
+                << ").");
           break;
 
        }
@@ -776,18 +778,18 @@ static void draw_rr_edges (int inode) {
           break;
 
        default:
-          printf("Error in draw_rr_edges:  node %d (type: %d) connects to \n"
-             "node %d (type: %d).\n", inode, from_type, to_node, to_type);
-          exit (1);
+          throw std::runtime_error (Formatter () << "Error in "
+                "draw_rr_edges:  node " << inode << " (type: " << from_type
+                << ") connects to node " << to_node << " (type: " << to_type
+                << ").");
           break;
        }
        break;
 
 
     default:                     /* from_type */
-       printf("Error:  draw_rr_edges called with node %d of type %d.\n",
-               inode, from_type);
-       exit (1);
+       throw std::runtime_error (Formatter () << "Error:  draw_rr_edges "
+             "called with node " << inode << " of type " << from_type << ".");
        break;
     }
 
@@ -847,9 +849,8 @@ static void draw_pin_to_chan_edge (int pin_node, int chan_node, int itrack,
     break;
 
  default:
-    printf ("Error in draw_pin_to_chan_edge:  invalid channel node %d.\n",
-            chan_node);
-    exit (1);
+    throw std::runtime_error (Formatter () << "Error in "
+          "draw_pin_to_chan_edge:  invalid channel node " << chan_node << ".");
  }
 
  drawline (x1, y1, x2, y2);
@@ -1184,9 +1185,8 @@ static void get_rr_pin_draw_coords (int inode, int iside, float *xcen,
      break;
 
   default:
-     printf ("Error in get_rr_pin_draw_coords:  Unexpected iside %d.\n",
-             iside);
-     exit (1);
+     throw std::runtime_error (Formatter () << "Error in "
+           "get_rr_pin_draw_coords:  Unexpected iside " << iside << ".");
      break;
  }
 
@@ -1295,9 +1295,10 @@ static void drawroute (enum e_draw_net_type draw_net_type) {
              break;
 
           default:
-             printf ("Error in drawroute:  Unexpected connection from an \n"
-                "rr_node of type %d to one of type %d.\n", prev_type, rr_type);
-             exit (1);
+             throw std::runtime_error (Formatter () << "Error in "
+                   "drawroute:  Unexpected connection from an rr_node of "
+                   "type " << prev_type << " to one of type " << rr_type
+                   << ".");
           }
 
           break;
@@ -1328,9 +1329,10 @@ static void drawroute (enum e_draw_net_type draw_net_type) {
              break;
 
           default:
-             printf ("Error in drawroute:  Unexpected connection from an \n"
-                "rr_node of type %d to one of type %d.\n", prev_type, rr_type);
-             exit (1);
+             throw std::runtime_error (Formatter () << "Error in "
+                   "drawroute:  Unexpected connection from an rr_node of "
+                   "type " << prev_type << " to one of type " << rr_type
+                   << ".");
           }
 
           break;
@@ -1377,9 +1379,8 @@ static int get_track_num (int inode, int **chanx_track, int **chany_track) {
     return (chany_track[i][j]);
 
  default:
-    printf ("Error in get_track_num:  unexpected node type %d for node %d."
-            "\n", rr_type, inode);
-    exit (1);
+    throw std::runtime_error (Formatter () << "Error in get_track_num:  "
+          "unexpected node type " << rr_type << " for node " << inode << ".");
  }
 }
 
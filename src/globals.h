@@ -7,6 +7,11 @@
 #include "vpr_types.h"
 #include "State.hpp"
 #include "Result.hpp"
+#include "FileMd5Cache.hpp"
+#include "ParseCache.hpp"
+#include "RrGraphCache.hpp"
+#include "NetlistCache.hpp"
+#include "PlaceDelayCache.hpp"
 
 #ifdef IGNORE_PRINTF
 
@@ -23,6 +28,19 @@ extern RouteState g_route_state;
 extern RouteResult g_route_result;
 extern std::vector<RouteState> g_route_states;
 extern std::vector<std::string> g_args;
+/* Process-wide cache of input file MD5 hashes _(see `FileMd5Cache.hpp`)_. */
+extern FileMd5Cache g_file_md5_cache;
+/* Process-wide cache of parsed input files _(see `ParseCache.hpp`)_. */
+extern ParseCache g_parse_cache;
+/* Process-wide on-disk cache of routing resource graphs _(see
+ * `RrGraphCache.hpp`)_. */
+extern RrGraphCache g_rr_graph_cache;
+/* Process-wide on-disk cache of compiled netlists _(see
+ * `NetlistCache.hpp`)_. */
+extern NetlistCache g_netlist_cache;
+/* Process-wide cache of placement delay lookup matrices _(see
+ * `PlaceDelayCache.hpp`)_. */
+extern PlaceDelayCache g_place_delay_cache;
 /* Mapping from file type _(i.e., `net`, `arch`, `placed`, or `routed`)_ to
  * corresponding file-path.
  * __NB__ The `routed` file-path is only present when routing is enabled. */
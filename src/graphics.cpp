@@ -14,6 +14,7 @@
 #include <X11/Xutil.h>
 #include <X11/Xos.h>
 #include <X11/Xatom.h>
+#include "VprError.hpp"
 
 #endif
 
@@ -231,8 +232,7 @@ static void load_font(int pointsize) {
 /* Load font and get font information structure. */
 
   if ((font_info[pointsize] = XLoadQueryFont(display,fontname)) == NULL) {
-     fprintf( stderr, "Cannot open desired font\n");
-     exit( -1 );
+     throw std::runtime_error (Formatter () << "Cannot open desired font");
   }
 }
 
@@ -532,9 +532,8 @@ void create_button (char *prev_button_text , char *button_text,
  }
 
  if (bnum == -1) {
-    printf ("Error in create_button:  button with text %s not found.\n",
-            prev_button_text);
-    exit (1);
+    throw std::runtime_error (Formatter () << "Error in create_button:  "
+          "button with text " << prev_button_text << " not found.");
  }
 
  num_buttons++;
@@ -586,9 +585,8 @@ void destroy_button (char *button_text) {
  }
 
  if (bnum == -1) {
-    printf ("Error in destroy_button:  button with text %s not found.\n",
-            button_text);
-    exit (1);
+    throw std::runtime_error (Formatter () << "Error in destroy_button:  "
+          "button with text " << button_text << " not found.");
  }
 
  for (i=bnum+1;i<num_buttons;i++) {
@@ -640,9 +638,8 @@ void init_graphics (char *window_name) {
         /* connect to X server */
  if ( (display=XOpenDisplay(display_name)) == NULL )
  {
-     fprintf( stderr, "Cannot connect to X server %s\n",
-                          XDisplayName(display_name));
-     exit( -1 );
+     throw std::runtime_error (Formatter () << "Cannot connect to X server "
+           << XDisplayName(display_name));
  }
 
  /* get screen size from display structure macro */
@@ -660,8 +657,8 @@ void init_graphics (char *window_name) {
 
  for (i=0;i<NUM_COLOR;i++) {
     if (!XParseColor(display,cmap,cnames[i],&exact_def)) {
-       fprintf(stderr, "Color name %s not in database", cnames[i]);
-       exit(-1);
+       throw std::runtime_error (Formatter () << "Color name " << cnames[i]
+             << " not in database");
     }
     if (!XAllocColor(display, cmap, &exact_def)) {
        fprintf(stderr, "Couldn't allocate color %s.\n",cnames[i]);
@@ -676,16 +673,14 @@ void init_graphics (char *window_name) {
           private_cmap = XCopyColormapAndFree (display, cmap);
           cmap = private_cmap;
           if (!XAllocColor (display, cmap, &exact_def)) {
-             fprintf (stderr, "Couldn't allocate color %s as private.\n",
-                 cnames[i]);
-             exit (1);
+             throw std::runtime_error (Formatter () << "Couldn't allocate "
+                   "color " << cnames[i] << " as private.");
           }
        }
 
        else {
-          fprintf (stderr, "Couldn't allocate color %s as private.\n",
-              cnames[i]);
-          exit (1);
+          throw std::runtime_error (Formatter () << "Couldn't allocate "
+                "color " << cnames[i] << " as private.");
        }
     }
     colors[i] = exact_def.pixel;
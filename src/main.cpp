@@ -15,18 +15,22 @@
 #include "print_netlist.h"
 #include "read_arch.h"
 #include "read_place.h"
+#include "rr_graph.h"
 #include "draw.h"
 #include "place_and_route.h"
 #include "stats.h"
 #include "path_delay.h"
+#include "timing_place.h"
 #include "State.hpp"
 #include "Result.hpp"
 #include "md5.hpp"
 #include "SignalException.hpp"
 #include "Main.h"
 #include "route_export.h"
+#include "route_common.h"
 #include "net_delay.h"
 #include "timing.hpp"
+#include "VprError.hpp"
 
 using std::vector;
 using std::map;
@@ -40,6 +44,11 @@ RouteState g_route_state;
 RouteResult g_route_result;
 vector<RouteState> g_route_states;
 vector<string> g_args;
+FileMd5Cache g_file_md5_cache;
+ParseCache g_parse_cache;
+RrGraphCache g_rr_graph_cache;
+NetlistCache g_netlist_cache;
+PlaceDelayCache g_place_delay_cache;
 
              /********** Netlist to be mapped stuff ****************/
 
@@ -117,11 +126,19 @@ int **rr_clb_source;          /* [0..num_blocks-1][0..num_class-1]*/
 
 static void get_input (char *net_file, char *arch_file, int place_cost_type,
      int num_regions, float aspect_ratio, boolean user_sized,
+     enum e_route_type route_type, struct s_det_routing_arch
+     *det_routing_arch, t_segment_inf **segment_inf_ptr,
+     t_timing_inf *timing_inf_ptr, t_subblock_data *subblock_data_ptr,
+     t_chan_width_dist *chan_width_dist_ptr, string const &parse_key);
+
+static void read_input (char *net_file, char *arch_file,
      enum e_route_type route_type, struct s_det_routing_arch
      *det_routing_arch, t_segment_inf **segment_inf_ptr,
      t_timing_inf *timing_inf_ptr, t_subblock_data *subblock_data_ptr,
      t_chan_width_dist *chan_width_dist_ptr);
 
+static void free_netlist_and_arch (void);
+
 static void parse_command (int argc, char *argv[], char *net_file, char
     *arch_file, char *place_file, char *route_file, enum e_operation
     *operation, float *aspect_ratio,  boolean *full_stats, boolean *user_sized,
@@ -190,6 +207,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 						  *no inner loop recomputes be done*/
   placer_opts->td_place_exp_first = 1; /*exponentiation starts at 1 */
   placer_opts->td_place_exp_last = 8;   /*experimental results indicate 8 is good*/
+  placer_opts->start_t = -1;     /* Negative:  find the starting temperature. */
+  placer_opts->start_rlim = -1;  /* Non-positive:  start with the whole chip. */
 
 
 /* Old values for breadth first router: first_iter_pres_fac = 0, *
@@ -201,6 +220,15 @@ static void parse_command (int argc, char *argv[], char *net_file, char
   router_opts->pres_fac_mult = 2;
   router_opts->acc_fac = 1;
   router_opts->base_cost_type = DEMAND_ONLY;
+  router_opts->heap_type = BINARY_HEAP;
+  router_opts->rr_graph_layout = RR_GRAPH_STRUCTS;
+  router_opts->route_threads = 1;
+  router_opts->incremental_reroute = FALSE;
+  router_opts->reroute_crit_change = -1.;
+  router_opts->route_abort = ABORT_NEVER;
+  router_opts->abort_iterations = 5;
+  router_opts->export_traceback = FALSE;
+  router_opts->route_file_format = ROUTE_FILE_TEXT;
   router_opts->bend_cost = 1.;
   router_opts->max_router_iterations = 30;
   router_opts->bb_factor = 3;
@@ -234,6 +262,7 @@ static void parse_command (int argc, char *argv[], char *net_file, char
     my_printf("\t[-place_algorithm bounding_box | net_timing_driven | path_timing_driven]\n");
     my_printf("\t[-init_t <float>] [-exit_t <float>]\n");
     my_printf("\t[-alpha_t <float>] [-inner_num <float>] [-seed <int>]\n");
+    my_printf("\t[-start_t <float>] [-start_rlim <float>]\n");
     my_printf("\t[-place_cost_exp <float>] [-place_cost_type linear | "
 	   "nonlinear]\n");
     my_printf("\t[-place_chan_width <int>] [-num_regions <int>] \n");
@@ -256,12 +285,19 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	   "\t[-verify_binary_search] [-route_chan_width <int>]\n"
 	   "\t[-router_algorithm breadth_first | timing_driven]\n"
 	   "\t[-base_cost_type intrinsic_delay | delay_normalized | "
-	   "demand_only]\n");
+	   "demand_only]\n"
+	   "\t[-heap_type binary | 4ary] [-route_threads <int>]\n"
+	   "\t[-rr_graph_layout structs | csr]\n"
+	   "\t[-incremental_reroute on | off]\n"
+	   "\t[-route_abort never | stalled | extrapolated] "
+	   "[-abort_iterations <int>]\n"
+	   "\t[-export_traceback on | off] [-route_file_format text | binary]\n");
 
     my_printf ("\nRouting options valid only for timing-driven routing:\n"
 	    "\t[-astar_fac <float>] [-max_criticality <float>]\n"
-	    "\t[-criticality_exp <float>]\n\n");
-    throw std::runtime_error("1");
+	    "\t[-criticality_exp <float>] [-reroute_crit_change <float>]\n\n");
+    throw ParseError (Formatter () << "Usage:  vpr circuit.net fpga.arch "
+          "placed.out routed.out [Options ...]");
   }
 
   strncpy(net_file,argv[1],BUFSIZE);
@@ -280,8 +316,7 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       *aspect_ratio = read_float_option (argc, argv, i);
 
       if (*aspect_ratio <= 0.) {
-	printf("Error:  Aspect ratio must be > 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  Aspect ratio must be > 0.");
       }
 
       i += 2;
@@ -299,8 +334,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       *gr_automode = read_int_option (argc, argv, i);
 
       if ((*gr_automode > 2) || (*gr_automode < 0)) {
-	printf("Error:  -auto value must be between 0 and 2.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -auto value must be between 0 "
+	      "and 2.");
       }
 
       i += 2;
@@ -311,8 +346,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
       placer_opts->recompute_crit_iter = read_int_option (argc, argv, i);
       if (placer_opts->recompute_crit_iter < 1) {
-	printf("Error: -recompute_crit_iter must be 1 or more \n");
-	exit (1);
+	throw ParseError (Formatter () << "Error: -recompute_crit_iter must be 1 "
+	      "or more");
       }
       i += 2;
       continue;
@@ -322,8 +357,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
       placer_opts->inner_loop_recompute_divider = read_int_option (argc, argv, i);
       if (placer_opts->inner_loop_recompute_divider < 1) {
-	printf("Error: -inner_loop_recompute_divider must be 1 or more \n");
-	exit (1);
+	throw ParseError (Formatter () << "Error: -inner_loop_recompute_divider "
+	      "must be 1 or more");
       }
       i += 2;
       continue;
@@ -332,8 +367,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
     if (strcmp(argv[i],"-fix_pins") == 0) {
 
       if (argc <= i+1) {
-	printf("Error:  -fix_pins option requires a string parameter.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -fix_pins option requires a "
+	      "string parameter.");
       }
 
       if (strcmp(argv[i+1], "random") == 0) {
@@ -361,8 +396,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       *user_sized = TRUE;
 
       if (nx <= 0) {
-	printf("Error:  -nx value must be greater than 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -nx value must be greater than "
+	      "0.");
       }
 
       i += 2;
@@ -375,8 +410,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       *user_sized = TRUE;
 
       if (ny <= 0) {
-	printf("Error:  -ny value must be greater than 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -ny value must be greater than "
+	      "0.");
       }
 
       i += 2;
@@ -400,9 +435,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
     if (strcmp (argv[i],"-timing_analysis") == 0) {
       if (argc <= i+1) {
-	printf ("Error:  -timing_analysis option requires a string "
-		"parameter.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -timing_analysis option "
+	      "requires a string parameter.");
       }
       if (strcmp(argv[i+1], "on") == 0) {
 	*timing_analysis_enabled = TRUE;
@@ -411,8 +445,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	*timing_analysis_enabled = FALSE;
       }
       else {
-	printf("Error:  -timing_analysis must be on or off.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -timing_analysis must be on or "
+	      "off.");
       }
 
       i += 2;
@@ -426,9 +460,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       *constant_net_delay = read_float_option (argc, argv, i);
 
       if (*constant_net_delay < 0.) {
-	printf("Error:  -timing_analyze_only_with_net_delay value must "
-	       "be > 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  "
+	      "-timing_analyze_only_with_net_delay value must be > 0.");
       }
 
       i += 2;
@@ -441,8 +474,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       annealing_sched->init_t = read_float_option (argc, argv, i);
 
       if (annealing_sched->init_t < 0) {
-	printf("Error:  -init_t value must be nonnegative 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -init_t value must be "
+	      "nonnegative 0.");
       }
 
       annealing_sched->type = USER_SCHED;
@@ -456,8 +489,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
       if ((annealing_sched->alpha_t <= 0) ||
 	  (annealing_sched->alpha_t >= 1.)) {
-	printf("Error:  -alpha_t value must be between 0. and 1.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -alpha_t value must be between "
+	      "0. and 1.");
       }
 
       annealing_sched->type = USER_SCHED;
@@ -470,8 +503,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       annealing_sched->exit_t = read_float_option (argc, argv, i);
 
       if (annealing_sched->exit_t <= 0.) {
-	printf("Error:  -exit_t value must be greater than 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -exit_t value must be greater "
+	      "than 0.");
       }
 
       annealing_sched->type = USER_SCHED;
@@ -479,13 +512,29 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       continue;
     }
 
+    if (strcmp(argv[i],"-start_t") == 0) {
+
+      placer_opts->start_t = read_float_option (argc, argv, i);
+
+      i += 2;
+      continue;
+    }
+
+    if (strcmp(argv[i],"-start_rlim") == 0) {
+
+      placer_opts->start_rlim = read_float_option (argc, argv, i);
+
+      i += 2;
+      continue;
+    }
+
     if (strcmp(argv[i],"-inner_num") == 0) {
 
       annealing_sched->inner_num = read_float_option (argc, argv, i);
 
       if (annealing_sched->inner_num <= 0.) {
-	printf("Error:  -inner_num value must be greater than 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -inner_num value must be "
+	      "greater than 0.");
       }
 
       i += 2;
@@ -505,8 +554,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       placer_opts->place_cost_exp = read_float_option (argc, argv, i);
 
       if (placer_opts->place_cost_exp < 0.) {
-	printf("Error:  -place_cost_exp value must be nonnegative.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -place_cost_exp value must be "
+	      "nonnegative.");
       }
 
       i += 2;
@@ -520,8 +569,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       placer_opts->td_place_exp_first = read_float_option (argc, argv, i);
 
       if (placer_opts->td_place_exp_first < 0.) {
-	printf("Error:  -td_place_exp_first value must be nonnegative.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -td_place_exp_first value must "
+	      "be nonnegative.");
       }
 
       i += 2;
@@ -535,8 +584,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       placer_opts->td_place_exp_last = read_float_option (argc, argv, i);
 
       if (placer_opts->td_place_exp_last < 0.) {
-	printf("Error:  -td_place_exp_last value must be nonnegative.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -td_place_exp_last value must "
+	      "be nonnegative.");
       }
 
       i += 2;
@@ -548,9 +597,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
     if (strcmp(argv[i],"-place_algorithm") == 0) {
 
       if (argc <= i+1) {
-	printf("Error:  -place_algorithm option requires a "
-               "string parameter.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -place_algorithm option "
+	      "requires a string parameter.");
       }
 
       if (strcmp(argv[i+1], "bounding_box") == 0) {
@@ -563,9 +611,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	placer_opts->place_algorithm = PATH_TIMING_DRIVEN_PLACE;
       }
       else {
-	printf("Error:  -place_algorithm must be bounding_box, "
-	       "net_timing_driven, or path_timing_driven\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -place_algorithm must be "
+	      "bounding_box, net_timing_driven, or path_timing_driven");
       }
 
       i += 2;
@@ -578,8 +625,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       placer_opts->timing_tradeoff = read_float_option (argc, argv, i);
 
       if (placer_opts->timing_tradeoff < 0.) {
-	printf("Error:  -timing_tradeoff value must be nonnegative.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -timing_tradeoff value must be "
+	      "nonnegative.");
       }
 
       i += 2;
@@ -590,9 +637,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
     if (strcmp(argv[i],"-enable_timing_computations") == 0) {
       if (argc <= i+1) {
-	printf ("Error:  -enable_timing_computations option requires a string "
-		"parameter.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -enable_timing_computations "
+	      "option requires a string parameter.");
       }
       if (strcmp(argv[i+1], "on") == 0) {
 	placer_opts->enable_timing_computations= TRUE;
@@ -601,8 +647,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	placer_opts->enable_timing_computations = FALSE;
       }
       else {
-	printf("Error:  -enable_timing_computations must be on or off.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -enable_timing_computations "
+	      "must be on or off.");
       }
       i += 2;
       continue;
@@ -615,8 +661,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       placer_opts->block_dist = read_int_option (argc, argv, i);
 
       if (placer_opts->block_dist < 0.) {
-	printf("Error:  -block_dist value must be nonnegative.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -block_dist value must be "
+	      "nonnegative.");
       }
 
       i += 2;
@@ -627,9 +673,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
     if (strcmp(argv[i],"-place_cost_type") == 0) {
 
       if (argc <= i+1) {
-	printf("Error:  -place_cost_type option requires a "
-               "string parameter.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -place_cost_type option "
+	      "requires a string parameter.");
       }
 
       if (strcmp(argv[i+1], "linear") == 0) {
@@ -639,8 +684,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	placer_opts->place_cost_type = NONLINEAR_CONG;
       }
       else {
-	printf("Error:  -place_cost_type must be linear or nonlinear.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -place_cost_type must be linear "
+	      "or nonlinear.");
       }
 
       i += 2;
@@ -653,8 +698,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       placer_opts->num_regions = read_int_option (argc, argv, i);
 
       if (placer_opts->num_regions <= 0.) {
-	printf("Error:  -num_regions value must be greater than 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -num_regions value must be "
+	      "greater than 0.");
       }
 
       i += 2;
@@ -667,8 +712,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       placer_opts->place_chan_width = read_int_option (argc, argv, i);
 
       if (placer_opts->place_chan_width <= 0.) {
-	printf("Error:  -place_chan_width value must be greater than 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -place_chan_width value must be "
+	      "greater than 0.");
       }
 
       i += 2;
@@ -681,8 +726,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->max_router_iterations = read_int_option (argc, argv, i);
 
       if (router_opts->max_router_iterations < 0) {
-	printf("Error:  -max_router_iterations value is less than 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -max_router_iterations value is "
+	      "less than 0.");
       }
 
       i += 2;
@@ -694,8 +739,179 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->bb_factor = read_int_option (argc, argv, i);
 
       if (router_opts->bb_factor < 0) {
-	printf("Error:  -bb_factor is less than 0.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -bb_factor is less than 0.");
+      }
+
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-heap_type") == 0) {
+
+      if (argc <= i+1) {
+	throw ParseError (Formatter () << "Error:  -heap_type option requires a "
+	      "string parameter.");
+      }
+
+      if (strcmp(argv[i+1], "binary") == 0) {
+	router_opts->heap_type = BINARY_HEAP;
+      }
+      else if (strcmp(argv[i+1], "4ary") == 0) {
+	router_opts->heap_type = FOUR_ARY_HEAP;
+      }
+      else {
+	throw ParseError (Formatter () << "Error:  -heap_type must be binary or "
+	      "4ary.");
+      }
+
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-rr_graph_layout") == 0) {
+
+      if (argc <= i+1) {
+	throw ParseError (Formatter () << "Error:  -rr_graph_layout option "
+	      "requires a string parameter.");
+      }
+
+      if (strcmp(argv[i+1], "structs") == 0) {
+	router_opts->rr_graph_layout = RR_GRAPH_STRUCTS;
+      }
+      else if (strcmp(argv[i+1], "csr") == 0) {
+	router_opts->rr_graph_layout = RR_GRAPH_CSR;
+      }
+      else {
+	throw ParseError (Formatter () << "Error:  -rr_graph_layout must be "
+	      "structs or csr.");
+      }
+
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-route_file_format") == 0) {
+
+      if (argc <= i+1) {
+	throw ParseError (Formatter () << "Error:  -route_file_format option "
+	      "requires a string parameter.");
+      }
+
+      if (strcmp(argv[i+1], "text") == 0) {
+	router_opts->route_file_format = ROUTE_FILE_TEXT;
+      }
+      else if (strcmp(argv[i+1], "binary") == 0) {
+	router_opts->route_file_format = ROUTE_FILE_BINARY;
+      }
+      else {
+	throw ParseError (Formatter () << "Error:  -route_file_format must be "
+	      "text or binary.");
+      }
+
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-route_threads") == 0) {
+
+      router_opts->route_threads = read_int_option (argc, argv, i);
+
+      if (router_opts->route_threads < 1) {
+	throw ParseError (Formatter () << "Error:  -route_threads must be at least "
+	      "1.");
+      }
+
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-incremental_reroute") == 0) {
+      if (argc <= i+1) {
+	throw ParseError (Formatter () << "Error:  -incremental_reroute option "
+	      "requires a string parameter.");
+      }
+      if (strcmp(argv[i+1], "on") == 0) {
+	router_opts->incremental_reroute = TRUE;
+      }
+      else if (strcmp(argv[i+1], "off") == 0) {
+	router_opts->incremental_reroute = FALSE;
+      }
+      else {
+	throw ParseError (Formatter () << "Error:  -incremental_reroute must be on "
+	      "or off.");
+      }
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-export_traceback") == 0) {
+      if (argc <= i+1) {
+	throw ParseError (Formatter () << "Error:  -export_traceback option "
+	      "requires a string parameter.");
+      }
+      if (strcmp(argv[i+1], "on") == 0) {
+	router_opts->export_traceback = TRUE;
+      }
+      else if (strcmp(argv[i+1], "off") == 0) {
+	router_opts->export_traceback = FALSE;
+      }
+      else {
+	throw ParseError (Formatter () << "Error:  -export_traceback must be on "
+	      "or off.");
+      }
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-reroute_crit_change") == 0) {
+
+      router_opts->reroute_crit_change = read_float_option (argc, argv, i);
+
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-route_abort") == 0) {
+
+      if (argc <= i+1) {
+	throw ParseError (Formatter () << "Error:  -route_abort option requires a "
+	      "string parameter.");
+      }
+
+      if (strcmp(argv[i+1], "never") == 0) {
+	router_opts->route_abort = ABORT_NEVER;
+      }
+      else if (strcmp(argv[i+1], "stalled") == 0) {
+	router_opts->route_abort = ABORT_STALLED;
+      }
+      else if (strcmp(argv[i+1], "extrapolated") == 0) {
+	router_opts->route_abort = ABORT_EXTRAPOLATED;
+      }
+      else {
+	throw ParseError (Formatter () << "Error:  -route_abort must be never, "
+	      "stalled or extrapolated.");
+      }
+
+      i += 2;
+      continue;
+    }
+
+
+    if (strcmp(argv[i],"-abort_iterations") == 0) {
+
+      router_opts->abort_iterations = read_int_option (argc, argv, i);
+
+      if (router_opts->abort_iterations < 1) {
+	throw ParseError (Formatter () << "Error:  -abort_iterations must be at "
+	      "least 1.");
       }
 
       i += 2;
@@ -706,9 +922,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
     if (strcmp(argv[i],"-router_algorithm") == 0) {
 
       if (argc <= i+1) {
-	printf("Error:  -router_algorithm option requires a string "
-	       "parameter.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -router_algorithm option "
+	      "requires a string parameter.");
       }
 
       if (strcmp(argv[i+1], "breadth_first") == 0) {
@@ -718,9 +933,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	router_opts->router_algorithm = TIMING_DRIVEN;
       }
       else {
-	printf("Error:  -router_algorithm must be breadth_first or "
-	       "timing_driven.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -router_algorithm must be "
+	      "breadth_first or timing_driven.");
       }
 
       i += 2;
@@ -733,8 +947,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->first_iter_pres_fac = read_float_option (argc, argv, i);
 
       if (router_opts->first_iter_pres_fac < 0.) {
-	printf("Error:  -first_iter_pres_fac must be nonnegative.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -first_iter_pres_fac must be "
+	      "nonnegative.");
       }
 
       i += 2;
@@ -747,8 +961,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->initial_pres_fac = read_float_option (argc, argv, i);
 
       if (router_opts->initial_pres_fac <= 0.) {
-	printf("Error:  -initial_pres_fac must be greater than 0.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -initial_pres_fac must be "
+	      "greater than 0.");
       }
 
       i += 2;
@@ -761,9 +975,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->pres_fac_mult = read_float_option (argc, argv, i);
 
       if (router_opts->pres_fac_mult <= 0.) {
-	printf("Error:  -pres_fac_mult must be greater than "
-               "0.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -pres_fac_mult must be greater "
+	      "than 0.");
       }
 
       i += 2;
@@ -776,8 +989,7 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->acc_fac = read_float_option (argc, argv, i);
 
       if (router_opts->acc_fac < 0.) {
-	printf("Error:  -acc_fac must be nonnegative.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -acc_fac must be nonnegative.");
       }
 
       i += 2;
@@ -790,8 +1002,7 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->astar_fac = read_float_option (argc, argv, i);
 
       if (router_opts->astar_fac < 0.) {
-	printf("Error:  -astar_fac must be nonnegative.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -astar_fac must be nonnegative.");
       }
 
       i += 2;
@@ -805,9 +1016,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
       if (router_opts->max_criticality < 0. || router_opts->max_criticality
 	  >= 1.) {
-	printf("Error:  -max_criticality must be greater than or equal\n"
-	       "to 0 and less than 1.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -max_criticality must be "
+	      "greater than or equal to 0 and less than 1.");
       }
 
       i += 2;
@@ -820,8 +1030,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->criticality_exp = read_float_option (argc, argv, i);
 
       if (router_opts->criticality_exp < 0.) {
-	printf("Error:  -criticality_exp must be non-negative.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -criticality_exp must be "
+	      "non-negative.");
       }
 
       i += 2;
@@ -832,9 +1042,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
     if (strcmp(argv[i],"-base_cost_type") == 0) {
 
       if (argc <= i+1) {
-	printf("Error:  -base_cost_type option requires a string "
-	       "parameter.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -base_cost_type option requires "
+	      "a string parameter.");
       }
 
       if (strcmp(argv[i+1], "intrinsic_delay") == 0) {
@@ -847,9 +1056,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	router_opts->base_cost_type = DEMAND_ONLY;
       }
       else {
-	printf("Error:  -base_cost_type must be intrinsic_delay, "
-	       "delay_normalized or demand_only.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -base_cost_type must be "
+	      "intrinsic_delay, delay_normalized or demand_only.");
       }
 
       base_cost_type_set = TRUE;
@@ -863,8 +1071,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->bend_cost = read_float_option (argc, argv, i);
 
       if (router_opts->bend_cost < 0.) {
-	printf("Error:  -bend_cost cannot be less than 0.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -bend_cost cannot be less than "
+	      "0.");
       }
 
       bend_cost_set = TRUE;
@@ -876,9 +1084,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
     if (strcmp(argv[i],"-route_type") == 0) {
 
       if (argc <= i+1) {
-	printf("Error:  -route_type option requires a "
-               "string parameter.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -route_type option requires a "
+	      "string parameter.");
       }
 
       if (strcmp(argv[i+1], "global") == 0) {
@@ -888,8 +1095,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	router_opts->route_type = DETAILED;
       }
       else {
-	printf("Error:  -route_type must be global or detailed.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -route_type must be global or "
+	      "detailed.");
       }
 
       i += 2;
@@ -903,14 +1110,13 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       router_opts->fixed_channel_width = read_int_option (argc, argv, i);
 
       if (router_opts->fixed_channel_width <= 0) {
-	printf("Error:  -route_chan_width value must be greater than 0.\n");
-	throw std::runtime_error("1");
+	throw ParseError (Formatter () << "Error:  -route_chan_width value must be "
+	      "greater than 0.");
       }
 
       if (router_opts->fixed_channel_width >= MAX_CHANNEL_WIDTH) {
-	printf ("Error:  -router_chan_width value must be less than %d."
-		"\n", MAX_CHANNEL_WIDTH);
-	exit (1);
+	throw ParseError (Formatter () << "Error:  -router_chan_width value must "
+	      "be less than " << MAX_CHANNEL_WIDTH << ".");
       }
 
       i += 2;
@@ -920,8 +1126,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
     if (strcmp(argv[i],"-route_only") == 0) {
       if (*operation == PLACE_ONLY) {
-	printf("Error:  Both -route_only and -place_only specified.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  Both -route_only and "
+	      "-place_only specified.");
       }
       *operation = ROUTE_ONLY;
       placer_opts->place_freq = PLACE_NEVER;
@@ -932,8 +1138,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
     if (strcmp(argv[i],"-place_only") == 0) {
       if (*operation == ROUTE_ONLY) {
-	printf("Error:  Both -route_only and -place_only specified.\n");
-	exit (1);
+	throw ParseError (Formatter () << "Error:  Both -route_only and "
+	      "-place_only specified.");
       }
       *operation = PLACE_ONLY;
       i++;
@@ -947,8 +1153,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       continue;
     }
 
-    printf("Error:  Unrecognized flag: %s.  Aborting.\n",argv[i]);
-    throw std::runtime_error("1");
+    throw ParseError (Formatter () << "Error:  Unrecognized flag: "
+          << argv[i] << ".");
 
   }   /* End of giant while loop. */
 
@@ -956,10 +1162,9 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
   if (placer_opts->place_cost_type == NONLINEAR_CONG && *operation !=
       PLACE_AND_ROUTE && do_one_nonlinear_place == FALSE) {
-    printf("Error:  Replacing using the nonlinear congestion option\n");
-    my_printf("        for each channel width makes sense only for full "
-	   "place and route.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  Replacing using the "
+          "nonlinear congestion option for each channel width makes sense "
+          "only for full place and route.");
   }
 
   if (placer_opts->place_cost_type == NONLINEAR_CONG &&
@@ -968,9 +1173,8 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 
     /*note that this may work together, but I have not tested it */
 
-    printf("Error: Cannot use nonlinear placement with \n"
-	   "      timing driven placement\n");
-    throw std::runtime_error("1");
+    throw ParseError (Formatter () << "Error: Cannot use nonlinear "
+          "placement with timing driven placement");
   }
 
   if (router_opts->route_type == GLOBAL &&
@@ -989,47 +1193,43 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       placer_opts->place_algorithm == PATH_TIMING_DRIVEN_PLACE)) {
 
       /*may work, not tested*/
-      printf("Error: timing analysis must be enabled for timing-driven placement\n");
-      exit (1);
+      throw ParseError (Formatter () << "Error: timing analysis must be "
+            "enabled for timing-driven placement");
   }
 
 
   if (*operation == ROUTE_ONLY && placer_opts->pad_loc_type == USER) {
-    printf ("Error:  You cannot specify both a full placement file and \n");
-    my_printf ("        a pad location file.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  You cannot specify both a "
+          "full placement file and a pad location file.");
   }
 
   if (router_opts->fixed_channel_width != NO_FIXED_CHANNEL_WIDTH &&
       *verify_binary_search) {
-    printf ("Error:  Routing on a fixed channel width (%d tracks) "
-	    "specified.\n", router_opts->fixed_channel_width);
-    my_printf ("        There is no binary search to verify, so you \n"
-	    "        cannot specify -verify_binary_search option.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  Routing on a fixed channel "
+          "width (" << router_opts->fixed_channel_width << " tracks) "
+          "specified.  There is no binary search to verify, so you cannot "
+          "specify -verify_binary_search option.");
   }
 
   if (*operation == ROUTE_ONLY || *operation == PLACE_AND_ROUTE) {
     if (router_opts->router_algorithm == TIMING_DRIVEN &&
 	*timing_analysis_enabled == FALSE) {
-      printf ("Error:  Cannot perform timing-driven routing when timing "
-	      "analysis is disabled.\n");
-      exit (1);
+      throw ParseError (Formatter () << "Error:  Cannot perform "
+            "timing-driven routing when timing analysis is disabled.");
     }
 
     if (*timing_analysis_enabled == FALSE && router_opts->base_cost_type
 	!= DEMAND_ONLY) {
-      printf ("Error:  base_cost_type must be demand_only when timing "
-	      "analysis is disabled.\n");
-      exit (1);
+      throw ParseError (Formatter () << "Error:  base_cost_type must be "
+            "demand_only when timing analysis is disabled.");
     }
   }
 
   if (*operation == TIMING_ANALYSIS_ONLY && *timing_analysis_enabled ==
       FALSE) {
-    printf ("Error:  -timing_analyze_only_with_net_delay option requires\n"
-	    "\tthat timing analysis not be disabled.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  "
+          "-timing_analyze_only_with_net_delay option requires that timing "
+          "analysis not be disabled.");
   }
 
 
@@ -1056,10 +1256,9 @@ static void parse_command (int argc, char *argv[], char *net_file, char
       nx = ny *  *aspect_ratio;
     }
     else if (*aspect_ratio != 1 && *aspect_ratio != nx / ny) {
-      printf("\nError:  User-specified size and aspect ratio do\n");
-      my_printf("not match.  Note that aspect ratio does not have to\n");
-      my_printf("be specified if both nx and ny are specified.\n");
-      exit (1);
+      throw ParseError (Formatter () << "Error:  User-specified size and "
+            "aspect ratio do not match.  Note that aspect ratio does not "
+            "have to be specified if both nx and ny are specified.");
     }
   }
 
@@ -1124,6 +1323,15 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	     "%g\n", annealing_sched->inner_num);
     }
 
+    if (placer_opts->start_t >= 0.) {
+      my_printf("\tAnneal starts at temperature %g.\n",
+	     placer_opts->start_t);
+    }
+    if (placer_opts->start_rlim > 0.) {
+      my_printf("\tAnneal starts with range limit %g.\n",
+	     placer_opts->start_rlim);
+    }
+
     if (placer_opts->place_cost_type == NONLINEAR_CONG) {
       my_printf("\tPlacement cost type is nonlinear congestion.\n");
       my_printf("\tCongestion will be determined on a %d x %d array.\n",
@@ -1222,6 +1430,32 @@ static void parse_command (int argc, char *argv[], char *net_file, char
     else if (router_opts->base_cost_type == DEMAND_ONLY)
       my_printf ("demand only.\n");
 
+    my_printf ("\tRouter heap type:  %s.\n", (router_opts->heap_type ==
+	    FOUR_ARY_HEAP) ? "4-ary" : "binary");
+    my_printf ("\tRouter rr_graph layout:  %s.\n",
+	    (router_opts->rr_graph_layout == RR_GRAPH_CSR) ? "csr" : "structs");
+    my_printf ("\tRouter threads:  %d.\n", router_opts->route_threads);
+    if (router_opts->incremental_reroute) {
+      my_printf ("\tRouter reroutes only nets using overused resources "
+	      "after the first iteration.\n");
+    }
+    if (router_opts->route_abort == ABORT_STALLED) {
+      my_printf ("\tRouter gives up if the overuse does not improve in %d "
+	      "iterations.\n", router_opts->abort_iterations);
+    }
+    else if (router_opts->route_abort == ABORT_EXTRAPOLATED) {
+      my_printf ("\tRouter gives up if the overuse, extrapolated from the "
+	      "last %d iterations,\n\twill not reach zero.\n",
+	      router_opts->abort_iterations);
+    }
+    if (router_opts->route_file_format == ROUTE_FILE_BINARY) {
+      my_printf ("\tRouter writes the routing in binary format.\n");
+    }
+    if (router_opts->export_traceback) {
+      my_printf ("\tRouter exports the traceback of each successful "
+	      "route.\n");
+    }
+
     if (router_opts->router_algorithm == TIMING_DRIVEN) {
       my_printf ("\tSearch aggressiveness factor (astar_fac): %g\n",
 	      router_opts->astar_fac);
@@ -1229,6 +1463,11 @@ static void parse_command (int argc, char *argv[], char *net_file, char
 	      router_opts->max_criticality);
       my_printf ("\tExponent for criticality computation (criticality_exp): "
 	      "%g\n", router_opts->criticality_exp);
+      if (router_opts->incremental_reroute &&
+	      router_opts->reroute_crit_change >= 0.) {
+	my_printf ("\tAlso reroutes nets whose criticality changes by more "
+		"than %g.\n", router_opts->reroute_crit_change);
+      }
     }
 
     if (router_opts->fixed_channel_width == NO_FIXED_CHANNEL_WIDTH) {
@@ -1267,11 +1506,57 @@ static void get_input (char *net_file, char *arch_file, int place_cost_type,
 		       enum e_route_type route_type, struct s_det_routing_arch
 		       *det_routing_arch, t_segment_inf **segment_inf_ptr,
 		       t_timing_inf *timing_inf_ptr, t_subblock_data *subblock_data_ptr,
-		       t_chan_width_dist *chan_width_dist_ptr) {
+		       t_chan_width_dist *chan_width_dist_ptr,
+		       string const &parse_key) {
 
   /* This subroutine reads in the netlist and architecture files, initializes *
  * some data structures and does any error checks that require knowledge of *
- * both the algorithms to be used and the FPGA architecture.                */
+ * both the algorithms to be used and the FPGA architecture.  If the parse  *
+ * cache holds a snapshot for parse_key, the parsed structures are restored *
+ * from it instead of reading the files.                                    */
+
+  if (g_parse_cache.restore(parse_key, det_routing_arch, segment_inf_ptr,
+                            timing_inf_ptr, subblock_data_ptr,
+                            chan_width_dist_ptr)) {
+    my_printf("Restored %s and %s from the parse cache.\n", arch_file,
+              net_file);
+  } else {
+    read_input(net_file, arch_file, route_type, det_routing_arch,
+               segment_inf_ptr, timing_inf_ptr, subblock_data_ptr,
+               chan_width_dist_ptr);
+    g_parse_cache.save(parse_key, *det_routing_arch, *segment_inf_ptr,
+                       *timing_inf_ptr, *subblock_data_ptr,
+                       *chan_width_dist_ptr);
+  }
+  my_printf("%d blocks, %d nets, %d global nets.\n", num_blocks, num_nets,
+	 num_globals);
+  my_printf("%d clbs, %d inputs, %d outputs.\n", num_clbs, num_p_inputs,
+	 num_p_outputs);
+
+  /* Set up some physical FPGA data structures that need to   *
+ *  know num_blocks.                                        */
+
+  init_arch(aspect_ratio, user_sized);
+
+  my_printf("The circuit will be mapped into a %d x %d array of clbs.\n\n",
+	 nx, ny);
+
+  if (place_cost_type == NONLINEAR_CONG && (num_regions > nx ||
+					    num_regions > ny)) {
+    throw ParseError (Formatter () << "Error:  Cannot use more regions than "
+          "clbs in placement cost function.");
+  }
+
+}
+
+
+static void read_input (char *net_file, char *arch_file,
+		       enum e_route_type route_type, struct s_det_routing_arch
+		       *det_routing_arch, t_segment_inf **segment_inf_ptr,
+		       t_timing_inf *timing_inf_ptr, t_subblock_data *subblock_data_ptr,
+		       t_chan_width_dist *chan_width_dist_ptr) {
+
+  /* Parses the architecture and netlist files. */
 
   my_printf("Reading the FPGA architectural description from %s.\n",
 	 arch_file);
@@ -1310,28 +1595,28 @@ static void get_input (char *net_file, char *arch_file, int place_cost_type,
 
 
   my_printf("Reading the circuit netlist from %s.\n",net_file);
-  read_net (net_file, subblock_data_ptr);
+  if (g_netlist_cache.load(net_file, subblock_data_ptr)) {
+    my_printf("Loaded the compiled netlist %s.\n",
+              NetlistCache::path(net_file).c_str());
+  } else {
+    read_net (net_file, subblock_data_ptr);
+    g_netlist_cache.save(net_file, *subblock_data_ptr);
+  }
   my_printf("Successfully read %s.\n", net_file);
-  my_printf("%d blocks, %d nets, %d global nets.\n", num_blocks, num_nets,
-	 num_globals);
-  my_printf("%d clbs, %d inputs, %d outputs.\n", num_clbs, num_p_inputs,
-	 num_p_outputs);
-
-  /* Set up some physical FPGA data structures that need to   *
- *  know num_blocks.                                        */
+}
 
-  init_arch(aspect_ratio, user_sized);
 
-  my_printf("The circuit will be mapped into a %d x %d array of clbs.\n\n",
-	 nx, ny);
+static void free_netlist_and_arch (void) {
 
-  if (place_cost_type == NONLINEAR_CONG && (num_regions > nx ||
-					    num_regions > ny)) {
-    printf("Error:  Cannot use more regions than clbs in placement cost "
-	   "function.\n");
-    throw std::runtime_error("1");
-  }
+  /* Frees the netlist and architecture globals loaded by get_input, along *
+   * with the routing (traceback) and routing resource graph built for     *
+   * them, which are freed first since they refer to the netlist.          */
 
+  if (trace_head != NULL)
+    free_trace_structs ();
+  free_rr_graph ();
+  free_netlist ();
+  free_arch ();
 }
 
 
@@ -1353,8 +1638,8 @@ static int read_int_option (int argc, char *argv[], int iarg) {
   /* Value exists and was a proper int? */
 
   if (num_read != 1) {
-    printf("Error:  %s option requires an integer parameter.\n\n", argv[iarg]);
-    throw std::runtime_error("1");
+    throw ParseError (Formatter () << "Error:  " << argv[iarg] << " option "
+          "requires an integer parameter.");
   }
 
   return (value);
@@ -1379,8 +1664,8 @@ static float read_float_option (int argc, char *argv[], int iarg) {
   /* Value exists and was a proper float? */
 
   if (num_read != 1) {
-    printf("Error:  %s option requires a float parameter.\n\n", argv[iarg]);
-    throw std::runtime_error("1");
+    throw ParseError (Formatter () << "Error:  " << argv[iarg] << " option "
+          "requires a float parameter.");
   }
 
   return (value);
@@ -1419,7 +1704,6 @@ void Main::run_default() {
 void Main::timing_analysis() {
     do_constant_net_delay_timing_analysis (timing_inf_, subblock_data_,
                     constant_net_delay_);
-    exit (0);
 }
 
 
@@ -1431,6 +1715,11 @@ void Main::init(int argc, char **argv) {
 
 
 void Main::init() {
+    /* Any open routing session, along with the routing resource graph,
+     * refers to the previous netlist, so free it all before reading the new
+     * input files. */
+    free_input();
+    free_netlist_and_arch();
     extract_arg_strings();
     g_route_result = RouteResult();
     char title[] = "\n\nVPR FPGA Placement and Routing Program Version 4.3\n"
@@ -1455,13 +1744,6 @@ void Main::init() {
                   &router_opts_, &timing_inf_.timing_analysis_enabled,
                   &constant_net_delay_);
 
-    /* Parse input circuit and architecture */
-
-    get_input(net_file_, arch_file_, placer_opts_.place_cost_type,
-            placer_opts_.num_regions, aspect_ratio, user_sized,
-            router_opts_.route_type, &det_routing_arch_, &segment_inf_,
-            &timing_inf_, &subblock_data_, &chan_width_dist_);
-
     g_route_states.clear();
     filepath_.clear();
     file_md5_.clear();
@@ -1474,16 +1756,37 @@ void Main::init() {
         filepath_["routed"] = string(route_file_);
     }
 
+    /* Only hash input files.  Output files have not been written yet, so
+     * their hashes are left empty. */
     map<string, string>::const_iterator i = filepath_.begin();
     for (; i != filepath_.end(); i++) {
-        MD5 m;
-
-        ifstream infile((i->second).c_str());
-        m = MD5(infile);
-        infile.close();
-        file_md5_[i->first] = m.hexdigest();
+        if (i->first == "routed" ||
+            (i->first == "placed" &&
+             placer_opts_.place_freq != PLACE_NEVER)) {
+            file_md5_[i->first] = "";
+        } else {
+            file_md5_[i->first] = g_file_md5_cache.hexdigest(i->second);
+        }
     }
 
+    /* Parse input circuit and architecture _(or restore them from the parse
+     * cache, if the same input files have already been parsed)_.  The
+     * netlist may also be loaded from its compiled netlist file. */
+    g_netlist_cache.net_md5_ = file_md5_["net"];
+
+    get_input(net_file_, arch_file_, placer_opts_.place_cost_type,
+            placer_opts_.num_regions, aspect_ratio, user_sized,
+            router_opts_.route_type, &det_routing_arch_, &segment_inf_,
+            &timing_inf_, &subblock_data_, &chan_width_dist_,
+            ParseCache::key(file_md5_["net"], file_md5_["arch"],
+                            router_opts_.route_type,
+                            timing_inf_.timing_analysis_enabled));
+
+    /* Routing resource graphs and placement delay lookup matrices computed
+     * for this architecture may be loaded from their caches. */
+    g_rr_graph_cache.arch_md5_ = file_md5_["arch"];
+    g_place_delay_cache.arch_md5_ = file_md5_["arch"];
+
     if (operation_ == PLACE_AND_ROUTE || operation_ == ROUTE_ONLY) {
         g_route_result.net_file_md5 = file_md5_["net"];
         g_route_result.arch_file_md5 = file_md5_["arch"];
@@ -1522,50 +1825,159 @@ void Main::do_place_and_route() {
     if (operation_ != PLACE_ONLY) {
         reset_buffer();
     }
+    this->do_place_and_route(buffer_, NULL);
+}
+
+void Main::do_place_and_route(const unsigned int *block_positions) {
+    /* Route the placement held in `block_positions`, a contiguous row-major
+     * `(block_count, 3)` array _(see `extract_block_positions`)_, rather than
+     * reading the placement file.
+     *
+     * If the circuit is to be placed _(once)_, the annealer instead starts
+     * from the placement held in `block_positions` and refines it. */
+    if (operation_ != ROUTE_ONLY && placer_opts_.place_freq != PLACE_ONCE) {
+        throw std::runtime_error("Block positions may only be provided for "
+                                 "route-only operation or a single "
+                                 "placement.");
+    }
+    if (buffer_ != NULL) {
+        delete buffer_;
+        buffer_ = NULL;
+    }
+    this->do_place_and_route(NULL, block_positions);
+}
+
+void Main::do_place_and_route(BufferBase *buffer,
+                              const unsigned int *block_positions) {
     // Start timer for placement
     clock_gettime(CLOCK_REALTIME, &g_place_state.start);
     g_place_state.placer_opts = placer_opts_;
-    place_and_route(operation_, placer_opts_, *buffer_, place_file_, net_file_,
-                    arch_file_, route_file_, full_stats_, verify_binary_search_,
-                    annealing_sched_, router_opts_, det_routing_arch_, segment_inf_,
+    /* Only keep the statistics of this placement. */
+    g_place_state.stats.clear();
+    place_and_route(operation_, placer_opts_, buffer, block_positions,
+                    place_file_, net_file_, arch_file_, route_file_,
+                    full_stats_, verify_binary_search_, annealing_sched_,
+                    router_opts_, det_routing_arch_, segment_inf_,
                     timing_inf_, &subblock_data_, chan_width_dist_);
     // End timer for placement
     clock_gettime(CLOCK_REALTIME, &g_place_state.end);
 }
 
 bool Main::route(int width_fac) {
-    /* Route (or try to route) once. */
+    /* Route (or try to route) once.
+     *
+     * If a routing session is open _(see `begin_route_session`)_, the route
+     * structures and timing graph held by the session are reused.  Otherwise,
+     * they are allocated for this attempt only. */
 
-    t_ivec **clb_opins_used_locally;  /* [0..num_blocks-1][0..num_class-1] */
-    float **net_delay, **net_slack;
-    struct s_linked_vptr *net_delay_chunk_list_head;
     bool success;
+    bool temporary_session = !route_session_open_;
+
+    if (temporary_session) {
+        this->begin_route_session();
+    }
+
+    try {
+        success = try_route(width_fac, router_opts_, det_routing_arch_,
+                            segment_inf_, timing_inf_, net_slack_, net_delay_,
+                            chan_width_dist_, clb_opins_used_locally_);
+    } catch (...) {
+        /* Do not leave a temporary session open after an error. */
+        if (temporary_session) {
+            this->end_route_session();
+        }
+        throw;
+    }
+
+    if (temporary_session) {
+        this->end_route_session();
+    }
+    return success;
+}
+
+void Main::begin_route_session() {
+    /* Allocate the major routing structures _(and the timing graph, if timing
+     * analysis is enabled)_.  None of these depend on the channel width, so
+     * they remain valid for any number of calls to `route` until
+     * `end_route_session` is called.
+     *
+     * __NB__ The netlist, architecture and placement must already be loaded,
+     * _e.g., by `init` followed by `do_read_place`_. */
 
-   /* Allocate the major routing structures. */
+    if (route_session_open_) { return; }
 
-    clb_opins_used_locally = alloc_route_structs(subblock_data_);
+    clb_opins_used_locally_ = alloc_route_structs(subblock_data_);
 
     if (timing_inf_.timing_analysis_enabled) {
-        net_slack = alloc_and_load_timing_graph(timing_inf_, subblock_data_);
-        net_delay = alloc_net_delay(&net_delay_chunk_list_head);
+        net_slack_ = alloc_and_load_timing_graph(timing_inf_, subblock_data_);
+        net_delay_ = alloc_net_delay(&net_delay_chunk_list_head_);
     } else {
-        net_delay = NULL;    /* Defensive coding. */
-        net_slack = NULL;
+        net_delay_ = NULL;    /* Defensive coding. */
+        net_slack_ = NULL;
     }
+    route_session_open_ = true;
+}
 
-    /* Only needed to build timing graph and clb_opins_used_locally */
+void Main::end_route_session() {
+    /* Free the structures allocated by `begin_route_session`. */
 
-    success = try_route(width_fac, router_opts_, det_routing_arch_,
-                        segment_inf_, timing_inf_, net_slack, net_delay,
-                        chan_width_dist_, clb_opins_used_locally);
+    if (!route_session_open_) { return; }
 
     if (timing_inf_.timing_analysis_enabled) {
-        free_timing_graph (net_slack);
-        free_net_delay (net_delay, &net_delay_chunk_list_head);
+        free_timing_graph(net_slack_);
+        free_net_delay(net_delay_, &net_delay_chunk_list_head_);
     }
 
-    free_route_structs (clb_opins_used_locally);
-    return success;
+    free_route_structs(clb_opins_used_locally_);
+    net_slack_ = NULL;
+    net_delay_ = NULL;
+    clb_opins_used_locally_ = NULL;
+    route_session_open_ = false;
+}
+
+void Main::free_input() {
+    /* Free the input structures held by this instance _(if any)_: any open
+     * routing session, the placement file buffer, and the subblock data,
+     * segment and subblock timing arrays returned by `get_input`.
+     *
+     * __NB__ The netlist and architecture globals are shared by all
+     * instances, so they are only freed by `free_netlist_and_arch`. */
+    end_route_session();
+    if (buffer_ != NULL) {
+        delete buffer_;
+        buffer_ = NULL;
+    }
+    free_subblock_data(&subblock_data_);
+    free(segment_inf_);
+    free(timing_inf_.T_subblock);
+    segment_inf_ = NULL;
+    timing_inf_.T_subblock = NULL;
+}
+
+void Main::reset() {
+    /* Free all of the state held by VPR, including the results of the most
+     * recent placement and routing, e.g., between jobs of a long-lived
+     * worker process.  `init` must be called again before anything else.
+     *
+     * __NB__ The process-wide caches _(e.g., `g_parse_cache`)_ are kept,
+     * since they are bounded by the number of distinct input files.  The
+     * node arenas of the router are kept from one route to the next, and
+     * are only freed here.
+     *
+     * Any placement lookups, criticalities or timing graph left allocated by
+     * a placement or routing that threw are freed too, so that the next
+     * call does not fail with "An old timing graph still exists". */
+    free_input();
+    free_leftover_lookups_and_criticalities();
+    free_leftover_timing_graph();
+    free_netlist_and_arch();
+    free_route_arenas();
+    g_place_state = PlaceState();
+    g_route_state = RouteState();
+    g_route_result = RouteResult();
+    g_route_states.clear();
+    filepath_.clear();
+    file_md5_.clear();
 }
 
 void Main::do_read_place() {
@@ -1582,13 +1994,11 @@ size_t Main::net_count() {
 }
 
 Main::~Main() {
+    end_route_session();
     if (show_graphics_) {
         close_graphics();  /* Close down X Display */
     }
-    if(buffer_ != NULL) {
-        delete buffer_;
-    }
-    free_subblock_data(&subblock_data_);
+    free_input();
 }
 
 
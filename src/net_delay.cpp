@@ -3,6 +3,7 @@
 #include "vpr_types.h"
 #include "globals.h"
 #include "net_delay.h"
+#include "VprError.hpp"
 
 
 /***************** Types and defines local to this module ********************/
@@ -211,9 +212,8 @@ static t_rc_node *alloc_and_load_rc_tree (int inet, t_rc_node
  tptr = trace_head[inet];
  
  if (tptr == NULL) {
-    printf ("Error in alloc_and_load_rc_tree:  Traceback for net %d doesn't "
-            "exist.\n", inet);
-    exit (1);
+    throw InternalError (Formatter () << "Error in alloc_and_load_rc_tree:  "
+          "Traceback for net " << inet << " doesn't exist.");
  }
 
  inode = tptr->index;
@@ -244,9 +244,9 @@ static t_rc_node *alloc_and_load_rc_tree (int inet, t_rc_node
      #ifdef DEBUG
        prev_node = prev_rc->inode;
        if (rr_node[prev_node].type != SINK) {
-          printf ("Error in alloc_and_load_rc_tree:  Routing of net %d is "
-                  "not a tree.\n", inet);
-          exit (1);
+          throw InternalError (Formatter () << "Error in "
+                "alloc_and_load_rc_tree:  Routing of net " << inet << " is "
+                "not a tree.");
        }
      #endif
 
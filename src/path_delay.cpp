@@ -8,6 +8,7 @@
 #include "vpr_utils.h"
 #include "Result.hpp"
 #include <assert.h>
+#include "VprError.hpp"
 
 
 /****************** Timing graph Structure ************************************
@@ -188,25 +189,24 @@ float **alloc_and_load_timing_graph (t_timing_inf timing_inf, t_subblock_data
 /************* End of variable declarations ********************************/
 
  if (tedge_ch_list_head != NULL) {
-    printf ("Error in alloc_and_load_timing_graph:\n"
-            "\tAn old timing graph still exists.\n");
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "alloc_and_load_timing_graph:  An old timing graph still exists.");
  }
 
 /* If either of the checks below ever fail, change the definition of        *
  * tnode_descript to use ints instead of shorts for isubblk or ipin.        */
 
  if (subblock_data.max_subblocks_per_block > MAX_SHORT) {
-    printf ("Error in alloc_and_load_timing_graph: max_subblocks_per_block"
-            "\tis %d -- will cause short overflow in tnode_descript.\n",
-            subblock_data.max_subblocks_per_block);
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "alloc_and_load_timing_graph: max_subblocks_per_block is "
+          << subblock_data.max_subblocks_per_block << " -- will cause short "
+          "overflow in tnode_descript.");
  }
 
  if (pins_per_clb > MAX_SHORT) {
-    printf ("Error in alloc_and_load_timing_graph: pins_per_clb is %d."
-            "\tWill cause short overflow in tnode_descript.\n", pins_per_clb);
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "alloc_and_load_timing_graph: pins_per_clb is " << pins_per_clb
+          << ". Will cause short overflow in tnode_descript.");
  }
 
  alloc_and_load_fanout_counts (&num_uses_of_clb_ipin, &num_uses_of_sblk_opin,
@@ -512,10 +512,10 @@ static void alloc_and_load_tnodes_and_net_mapping (int **num_uses_of_clb_ipin,
        break;
 
     default:
-       printf ("Error in alloc_and_load_tnodes_and_net_mapping:\n"
-               "\tUnexpected block type (%d) for block %d (%s).\n",
-                block[iblk].type, iblk, block[iblk].name);
-       exit (1);
+       throw InternalError (Formatter () << "Error in "
+             "alloc_and_load_tnodes_and_net_mapping:  Unexpected block type "
+             "(" << block[iblk].type << ") for block " << iblk << " ("
+             << block[iblk].name << ").");
     }
  }
 
@@ -966,8 +966,8 @@ void free_timing_graph (float **net_slack) {
 /* Frees the timing graph data. */
 
  if (tedge_ch_list_head == NULL) {
-    printf ("Error in free_timing_graph: No timing graph to free.\n");
-    exit (1);
+    throw InternalError (Formatter () << "Error in free_timing_graph: No "
+          "timing graph to free.");
  }
 
  free_chunk_memory (tedge_ch_list_head);
@@ -990,6 +990,19 @@ void free_timing_graph (float **net_slack) {
 }
 
 
+
+void free_leftover_timing_graph (void) {
+
+/* Frees the timing graph, if one is still allocated _(e.g., by a routing  *
+ * interrupted by an exception)_.  The net_slack array of its owner is     *
+ * lost, but its rows are held by the timing graph chunks, so only the     *
+ * array of row pointers is leaked.                                        */
+
+ if (tedge_ch_list_head != NULL)
+    free_timing_graph (NULL);
+}
+
+
 void print_net_slack (char *fname, float **net_slack) {
 
 /* Prints the net slacks into a file.                                     */
@@ -9,6 +9,8 @@ float load_net_slack (float **net_slack, float target_cycle_time);
 
 void free_timing_graph (float **net_slack);
 
+void free_leftover_timing_graph (void);
+
 void free_subblock_data (t_subblock_data *subblock_data_ptr);
 
 void print_timing_graph (char *fname);
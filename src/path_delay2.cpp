@@ -2,6 +2,7 @@
 #include "vpr_types.h"
 #include "globals.h"
 #include "path_delay2.h"
+#include "VprError.hpp"
 
 
 /************* Variables (globals) shared by all path_delay modules **********/
@@ -78,8 +79,8 @@ static int *alloc_and_load_tnode_fanin_and_check_edges (int *num_sinks_ptr) {
  }
 
  if (error != 0) {
-    printf ("Found %d Errors in the timing graph.  Aborting.\n", error);
-    exit (1);
+    throw InternalError (Formatter () << "Found " << error << " Errors in "
+          "the timing graph.");
  }
 
  *num_sinks_ptr = num_sinks;
@@ -215,8 +216,8 @@ void check_timing_graph (int num_const_gen, int num_ff, int num_sinks) {
  }
 
  if (error != 0) {
-    printf ("Found %d Errors in the timing graph.  Aborting.\n", error);
-    exit (1);
+    throw InternalError (Formatter () << "Found " << error << " Errors in "
+          "the timing graph.");
  }
 }
 
@@ -13,6 +13,7 @@
 #include "timing_place_lookup.h"
 #include "timing_place.h"
 #include "State.hpp"
+#include "VprError.hpp"
 
 
 /************** Types and defines local to place.c ***************************/
@@ -37,8 +38,21 @@ enum cost_methods {NORMAL, CHECK};
 
 #define EMPTY -1
 
+/* Default starting temperature (as a multiple of the temperature at which *
+ * the automatic schedule stops) and range limit used to refine an         *
+ * existing placement.                                                     */
+
+#define REFINE_EXIT_T_MULT 20.
+#define REFINE_RLIM 3.
+
 /********************** Variables local to place.c ***************************/
 
+/* Called with the statistics of each temperature of the anneal (see       *
+ * set_place_stats_callback), or NULL.                                     */
+
+static t_place_stats_callback place_stats_callback = NULL;
+static void *place_stats_callback_data = NULL;
+
 /* [0..num_nets-1]  0 if net never connects to the same block more than  *
  *  once, otherwise it gives the number of duplicate connections.        */
 
@@ -216,24 +230,49 @@ static void restore_region_occ (float **old_region_occ_x,
 static void get_bb_from_scratch (int inet, struct s_bb *coords,
         struct s_bb *num_on_edges);
 
+static void load_placement (BufferBase *place_file_buffer,
+        const unsigned int *block_positions, char *net_file, char *arch_file,
+        struct s_placer_opts placer_opts, struct s_router_opts router_opts,
+        t_chan_width_dist chan_width_dist,
+        struct s_det_routing_arch det_routing_arch,
+        t_segment_inf *segment_inf, t_timing_inf timing_inf,
+        t_subblock_data *subblock_data_ptr);
+
 
 /*****************************************************************************/
 
 
+void set_place_stats_callback (t_place_stats_callback callback, void *data) {
+
+/* Has try_place call callback (with data) with the statistics of each     *
+ * temperature of the anneal, as soon as they are computed.  If callback  *
+ * returns false, the anneal stops and keeps its current placement.  Pass *
+ * a NULL callback to stop calling it.                                     */
+
+ place_stats_callback = callback;
+ place_stats_callback_data = data;
+}
+
+
 void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
                 annealing_sched, t_chan_width_dist chan_width_dist,
 		struct s_router_opts router_opts,
 		struct s_det_routing_arch det_routing_arch,
 		t_segment_inf *segment_inf,
 		t_timing_inf timing_inf,
-		t_subblock_data *subblock_data_ptr) {
+		t_subblock_data *subblock_data_ptr,
+		const unsigned int *block_positions) {
 
 /* Does almost all the work of placing a circuit.  Width_fac gives the   *
  * width of the widest channel.  Place_cost_exp says what exponent the   *
  * width should be taken to when calculating costs.  This allows a       *
  * greater bias for anisotropic architectures.  Place_cost_type          *
  * determines which cost function is used.  num_regions is used only     *
- * the place_cost_type is NONLINEAR_CONG.                                */
+ * the place_cost_type is NONLINEAR_CONG.                                *
+ * If block_positions is not NULL, the anneal starts from the placement  *
+ * it holds (see load_block_positions) rather than a random placement,   *
+ * and, unless start_t and start_rlim are given, only the low-           *
+ * temperature end of the anneal is run, to refine that placement.       */
 
 
  int tot_iter, inner_iter, success_sum, pins_on_block[3];
@@ -247,6 +286,8 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
  float **old_region_occ_x, **old_region_occ_y;
  char msg[BUFSIZE];
  boolean fixed_pins;  /* Can pads move or not? */
+ boolean stopped;     /* Has the statistics callback stopped the anneal? */
+ int freeze_move_lim;
  int num_connections;
  int inet, ipin, outer_crit_iter_count, inner_crit_iter_count, inner_recompute_limit;
  float **net_slack, **net_delay;
@@ -316,7 +357,27 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
             placer_opts.num_regions, placer_opts.place_cost_exp,
             &old_region_occ_x, &old_region_occ_y, placer_opts);
 
- initial_placement (placer_opts.pad_loc_type, placer_opts.pad_loc_file);
+ if (block_positions != NULL) {
+    try {
+       load_block_positions (block_positions);
+    } catch (...) {
+       /* Invalid block positions; free everything allocated above so the *
+        * next placement may allocate it again.                           */
+       free_placement_structs (placer_opts.place_cost_type,
+             placer_opts.num_regions, old_region_occ_x, old_region_occ_y,
+             placer_opts);
+       if (placer_opts.place_algorithm == NET_TIMING_DRIVEN_PLACE ||
+           placer_opts.place_algorithm == PATH_TIMING_DRIVEN_PLACE ||
+           placer_opts.enable_timing_computations) {
+          free_lookups_and_criticalities (&net_delay, &net_slack);
+       }
+       throw;
+    }
+    my_printf ("Refining the given placement.\n");
+ }
+ else {
+    initial_placement (placer_opts.pad_loc_type, placer_opts.pad_loc_file);
+ }
  init_draw_coords ((float) width_fac);
 
 /* Storing the number of pins on each type of block makes the swap routine *
@@ -417,12 +478,26 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
  final_rlim = 1;
  inverse_delta_rlim = 1 / (first_rlim - final_rlim);
 
- t = starting_t (&cost, &bb_cost, &timing_cost,
-                 pins_on_block, placer_opts.place_cost_type,
-		 old_region_occ_x, old_region_occ_y, placer_opts.num_regions,
-		 fixed_pins, annealing_sched, move_lim, rlim,
-		 placer_opts.place_algorithm, placer_opts.timing_tradeoff,
-		 inverse_prev_bb_cost, inverse_prev_timing_cost, &delay_cost);
+/* A refinement starts with a small range limit at a low temperature, so  *
+ * the placement it starts from is improved rather than scrambled.  The   *
+ * criticality exponent is still computed relative to the whole chip.     */
+
+ if (placer_opts.start_rlim > 0.)
+    rlim = my_max (my_min (placer_opts.start_rlim, first_rlim), 1.);
+ else if (block_positions != NULL)
+    rlim = my_min (REFINE_RLIM, first_rlim);
+
+ if (placer_opts.start_t >= 0.)
+    t = placer_opts.start_t;
+ else if (block_positions != NULL && annealing_sched.type == AUTO_SCHED)
+    t = REFINE_EXIT_T_MULT * 0.005 * cost / num_nets;    /* See exit_crit. */
+ else
+    t = starting_t (&cost, &bb_cost, &timing_cost,
+                    pins_on_block, placer_opts.place_cost_type,
+		    old_region_occ_x, old_region_occ_y, placer_opts.num_regions,
+		    fixed_pins, annealing_sched, move_lim, rlim,
+		    placer_opts.place_algorithm, placer_opts.timing_tradeoff,
+		    inverse_prev_bb_cost, inverse_prev_timing_cost, &delay_cost);
  tot_iter = 0;
  moves_since_cost_recompute = 0;
  my_printf("Initial Placement Cost: %g bb_cost: %g td_cost: %g delay_cost: %g\n\n",
@@ -442,7 +517,9 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
    cost, bb_cost, timing_cost, delay_cost, d_max, width_fac);
  update_screen(MAJOR, msg, PLACEMENT, FALSE);
 
- while (exit_crit(t, cost, annealing_sched) == 0) {
+ stopped = FALSE;
+
+ while (!stopped && exit_crit(t, cost, annealing_sched) == 0) {
     clock_gettime(CLOCK_REALTIME, &stats.start);
 
    if (placer_opts.place_algorithm == NET_TIMING_DRIVEN_PLACE ||
@@ -532,7 +609,7 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
 	     t, cost, bb_cost, timing_cost, inner_iter, d_max);
       if (fabs(bb_cost - comp_bb_cost(CHECK, placer_opts.place_cost_type,
 				      placer_opts.num_regions)) > bb_cost * ERROR_TOL)
-	exit(1);
+	throw InternalError (Formatter () << "Error in try_place.");
 #endif
     }
     clock_gettime(CLOCK_REALTIME, &stats.start);
@@ -547,9 +624,9 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
        new_bb_cost = recompute_bb_cost (placer_opts.place_cost_type,
                      placer_opts.num_regions);
        if (fabs(new_bb_cost - bb_cost) > bb_cost * ERROR_TOL) {
-          printf("Error in try_place:  new_bb_cost = %g, old bb_cost = %g.\n",
-              new_bb_cost, bb_cost);
-          exit (1);
+          throw InternalError (Formatter () << "Error in try_place:  "
+                "new_bb_cost = " << new_bb_cost << ", old bb_cost = "
+                << bb_cost << ".");
        }
        bb_cost = new_bb_cost;
 
@@ -557,14 +634,14 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
            placer_opts.place_algorithm == PATH_TIMING_DRIVEN_PLACE) {
 	 comp_td_costs(&new_timing_cost, &new_delay_cost);
 	 if (fabs(new_timing_cost - timing_cost) > timing_cost * ERROR_TOL) {
-	   printf("Error in try_place:  new_timing_cost = %g, old timing_cost = %g.\n",
-		  new_timing_cost, timing_cost);
-	   exit (1);
+	   throw InternalError (Formatter () << "Error in try_place:  "
+	         "new_timing_cost = " << new_timing_cost << ", old timing_cost = "
+	         << timing_cost << ".");
 	 }
 	 if (fabs(new_delay_cost - delay_cost) > delay_cost * ERROR_TOL) {
-	   printf("Error in try_place:  new_delay_cost = %g, old delay_cost = %g.\n",
-		  new_delay_cost, delay_cost);
-	   exit (1);
+	   throw InternalError (Formatter () << "Error in try_place:  "
+	         "new_delay_cost = " << new_delay_cost << ", old delay_cost = "
+	         << delay_cost << ".");
 	 }
 	 timing_cost = new_timing_cost;
        }
@@ -609,6 +686,11 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
     // Append `PlaceStats` to running list _(i.e., `vector<PlaceStats>`)_.
     g_place_state.stats.push_back(stats);
 
+    if (place_stats_callback != NULL &&
+        !place_stats_callback (stats, place_stats_callback_data)) {
+       stopped = TRUE;
+    }
+
 #ifndef SPEC
     my_printf("%11.5g  %10.6g %11.6g  %11.6g  %11.6g %11.6g %11.4g %9.4g %8.3g  %7.4g  %7.4g  %10d  ",t, av_cost,
 	   av_bb_cost, av_timing_cost, av_delay_cost, place_delay_value, d_max, success_rat, std_dev,
@@ -638,6 +720,16 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
 #endif
  }
 
+ if (stopped) {
+    my_printf ("Anneal stopped at temperature %g by the statistics "
+	       "callback.\n", t);
+ }
+
+/* An anneal stopped early keeps its current placement, so no moves are   *
+ * made at the freeze out temperature.                                    */
+
+ freeze_move_lim = stopped ? 0 : move_lim;
+
  t = 0;   /* freeze out */
  av_cost = 0.;
  av_bb_cost = 0.;
@@ -677,7 +769,7 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
  inner_crit_iter_count = 1;
 
  clock_gettime(CLOCK_REALTIME, &stats.start);
- for (inner_iter=0; inner_iter < move_lim; inner_iter++) {
+ for (inner_iter=0; inner_iter < freeze_move_lim; inner_iter++) {
    if (try_swap(t, &cost, &bb_cost, &timing_cost,
 	  rlim, pins_on_block, placer_opts.place_cost_type,
           old_region_occ_x, old_region_occ_y, placer_opts.num_regions,
@@ -717,8 +809,8 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
    my_printf("t = %g  cost = %g   move = %d\n",t, cost, tot_iter);
 #endif
  }
- tot_iter += move_lim;
- success_rat = ((float) success_sum) / move_lim;
+ tot_iter += freeze_move_lim;
+ success_rat = ((float) success_sum) / my_max (freeze_move_lim, 1);
  if (success_sum == 0) {
     av_cost = cost;
     av_bb_cost = bb_cost;
@@ -753,7 +845,11 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
  stats.radius_limit = rlim;
  stats.criticality_exponent = crit_exponent;
  stats.total_iteration_count = tot_iter;
- g_place_state.stats.push_back(stats);
+ if (!stopped) {
+    g_place_state.stats.push_back(stats);
+    if (place_stats_callback != NULL)
+       place_stats_callback (stats, place_stats_callback_data);
+ }
 
 #ifdef VERBOSE
  dump_clbs();
@@ -802,14 +898,15 @@ void try_place (struct s_placer_opts placer_opts,struct s_annealing_sched
  my_printf ("Total moves attempted: %d.0\n", tot_iter);
 #endif
 
+ free_placement_structs (placer_opts.place_cost_type, placer_opts.num_regions,
+			 old_region_occ_x, old_region_occ_y, placer_opts);
+
  if (placer_opts.place_algorithm == NET_TIMING_DRIVEN_PLACE ||
      placer_opts.place_algorithm == PATH_TIMING_DRIVEN_PLACE ||
      placer_opts.enable_timing_computations) {
 
    net_delay = remember_net_delay_original_ptr;
 
-   free_placement_structs (placer_opts.place_cost_type, placer_opts.num_regions,
-			   old_region_occ_x, old_region_occ_y, placer_opts);
    free_lookups_and_criticalities( &net_delay, &net_slack);
  }
 }
@@ -1393,9 +1490,9 @@ static int find_affected_nets (int *nets_to_update, int *net_block_moved,
 
 #ifdef DEBUG
           if (count > affected_index) {
-             printf("Error in find_affected_nets -- count = %d,"
-              " affected index = %d.\n", count, affected_index);
-             exit (1);
+             throw InternalError (Formatter () << "Error in "
+                   "find_affected_nets -- count = " << count << ", affected "
+                   "index = " << affected_index << ".");
           }
 #endif
        }
@@ -1428,8 +1525,7 @@ static void find_to (int x_from, int y_from, int type, float rlim,
 
 #ifdef DEBUG
  if (rlx < 1 || rlx > nx) {
-    printf("Error in find_to: rlx = %d\n",rlx);
-    exit(1);
+    throw InternalError (Formatter () << "Error in find_to: rlx = " << rlx);
  }
 #endif
 
@@ -1478,8 +1574,8 @@ static void find_to (int x_from, int y_from, int type, float rlim,
              *y_to = 0;
              break;
           default:
-             printf("Error in find_to.  Unexpected io swap location.\n");
-             exit (1);
+             throw InternalError (Formatter () << "Error in find_to.  "
+                   "Unexpected io swap location.");
           }
        }
        else {   /* rlx is less than whole chip */
@@ -1541,23 +1637,20 @@ static void find_to (int x_from, int y_from, int type, float rlim,
 
 #ifdef DEBUG
    if (*x_to < 0 || *x_to > nx+1 || *y_to < 0 || *y_to > ny+1) {
-      printf("Error in routine find_to:  (x_to,y_to) = (%d,%d)\n",
-            *x_to, *y_to);
-      exit(1);
+      throw InternalError (Formatter () << "Error in routine find_to:  "
+            "(x_to,y_to) = (" << *x_to << "," << *y_to << ")");
    }
 
    if (type == CLB) {
      if (clb[*x_to][*y_to].type != CLB) {
-        printf("Error: Moving CLB to illegal type block at (%d,%d)\n",
-          *x_to,*y_to);
-        exit(1);
+        throw InternalError (Formatter () << "Error: Moving CLB to illegal "
+              "type block at (" << *x_to << "," << *y_to << ")");
      }
    }
    else {
      if (clb[*x_to][*y_to].type != IO) {
-        printf("Error: Moving IO block to illegal type location at "
-              "(%d,%d)\n", *x_to, *y_to);
-        exit(1);
+        throw InternalError (Formatter () << "Error: Moving IO block to "
+              "illegal type location at (" << *x_to << "," << *y_to << ")");
      }
    }
 #endif
@@ -1669,8 +1762,8 @@ static float comp_td_point_to_point_delay (int inet, int ipin) {
     else if (sink_type == OUTPAD)
       delay_source_to_sink = delta_clb_to_outpad[delta_x][delta_y];
     else {
-      printf("Error in comp_td_point_to_point_delay in place.c, bad sink_type\n");
-      exit(1);
+      throw InternalError (Formatter () << "Error in "
+            "comp_td_point_to_point_delay in place.c, bad sink_type");
     }
   }
   else if (source_type == INPAD) {
@@ -1679,22 +1772,23 @@ static float comp_td_point_to_point_delay (int inet, int ipin) {
     else if (sink_type == OUTPAD)
       delay_source_to_sink = delta_inpad_to_outpad[delta_x][delta_y];
     else {
-      printf("Error in comp_td_point_to_point_delay in place.c, bad sink_type\n");
-      exit(1);
+      throw InternalError (Formatter () << "Error in "
+            "comp_td_point_to_point_delay in place.c, bad sink_type");
     }
   }
   else {
-    printf("Error in comp_td_point_to_point_delay in place.c, bad source_type\n");
-    exit(1);
+    throw InternalError (Formatter () << "Error in "
+          "comp_td_point_to_point_delay in place.c, bad source_type");
   }
   if (delay_source_to_sink < 0) {
-    printf("Error in comp_td_point_to_point_delay in place.c, bad delay_source_to_sink value\n");
-    exit(1);
+    throw InternalError (Formatter () << "Error in "
+          "comp_td_point_to_point_delay in place.c, bad "
+          "delay_source_to_sink value");
   }
 
   if (delay_source_to_sink < 0.) {
-    printf("Error in comp_td_point_to_point_delay in place.c, delay is less than 0\n");
-    exit(1);
+    throw InternalError (Formatter () << "Error in "
+          "comp_td_point_to_point_delay in place.c, delay is less than 0");
   }
 
   return(delay_source_to_sink);
@@ -3234,10 +3328,8 @@ static void check_place (float bb_cost, float timing_cost, int place_cost_type,
     my_printf("\nCompleted placement consistency check successfully.\n\n");
  }
  else {
-    printf("\nCompleted placement consistency check, %d Errors found.\n\n",
-       error);
-    my_printf("Aborting program.\n");
-    exit(1);
+    throw InternalError (Formatter () << "Completed placement consistency "
+          "check, " << error << " Errors found.");
  }
 }
 
@@ -3263,9 +3355,41 @@ void read_place (BufferBase &place_file_buffer, char *net_file,
                  struct s_det_routing_arch det_routing_arch,
                  t_segment_inf *segment_inf, t_timing_inf timing_inf,
                  t_subblock_data *subblock_data_ptr) {
-  /* Reads in a previously computed placement of the circuit.  It      *
-   * checks that the placement corresponds to the current architecture *
-   * and netlist file.                                                 */
+  load_placement(&place_file_buffer, NULL, net_file, arch_file, placer_opts,
+                 router_opts, chan_width_dist, det_routing_arch, segment_inf,
+                 timing_inf, subblock_data_ptr);
+}
+
+
+void read_place (const unsigned int *block_positions, char *net_file,
+                 char *arch_file, struct s_placer_opts placer_opts,
+                 struct s_router_opts router_opts,
+                 t_chan_width_dist chan_width_dist,
+                 struct s_det_routing_arch det_routing_arch,
+                 t_segment_inf *segment_inf, t_timing_inf timing_inf,
+                 t_subblock_data *subblock_data_ptr) {
+  /* Same as above, but the placement is loaded from an array of block *
+   * positions _(see `load_block_positions`)_ rather than from a file. */
+  load_placement(NULL, block_positions, net_file, arch_file, placer_opts,
+                 router_opts, chan_width_dist, det_routing_arch, segment_inf,
+                 timing_inf, subblock_data_ptr);
+}
+
+
+static void load_placement (BufferBase *place_file_buffer,
+                            const unsigned int *block_positions,
+                            char *net_file, char *arch_file,
+                            struct s_placer_opts placer_opts,
+                            struct s_router_opts router_opts,
+                            t_chan_width_dist chan_width_dist,
+                            struct s_det_routing_arch det_routing_arch,
+                            t_segment_inf *segment_inf,
+                            t_timing_inf timing_inf,
+                            t_subblock_data *subblock_data_ptr) {
+  /* Reads in a previously computed placement of the circuit, either from *
+   * `place_file_buffer` or, if it is `NULL`, from `block_positions`.  It *
+   * checks that the placement corresponds to the current architecture    *
+   * and netlist file.                                                    */
 
 
   char msg[BUFSIZE];
@@ -3274,6 +3398,7 @@ void read_place (BufferBase &place_file_buffer, char *net_file,
   float **dummy_x, **dummy_y;
   float **net_slack, **net_delay;
   float **remember_net_delay_original_ptr; /*used to free net_delay if it is re-assigned*/
+  boolean structs_loaded;   /* Must free_placement_structs on error? */
 
   remember_net_delay_original_ptr = NULL; /*prevents compiler warning*/
 
@@ -3298,70 +3423,96 @@ void read_place (BufferBase &place_file_buffer, char *net_file,
     num_connections = 0;
   }
 
-  /* First read in the placement.   */
+  /* Anything below may throw (e.g. on an invalid placement).  Free the  *
+   * placement structures and timing lookups (and graph) before          *
+   * re-raising, so the next placement may allocate them again.          */
+
+  structs_loaded = FALSE;
+  try {
+    /* First read in the placement.   */
 
-  parse_placement_file(place_file_buffer, net_file, arch_file);
+    if (place_file_buffer != NULL) {
+      parse_placement_file(*place_file_buffer, net_file, arch_file);
+    } else {
+      load_block_positions(block_positions);
+    }
 
-  /* Load the channel occupancies and cost factors so that:   *
-   * (1) the cost check will be OK, and                       *
-   * (2) the geometry will draw correctly.                    */
+    /* Load the channel occupancies and cost factors so that:   *
+     * (1) the cost check will be OK, and                       *
+     * (2) the geometry will draw correctly.                    */
 
-  chan_width_factor = placer_opts.place_chan_width;
-  init_chan (chan_width_factor, chan_width_dist);
+    chan_width_factor = placer_opts.place_chan_width;
+    init_chan (chan_width_factor, chan_width_dist);
 
 /* NB:  dummy_x and dummy_y used because I'll never use the old_place_occ *
  * arrays in this routine.  I need the placement structures loaded for    *
  * comp_cost and check_place to work.                                     */
 
-  alloc_and_load_placement_structs (placer_opts.place_cost_type,
-				    placer_opts.num_regions,
-				    placer_opts.place_cost_exp,
-				    &dummy_x,  &dummy_y, placer_opts);
+    alloc_and_load_placement_structs (placer_opts.place_cost_type,
+                                      placer_opts.num_regions,
+                                      placer_opts.place_cost_exp,
+                                      &dummy_x,  &dummy_y, placer_opts);
+    structs_loaded = TRUE;
 
-  /* Need cost in order to call check_place. */
+    /* Need cost in order to call check_place. */
 
-  bb_cost = comp_bb_cost (NORMAL, placer_opts.place_cost_type,
-			  placer_opts.num_regions);
+    bb_cost = comp_bb_cost (NORMAL, placer_opts.place_cost_type,
+                            placer_opts.num_regions);
 
- if (placer_opts.place_algorithm == NET_TIMING_DRIVEN_PLACE ||
-     placer_opts.place_algorithm == PATH_TIMING_DRIVEN_PLACE ||
-     placer_opts.enable_timing_computations) {
+    if (placer_opts.place_algorithm == NET_TIMING_DRIVEN_PLACE ||
+        placer_opts.place_algorithm == PATH_TIMING_DRIVEN_PLACE ||
+        placer_opts.enable_timing_computations) {
 
-    for (inet = 0; inet<num_nets; inet++)
-      for (ipin=1; ipin<net[inet].num_pins; ipin++)
-    	timing_place_crit[inet][ipin] = 0;  /*dummy crit values*/
+      for (inet = 0; inet<num_nets; inet++)
+        for (ipin=1; ipin<net[inet].num_pins; ipin++)
+          timing_place_crit[inet][ipin] = 0;  /*dummy crit values*/
 
-    comp_td_costs(&timing_cost, &delay_cost);  /*set up point_to_point_delay_cost*/
+      comp_td_costs(&timing_cost, &delay_cost);  /*set up point_to_point_delay_cost*/
 
-    net_delay = point_to_point_delay_cost;  /*this keeps net_delay up to date with the *
-					     *same values that the placer is using     */
-    load_timing_graph_net_delays(net_delay);
-    est_crit = load_net_slack(net_slack, 0);
+      net_delay = point_to_point_delay_cost;  /*this keeps net_delay up to date with the *
+                                               *same values that the placer is using     */
+      load_timing_graph_net_delays(net_delay);
+      est_crit = load_net_slack(net_slack, 0);
 
-    my_printf("Placement. bb_cost: %g  delay_cost: %g.\n\n",
-	   bb_cost, delay_cost);
+      my_printf("Placement. bb_cost: %g  delay_cost: %g.\n\n",
+             bb_cost, delay_cost);
 #ifdef PRINT_SINK_DELAYS
-    print_sink_delays("Placement_Sink_Delays.echo");
+      print_sink_delays("Placement_Sink_Delays.echo");
 #endif
 #ifdef PRINT_NET_SLACKS
-   print_net_slack("Placement_Net_Slacks.echo", net_slack);
+      print_net_slack("Placement_Net_Slacks.echo", net_slack);
 #endif
 #ifdef PRINT_PLACE_CRIT_PATH
-   print_critical_path("Placement_Crit_Path.echo");
+      print_critical_path("Placement_Crit_Path.echo");
 #endif
-    my_printf("Placement Estimated Crit Path Delay: %g\n\n", est_crit);
+      my_printf("Placement Estimated Crit Path Delay: %g\n\n", est_crit);
+    }
+    else {
+      timing_cost = 0;
+      delay_cost = 0;
+      my_printf("Placement bb_cost is %g.\n", bb_cost);
+    }
+    check_place(bb_cost, timing_cost, placer_opts.place_cost_type,
+                placer_opts.num_regions, placer_opts.place_algorithm,
+                delay_cost);
+
+    free_placement_structs(placer_opts.place_cost_type, placer_opts.num_regions,
+                           dummy_x, dummy_y, placer_opts);
+    structs_loaded = FALSE;
   }
-  else {
-    timing_cost = 0;
-    delay_cost = 0;
-    my_printf("Placement bb_cost is %g.\n", bb_cost);
+  catch (...) {
+    if (structs_loaded)
+      free_placement_structs(placer_opts.place_cost_type,
+                             placer_opts.num_regions, dummy_x, dummy_y,
+                             placer_opts);
+    if (placer_opts.place_algorithm == NET_TIMING_DRIVEN_PLACE ||
+        placer_opts.place_algorithm == PATH_TIMING_DRIVEN_PLACE ||
+        placer_opts.enable_timing_computations) {
+      net_delay = remember_net_delay_original_ptr;
+      free_lookups_and_criticalities(&net_delay, &net_slack);
+    }
+    throw;
   }
-  check_place(bb_cost, timing_cost, placer_opts.place_cost_type,
-              placer_opts.num_regions, placer_opts.place_algorithm,
-              delay_cost);
-
-  free_placement_structs(placer_opts.place_cost_type, placer_opts.num_regions,
-                         dummy_x, dummy_y, placer_opts);
 
   if (placer_opts.place_algorithm == NET_TIMING_DRIVEN_PLACE ||
       placer_opts.place_algorithm == PATH_TIMING_DRIVEN_PLACE ||
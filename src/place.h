@@ -3,6 +3,12 @@
 
 #include "Buffer.hpp"
 
+class PlaceStats;
+
+typedef bool (*t_place_stats_callback) (const PlaceStats &stats, void *data);
+
+void set_place_stats_callback (t_place_stats_callback callback, void *data);
+
 
 void try_place (struct s_placer_opts placer_opts,
                 struct s_annealing_sched annealing_sched,
@@ -10,7 +16,8 @@ void try_place (struct s_placer_opts placer_opts,
                 struct s_router_opts router_opts,
                 struct s_det_routing_arch det_routing_arch,
                 t_segment_inf *segment_inf, t_timing_inf timing_inf,
-                t_subblock_data *subblock_data_ptr);
+                t_subblock_data *subblock_data_ptr,
+                const unsigned int *block_positions);
 
 
 void read_place (char *place_file, char *net_file, char *arch_file,
@@ -30,4 +37,13 @@ void read_place (BufferBase &place_file_buffer, char *net_file,
                  t_segment_inf *segment_inf, t_timing_inf timing_inf,
                  t_subblock_data *subblock_data_ptr);
 
+
+void read_place (const unsigned int *block_positions, char *net_file,
+                 char *arch_file, struct s_placer_opts placer_opts,
+                 struct s_router_opts router_opts,
+                 t_chan_width_dist chan_width_dist,
+                 struct s_det_routing_arch det_routing_arch,
+                 t_segment_inf *segment_inf, t_timing_inf timing_inf,
+                 t_subblock_data *subblock_data_ptr);
+
 #endif
@@ -7,6 +7,7 @@
 #include "place.h"
 #include "read_place.h"
 #include "route_export.h"
+#include "route_file.h"
 #include "draw.h"
 #include "stats.h"
 #include "check_route.h"
@@ -14,6 +15,7 @@
 #include "path_delay.h"
 #include "net_delay.h"
 #include "timing_place.h"
+#include "VprError.hpp"
 
 
 /******************* Subroutines local to this module ************************/
@@ -26,14 +28,20 @@ static int binary_search_place_and_route (struct s_placer_opts
       t_segment_inf *segment_inf, t_timing_inf timing_inf, t_subblock_data
       *subblock_data_ptr, t_chan_width_dist chan_width_dist);
 
+static void free_binary_search_structs (t_timing_inf timing_inf, float
+      **net_slack, float **net_delay, struct s_linked_vptr
+      **net_delay_chunk_list_head_ptr, t_ivec **clb_opins_used_locally,
+      struct s_trace **best_routing, t_ivec **saved_clb_opins_used_locally);
+
 static float comp_width (t_chan *chan, float x, float separation);
 
 
 /************************* Subroutine Definitions ****************************/
 
 void place_and_route (enum e_operation operation,
-                      struct s_placer_opts placer_opts, BufferBase &buffer,
-                      char *place_file, char *net_file, char *arch_file,
+                      struct s_placer_opts placer_opts, BufferBase *buffer,
+                      const unsigned int *block_positions, char *place_file,
+                      char *net_file, char *arch_file,
                       char *route_file, boolean full_stats,
                       boolean verify_binary_search,
                       struct s_annealing_sched annealing_sched,
@@ -43,7 +51,11 @@ void place_and_route (enum e_operation operation,
                       t_subblock_data *subblock_data_ptr,
                       t_chan_width_dist chan_width_dist) {
 
-/* This routine controls the overall placement and routing of a circuit. */
+/* This routine controls the overall placement and routing of a circuit.  *
+ * If no placement is to be performed, the placement is read from         *
+ * `buffer` or, if `buffer` is `NULL`, loaded from `block_positions`.     *
+ * Otherwise, if `block_positions` is not `NULL`, the single placement    *
+ * refines the placement it holds rather than starting from scratch.      */
 
  char msg[BUFSIZE];
  int width_fac;
@@ -58,15 +70,24 @@ void place_and_route (enum e_operation operation,
  }
 
  if (placer_opts.place_freq == PLACE_NEVER) {
-    read_place(buffer, net_file, arch_file, placer_opts, router_opts,
-               chan_width_dist, det_routing_arch, segment_inf, timing_inf,
-               subblock_data_ptr);
+    if (buffer != NULL) {
+       read_place(*buffer, net_file, arch_file, placer_opts, router_opts,
+                  chan_width_dist, det_routing_arch, segment_inf, timing_inf,
+                  subblock_data_ptr);
+    } else if (block_positions != NULL) {
+       read_place(block_positions, net_file, arch_file, placer_opts,
+                  router_opts, chan_width_dist, det_routing_arch, segment_inf,
+                  timing_inf, subblock_data_ptr);
+    } else {
+       throw std::runtime_error("No placement file or block positions "
+                                "provided.");
+    }
  }
 
  else if (placer_opts.place_freq == PLACE_ONCE) {
     try_place (placer_opts, annealing_sched, chan_width_dist,
                router_opts, det_routing_arch, segment_inf,
-               timing_inf, subblock_data_ptr);
+               timing_inf, subblock_data_ptr, block_positions);
     print_place (place_file, net_file, arch_file);
  }
 
@@ -75,7 +96,7 @@ void place_and_route (enum e_operation operation,
     placer_opts.place_chan_width = router_opts.fixed_channel_width;
     try_place (placer_opts, annealing_sched, chan_width_dist,
                router_opts, det_routing_arch, segment_inf,
-               timing_inf, subblock_data_ptr);
+               timing_inf, subblock_data_ptr, NULL);
     print_place (place_file, net_file, arch_file);
  }
 
@@ -144,7 +165,10 @@ void place_and_route (enum e_operation operation,
            det_routing_arch.R_minW_pmos, timing_inf.timing_analysis_enabled,
            net_slack, net_delay);
 
-    print_route (route_file);
+    if (router_opts.route_file_format == ROUTE_FILE_BINARY)
+       print_route_binary (route_file);
+    else
+       print_route (route_file);
 
 #ifdef PRINT_SINK_DELAYS
     print_sink_delays("Routing_Sink_Delays.echo");
@@ -177,7 +201,9 @@ static int binary_search_place_and_route (struct s_placer_opts
 
 /* This routine performs a binary search to find the minimum number of      *
  * tracks per channel required to successfully route a circuit, and returns *
- * that minimum width_fac.                                                  */
+ * that minimum width_fac.  If the routing iteration callback cancels a     *
+ * route, the search stops and returns the smallest width_fac routed so     *
+ * far, or -1 if none has been.                                             */
 
  struct s_trace **best_routing;  /* Saves the best routing found so far. */
  int current, low, high, final;
@@ -226,22 +252,34 @@ static int binary_search_place_and_route (struct s_placer_opts
  * going to overflow.                                                */
 
     if (current > MAX_CHANNEL_WIDTH) {
-       my_printf("This circuit appears to be unroutable with the current "
-         "router options.\n");
-       my_printf("Aborting routing procedure.\n");
-       exit (1);
+       free_binary_search_structs (timing_inf, net_slack, net_delay,
+             &net_delay_chunk_list_head, clb_opins_used_locally, best_routing,
+             saved_clb_opins_used_locally);
+       throw UnroutableError (Formatter () << "This circuit appears to be "
+             "unroutable with the current router options (no routing found "
+             "with up to " << MAX_CHANNEL_WIDTH << " tracks per channel).");
     }
 
     if (placer_opts.place_freq == PLACE_ALWAYS) {
        placer_opts.place_chan_width = current;
        try_place (placer_opts, annealing_sched, chan_width_dist,
                   router_opts, det_routing_arch, segment_inf,
-                  timing_inf, subblock_data_ptr);
+                  timing_inf, subblock_data_ptr, NULL);
     }
     success = try_route (current, router_opts, det_routing_arch, segment_inf,
                          timing_inf, net_slack, net_delay, chan_width_dist,
                          clb_opins_used_locally);
 
+/* A cancelled route ends the search, keeping the best routing found so far *
+ * (if any).                                                                */
+
+    if (g_route_state.cancelled) {
+       my_printf("Binary search cancelled at a channel width factor of %d.\n",
+          current);
+       final = high;
+       break;
+    }
+
     if (success) {
        high = current;
 
@@ -290,7 +328,7 @@ static int binary_search_place_and_route (struct s_placer_opts
  * trying smaller channel widths until two in a row (e.g. 8 and 9)    *
  * fail.                                                              */
 
- if (verify_binary_search) {
+ if (verify_binary_search && !g_route_state.cancelled) {
 
     my_printf("\nVerifying that binary search found min. channel width ...\n");
 
@@ -308,13 +346,16 @@ static int binary_search_place_and_route (struct s_placer_opts
           placer_opts.place_chan_width = current;
           try_place (placer_opts, annealing_sched, chan_width_dist,
                      router_opts, det_routing_arch, segment_inf,
-                     timing_inf, subblock_data_ptr);
+                     timing_inf, subblock_data_ptr, NULL);
        }
 
        success = try_route (current, router_opts, det_routing_arch,
                segment_inf, timing_inf, net_slack, net_delay, chan_width_dist,
                clb_opins_used_locally);
 
+       if (g_route_state.cancelled)
+          break;
+
        if (success) {
           final = current;
           save_routing (best_routing, clb_opins_used_locally,
@@ -333,6 +374,15 @@ static int binary_search_place_and_route (struct s_placer_opts
  }   /* End binary search verification. */
 
 
+/* Nothing to restore if the search was cancelled before any route. */
+
+ if (final == -1) {
+    free_binary_search_structs (timing_inf, net_slack, net_delay,
+          &net_delay_chunk_list_head, clb_opins_used_locally, best_routing,
+          saved_clb_opins_used_locally);
+    return (final);
+ }
+
 /* Restore the best placement (if necessary), the best routing, and  *
  * the best channel widths for final drawing and statistics output.  */
 
@@ -365,7 +415,10 @@ static int binary_search_place_and_route (struct s_placer_opts
            det_routing_arch.R_minW_pmos, timing_inf.timing_analysis_enabled,
            net_slack, net_delay);
 
- print_route (route_file);
+ if (router_opts.route_file_format == ROUTE_FILE_BINARY)
+    print_route_binary (route_file);
+ else
+    print_route (route_file);
 
 #ifdef PRINT_SINK_DELAYS
  print_sink_delays("Routing_Sink_Delays.echo");
@@ -377,16 +430,29 @@ static int binary_search_place_and_route (struct s_placer_opts
     final);
  update_screen (MAJOR, msg, ROUTING, timing_inf.timing_analysis_enabled);
 
+ free_binary_search_structs (timing_inf, net_slack, net_delay,
+       &net_delay_chunk_list_head, clb_opins_used_locally, best_routing,
+       saved_clb_opins_used_locally);
+ fflush (stdout);
+
+ return (final);
+}
+
+
+static void free_binary_search_structs (t_timing_inf timing_inf, float
+      **net_slack, float **net_delay, struct s_linked_vptr
+      **net_delay_chunk_list_head_ptr, t_ivec **clb_opins_used_locally,
+      struct s_trace **best_routing, t_ivec **saved_clb_opins_used_locally) {
+
+/* Frees the structures allocated by binary_search_place_and_route. */
+
  if (timing_inf.timing_analysis_enabled) {
     free_timing_graph (net_slack);
-    free_net_delay (net_delay, &net_delay_chunk_list_head);
+    free_net_delay (net_delay, net_delay_chunk_list_head_ptr);
  }
 
  free_route_structs (clb_opins_used_locally);
  free_saved_routing (best_routing, saved_clb_opins_used_locally);
- fflush (stdout);
-
- return (final);
 }
 
 
@@ -502,8 +568,8 @@ static float comp_width (t_chan *chan, float x, float separation) {
     break;
 
  default:
-    printf("Error in comp_width:  Unknown channel type %d.\n",chan->type);
-    exit (1);
+    throw InternalError (Formatter () << "Error in comp_width:  Unknown "
+          "channel type " << chan->type << ".");
     break;
  }
 
@@ -5,8 +5,9 @@
 #include "Buffer.hpp"
 
 void place_and_route (enum e_operation operation,
-                      struct s_placer_opts placer_opts, BufferBase &buffer,
-                      char *place_file, char *net_file, char *arch_file,
+                      struct s_placer_opts placer_opts, BufferBase *buffer,
+                      const unsigned int *block_positions, char *place_file,
+                      char *net_file, char *arch_file,
                       char *route_file, boolean full_stats,
                       boolean verify_binary_search,
                       struct s_annealing_sched annealing_sched,
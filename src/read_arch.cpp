@@ -5,6 +5,7 @@
 #include "vpr_types.h"
 #include "globals.h"
 #include "read_arch.h"
+#include "VprError.hpp"
 
 /* This source file reads in the architectural description of an FPGA.       *
  * A # symbol anywhere in the input file denotes a comment to the end        *
@@ -134,6 +135,7 @@
 /******************** Variables local to this module. **********************/
 
 static int isread[NUMINP];
+static int num_T_subblock;   /* Length of the timing_inf.T_subblock array. */
 static const char *names[NUMINP] = {"io_rat", "chan_width_x", "chan_width_y",
    "chan_width_io", "outpin", "inpin", "subblocks_per_clb",
    "subblock_lut_size", "Fc_output", "Fc_input", "Fc_pad", "Fc_type",
@@ -199,6 +201,12 @@ static void countpass (FILE *fp_arch, enum e_route_type route_type,
             s_det_routing_arch *det_routing_arch_ptr, t_timing_inf
             *timing_inf);
 
+static void load_arch (FILE *fp_arch, char *arch_file, enum e_route_type
+       route_type, struct s_det_routing_arch *det_routing_arch,
+       t_segment_inf **segment_inf_ptr, t_timing_inf *timing_inf_ptr,
+       t_subblock_data *subblock_data_ptr, t_chan_width_dist
+       *chan_width_dist_ptr);
+
 
 
 /****************** Subroutine definitions **********************************/
@@ -209,14 +217,37 @@ void read_arch (char *arch_file, enum e_route_type route_type,
        **segment_inf_ptr, t_timing_inf *timing_inf_ptr, t_subblock_data
        *subblock_data_ptr, t_chan_width_dist *chan_width_dist_ptr) {
 
-/* Reads in the architecture description file for the FPGA. */
+/* Reads in the architecture description file for the FPGA.  The file is *
+ * closed even if it cannot be parsed.                                    */
+
+ FILE *fp_arch;
+
+ fp_arch = my_fopen (arch_file, "r", 0);
+ try {
+    load_arch (fp_arch, arch_file, route_type, det_routing_arch,
+          segment_inf_ptr, timing_inf_ptr, subblock_data_ptr,
+          chan_width_dist_ptr);
+ }
+ catch (...) {
+    fclose (fp_arch);
+    throw;
+ }
+ fclose (fp_arch);
+}
+
+
+static void load_arch (FILE *fp_arch, char *arch_file, enum e_route_type
+       route_type, struct s_det_routing_arch *det_routing_arch,
+       t_segment_inf **segment_inf_ptr, t_timing_inf *timing_inf_ptr,
+       t_subblock_data *subblock_data_ptr, t_chan_width_dist
+       *chan_width_dist_ptr) {
+
+/* Parses the architecture file fp_arch (named arch_file) for read_arch. */
 
  int i, j, pinnum, next_segment;
  char *ptr, buf[BUFSIZE];
- FILE *fp_arch;
  t_T_subblock *next_T_subblock_ptr;
 
- fp_arch = my_fopen (arch_file, "r", 0);
  countpass (fp_arch, route_type, segment_inf_ptr, det_routing_arch,
             timing_inf_ptr);
 
@@ -400,8 +431,8 @@ void read_arch (char *arch_file, enum e_route_type route_type,
     }
 
 
-    printf ("Error:  unrecognized keyword (%s) on line %d.\n", ptr, linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  unrecognized keyword (" << ptr
+          << ") on line " << linenum << ".");
  }
 
  if (route_type == GLOBAL) {
@@ -415,7 +446,6 @@ void read_arch (char *arch_file, enum e_route_type route_type,
  check_arch (arch_file, route_type, *det_routing_arch, *segment_inf_ptr,
        *timing_inf_ptr, subblock_data_ptr->max_subblocks_per_block,
        *chan_width_dist_ptr);
- fclose (fp_arch);
 }
 
 
@@ -428,7 +458,7 @@ static void countpass (FILE *fp_arch, enum e_route_type route_type,
  * for them before the second (loading) pass begins.                        */
 
  char buf[BUFSIZE], *ptr;
- int *pins_per_class, iclass, i, num_segment, num_switch, num_T_subblock;
+ int *pins_per_class, iclass, i, num_segment, num_switch;
 
  linenum = 0;
  num_class = 1;   /* Must be at least 1 class  */
@@ -485,10 +515,9 @@ static void countpass (FILE *fp_arch, enum e_route_type route_type,
 
  for (i=0;i<num_class;i++) {
     if (pins_per_class[i] == 0) {
-       printf("\nError:  class index %d not used in architecture "
-               "file.\n", i);
-       my_printf("          Specified class indices are not consecutive.\n");
-       exit (1);
+       throw ParseError (Formatter () << "Error:  class index " << i
+             << " not used in architecture file.  Specified class indices "
+             "are not consecutive.");
     }
  }
 
@@ -525,8 +554,8 @@ static void countpass (FILE *fp_arch, enum e_route_type route_type,
  }
 
  if (num_segment < 1) {
-    printf ("Error:  No segment information specified in architecture.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  No segment information "
+          "specified in architecture.");
  }
 
  *segment_inf_ptr = (t_segment_inf *) my_malloc (num_segment *
@@ -534,8 +563,8 @@ static void countpass (FILE *fp_arch, enum e_route_type route_type,
  det_routing_arch_ptr->num_segment = num_segment;
 
  if (num_switch < 1) {
-    printf ("Error:  No switch information specified in architecture.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  No switch information "
+          "specified in architecture.");
  }
 
  switch_inf = (struct s_switch_inf *) my_malloc (num_switch *
@@ -565,31 +594,28 @@ static int get_class (FILE *fp_arch, char *buf) {
  ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
 
  if (ptr == NULL) {
-    printf("Error in get_class on line %d of architecture file.\n",linenum);
-    my_printf("Expected class: keyword.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error in get_class on line "
+          << linenum << " of architecture file.  Expected class: keyword.");
  }
 
  if (strcmp (ptr, "class:") != 0) {
-    printf("Error in get_class on line %d of architecture file.\n",linenum);
-    my_printf("Expected class: keyword.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error in get_class on line "
+          << linenum << " of architecture file.  Expected class: keyword.");
  }
 
 /* Now get class number. */
 
  ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
  if (ptr == NULL) {
-    printf("Error in get_class on line %d of architecture file.\n",linenum);
-    my_printf("Expected class number.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error in get_class on line "
+          << linenum << " of architecture file.  Expected class number.");
  }
 
  iclass = my_atoi (ptr);
  if (iclass < 0) {
-    printf("Error in get_class on line %d of architecture file.\n",linenum);
-    my_printf("Expected class number >= 0, got %d.\n", iclass);
-    exit (1);
+    throw ParseError (Formatter () << "Error in get_class on line "
+          << linenum << " of architecture file.  Expected class number >= "
+          "0, got " << iclass << ".");
  }
 
  return (iclass);
@@ -612,10 +638,9 @@ static void get_pin (char *ptr, int pinnum, enum e_pin_type type,
  }
  else {
     if (class_inf[iclass].type != type) {
-       printf("Error in get_pin: architecture file, line %d.\n",
-          linenum);
-       my_printf("Class %d contains both input and output pins.\n", iclass);
-       exit (1);
+       throw ParseError (Formatter () << "Error in get_pin: architecture "
+             "file, line " << linenum << ".  Class " << iclass
+             << " contains both input and output pins.");
     }
  }
 
@@ -627,18 +652,16 @@ static void get_pin (char *ptr, int pinnum, enum e_pin_type type,
 
  ptr = my_strtok(NULL,TOKENS,fp_arch,buf);
  if (ptr == NULL) {
-    printf("Error:  pin statement specifies no locations, line %d.\n",
-       linenum);
-    exit(1);
+    throw ParseError (Formatter () << "Error:  pin statement specifies no "
+          "locations, line " << linenum << ".");
  }
 
  if (type == RECEIVER && strcmp (ptr, "global") == 0) {
     is_global_clb_pin[pinnum] = TRUE;
     ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
     if (ptr == NULL) {
-       printf("Error:  pin statement specifies no locations, line %d.\n",
-          linenum);
-       exit(1);
+       throw ParseError (Formatter () << "Error:  pin statement specifies "
+             "no locations, line " << linenum << ".");
     }
  }
  else {
@@ -655,8 +678,8 @@ static void get_pin (char *ptr, int pinnum, enum e_pin_type type,
        }
     }
     if (valid != 1) {
-       printf("Error:  bad pin location on line %d.\n", linenum);
-       exit(1);
+       throw ParseError (Formatter () << "Error:  bad pin location on line "
+             << linenum << ".");
     }
  } while((ptr = my_strtok(NULL,TOKENS,fp_arch,buf)) != NULL);
 }
@@ -670,9 +693,8 @@ static enum e_Fc_type get_Fc_type (char *ptr, FILE *fp_arch, char *buf) {
 
  ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
  if (ptr == NULL) {
-    printf("Error:  missing Fc_type value on line %d of "
-         "architecture file.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  missing Fc_type value on "
+          "line " << linenum << " of architecture file.");
  }
 
  if (strcmp (ptr, "absolute") == 0) {
@@ -682,15 +704,14 @@ static enum e_Fc_type get_Fc_type (char *ptr, FILE *fp_arch, char *buf) {
     Fc_type = FRACTIONAL;
  }
  else {
-    printf("Error:  Bad Fc_type value (%s) on line %d of "
-         "architecture file.\n", ptr, linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  Bad Fc_type value (" << ptr
+          << ") on line " << linenum << " of architecture file.");
  }
 
  ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
  if (ptr != NULL) {
-    printf("Error:  extra characters at end of line %d.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  extra characters at end of "
+          "line " << linenum << ".");
  }
 
  return (Fc_type);
@@ -708,9 +729,8 @@ static enum e_switch_block_type get_switch_block_type (FILE *fp_arch,
 
  ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
  if (ptr == NULL) {
-    printf("Error:  missing switch_block_type value on line %d of "
-         "architecture file.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  missing switch_block_type "
+          "value on line " << linenum << " of architecture file.");
  }
 
  if (strcmp (ptr, "subset") == 0) {
@@ -723,15 +743,14 @@ static enum e_switch_block_type get_switch_block_type (FILE *fp_arch,
     sblock_type = UNIVERSAL;
  }
  else {
-    printf("Error:  Bad switch_block_type value (%s) on line %d of "
-         "architecture file.\n", ptr, linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  Bad switch_block_type value ("
+          << ptr << ") on line " << linenum << " of architecture file.");
  }
 
  ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
  if (ptr != NULL) {
-    printf("Error:  extra characters at end of line %d.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  extra characters at end of "
+          "line " << linenum << ".");
  }
 
  return (sblock_type);
@@ -751,9 +770,8 @@ static void get_T_subblock (FILE *fp_arch, char *buf, t_T_subblock
  ptr = get_middle_token (fp_arch, buf);
  T_subblock->T_comb = atof (ptr);
  if (T_subblock->T_comb < 0.) {
-    printf ("Error on line %d:  T_comb value (%g) is negative.\n",
-             linenum, T_subblock->T_comb);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "T_comb value (" << T_subblock->T_comb << ") is negative.");
  }
 
  check_keyword (fp_arch, buf, "T_seq_in:");
@@ -761,9 +779,8 @@ static void get_T_subblock (FILE *fp_arch, char *buf, t_T_subblock
  ptr = get_middle_token (fp_arch, buf);
  T_subblock->T_seq_in = atof (ptr);
  if (T_subblock->T_seq_in < 0.) {
-    printf ("Error on line %d:  T_seq_in value (%g) is negative.\n",
-             linenum, T_subblock->T_seq_in);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "T_seq_in value (" << T_subblock->T_seq_in << ") is negative.");
  }
 
  check_keyword (fp_arch, buf, "T_seq_out:");
@@ -771,9 +788,8 @@ static void get_T_subblock (FILE *fp_arch, char *buf, t_T_subblock
  ptr = get_last_token (fp_arch, buf);
  T_subblock->T_seq_out = atof (ptr);
  if (T_subblock->T_seq_out < 0.) {
-    printf ("Error on line %d:  T_seq_out value (%g) is negative.\n",
-            linenum, T_subblock->T_seq_out);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "T_seq_out value (" << T_subblock->T_seq_out << ") is negative.");
  }
 
 }
@@ -800,9 +816,8 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
  ptr = get_middle_token (fp_arch, buf);
  seg_ptr->frequency = atof (ptr);
  if (seg_ptr->frequency <= 0. || seg_ptr->frequency > 1.) {
-    printf ("Error on line %d:  Frequency value (%g) is out of range.\n",
-             linenum, seg_ptr->frequency);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "Frequency value (" << seg_ptr->frequency << ") is out of range.");
  }
 
  check_keyword (fp_arch, buf, "length:");
@@ -816,9 +831,8 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
     seg_ptr->length = my_atoi (ptr);
     seg_ptr->longline = FALSE;
     if (seg_ptr->length < 1) {
-       printf ("Error on line %d:  Length value (%d) is less than 1.\n",
-                linenum, seg_ptr->length);
-       exit (1);
+       throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+             "Length value (" << seg_ptr->length << ") is less than 1.");
     }
  }
 
@@ -831,9 +845,9 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
  * used in the architecture file.                                          */
 
  if (seg_ptr->wire_switch < 0 || seg_ptr->wire_switch >= num_switch - 2) {
-    printf ("Error on line %d:  wire_switch value (%d) is out of range.\n",
-             linenum, seg_ptr->wire_switch);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "wire_switch value (" << seg_ptr->wire_switch << ") is out of "
+          "range.");
  }
 
  check_keyword (fp_arch, buf, "opin_switch:");
@@ -845,9 +859,9 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
  * used in the architecture file.                                          */
 
  if (seg_ptr->opin_switch < 0 || seg_ptr->opin_switch >= num_switch - 2) {
-    printf ("Error on line %d:  opin_switch value (%d) is out of range.\n",
-             linenum, seg_ptr->opin_switch);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "opin_switch value (" << seg_ptr->opin_switch << ") is out of "
+          "range.");
  }
 
 
@@ -856,9 +870,8 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
  ptr = get_middle_token (fp_arch, buf);
  seg_ptr->frac_cb = atof (ptr);
  if (seg_ptr->frac_cb < 0. || seg_ptr->frac_cb > 1.) {
-    printf ("Error on line %d:  Frac_cb value (%g) is out of range.\n",
-             linenum, seg_ptr->frac_cb);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "Frac_cb value (" << seg_ptr->frac_cb << ") is out of range.");
  }
 
  check_keyword (fp_arch, buf, "Frac_sb:");
@@ -866,9 +879,8 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
  ptr = get_middle_token (fp_arch, buf);
  seg_ptr->frac_sb = atof (ptr);
  if (seg_ptr->frac_sb < 0. || seg_ptr->frac_sb > 1.) {
-    printf ("Error on line %d:  Frac_sb value (%g) is out of range.\n",
-             linenum, seg_ptr->frac_sb);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "Frac_sb value (" << seg_ptr->frac_sb << ") is out of range.");
  }
 
  if (seg_ptr->longline == FALSE) {
@@ -879,11 +891,9 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
     num_sb = nint ((seg_ptr->length + 1) * seg_ptr->frac_sb);
 
     if (num_sb < 2) {
-       printf ("Error on line %d:  Frac_sb value results in only %d switch "
-               "boxes.\n"
-               "Minimum 2 switch boxes on non-longline segments.\n", linenum,
-               num_sb);
-       exit (1);
+       throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+             "Frac_sb value results in only " << num_sb << " switch boxes.  "
+             "Minimum 2 switch boxes on non-longline segments.");
     }
  }
 
@@ -892,9 +902,8 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
  ptr = get_middle_token (fp_arch, buf);
  seg_ptr->Rmetal = atof (ptr);
  if (seg_ptr->Rmetal < 0.) {
-    printf ("Error on line %d:  Rmetal value (%g) is out of range.\n",
-             linenum, seg_ptr->Rmetal);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "Rmetal value (" << seg_ptr->Rmetal << ") is out of range.");
  }
 
  check_keyword (fp_arch, buf, "Cmetal:");
@@ -902,9 +911,8 @@ static void get_segment_inf (FILE *fp_arch, char *buf, t_segment_inf *seg_ptr,
  ptr = get_last_token (fp_arch, buf);
  seg_ptr->Cmetal = atof (ptr);
  if (seg_ptr->Cmetal < 0.) {
-    printf ("Error on line %d:  Cmetal value (%g) is out of range.\n",
-             linenum, seg_ptr->Cmetal);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "Cmetal value (" << seg_ptr->Cmetal << ") is out of range.");
  }
 }
 
@@ -927,21 +935,18 @@ static void get_switch_inf (FILE *fp_arch, char *buf, int num_switch,
  ptr = get_middle_token (fp_arch, buf);
  index = my_atoi (ptr);
  if (index < 0) {
-    printf ("Error on line %d:  switch number (%d) is out of range.\n",
-        linenum, index);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "switch number (" << index << ") is out of range.");
  }
 
  if (index >= num_switch) {
-    printf ("Error on line %d:  switch numbers are not consecutive or do \n"
-            "\tnot start at 0.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "switch numbers are not consecutive or do not start at 0.");
  }
 
  if (switch_inf[index].R >= 0.) {
-    printf ("Error on line %d:  switch %d properties already set.\n", linenum,
-        index);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "switch " << index << " properties already set.");
  }
 
  check_keyword (fp_arch, buf, "buffered:");
@@ -954,8 +959,8 @@ static void get_switch_inf (FILE *fp_arch, char *buf, int num_switch,
     switch_inf[index].buffered = FALSE;
  }
  else {
-    printf ("Error on line %d:  invalid buffered value: %s.\n", linenum, ptr);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "invalid buffered value: " << ptr << ".");
  }
 
  check_keyword (fp_arch, buf, "R:");
@@ -963,9 +968,8 @@ static void get_switch_inf (FILE *fp_arch, char *buf, int num_switch,
  ptr = get_middle_token (fp_arch, buf);
  switch_inf[index].R = atof (ptr);
  if (switch_inf[index].R < 0) {
-    printf ("Error on line %d:  resistance value (%g) is negative.\n",
-        linenum, switch_inf[index].R);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "resistance value (" << switch_inf[index].R << ") is negative.");
  }
 
  check_keyword (fp_arch, buf, "Cin:");
@@ -973,9 +977,8 @@ static void get_switch_inf (FILE *fp_arch, char *buf, int num_switch,
  ptr = get_middle_token (fp_arch, buf);
  switch_inf[index].Cin = atof (ptr);
  if (switch_inf[index].Cin < 0) {
-    printf ("Error on line %d:  capacitance value (%g) is negative.\n",
-        linenum, switch_inf[index].Cin);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "capacitance value (" << switch_inf[index].Cin << ") is negative.");
  }
 
  check_keyword (fp_arch, buf, "Cout:");
@@ -983,17 +986,16 @@ static void get_switch_inf (FILE *fp_arch, char *buf, int num_switch,
  ptr = get_middle_token (fp_arch, buf);
  switch_inf[index].Cout = atof (ptr);
  if (switch_inf[index].Cout < 0) {
-    printf ("Error on line %d:  capacitance value (%g) is negative.\n",
-        linenum, switch_inf[index].Cout);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "capacitance value (" << switch_inf[index].Cout << ") is negative.");
  }
 
  if (switch_inf[index].buffered == FALSE && switch_inf[index].Cout
         != switch_inf[index].Cin) {
-    printf ("Error on line %d:  Cin (%g) and Cout (%g) differ for a "
-            "pass transitor (switch #%d).\n", linenum, switch_inf[index].Cin,
-            switch_inf[index].Cout, index);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "Cin (" << switch_inf[index].Cin << ") and Cout ("
+          << switch_inf[index].Cout << ") differ for a pass transitor "
+          "(switch #" << index << ").");
  }
 
  check_keyword (fp_arch, buf, "Tdel:");
@@ -1001,9 +1003,8 @@ static void get_switch_inf (FILE *fp_arch, char *buf, int num_switch,
  ptr = get_last_token (fp_arch, buf);
  switch_inf[index].Tdel = atof (ptr);
  if (switch_inf[index].Tdel < 0) {
-    printf ("Error on line %d:  delay value (%g) is negative.\n",
-        linenum, switch_inf[index].Tdel);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "delay value (" << switch_inf[index].Tdel << ") is negative.");
  }
 }
 
@@ -1061,9 +1062,8 @@ static void load_extra_switch_types (struct s_det_routing_arch *
 
  if (switch_inf[delayless_switch].R >= 0. ||
           switch_inf[wire_to_ipin_switch].R >= 0.) {
-    printf ("Error:  switch indices are not consecutive or do not start at 0."
-            "\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  switch indices are not "
+          "consecutive or do not start at 0.");
  }
 
  switch_inf[delayless_switch].buffered = TRUE;
@@ -1089,9 +1089,8 @@ static void check_keyword (FILE *fp, char *buf, const char *keyword) {
 
  ptr = get_middle_token (fp, buf);
  if (strcmp (ptr, keyword) != 0) {
-    printf ("Error on line %d:  Expected keyword %s, got %s.\n", linenum,
-             keyword, ptr);
-    exit (1);
+    throw ParseError (Formatter () << "Error on line " << linenum << ":  "
+          "Expected keyword " << keyword << ", got " << ptr << ".");
  }
 }
 
@@ -1105,8 +1104,8 @@ static char *get_middle_token (FILE *fp, char *buf) {
 
  ptr = my_strtok (NULL, TOKENS, fp, buf);
  if (ptr == NULL) {
-    printf("Error:  line %d is incomplete.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  line " << linenum << " is "
+          "incomplete.");
  }
  return (ptr);
 }
@@ -1121,8 +1120,8 @@ static char *get_last_token (FILE *fp, char *buf) {
  ptr = get_middle_token (fp, buf);
  ptr2 = my_strtok (NULL, TOKENS, fp, buf);
  if (ptr2 != NULL) {
-    printf("Error:  Extra characters at end of line %d.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  Extra characters at end of "
+          "line " << linenum << ".");
  }
  return (ptr);
 }
@@ -1138,21 +1137,19 @@ static int get_int (char *ptr, int inp_num, FILE *fp_arch, char *buf,
 
  ptr = my_strtok(NULL,TOKENS,fp_arch,buf);
  if (ptr == NULL) {
-    printf("Error:  missing %s value on line %d.\n",
-       names[inp_num],linenum);
-    exit(1);
+    throw ParseError (Formatter () << "Error:  missing " << names[inp_num]
+          << " value on line " << linenum << ".");
  }
  val = my_atoi(ptr);
  if (val < min_val) {
-    printf("Error:  Bad value.  %s = %d on line %d.\n",
-       names[inp_num],val,linenum);
-    exit(1);
+    throw ParseError (Formatter () << "Error:  Bad value.  "
+          << names[inp_num] << " = " << val << " on line " << linenum << ".");
  }
 
  ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
  if (ptr != NULL) {
-    printf("Error:  extra characters at end of line %d.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  extra characters at end of "
+          "line " << linenum << ".");
  }
 
  isread[inp_num]++;
@@ -1173,8 +1170,8 @@ static float get_one_float (char *ptr, int inp_num, float low_lim,
 
  ptr = my_strtok (NULL, TOKENS, fp_arch, buf);
  if (ptr != NULL) {
-    printf("Error:  extra characters at end of line %d.\n", linenum);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  extra characters at end of "
+          "line " << linenum << ".");
  }
 
  isread[inp_num]++;
@@ -1193,16 +1190,14 @@ static float get_float (char *ptr, int inp_num, float low_lim,
 
  ptr = my_strtok(NULL,TOKENS,fp_arch,buf);
  if (ptr == NULL) {
-    printf("Error:  missing %s value on line %d.\n",
-       names[inp_num],linenum);
-    exit(1);
+    throw ParseError (Formatter () << "Error:  missing " << names[inp_num]
+          << " value on line " << linenum << ".");
  }
 
  val = atof(ptr);
  if (val <= low_lim || val > upp_lim) {
-    printf("Error:  Bad value parsing %s. %g on line %d.\n",
-       names[inp_num],val,linenum);
-    exit(1);
+    throw ParseError (Formatter () << "Error:  Bad value parsing "
+          << names[inp_num] << ". " << val << " on line " << linenum << ".");
  }
 
  return(val);
@@ -1225,9 +1220,8 @@ static void get_chan (char *ptr, t_chan *chan, int inp_num, FILE *fp_arch,
 
  ptr = my_strtok(NULL,TOKENS,fp_arch,buf);
  if (ptr == NULL) {
-    printf("Error:  missing %s value on line %d.\n",
-       names[inp_num],linenum);
-    exit(1);
+    throw ParseError (Formatter () << "Error:  missing " << names[inp_num]
+          << " value on line " << linenum << ".");
  }
 
  if (strcmp(ptr,"uniform") == 0) {
@@ -1261,15 +1255,13 @@ static void get_chan (char *ptr, t_chan *chan, int inp_num, FILE *fp_arch,
  }
 
  if (isread[inp_num] == 0) {
-    printf("Error:  %s distribution keyword: %s unknown.\n",
-       names[inp_num],ptr);
-    exit(1);
+    throw ParseError (Formatter () << "Error:  " << names[inp_num]
+          << " distribution keyword: " << ptr << " unknown.");
  }
 
  if (my_strtok(NULL,TOKENS,fp_arch,buf) != NULL) {
-    printf("Error:  extra value for %s at end of line %d.\n",
-       names[inp_num],linenum);
-    exit(1);
+    throw ParseError (Formatter () << "Error:  extra value for "
+          << names[inp_num] << " at end of line " << linenum << ".");
  }
 }
 
@@ -1359,9 +1351,9 @@ static void check_arch (char *arch_file, enum e_route_type route_type,
 
     opin_switch = segment_inf[i].opin_switch;
     if (switch_inf[opin_switch].buffered == FALSE) {
-       printf ("Error in check_arch:  opin_switch (#%d) of segment type #%d "
-               "is not buffered.\n", opin_switch, i);
-       exit (1);
+       throw ParseError (Formatter () << "Error in check_arch:  opin_switch "
+             "(#" << opin_switch << ") of segment type #" << i << " is not "
+             "buffered.");
     }
  }
 
@@ -1414,20 +1406,20 @@ static void check_arch (char *arch_file, enum e_route_type route_type,
        * on the output.  Hence largest R = 2 * largest_transistor_R.        */
 
           if (switch_inf[i].R > 2 * det_routing_arch.R_minW_nmos) {
-             printf ("Error in check_arch:  Switch %d R value (%g) is greater"
-                     " than 2 * R_minW_nmos (%g).\n", i, switch_inf[i].R,
-                     2 * det_routing_arch.R_minW_nmos);
-             exit (1);
+             throw ParseError (Formatter () << "Error in check_arch:  "
+                   "Switch " << i << " R value (" << switch_inf[i].R << ") "
+                   "is greater than 2 * R_minW_nmos ("
+                   << 2 * det_routing_arch.R_minW_nmos << ").");
           }
        }
 
        else {    /* Pass transistor switch */
 
           if (switch_inf[i].R > det_routing_arch.R_minW_nmos) {
-             printf ("Error in check_arch:  Switch %d R value (%g) is greater "
-                     "than R_minW_nmos (%g).\n", i, switch_inf[i].R,
-                     det_routing_arch.R_minW_nmos);
-             exit (1);
+             throw ParseError (Formatter () << "Error in check_arch:  "
+                   "Switch " << i << " R value (" << switch_inf[i].R << ") "
+                   "is greater than R_minW_nmos ("
+                   << det_routing_arch.R_minW_nmos << ").");
           }
        }
     }     /* End for all switches. */
@@ -1435,7 +1427,7 @@ static void check_arch (char *arch_file, enum e_route_type route_type,
  }     /* End if route_type == DETAILED */
 
  if (fatal)
-    exit(1);
+    throw ParseError (Formatter () << "Error in check_arch.");
 }
 
 
@@ -1579,6 +1571,15 @@ void print_arch (char *arch_file, enum e_route_type route_type,
 }
 
 
+int get_num_T_subblock (void) {
+
+/* Returns the number of T_subblock entries allocated by the most recent *
+ * call to read_arch.                                                     */
+
+ return (num_T_subblock);
+}
+
+
 void init_arch (float aspect_ratio, boolean user_sized) {
 
 /* Allocates various data structures that depend on the FPGA         *
@@ -1596,8 +1597,8 @@ void init_arch (float aspect_ratio, boolean user_sized) {
  if (user_sized == TRUE) {
     if (num_clbs > nx * ny || num_p_inputs + num_p_outputs >
            2 * io_rat * (nx + ny)) {
-       printf ("Error:  User-specified size is too small for circuit.\n");
-       exit (1);
+       throw ParseError (Formatter () << "Error:  User-specified size is "
+             "too small for circuit.");
     }
  }
 
@@ -1622,21 +1623,18 @@ void init_arch (float aspect_ratio, boolean user_sized) {
  * instead.                                                            */
 
  if (nx == 1  && ny == 1 && num_clbs != 0) {
-    printf ("Error:\n");
-    my_printf ("Sorry, can't place a circuit with only one valid location\n");
-    my_printf ("for a logic block (clb).\n");
-    my_printf ("Try me with a more realistic circuit!\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  Sorry, can't place a circuit "
+          "with only one valid location for a logic block (clb).  Try me "
+          "with a more realistic circuit!");
  }
 
 /* To remove this limitation, change ylow etc. in t_rr_node to        *
  * be ints instead.  Used shorts to save memory.                      */
 
  if (nx > 32766 || ny > 32766) {
-    printf("Error:  nx and ny must be less than 32767, since the \n");
-    my_printf("router uses shorts (16-bit) to store coordinates.\n");
-    my_printf("nx: %d.  ny: %d.\n", nx, ny);
-    exit (1);
+    throw ParseError (Formatter () << "Error:  nx and ny must be less than "
+          "32767, since the router uses shorts (16-bit) to store "
+          "coordinates.  nx: " << nx << ".  ny: " << ny << ".");
  }
 
  clb = (struct s_clb **) alloc_matrix (0, nx+1, 0, ny+1,
@@ -1649,6 +1647,48 @@ void init_arch (float aspect_ratio, boolean user_sized) {
 }
 
 
+void free_arch (void) {
+
+/* Frees the global architecture structures allocated by read_arch (or    *
+ * restored from the parse cache) and init_arch, so that another          *
+ * architecture may be read.  The segment_inf and T_subblock arrays       *
+ * returned by read_arch are freed by the caller.                         */
+
+ int i;
+
+ if (clb != NULL) {
+    /* io_blocks storage for all the pads starts at the first pad location. */
+    if (nx >= 1)
+       free (clb[1][0].u.io_blocks);
+    else if (ny >= 1)
+       free (clb[0][1].u.io_blocks);
+    free_matrix (clb, 0, nx+1, 0, sizeof (struct s_clb));
+ }
+ free (chan_width_x);
+ free (chan_width_y);
+
+ if (pinloc != NULL)
+    free_matrix (pinloc, 0, 3, 0, sizeof (int));
+ if (class_inf != NULL)
+    for (i=0;i<num_class;i++)
+       free (class_inf[i].pinlist);
+ free (class_inf);
+ free (clb_pin_class);
+ free (is_global_clb_pin);
+ free (switch_inf);
+
+ clb = NULL;
+ chan_width_x = NULL;
+ chan_width_y = NULL;
+ pinloc = NULL;
+ class_inf = NULL;
+ num_class = 0;
+ clb_pin_class = NULL;
+ is_global_clb_pin = NULL;
+ switch_inf = NULL;
+}
+
+
 static void fill_arch (void) {
 
 /* Fill some of the FPGA architecture data structures.         */
@@ -5,6 +5,10 @@ void read_arch (char *arch_file, enum e_route_type route_type,
 
 void init_arch (float aspect_ratio, boolean user_sized);
 
+void free_arch (void);
+
+int get_num_T_subblock (void);
+
 void print_arch (char *arch_file, enum e_route_type route_type,
        struct s_det_routing_arch det_routing_arch, t_segment_inf *segment_inf, 
        t_timing_inf timing_inf, t_subblock_data subblock_data,
@@ -1,5 +1,10 @@
 #include <string.h>
 #include <stdio.h>
+#include <stdexcept>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 #include "util.h"
 #include "vpr_types.h"
 #include "globals.h"
@@ -7,6 +12,7 @@
 #include "hash.h"
 #include "check_netlist.h"
 #include <assert.h>
+#include "VprError.hpp"
 
 
 /* This source file reads in a .net file.  A .net file is a netlist   *
@@ -51,14 +57,14 @@
  *                                                                    *
  * V. Betz, Jan. 29, 1997.                                            */
 
-/* A note about the way the character buffer, buf, is passed around. *
- * strtok does not make a local copy of the character string         *
- * initially passed to it, so you must make sure it always exists.   *
- * Hence, I just use one buffer declared in read_net and pass it     *
- * downstream.  Starting a new line with an automatic variable       *
- * buffer in a downstream subroutine and then returning and trying   *
- * to keep tokenizing it would cause problems since the buffer now   *
- * lies on a stale part of the stack and can be overwritten.         */
+/* The netlist file is memory-mapped and split into tokens in a single  *
+ * pass by tokenize_netlist, which follows the rules above: tokens are   *
+ * separated by TOKENS, # starts a comment and a \ at the end of a line  *
+ * (with no comment) continues it.  The counting and loading passes      *
+ * then walk the token array, one (logical, non-empty) line at a time,   *
+ * rather than reading the file twice, and the loading pass reuses the   *
+ * net index found by the counting pass for each pin, rather than        *
+ * looking its name up in the hash table again.                          */
 
 
 /*************************** Variables local to this module *****************/
@@ -69,10 +75,12 @@ static int *num_driver, *temp_num_pins;
 static struct s_hash **hash_table;
 static int temp_block_storage;
 
-/* Used for memory chunking of everything except subblock data. */
+/* Used for memory chunking of everything except subblock data.  The       *
+ * chunks are released by free_netlist.                                     */
 
 static int chunk_bytes_avail = 0;
 static char *chunk_next_avail_mem = NULL;
+static struct s_linked_vptr *chunk_head_ptr = NULL;
 
 
 /* Subblock data can be accessed anywhere within this module.  Pointers to *
@@ -91,27 +99,51 @@ static int ch_subblock_bytes_avail;
 static char *ch_subblock_next_avail_mem;
 static struct s_linked_vptr *ch_subblock_head_ptr;
 
+/* The tokens of the netlist file, made by tokenize_netlist.  Each token   *
+ * is NUL-terminated in place in the (private) mapping of the file, except *
+ * for a token that ends the file, which is copied to tail_token.  The     *
+ * tokens of logical line iline are [line_start[iline]..                   *
+ * line_start[iline+1]-1].  token_net holds the net index of each token    *
+ * naming a net, found by the counting pass.                               */
 
+static char *net_text;
+static size_t net_text_size;
+static char *tail_token;
+static char **tokens;
+static int *token_linenum;
+static int *token_net;
+static int num_tokens;
+static int *line_start;
+static int num_lines;
+
+/* Parsing position: the current line and the next token on it. */
+
+static int iline, itoken, line_end;
 
-/************************ Subroutines local to this module ******************/
 
-static int add_net (char *ptr, enum e_pin_type type, int bnum, int blk_pnum,
-       int doall);
 
-static char *get_tok(char *buf, int doall, FILE *fp_net);
-static void add_io (int doall, int type, FILE *fp_net, char *buf);
-static char *add_clb (int doall, FILE *fp_net, char *buf);
-static void add_global (int doall, FILE *fp_net, char *buf);
+/************************ Subroutines local to this module ******************/
+
+static int add_net (int inet_token, enum e_pin_type type, int bnum,
+       int blk_pnum, int doall);
+
+static void tokenize_netlist (char *net_file);
+static void free_netlist_tokens (void);
+static boolean next_line (void);
+static char *next_token (void);
+static boolean get_tok (int doall);
+static void add_io (int doall, int type);
+static boolean add_clb (int doall);
+static void add_global (int doall);
 static void init_parse(int doall);
 static void free_parse (void);
-static void parse_name_and_pinlist (int doall, FILE *fp_net, char *buf);
+static void parse_name_and_pinlist (int doall);
 static int get_pin_number (char *ptr);
 
-static void load_subblock_array (int doall, FILE *fp_net, char *temp_buf,
-     int num_subblocks, int bnum);
+static void load_subblock_array (int doall, int num_subblocks, int bnum);
 
 static void set_subblock_count (int bnum, int num_subblocks);
-static char *parse_subblocks (int doall, FILE *fp_net, char *buf, int bnum);
+static boolean parse_subblocks (int doall, int bnum);
 
 
 
@@ -123,9 +155,8 @@ void read_net (char *net_file, t_subblock_data *subblock_data_ptr) {
 
 /* Main routine that parses a netlist file in my (.net) format. */
 
- char buf[BUFSIZE], *ptr;
  int doall;
- FILE *fp_net;
+ boolean more;
 
 /* Make two variables below accessible anywhere in the module because I'm *
  * too lazy to pass them all over the place.                              */
@@ -133,26 +164,32 @@ void read_net (char *net_file, t_subblock_data *subblock_data_ptr) {
  max_subblocks_per_block = subblock_data_ptr->max_subblocks_per_block;
  subblock_lut_size = subblock_data_ptr->subblock_lut_size;
 
- fp_net = my_fopen (net_file, "r", 0);
+ tokenize_netlist (net_file);
 
 /* First pass builds the symbol table and counts the number of pins  *
  * on each net.  Then I allocate exactly the right amount of storage *
  * for each net.  Finally, the second pass loads the block and net   *
  * arrays.                                                           */
 
- for (doall=0;doall<=1;doall++) {  /* Pass number. */
-    init_parse(doall);
+ try {
+    for (doall=0;doall<=1;doall++) {  /* Pass number. */
+       init_parse(doall);
 
-    linenum = 0;   /* Reset line number. */
-    ptr = my_fgets (buf, BUFSIZE, fp_net);
+       iline = -1;   /* Start at the first line again. */
+       more = next_line ();
 
-    while (ptr != NULL) {
-       ptr = get_tok (buf, doall, fp_net);
+       while (more) {
+          more = get_tok (doall);
+       }
     }
-    rewind (fp_net);  /* Start at beginning of file again */
+ }
+ catch (...) {
+    free_netlist_tokens ();
+    free_parse();
+    throw;
  }
 
- fclose(fp_net);
+ free_netlist_tokens ();
 
 /* Return the three data structures below through subblock_data_ptr.        */
 
@@ -165,6 +202,188 @@ void read_net (char *net_file, t_subblock_data *subblock_data_ptr) {
 }
 
 
+static void tokenize_netlist (char *net_file) {
+
+/* Maps net_file into memory and splits it into tokens and logical lines  *
+ * in one pass (see the comments at the top of this file).  The end of    *
+ * the file is treated as one more newline.                               */
+
+ int fd, max_tokens, max_lines, first_token, line;
+ size_t i, start;
+ struct stat info;
+ char c;
+
+ fd = open (net_file, O_RDONLY);
+ if (fd < 0 || fstat (fd, &info) != 0) {
+    if (fd >= 0)
+       close (fd);
+    throw std::runtime_error(Formatter() << "Error opening file " << net_file
+                             << " for r access.");
+ }
+
+ net_text_size = info.st_size;
+ net_text = NULL;
+ if (net_text_size > 0) {
+
+/* A private mapping, so tokens can be NUL-terminated in place. */
+
+    net_text = (char *) mmap (NULL, net_text_size, PROT_READ | PROT_WRITE,
+          MAP_PRIVATE, fd, 0);
+    if (net_text == MAP_FAILED) {
+       net_text = NULL;
+       close (fd);
+       throw std::runtime_error(Formatter() << "Error mapping file "
+                                << net_file << " into memory.");
+    }
+ }
+ close (fd);
+
+ max_tokens = 1024;
+ max_lines = 256;
+ tokens = (char **) my_malloc (max_tokens * sizeof (char *));
+ token_linenum = (int *) my_malloc (max_tokens * sizeof (int));
+ line_start = (int *) my_malloc ((max_lines + 1) * sizeof (int));
+ tail_token = NULL;
+ num_tokens = 0;
+ num_lines = 0;
+ first_token = 0;
+ line = 1;
+
+ i = 0;
+ while (i <= net_text_size) {
+    c = (i < net_text_size) ? net_text[i] : '\n';
+
+    if (c == '\n' || c == '\0') {   /* End of a logical line. */
+       if (num_tokens > first_token) {   /* Skip empty lines. */
+          if (num_lines == max_lines) {
+             max_lines *= 2;
+             line_start = (int *) my_realloc (line_start, (max_lines + 1) *
+                   sizeof (int));
+          }
+          line_start[num_lines++] = first_token;
+          first_token = num_tokens;
+       }
+       line++;
+       i++;
+    }
+    else if (c == '#') {          /* Comment.  Skip to the newline. */
+       while (i < net_text_size && net_text[i] != '\n')
+          i++;
+    }
+    else if (c == '\\' && i + 1 < net_text_size && net_text[i+1] == '\n') {
+       line++;                    /* Line continued. */
+       i += 2;
+    }
+    else if (c == ' ' || c == '\t') {
+       i++;
+    }
+    else {
+
+/* Start of a token.  It ends at a separator, a comment, a continued line *
+ * or the end of the file.                                                */
+
+       start = i;
+       while (i < net_text_size) {
+          c = net_text[i];
+          if (c == ' ' || c == '\t' || c == '\n' || c == '#')
+             break;
+          if (c == '\\' && i + 1 < net_text_size && net_text[i+1] == '\n')
+             break;
+          i++;
+       }
+
+       if (num_tokens == max_tokens) {
+          max_tokens *= 2;
+          tokens = (char **) my_realloc (tokens, max_tokens *
+                sizeof (char *));
+          token_linenum = (int *) my_realloc (token_linenum, max_tokens *
+                sizeof (int));
+       }
+       token_linenum[num_tokens] = line;
+
+       if (i == net_text_size) {   /* No room for the terminator. */
+          tail_token = (char *) my_malloc (i - start + 1);
+          memcpy (tail_token, net_text + start, i - start);
+          tail_token[i - start] = '\0';
+          tokens[num_tokens++] = tail_token;
+       }
+       else {
+
+/* Terminate the token in place and step over its terminator, except  *
+ * for a newline, which is left (as a NUL) to end the line.             */
+
+          tokens[num_tokens++] = net_text + start;
+          net_text[i] = '\0';
+          if (c == '\\') {
+             line++;
+             i += 2;
+          }
+          else if (c == '#') {
+             while (i < net_text_size && net_text[i] != '\n')
+                i++;
+          }
+          else if (c != '\n') {
+             i++;
+          }
+       }
+    }
+ }
+
+ line_start[num_lines] = num_tokens;   /* End of the last line. */
+ token_net = (int *) my_malloc ((num_tokens + 1) * sizeof (int));
+}
+
+
+static void free_netlist_tokens (void) {
+
+/* Unmaps the netlist file and frees the token arrays. */
+
+ if (net_text != NULL)
+    munmap (net_text, net_text_size);
+ net_text = NULL;
+
+ free (tail_token);
+ free (tokens);
+ free (token_linenum);
+ free (token_net);
+ free (line_start);
+ tail_token = NULL;
+ tokens = NULL;
+ token_linenum = NULL;
+ token_net = NULL;
+ line_start = NULL;
+}
+
+
+static boolean next_line (void) {
+
+/* Moves to the next (non-empty) line.  Returns FALSE at the end of the *
+ * file.                                                                */
+
+ iline++;
+ if (iline >= num_lines)
+    return (FALSE);
+
+ itoken = line_start[iline];
+ line_end = line_start[iline+1];
+ linenum = token_linenum[itoken];
+ return (TRUE);
+}
+
+
+static char *next_token (void) {
+
+/* Returns the next token on the current line, or NULL at the end of the *
+ * line.                                                                 */
+
+ if (itoken >= line_end)
+    return (NULL);
+
+ linenum = token_linenum[itoken];
+ return (tokens[itoken++]);
+}
+
+
 static void init_parse(int doall) {
 
 /* Allocates and initializes the data structures needed for the parse. */
@@ -226,10 +445,10 @@ static void init_parse(int doall) {
        nindex = h_ptr->index;
        pin_count = h_ptr->count;
        net[nindex].blocks = (int *) my_chunk_malloc(pin_count *
-               sizeof(int), NULL, &chunk_bytes_avail, &chunk_next_avail_mem);
+               sizeof(int), &chunk_head_ptr, &chunk_bytes_avail, &chunk_next_avail_mem);
 
        net[nindex].blk_pin = (int *) my_chunk_malloc (pin_count *
-               sizeof(int), NULL, &chunk_bytes_avail, &chunk_next_avail_mem);
+               sizeof(int), &chunk_head_ptr, &chunk_bytes_avail, &chunk_next_avail_mem);
 
 /* For avoiding assigning values beyond end of pins array. */
 
@@ -237,7 +456,7 @@ static void init_parse(int doall) {
 
        len = strlen (h_ptr->name);
        net[nindex].name = (char *) my_chunk_malloc ((len + 1) *
-            sizeof(char), NULL, &chunk_bytes_avail, &chunk_next_avail_mem);
+            sizeof(char), &chunk_head_ptr, &chunk_bytes_avail, &chunk_next_avail_mem);
        strcpy (net[nindex].name, h_ptr->name);
        h_ptr = get_next_hash (hash_table, &hash_iterator);
     }
@@ -276,47 +495,39 @@ static void init_parse(int doall) {
 }
 
 
-static char *get_tok (char *buf, int doall, FILE *fp_net) {
+static boolean get_tok (int doall) {
 
-/* Figures out which, if any token is at the start of this line and *
- * takes the appropriate action.  It always returns a pointer to    *
- * the next line (I need to do this so I can do some lookahead).    */
+/* Figures out which token is at the start of the current line and takes *
+ * the appropriate action.  It always moves to the next line (I need to  *
+ * do this so I can do some lookahead) and returns FALSE at the end of   *
+ * the file.                                                             */
 
  char *ptr;
 
- ptr = my_strtok(buf,TOKENS,fp_net,buf);
-
- if (ptr == NULL) {                       /* Empty line.  Skip. */
-    ptr = my_fgets(buf, BUFSIZE, fp_net);
-    return (ptr);
- }
+ ptr = next_token ();
 
  if (strcmp(ptr,".clb") == 0) {
-    ptr = add_clb (doall, fp_net, buf);
-    return (ptr);
+    return (add_clb (doall));
  }
 
  if (strcmp(ptr,".input") == 0) {
-    add_io (doall, INPAD, fp_net, buf);
-    ptr = my_fgets(buf, BUFSIZE, fp_net);
-    return (ptr);
+    add_io (doall, INPAD);
+    return (next_line ());
  }
 
  if (strcmp(ptr,".output") == 0) {
-    add_io (doall, OUTPAD, fp_net, buf);
-    ptr = my_fgets(buf, BUFSIZE, fp_net);
-    return (ptr);
+    add_io (doall, OUTPAD);
+    return (next_line ());
  }
 
  if (strcmp(ptr,".global") == 0) {
-    add_global (doall, fp_net, buf);
-    ptr = my_fgets(buf, BUFSIZE, fp_net);
-    return (ptr);
+    add_global (doall);
+    return (next_line ());
  }
 
- printf ("Error in get_tok while parsing netlist file.\n");
- my_printf ("Line %d starts with an invalid token (%s).\n", linenum, ptr);
- exit (1);
+ throw ParseError (Formatter () << "Error in get_tok while parsing netlist "
+       "file.  Line " << linenum << " starts with an invalid token (" << ptr
+       << ").");
 }
 
 
@@ -336,11 +547,10 @@ static int get_pin_number (char *ptr) {
  if (strncmp ("ble_", ptr, 4) == 0) {   /* "Hidden" pin (Subblock output) */
     val = my_atoi (ptr + 4);
     if (val < 0 || val >= max_subblocks_per_block) {
-       printf("Error in get_pin_number on line %d of netlist file.\n",
-            linenum);
-       my_printf("Pin ble_%d is out of legal range (ble_%d to ble_%d).\n"
-            "Aborting.\n\n", val, 0, max_subblocks_per_block - 1);
-       exit (1);
+       throw ParseError (Formatter () << "Error in get_pin_number on line "
+             << linenum << " of netlist file.  Pin ble_" << val << " is out "
+             "of legal range (ble_0 to ble_" << max_subblocks_per_block - 1
+             << ").");
     }
     val += pins_per_clb;  /* pins_per_clb .. pins_per_clb + max_subblocks-1 */
     return (val);
@@ -351,19 +561,16 @@ static int get_pin_number (char *ptr) {
  val = my_atoi (ptr);
 
  if (val < 0 || val >= pins_per_clb) {
-    printf("Error in get_pin_number on line %d of netlist file.\n",
-         linenum);
-    my_printf("Pin %d is out of legal range (%d to %d).\nAborting.\n\n",
-         val, 0, pins_per_clb - 1);
-    exit (1);
+    throw ParseError (Formatter () << "Error in get_pin_number on line "
+          << linenum << " of netlist file.  Pin " << val << " is out of "
+          "legal range (0 to " << pins_per_clb - 1 << ").");
  }
 
  return (val);
 }
 
 
-static void load_subblock_array (int doall, FILE *fp_net,
-           char *temp_buf, int num_subblocks, int bnum) {
+static void load_subblock_array (int doall, int num_subblocks, int bnum) {
 
 /* Parses one subblock line and, if doall is 1, loads the proper   *
  * arrays.  Each subblock line is of the format:                   *
@@ -374,13 +581,11 @@ static void load_subblock_array (int doall, FILE *fp_net,
  char *ptr;
 
  ipin = 0;
- ptr = my_strtok(NULL,TOKENS,fp_net,temp_buf);
+ ptr = next_token ();
 
  if (ptr == NULL) {
-    printf("Error in load_subblock_array on line %d of netlist file.\n",
-             linenum);
-    my_printf("Subblock name is missing.\nAborting.\n\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error in load_subblock_array on line "
+          << linenum << " of netlist file.  Subblock name is missing.");
  }
 
 /* Load subblock name if this is the load pass. */
@@ -392,7 +597,7 @@ static void load_subblock_array (int doall, FILE *fp_net,
     strcpy (subblock_inf[bnum][num_subblocks-1].name, ptr);
  }
 
- ptr = my_strtok(NULL,TOKENS,fp_net,temp_buf);
+ ptr = next_token ();
 
  while (ptr != NULL) {    /* For each subblock pin. */
     if (doall == 1) {
@@ -408,16 +613,13 @@ static void load_subblock_array (int doall, FILE *fp_net,
        }
     }
     ipin++;
-    ptr = my_strtok(NULL,TOKENS,fp_net,temp_buf);
+    ptr = next_token ();
  }
 
  if (ipin != subblock_lut_size + 2) {
-    printf("Error in load_subblock_array at line %d of netlist file.\n",
-            linenum);
-    my_printf("Subblock had %d pins, expected %d.\n", ipin,
-            subblock_lut_size+2);
-    my_printf("Aborting.\n\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error in load_subblock_array at line "
+          << linenum << " of netlist file.  Subblock had " << ipin
+          << " pins, expected " << subblock_lut_size+2 << ".");
  }
 }
 
@@ -437,45 +639,35 @@ static void set_subblock_count (int bnum, int num_subblocks) {
 }
 
 
-static char *parse_subblocks (int doall, FILE *fp_net, char *buf,
-               int bnum) {
+static boolean parse_subblocks (int doall, int bnum) {
 
-/* Loads the subblock arrays with the proper values. */
+/* Loads the subblock arrays with the proper values.  Returns TRUE if the *
+ * line after the subblocks is waiting to be parsed, or FALSE at EOF.     */
 
- char temp_buf[BUFSIZE], *ptr;
+ boolean more;
  int num_subblocks;
 
  num_subblocks = 0;
 
  while (1) {
-    ptr = my_fgets (temp_buf, BUFSIZE, fp_net);
-    if (ptr == NULL)
+    more = next_line ();
+    if (!more)
        break;          /* EOF */
 
-  /* Save line in case it's not a sublock */
-    strcpy (buf, temp_buf);
-
-    ptr = my_strtok(temp_buf,TOKENS,fp_net,temp_buf);
-    if (ptr == NULL)
-       continue;       /* Blank or comment line.  Skip. */
-
-    if (strcmp("subblock:", ptr) == 0) {
+    if (strcmp("subblock:", next_token ()) == 0) {
        num_subblocks++;
-       load_subblock_array (doall, fp_net, temp_buf, num_subblocks,
-               bnum);
+       load_subblock_array (doall, num_subblocks, bnum);
     }
     else {
-       break;  /* Subblock list has ended.  Buf contains next line. */
+       itoken = line_start[iline];  /* Not a subblock.  Parse it next. */
+       break;
     }
  }   /* End infinite while */
 
  if (num_subblocks < 1 || num_subblocks > max_subblocks_per_block) {
-    printf("Error in parse_subblocks on line %d of netlist file.\n",
-         linenum);
-    my_printf("Block #%d has %d subblocks.  Out of range.\n",
-         bnum, num_subblocks);
-    my_printf("Aborting.\n\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error in parse_subblocks on line "
+          << linenum << " of netlist file.  Block #" << bnum << " has "
+          << num_subblocks << " subblocks.  Out of range.");
  }
 
  if (doall == 0)
@@ -483,11 +675,11 @@ static char *parse_subblocks (int doall, FILE *fp_net, char *buf,
  else
     assert (num_subblocks == num_subblocks_per_block[bnum]);
 
- return (ptr);
+ return (more);
 }
 
 
-static char *add_clb (int doall, FILE *fp_net, char *buf) {
+static boolean add_clb (int doall) {
 
 /* Adds the clb (.clb) currently being parsed to the block array.  Adds *
  * its pins to the nets data structure by calling add_net.  If doall is *
@@ -499,28 +691,28 @@ static char *add_clb (int doall, FILE *fp_net, char *buf) {
  enum e_pin_type type;
 
  num_blocks++;
- parse_name_and_pinlist (doall, fp_net, buf);
+ parse_name_and_pinlist (doall);
  num_clbs++;
 
  if (doall)
     block[num_blocks - 1].type = CLB;
 
  pin_index = -1;
- ptr = my_strtok(NULL,TOKENS,fp_net,buf);
+ ptr = next_token ();
 
  while (ptr != NULL) {
     pin_index++;
     if (pin_index >= pins_per_clb) {
-       printf("Error in add_clb on line %d of netlist file.\n",linenum);
-       my_printf("Too many pins on this clb.  Expected %d.\n",pins_per_clb);
-       exit (1);
+       throw ParseError (Formatter () << "Error in add_clb on line "
+             << linenum << " of netlist file.  Too many pins on this clb.  "
+             "Expected " << pins_per_clb << ".");
     }
 
     iclass = clb_pin_class[pin_index];
     type = class_inf[iclass].type;      /* DRIVER or RECEIVER */
 
     if (strcmp(ptr,"open") != 0) {     /* Pin is connected. */
-       inet = add_net (ptr, type, num_blocks-1, pin_index, doall);
+       inet = add_net (itoken-1, type, num_blocks-1, pin_index, doall);
 
        if (doall)                      /* Loading pass only */
           block[num_blocks - 1].nets[pin_index] = inet;
@@ -530,21 +722,20 @@ static char *add_clb (int doall, FILE *fp_net, char *buf) {
           block[num_blocks - 1].nets[pin_index] = OPEN;
     }
 
-    ptr = my_strtok(NULL,TOKENS,fp_net,buf);
+    ptr = next_token ();
  }
 
  if (pin_index != pins_per_clb - 1) {
-    printf("Error in add_clb on line %d of netlist file.\n",linenum);
-    my_printf("Expected %d pins on clb, got %d.\n", pins_per_clb, pin_index + 1);
-    exit (1);
+    throw ParseError (Formatter () << "Error in add_clb on line " << linenum
+          << " of netlist file.  Expected " << pins_per_clb << " pins on "
+          "clb, got " << pin_index + 1 << ".");
  }
 
- ptr = parse_subblocks (doall, fp_net, buf, num_blocks-1);
- return (ptr);
+ return (parse_subblocks (doall, num_blocks-1));
 }
 
 
-static void add_io (int doall, int block_type, FILE *fp_net, char *buf) {
+static void add_io (int doall, int block_type) {
 
 /* Adds the INPAD or OUTPAD (specified by block_type)  currently being  *
  * parsed to the block array.  Adds its pin to the nets data structure  *
@@ -558,7 +749,7 @@ static void add_io (int doall, int block_type, FILE *fp_net, char *buf) {
  num_blocks++;
  if (doall == 0)
     set_subblock_count (num_blocks-1, 0);    /* No subblocks for IO */
- parse_name_and_pinlist (doall, fp_net, buf);
+ parse_name_and_pinlist (doall);
 
  if (block_type == INPAD) {
     num_p_inputs++;
@@ -573,38 +764,38 @@ static void add_io (int doall, int block_type, FILE *fp_net, char *buf) {
     block[num_blocks - 1].type = (e_block_types)block_type;
 
  pin_index = -1;
- ptr = my_strtok(NULL,TOKENS,fp_net,buf);
+ ptr = next_token ();
 
  while (ptr != NULL) {
     pin_index++;
     if (pin_index >= 1) {
-       printf("Error in add_io on line %d of netlist file.\n",linenum);
-       my_printf("Too many pins on this io.  Expected 1.\n");
-       exit (1);
+       throw ParseError (Formatter () << "Error in add_io on line "
+             << linenum << " of netlist file.  Too many pins on this io.  "
+             "Expected 1.");
     }
 
     if (strcmp(ptr,"open") == 0) {     /* Pin unconnected. */
-       printf("Error in add_io, line %d of netlist file.\n",linenum);
-       my_printf("Inputs and Outputs cannot have open pins.\n");
-       exit (1);
+       throw ParseError (Formatter () << "Error in add_io, line " << linenum
+             << " of netlist file.  Inputs and Outputs cannot have open "
+             "pins.");
     }
 
 /* Note the dummy pin number for IO pins.  Change this if necessary. I set *
  * them to OPEN because I want the code to crash if I try to look up the   *
  * class of an I/O pin (since I/O pins don't have classes).                */
 
-    inet = add_net (ptr, type, num_blocks-1, OPEN, doall);
+    inet = add_net (itoken-1, type, num_blocks-1, OPEN, doall);
 
     if (doall)                      /* Loading pass only */
        block[num_blocks - 1].nets[pin_index] = inet;
 
-    ptr = my_strtok(NULL,TOKENS,fp_net,buf);
+    ptr = next_token ();
  }
 
  if (pin_index != 0) {
-    printf("Error in add_io on line %d of netlist file.\n",linenum);
-    my_printf("Expected 1 pin on pad, got %d.\n", pin_index + 1);
-    exit (1);
+    throw ParseError (Formatter () << "Error in add_io on line " << linenum
+          << " of netlist file.  Expected 1 pin on pad, got "
+          << pin_index + 1 << ".");
  }
 
  if (doall) {
@@ -614,14 +805,14 @@ static void add_io (int doall, int block_type, FILE *fp_net, char *buf) {
 }
 
 
-static void parse_name_and_pinlist (int doall, FILE *fp_net, char *buf) {
+static void parse_name_and_pinlist (int doall) {
 
 /* This routine does the first part of the parsing of a block.  It is *
  * called whenever any type of block (.clb, .input or .output) is to  *
  * be parsed.  It increments the block count (num_blocks), and checks *
  * that the block has a name.  If doall is 1, this is the loading     *
  * pass and it copies the name to the block data structure.  Finally  *
- * it checks that the pinlist: keyword exists.  On return, my_strtok  *
+ * it checks that the pinlist: keyword exists.  On return, next_token *
  * is set so that the next call will get the first net connected to   *
  * this block.                                                        */
 
@@ -630,63 +821,55 @@ static void parse_name_and_pinlist (int doall, FILE *fp_net, char *buf) {
 
 /* Get block name. */
 
- ptr = my_strtok(NULL,TOKENS,fp_net,buf);
+ ptr = next_token ();
  if (ptr == NULL) {
-    printf("Error in parse_name_and_pinlist on line %d of netlist file.\n",
-       linenum);
-    my_printf(".clb, .input or .output line has no associated name.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error in parse_name_and_pinlist on "
+          "line " << linenum << " of netlist file.  .clb, .input or .output "
+          "line has no associated name.");
  }
 
  if (doall == 1) {    /* Second (loading) pass, store block name */
     len = strlen (ptr);
     block[num_blocks-1].name = (char *)my_chunk_malloc ((len + 1) * sizeof(char),
-                  NULL, &chunk_bytes_avail, &chunk_next_avail_mem);
+                  &chunk_head_ptr, &chunk_bytes_avail, &chunk_next_avail_mem);
     strcpy (block[num_blocks-1].name, ptr);
  }
 
- ptr = my_strtok (NULL,TOKENS,fp_net,buf);
+ ptr = next_token ();
  if (ptr != NULL) {
-    printf("Error in parse_name_and_pinlist on line %d of netlist file.\n",
-       linenum);
-    my_printf("Extra characters at end of line.\n");
-    exit (1);
- }
-
-/* Now get pinlist from the next line.  Note that a NULL return value *
- * from my_gets means EOF, while a NULL return from my_strtok just    *
- * means we had a blank or comment line.                              */
-
- do {
-    ptr = my_fgets (buf, BUFSIZE, fp_net);
-    if (ptr == NULL) {
-       printf("Error in parse_name_and_pinlist on line %d of netlist file.\n",
-          linenum);
-       my_printf("Missing pinlist: keyword.\n");
-       exit (1);
-    }
+    throw ParseError (Formatter () << "Error in parse_name_and_pinlist on "
+          "line " << linenum << " of netlist file.  Extra characters at end "
+          "of line.");
+ }
+
+/* Now get pinlist from the next line.  Blank and comment lines were *
+ * already dropped by tokenize_netlist.                               */
+
+ if (!next_line ()) {
+    throw ParseError (Formatter () << "Error in parse_name_and_pinlist "
+          "on line " << linenum << " of netlist file.  Missing pinlist: "
+          "keyword.");
+ }
 
-    ptr = my_strtok(buf,TOKENS,fp_net,buf);
- } while (ptr == NULL);
+ ptr = next_token ();
 
  if (strcmp (ptr, "pinlist:") != 0) {
-    printf("Error in parse_name_and_pinlist on line %d of netlist file.\n",
-       linenum);
-    my_printf("Expected pinlist: keyword, got %s.\n",ptr);
-    exit (1);
+    throw ParseError (Formatter () << "Error in parse_name_and_pinlist on "
+          "line " << linenum << " of netlist file.  Expected pinlist: "
+          "keyword, got " << ptr << ".");
  }
 }
 
 
-static void add_global (int doall, FILE *fp_net, char *buf) {
+static void add_global (int doall) {
 
 /* Doall is 0 for the first (counting) pass and 1 for the second           *
- * (loading) pass.  fp_net is a pointer to the netlist file.  This         *
- * routine sets the proper entry(ies) in is_global to TRUE during the      *
- * loading pass.  The routine does nothing during the counting pass. If    *
- * is_global = TRUE for a net, it will not be considered in the placement  *
- * cost function, nor will it be routed.  This is useful for global        *
- * signals like clocks that generally have dedicated routing in FPGAs.     */
+ * (loading) pass.  This routine sets the proper entry(ies) in is_global   *
+ * to TRUE during the loading pass.  The routine does nothing during the   *
+ * counting pass. If is_global = TRUE for a net, it will not be considered *
+ * in the placement cost function, nor will it be routed.  This is useful  *
+ * for global signals like clocks that generally have dedicated routing    *
+ * in FPGAs.                                                               */
 
  char *ptr;
  struct s_hash *h_ptr;
@@ -697,7 +880,7 @@ static void add_global (int doall, FILE *fp_net, char *buf) {
  if (doall == 0)
     return;
 
- ptr = my_strtok(NULL,TOKENS,fp_net,buf);
+ ptr = next_token ();
 
  while (ptr != NULL) {     /* For each .global signal */
     num_globals++;
@@ -705,32 +888,36 @@ static void add_global (int doall, FILE *fp_net, char *buf) {
     h_ptr = get_hash_entry (hash_table, ptr);
 
     if (h_ptr == NULL) {        /* Net was not found in list! */
-       printf("Error in add_global on netlist file line %d.\n",linenum);
-       my_printf("Global signal %s does not exist.\n",ptr);
-       exit(1);
+       throw ParseError (Formatter () << "Error in add_global on netlist "
+             "file line " << linenum << ".  Global signal " << ptr
+             << " does not exist.");
     }
 
     nindex = h_ptr->index;
     is_global[nindex] = TRUE;    /* Flagged as global net */
 
-    ptr = my_strtok(NULL,TOKENS,fp_net,buf);
+    ptr = next_token ();
  }
 }
 
 
-static int add_net (char *ptr, enum e_pin_type type, int bnum, int blk_pnum,
-          int doall) {
+static int add_net (int inet_token, enum e_pin_type type, int bnum,
+          int blk_pnum, int doall) {
 
-/* This routine is given a net name in *ptr, either DRIVER or RECEIVER *
- * specifying whether the block number given by bnum is driving this   *
- * net or in the fan-out and doall, which is 0 for the counting pass   *
- * and 1 for the loading pass.  It updates the net data structure and  *
- * returns the net number so the calling routine can update the block  *
- * data structure.                                                     */
+/* This routine is given the index of a token naming a net, either DRIVER *
+ * or RECEIVER specifying whether the block number given by bnum is       *
+ * driving this net or in the fan-out and doall, which is 0 for the       *
+ * counting pass and 1 for the loading pass.  It updates the net data     *
+ * structure and returns the net number so the calling routine can update *
+ * the block data structure.  The counting pass saves the net number of   *
+ * the token in token_net, so the loading pass needn't look it up again.  */
 
  struct s_hash *h_ptr;
+ char *ptr;
  int j, nindex;
 
+ ptr = tokens[inet_token];
+
  if (doall == 0) {             /* Counting pass only */
     h_ptr = insert_in_hash_table (hash_table, ptr, num_nets);
     nindex = h_ptr->index;
@@ -738,19 +925,12 @@ static int add_net (char *ptr, enum e_pin_type type, int bnum, int blk_pnum,
     if (nindex == num_nets)    /* Net was not in the hash table */
        num_nets++;
 
+    token_net[inet_token] = nindex;
     return (nindex);
  }
 
  else {                        /* Load pass */
-    h_ptr = get_hash_entry (hash_table, ptr);
-    nindex = h_ptr->index;
-
-    if (h_ptr == NULL) {
-       printf("Error in add_net:  the second (load) pass found could not\n");
-       my_printf("find net %s in the symbol table.\n", ptr);
-       exit(1);
-    }
-
+    nindex = token_net[inet_token];
     net[nindex].num_pins++;
     if (type == DRIVER) {
        num_driver[nindex]++;
@@ -763,10 +943,8 @@ static int add_net (char *ptr, enum e_pin_type type, int bnum, int blk_pnum,
     * should always be zero or 1 unless the netlist is bad.   */
 
        if (j >= temp_num_pins[nindex]) {
-          printf("Error:  Net #%d (%s) has no driver and will cause\n",
-             nindex, ptr);
-          my_printf("memory corruption.\n");
-          exit(1);
+          throw ParseError (Formatter () << "Error:  Net #" << nindex << " ("
+                << ptr << ") has no driver and will cause memory corruption.");
        }
     }
     net[nindex].blocks[j] = bnum;
@@ -781,6 +959,45 @@ static void free_parse (void) {
 /* Release memory needed only during circuit netlist parsing. */
 
  free (num_driver);
- free_hash_table (hash_table);
+ if (hash_table != NULL)
+    free_hash_table (hash_table);
  free (temp_num_pins);
+ num_driver = NULL;
+ hash_table = NULL;
+ temp_num_pins = NULL;
+}
+
+
+void *alloc_netlist_storage (size_t size) {
+
+/* Allocates size bytes of storage for the net and block arrays (e.g. a   *
+ * name), which is released along with them by free_netlist.             */
+
+ return (my_chunk_malloc (size, &chunk_head_ptr, &chunk_bytes_avail,
+          &chunk_next_avail_mem));
+}
+
+
+void free_netlist (void) {
+
+/* Frees the net and block arrays loaded by read_net (or restored from the *
+ * parse cache), so that another netlist may be read.  The subblock data   *
+ * is freed separately, by free_subblock_data.                             */
+
+ if (block != NULL && num_blocks > 0)
+    free (block[0].nets);   /* Pin storage for all blocks. */
+ free (block);
+ free (net);
+ free (is_global);
+ free_chunk_memory (chunk_head_ptr);
+
+ block = NULL;
+ net = NULL;
+ is_global = NULL;
+ num_blocks = 0;
+ num_nets = 0;
+
+ chunk_head_ptr = NULL;
+ chunk_bytes_avail = 0;
+ chunk_next_avail_mem = NULL;
 }
@@ -1 +1,5 @@
 void read_net (char *net_file, t_subblock_data *subblock_data_ptr);
+
+void *alloc_netlist_storage (size_t size);
+
+void free_netlist (void);
@@ -8,6 +8,7 @@
 #include "hash.h"
 #include "read_place.h"
 #include "Formatter.hpp"
+#include "VprError.hpp"
 
 
 static int get_subblock (int i, int j, int bnum);
@@ -56,66 +57,65 @@ void read_user_pad_loc (char *pad_loc_file) {
 
     ptr = file_buffer.token(NULL, TOKENS);
     if (ptr == NULL) {
-       printf ("Error:  line %d is incomplete.\n", file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  line "
+             << file_buffer.linenum_ << " is incomplete.");
     }
     sscanf (ptr, "%d", &xtmp);
 
     ptr = file_buffer.token(NULL, TOKENS);
     if (ptr == NULL) {
-       printf ("Error:  line %d is incomplete.\n", file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  line "
+             << file_buffer.linenum_ << " is incomplete.");
     }
     sscanf (ptr, "%d", &ytmp);
 
     ptr = file_buffer.token(NULL, TOKENS);
     if (ptr == NULL) {
-       printf ("Error:  line %d is incomplete.\n", file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  line "
+             << file_buffer.linenum_ << " is incomplete.");
     }
     sscanf (ptr, "%d", &isubblk);
 
     ptr = file_buffer.token(NULL, TOKENS);
     if (ptr != NULL) {
-       printf ("Error:  extra characters at end of line %d.\n", file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  extra characters at end "
+             "of line " << file_buffer.linenum_ << ".");
     }
 
     h_ptr = get_hash_entry (hash_table, bname);
     if (h_ptr == NULL) {
-       printf ("Error:  block %s on line %d: no such IO pad.\n",
-                bname, file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  block " << bname << " on "
+             "line " << file_buffer.linenum_ << ": no such IO pad.");
     }
     bnum = h_ptr->index;
     i = xtmp;
     j = ytmp;
 
     if (block[bnum].x != OPEN) {
-       printf ("Error:  line %d.  Block %s listed twice in pad file.\n",
-                file_buffer.linenum_, bname);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  line "
+             << file_buffer.linenum_ << ".  Block " << bname << " listed "
+             "twice in pad file.");
     }
 
     if (i < 0 || i > nx+1 || j < 0 || j > ny + 1) {
-       printf("Error:  block #%d (%s) location\n", bnum, bname);
-       my_printf("(%d,%d) is out of range.\n", i, j);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  block #" << bnum << " ("
+             << bname << ") location (" << i << "," << j << ") is out of "
+             "range.");
     }
 
     block[bnum].x = i;   /* Will be reloaded by initial_placement anyway. */
     block[bnum].y = j;   /* I need to set .x only as a done flag.         */
 
     if (clb[i][j].type != IO) {
-       printf("Error:  attempt to place IO block %s in \n", bname);
-       my_printf("an illegal location (%d, %d).\n", i, j);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  attempt to place IO block "
+             << bname << " in an illegal location (" << i << ", " << j
+             << ").");
     }
 
     if (isubblk >= io_rat || isubblk < 0) {
-       printf ("Error:  Block %s subblock number (%d) on line %d is out of "
-               "range.\n", bname, isubblk, file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  Block " << bname
+             << " subblock number (" << isubblk << ") on line "
+             << file_buffer.linenum_ << " is out of range.");
     }
     clb[i][j].u.io_blocks[isubblk] = bnum;
     clb[i][j].occ++;
@@ -126,9 +126,9 @@ void read_user_pad_loc (char *pad_loc_file) {
  for (iblk=0;iblk<num_blocks;iblk++) {
     if ((block[iblk].type == INPAD || block[iblk].type == OUTPAD) &&
              block[iblk].x == OPEN) {
-       printf ("Error:  IO block %s location was not specified in "
-               "the pad file.\n", block[iblk].name);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  IO block "
+             << block[iblk].name << " location was not specified in the pad "
+             "file.");
     }
  }
 
@@ -137,9 +137,9 @@ void read_user_pad_loc (char *pad_loc_file) {
        if (clb[i][j].type == IO) {
           for (isubblk=0;isubblk<clb[i][j].occ;isubblk++) {
              if (clb[i][j].u.io_blocks[isubblk] == OPEN) {
-                printf ("Error:  The IO blocks at (%d, %d) do not have \n"
-                        "consecutive subblock numbers starting at 0.\n", i, j);
-                exit (1);
+                throw ParseError (Formatter () << "Error:  The IO blocks at "
+                      "(" << i << ", " << j << ") do not have consecutive "
+                      "subblock numbers starting at 0.");
              }
           }
        }
@@ -221,23 +221,42 @@ std::vector<std::vector<unsigned int> > extract_block_positions() {
  *
  *     block-index, x=0/y=1/slot-index=2
  */
- std::vector<std::vector<unsigned int> > block_positions(num_blocks,
-                                                         std::vector
-                                                         <unsigned int>(3));
+ std::vector<unsigned int> flat_positions(3 * num_blocks);
+ std::vector<std::vector<unsigned int> > block_positions(num_blocks);
 
+ if (num_blocks > 0) {
+    extract_block_positions(&flat_positions[0]);
+ }
  for (int i = 0; i < num_blocks; i++) {
-    block_positions[i][0] = block[i].x;
-    block_positions[i][1] = block[i].y;
+    block_positions[i].assign(flat_positions.begin() + 3 * i,
+                              flat_positions.begin() + 3 * (i + 1));
+ }
+
+ return block_positions;
+}
+
+
+void extract_block_positions(unsigned int *block_positions) {
+/* Write the position of all blocks in the placement to the contiguous,     *
+ * row-major `block_positions` buffer, which must hold `3 * num_blocks`     *
+ * elements, indexed as follows:                                            *
+ *                                                                          *
+ *     block-index, x=0/y=1/slot-index=2                                    */
+
+ unsigned int *position;
+
+ for (int i = 0; i < num_blocks; i++) {
+    position = block_positions + 3 * i;
+    position[0] = block[i].x;
+    position[1] = block[i].y;
     if (block[i].type == CLB) {
         /* Sub block number not meaningful in the case of CLB. */
-        block_positions[i][2] = 0;
+        position[2] = 0;
     } else {
         /* IO block.  Save sub block number as slot-index. */
-        block_positions[i][2] = get_subblock (block[i].x, block[i].y, i);
+        position[2] = get_subblock (block[i].x, block[i].y, i);
     }
  }
-
- return block_positions;
 }
 
 static int get_subblock (int i, int j, int bnum) {
@@ -252,9 +271,8 @@ static int get_subblock (int i, int j, int bnum) {
        return (k);
  }
 
- printf("Error in get_subblock.  Block %d is not at location (%d,%d)\n",
-    bnum, i, j);
- exit (1);
+ throw ParseError (Formatter () << "Error in get_subblock.  Block " << bnum
+       << " is not at location (" << i << "," << j << ")");
 }
 
 
@@ -303,51 +321,51 @@ void parse_placement_file(BufferBase &place_file_buffer, char *net_file,
 
     ptr = place_file_buffer.token(NULL, TOKENS);
     if (ptr == NULL) {
-       printf ("Error:  line %d is incomplete.\n", place_file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  line "
+             << place_file_buffer.linenum_ << " is incomplete.");
     }
     sscanf (ptr, "%d", &xtmp);
 
     ptr = place_file_buffer.token(NULL, TOKENS);
     if (ptr == NULL) {
-       printf ("Error:  line %d is incomplete.\n", place_file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  line "
+             << place_file_buffer.linenum_ << " is incomplete.");
     }
     sscanf (ptr, "%d", &ytmp);
 
     ptr = place_file_buffer.token(NULL, TOKENS);
     if (ptr == NULL) {
-       printf ("Error:  line %d is incomplete.\n", place_file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  line "
+             << place_file_buffer.linenum_ << " is incomplete.");
     }
     sscanf (ptr, "%d", &isubblock);
 
     ptr = place_file_buffer.token(NULL, TOKENS);
     if (ptr != NULL) {
-       printf ("Error:  extra characters at end of line %d.\n", place_file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  extra characters at end "
+             "of line " << place_file_buffer.linenum_ << ".");
     }
 
     h_ptr = get_hash_entry (hash_table, bname);
     if (h_ptr == NULL) {
-       printf ("Error:  block %s on line %d does not exist in the netlist.\n",
-                bname, place_file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  block " << bname << " on "
+             "line " << place_file_buffer.linenum_ << " does not exist in "
+             "the netlist.");
     }
     bnum = h_ptr->index;
     i = xtmp;
     j = ytmp;
 
     if (block[bnum].x != OPEN) {
-       printf ("Error:  line %d.  Block %s listed twice in placement file.\n",
-                place_file_buffer.linenum_, bname);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  line "
+             << place_file_buffer.linenum_ << ".  Block " << bname
+             << " listed twice in placement file.");
     }
 
     if (i < 0 || i > nx+1 || j < 0 || j > ny + 1) {
-       printf("Error in read_place.  Block #%d (%s) location\n", bnum, bname);
-       my_printf("(%d,%d) is out of range.\n", i, j);
-       exit (1);
+       throw ParseError (Formatter () << "Error in read_place.  Block #"
+             << bnum << " (" << bname << ") location (" << i << "," << j
+             << ") is out of range.");
     }
 
     block[bnum].x = i;
@@ -355,10 +373,9 @@ void parse_placement_file(BufferBase &place_file_buffer, char *net_file,
 
     if (clb[i][j].type == CLB) {
        if (block[bnum].type != CLB) {
-          printf("Error in read_place.  Attempt to place block #%d (%s) in\n",
-               bnum, bname);
-          my_printf("a logic block location (%d, %d).\n", i, j);
-          exit (1);
+          throw ParseError (Formatter () << "Error in read_place.  Attempt "
+                "to place block #" << bnum << " (" << bname << ") in a "
+                "logic block location (" << i << ", " << j << ").");
        }
        clb[i][j].u.block = bnum;
        clb[i][j].occ++;
@@ -366,25 +383,23 @@ void parse_placement_file(BufferBase &place_file_buffer, char *net_file,
 
     else if (clb[i][j].type == IO) {
        if (block[bnum].type != INPAD && block[bnum].type != OUTPAD) {
-          printf("Error in read_place.  Attempt to place block #%d (%s) in\n",
-               bnum, bname);
-          my_printf("an IO block location (%d, %d).\n", i, j);
-          exit (1);
+          throw ParseError (Formatter () << "Error in read_place.  Attempt "
+                "to place block #" << bnum << " (" << bname << ") in an IO "
+                "block location (" << i << ", " << j << ").");
        }
        if (isubblock >= io_rat || isubblock < 0) {
-          printf ("Error:  Block %s subblock number (%d) on line %d is out of "
-                  "range.\n", bname, isubblock, place_file_buffer.linenum_);
-          exit (1);
+          throw ParseError (Formatter () << "Error:  Block " << bname
+                << " subblock number (" << isubblock << ") on line "
+                << place_file_buffer.linenum_ << " is out of range.");
        }
        clb[i][j].u.io_blocks[isubblock] = bnum;
        clb[i][j].occ++;
     }
 
     else {    /* Block type was ILLEGAL or some unknown value */
-       printf("Error in read_place.  Block #%d (%s) is in an illegal ",
-           bnum, bname);
-       my_printf("location.\nLocation specified: (%d,%d).\n", i, j);
-       exit (1);
+       throw ParseError (Formatter () << "Error in read_place.  Block #"
+             << bnum << " (" << bname << ") is in an illegal location.  "
+             "Location specified: (" << i << "," << j << ").");
     }
 
     ptr = place_file_buffer.get_joined_string(BUFSIZE);
@@ -394,9 +409,9 @@ void parse_placement_file(BufferBase &place_file_buffer, char *net_file,
 
  for (i=0;i<num_blocks;i++) {
     if (block[i].x == OPEN) {
-       printf ("Error in read_place:  block %s location was not specified in "
-               "the placement file.\n", block[i].name);
-       exit (1);
+       throw ParseError (Formatter () << "Error in read_place:  block "
+             << block[i].name << " location was not specified in the "
+             "placement file.");
     }
  }
 
@@ -405,9 +420,9 @@ void parse_placement_file(BufferBase &place_file_buffer, char *net_file,
        if (clb[i][j].type == IO) {
           for (isubblock=0;isubblock<clb[i][j].occ;isubblock++) {
              if (clb[i][j].u.io_blocks[isubblock] == OPEN) {
-                printf ("Error:  The IO blocks at (%d, %d) do not have \n"
-                        "consecutive subblock numbers starting at 0.\n", i, j);
-                exit (1);
+                throw ParseError (Formatter () << "Error:  The IO blocks at "
+                      "(" << i << ", " << j << ") do not have consecutive "
+                      "subblock numbers starting at 0.");
              }
           }
        }
@@ -418,6 +433,104 @@ void parse_placement_file(BufferBase &place_file_buffer, char *net_file,
 }
 
 
+void load_block_positions(const unsigned int *block_positions) {
+
+/* Loads a placement directly from the contiguous, row-major                *
+ * `block_positions` buffer, holding `3 * num_blocks` elements indexed as   *
+ * `block-index, x=0/y=1/slot-index=2` _(i.e., the layout written by        *
+ * `extract_block_positions`)_.  This performs the same checks as           *
+ * `parse_placement_file`, without formatting or parsing a placement file.  */
+
+ const unsigned int *position;
+ int i, j, bnum, isubblock;
+
+ for (i=0;i<=nx+1;i++) {
+    for (j=0;j<=ny+1;j++) {
+       clb[i][j].occ = 0;
+       if (clb[i][j].type == IO) {
+          for (isubblock=0;isubblock<io_rat;isubblock++) {
+             clb[i][j].u.io_blocks[isubblock] = OPEN;
+          }
+       }
+    }
+ }
+
+ for (bnum=0;bnum<num_blocks;bnum++) {
+    position = block_positions + 3 * bnum;
+
+    if (position[0] > (unsigned int)(nx + 1) ||
+        position[1] > (unsigned int)(ny + 1)) {
+       throw std::runtime_error(Formatter() << "Block #" << bnum << " ("
+                                << block[bnum].name << ") location ("
+                                << position[0] << ", " << position[1]
+                                << ") is out of range.");
+    }
+    i = position[0];
+    j = position[1];
+    isubblock = position[2];
+
+    block[bnum].x = i;
+    block[bnum].y = j;
+
+    if (clb[i][j].type == CLB) {
+       if (block[bnum].type != CLB) {
+          throw std::runtime_error(Formatter() << "Attempt to place block #"
+                                   << bnum << " (" << block[bnum].name
+                                   << ") in a logic block location (" << i
+                                   << ", " << j << ").");
+       }
+       if (clb[i][j].occ > 0) {
+          throw std::runtime_error(Formatter() << "Block #" << bnum << " ("
+                                   << block[bnum].name << ") placed in "
+                                   "occupied logic block location (" << i
+                                   << ", " << j << ").");
+       }
+       clb[i][j].u.block = bnum;
+       clb[i][j].occ++;
+    }
+
+    else if (clb[i][j].type == IO) {
+       if (block[bnum].type != INPAD && block[bnum].type != OUTPAD) {
+          throw std::runtime_error(Formatter() << "Attempt to place block #"
+                                   << bnum << " (" << block[bnum].name
+                                   << ") in an IO block location (" << i
+                                   << ", " << j << ").");
+       }
+       if (isubblock >= io_rat || isubblock < 0 ||
+           clb[i][j].u.io_blocks[isubblock] != OPEN) {
+          throw std::runtime_error(Formatter() << "Block #" << bnum << " ("
+                                   << block[bnum].name << ") subblock number ("
+                                   << position[2] << ") is out of range or "
+                                   "already occupied.");
+       }
+       clb[i][j].u.io_blocks[isubblock] = bnum;
+       clb[i][j].occ++;
+    }
+
+    else {    /* Block type was ILLEGAL or some unknown value */
+       throw std::runtime_error(Formatter() << "Block #" << bnum << " ("
+                                << block[bnum].name << ") is in an illegal "
+                                "location (" << i << ", " << j << ").");
+    }
+ }
+
+ for (i=0;i<=nx+1;i++) {
+    for (j=0;j<=ny+1;j++) {
+       if (clb[i][j].type == IO) {
+          for (isubblock=0;isubblock<clb[i][j].occ;isubblock++) {
+             if (clb[i][j].u.io_blocks[isubblock] == OPEN) {
+                throw std::runtime_error(Formatter() << "The IO blocks at ("
+                                         << i << ", " << j << ") do not have "
+                                         "consecutive subblock numbers "
+                                         "starting at 0.");
+             }
+          }
+       }
+    }
+ }
+}
+
+
 static void read_place_header(BufferBase &file_buffer, char *net_file,
                               char *arch_file) {
 /* Reads the header from the placement file.  Used only to check that this *
@@ -432,15 +545,16 @@ static void read_place_header(BufferBase &file_buffer, char *net_file,
  ptr = file_buffer.get_joined_string(BUFSIZE);
 
  if (ptr == NULL) {
-    printf ("Error:  netlist file and architecture file used not listed.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  netlist file and "
+          "architecture file used not listed.");
  }
 
  ptr = file_buffer.token(file_buffer.buffer_, TOKENS);
  while (ptr == NULL) {   /* Skip blank or comment lines. */
     ptr = file_buffer.get_joined_string(BUFSIZE);
     if (ptr == NULL) {
-       printf ("Error:  netlist file and architecture file used not listed.\n");       exit (1);
+       throw ParseError (Formatter () << "Error:  netlist file and "
+             "architecture file used not listed.");
     }
     ptr = file_buffer.token(file_buffer.buffer_, TOKENS);
  }
@@ -454,16 +568,15 @@ static void read_place_header(BufferBase &file_buffer, char *net_file,
     }
     else {
        if (strcmp (ptr, line_one_names[i]) != 0) {
-          printf ("Error on line %d, word %d:  \n"
-                  "Expected keyword %s, got %s.\n", file_buffer.linenum_, i+1,
-                  line_one_names[i], ptr);
-          exit (1);
+          throw ParseError (Formatter () << "Error on line "
+                << file_buffer.linenum_ << ", word " << i+1 << ":  Expected "
+                "keyword " << line_one_names[i] << ", got " << ptr << ".");
        }
     }
     ptr = file_buffer.token(NULL, TOKENS);
     if (ptr == NULL && i != 5) {
-       printf ("Error:  Unexpected end of line on line %d.\n", file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  Unexpected end of line on "
+             "line " << file_buffer.linenum_ << ".");
     }
  }
 
@@ -484,16 +597,14 @@ static void read_place_header(BufferBase &file_buffer, char *net_file,
  ptr = file_buffer.get_joined_string(BUFSIZE);
 
  if (ptr == NULL) {
-    printf ("Error:  Array size not listed.\n");
-    exit (1);
+    throw ParseError (Formatter () << "Error:  Array size not listed.");
  }
 
  ptr = file_buffer.token(file_buffer.buffer_, TOKENS);
  while (ptr == NULL) {   /* Skip blank or comment lines. */
     ptr = file_buffer.get_joined_string(BUFSIZE);
     if (ptr == NULL) {
-       printf ("Error:  array size not listed.\n");
-       exit (1);
+       throw ParseError (Formatter () << "Error:  array size not listed.");
     }
     ptr = file_buffer.token(file_buffer.buffer_, TOKENS);
  }
@@ -507,16 +618,15 @@ static void read_place_header(BufferBase &file_buffer, char *net_file,
     }
     else {
        if (strcmp (ptr, line_two_names[i]) != 0) {
-          printf ("Error on line %d, word %d:  \n"
-                  "Expected keyword %s, got %s.\n", file_buffer.linenum_, i+1,
-                  line_two_names[i], ptr);
-          exit (1);
+          throw ParseError (Formatter () << "Error on line "
+                << file_buffer.linenum_ << ", word " << i+1 << ":  Expected "
+                "keyword " << line_two_names[i] << ", got " << ptr << ".");
        }
     }
     ptr = file_buffer.token(NULL, TOKENS);
     if (ptr == NULL && i != 6) {
-       printf ("Error:  Unexpected end of line on line %d.\n", file_buffer.linenum_);
-       exit (1);
+       throw ParseError (Formatter () << "Error:  Unexpected end of line on "
+             "line " << file_buffer.linenum_ << ".");
     }
  }
 
@@ -11,6 +11,10 @@ void print_place (char *place_file, char *net_file, char *arch_file);
 
 void read_user_pad_loc (char *pad_loc_file);
 
+void extract_block_positions(unsigned int *block_positions);
+
+void load_block_positions(const unsigned int *block_positions);
+
 void dump_clbs (void);   /* For debugging */
 
 #endif
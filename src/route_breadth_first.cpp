@@ -4,19 +4,39 @@
 #include "globals.h"
 #include "route_export.h"
 #include "route_common.h"
+#include "rr_graph_csr.h"
 #include "route_breadth_first.h"
+#include "route_parallel.h"
+
+
+/********************* Types local to this module ***************************/
+
+typedef struct s_breadth_first_net_data {int itry; float pres_fac; float
+      bend_cost; boolean incremental_reroute; int num_nets_routed;}
+      t_breadth_first_net_data;
+
+/* What each thread needs to rip up and reroute a net (see                  *
+ * breadth_first_reroute_net_data).  When the nets are routed in parallel   *
+ * (see route_parallel.c) each thread has its own copy.                     *
+ * num_nets_routed:  Number of nets this thread has rerouted (rather than   *
+ *                   skipped) in the current iteration.                     */
 
 
 /********************* Subroutines local to this module *********************/
 
 static boolean breadth_first_route_net (int inet, float bend_cost);
 
+static boolean breadth_first_reroute_net_data (int inet, void *net_data);
+
 static void breadth_first_expand_trace_segment (struct s_trace *start_ptr,
         int remaining_connections_to_sink);
 
 static void breadth_first_expand_neighbours (int inode, float pcost, int inet,
           float bend_cost);
 
+static void breadth_first_expand_csr_neighbours (int inode, float pcost, int
+          inet, float bend_cost);
+
 static void breadth_first_add_source_to_heap (int inet);
 
 
@@ -30,8 +50,11 @@ boolean try_breadth_first_route (struct s_router_opts router_opts,
  * it can't.                                                             */
 
  float pres_fac;
- boolean success, is_routable, rip_up_local_opins;
- int itry, inet;
+ boolean success, is_routable, rip_up_local_opins, keep_routing;
+ int itry, inet, ithread, num_nets_routed;
+ t_route_schedule *schedule;
+ t_breadth_first_net_data *net_data;   /* [0..route_threads-1]. */
+ void **thread_data;                   /* [0..route_threads-1]. */
 
 /* Usually the first iteration uses a very small (or 0) pres_fac to find  *
  * the shortest path and get a congestion map.  For fast compiles, I set  *
@@ -39,27 +62,65 @@ boolean try_breadth_first_route (struct s_router_opts router_opts,
 
  pres_fac = router_opts.first_iter_pres_fac;
 
- for (itry=1;itry<=router_opts.max_router_iterations;itry++) {
+ net_data = (t_breadth_first_net_data *) my_malloc (
+       router_opts.route_threads * sizeof (t_breadth_first_net_data));
+ thread_data = (void **) my_malloc (router_opts.route_threads *
+       sizeof (void *));
+ for (ithread=0;ithread<router_opts.route_threads;ithread++) {
+    net_data[ithread].bend_cost = router_opts.bend_cost;
+    net_data[ithread].incremental_reroute = router_opts.incremental_reroute;
+    thread_data[ithread] = &net_data[ithread];
+ }
 
-    for (inet=0;inet<num_nets;inet++) {
-       if (is_global[inet] == FALSE) {       /* Skip global nets. */
+/* Nets are routed on several threads only if more than one is requested. */
 
-          pathfinder_update_one_cost (trace_head[inet], -1, pres_fac);
+ schedule = NULL;
+ if (router_opts.route_threads > 1)
+    schedule = alloc_and_load_route_schedule ();
 
-          is_routable = breadth_first_route_net (inet, router_opts.bend_cost);
+ success = FALSE;
 
-          /* Impossible to route? (disconnected rr_graph) */
+ for (itry=1;itry<=router_opts.max_router_iterations;itry++) {
 
-          if (!is_routable) {
-             my_printf ("Routing failed.\n");
-             return (FALSE);
-          }
+    for (ithread=0;ithread<router_opts.route_threads;ithread++) {
+       net_data[ithread].itry = itry;
+       net_data[ithread].pres_fac = pres_fac;
+       net_data[ithread].num_nets_routed = 0;
+    }
+
+    if (schedule != NULL) {
+       is_routable = route_nets_in_parallel (schedule,
+                  router_opts.route_threads, breadth_first_reroute_net_data,
+                  thread_data);
+    }
 
-          pathfinder_update_one_cost (trace_head[inet], 1, pres_fac);
+    else {
+       is_routable = TRUE;
 
+       for (inet=0;inet<num_nets;inet++) {
+          if (is_global[inet] == FALSE) {       /* Skip global nets. */
+             is_routable = breadth_first_reroute_net_data (inet,
+                     &net_data[0]);
+             if (!is_routable)
+                break;
+          }
        }
     }
 
+   /* Impossible to route? (disconnected rr_graph) */
+
+    if (!is_routable)
+       break;
+
+    num_nets_routed = 0;
+    for (ithread=0;ithread<router_opts.route_threads;ithread++)
+       num_nets_routed += net_data[ithread].num_nets_routed;
+    g_route_state.nets_rerouted.push_back (num_nets_routed);
+
+    if (router_opts.incremental_reroute)
+       my_printf ("Routing iteration %d rerouted %d nets.\n", itry,
+               num_nets_routed);
+
    /* Make sure any CLB OPINs used up by subblocks being hooked directly     *
     * to them are reserved for that purpose.                                 */
 
@@ -72,11 +133,15 @@ boolean try_breadth_first_route (struct s_router_opts router_opts,
                     clb_opins_used_locally);
 
     success = feasible_routing ();
+    keep_routing = record_routing_iteration (pres_fac, success);
     if (success) {
        my_printf("Successfully routed after %d routing iterations.\n", itry);
-       return (TRUE);
+       break;
     }
 
+    if (!keep_routing || should_abort_routing (&router_opts, itry))
+       break;
+
     if (itry == 1)
        pres_fac = router_opts.initial_pres_fac;
     else
@@ -85,8 +150,41 @@ boolean try_breadth_first_route (struct s_router_opts router_opts,
     pathfinder_update_cost (pres_fac, router_opts.acc_fac);
  }
 
- my_printf ("Routing failed.\n");
- return (FALSE);
+ if (schedule != NULL)
+    free_route_schedule (schedule);
+ free (net_data);
+ free (thread_data);
+
+ if (!success)
+    my_printf ("Routing failed.\n");
+ return (success);
+}
+
+
+static boolean breadth_first_reroute_net_data (int inet, void *net_data) {
+
+/* Rips up and reroutes net inet, with the pres_fac and bend_cost in       *
+ * net_data (a t_breadth_first_net_data).  After the first iteration, an   *
+ * incremental router leaves nets that use no overused rr_node alone.      *
+ * Returns FALSE only if the net cannot be routed.                         */
+
+ t_breadth_first_net_data *data;
+
+ data = (t_breadth_first_net_data *) net_data;
+
+ if (data->incremental_reroute && data->itry > 1 &&
+       !net_uses_overused_node (inet))
+    return (TRUE);
+
+ data->num_nets_routed++;
+
+ pathfinder_update_one_cost (trace_head[inet], -1, data->pres_fac);
+
+ if (!breadth_first_route_net (inet, data->bend_cost))
+    return (FALSE);
+
+ pathfinder_update_one_cost (trace_head[inet], 1, data->pres_fac);
+ return (TRUE);
 }
 
 
@@ -140,7 +238,12 @@ static boolean breadth_first_route_net (int inet, float bend_cost) {
           if (pcost > 0.99 * HUGE_FLOAT)          /* First time touched. */
              add_to_mod_list (&rr_node_route_inf[inode].path_cost);
 
-          breadth_first_expand_neighbours (inode, new_pcost, inet, bend_cost);
+          if (rr_graph_layout == RR_GRAPH_CSR)
+             breadth_first_expand_csr_neighbours (inode, new_pcost, inet,
+                   bend_cost);
+          else
+             breadth_first_expand_neighbours (inode, new_pcost, inet,
+                   bend_cost);
        }
 
        free_heap_data (current);
@@ -285,6 +388,50 @@ static void breadth_first_expand_neighbours (int inode, float pcost, int inet,
 }
 
 
+static void breadth_first_expand_csr_neighbours (int inode, float pcost, int
+          inet, float bend_cost) {
+
+/* Same as breadth_first_expand_neighbours, but walks the compact copy of  *
+ * the rr_graph in rr_csr.                                                 */
+
+ int iedge, first_edge, last_edge, to_node;
+ short from_type, to_type;
+ float tot_cost, cong_cost;
+ struct s_bb *bb;
+ t_rr_node_box *to_box;
+ t_rr_indexed_data *indexed_data;
+
+ first_edge = rr_csr.edge_start[inode];
+ last_edge = rr_csr.edge_start[inode+1];
+ from_type = rr_csr.type[inode];
+ bb = &route_bb[inet];
+ indexed_data = get_route_indexed_data ();
+
+ for (iedge=first_edge;iedge<last_edge;iedge++) {
+    to_node = rr_csr.edge_sink[iedge];
+    to_box = &rr_csr.box[to_node];
+
+    if (   to_box->xhigh < bb->xmin || to_box->xlow > bb->xmax  ||
+           to_box->yhigh < bb->ymin || to_box->ylow > bb->ymax    )
+       continue;      /* Node is outside (expanded) bounding box. */
+
+    cong_cost = indexed_data[rr_csr.cost_index[to_node]].base_cost *
+                rr_node_route_inf[to_node].acc_cost *
+                rr_node_route_inf[to_node].pres_cost;
+    tot_cost = pcost + cong_cost;
+
+    if (bend_cost != 0.) {
+       to_type = rr_csr.type[to_node];
+       if ((from_type == CHANX && to_type == CHANY) ||
+              (from_type == CHANY && to_type == CHANX))
+          tot_cost += bend_cost;
+    }
+
+    node_to_heap (to_node, tot_cost, inode, iedge - first_edge, OPEN, OPEN);
+ }
+}
+
+
 static void breadth_first_add_source_to_heap (int inet) {
 
 /* Adds the SOURCE of this net to the heap.  Used to start a net's routing. */
@@ -1,5 +1,6 @@
 #include <math.h>
 #include <stdio.h>
+#include <string.h>
 #include "util.h"
 #include "vpr_types.h"
 #include "globals.h"
@@ -12,6 +13,7 @@
 #include "rr_graph.h"
 #include "path_delay.h"
 #include "stats.h"
+#include "VprError.hpp"
 
 /***************** Variables shared only by route modules *******************/
 
@@ -20,27 +22,34 @@ t_rr_node_route_inf *rr_node_route_inf = NULL;       /* [0..num_rr_nodes-1] */
 struct s_bb *route_bb = NULL; /* [0..num_nets-1]. Limits area in which each  */
                               /* net must be routed.                         */
 
+/* Copy of the rr_graph the maze router walks (see s_router_opts). */
+
+enum e_rr_graph_layout rr_graph_layout = RR_GRAPH_STRUCTS;
+
 
 /**************** Static variables local to route_common.c ******************/
 
-static struct s_heap **heap;  /* Indexed from [1..heap_size] */
-static int heap_size;   /* Number of slots in the heap array */
-static int heap_tail;   /* Index of first unused slot in the heap array */
+static enum e_heap_type heap_type = BINARY_HEAP;  /* Heap arrangement. */
 
-/* For managing my own list of currently free heap data structures.     */
-static struct s_heap *heap_free_head = NULL;
+/* Function called after each Pathfinder iteration (see                     *
+ * set_route_iteration_callback), or NULL.                                  */
 
-/* For managing my own list of currently free trace data structures.    */
-static struct s_trace *trace_free_head = NULL;
+static t_route_iteration_callback route_iteration_callback = NULL;
+static void *route_iteration_callback_data = NULL;
 
-#ifdef DEBUG
- static int num_trace_allocated = 0;   /* To watch for memory leaks. */
- static int num_heap_allocated = 0;
- static int num_linked_f_pointer_allocated = 0;
-#endif
+/* The heap and arenas used by all routing that is not done by a worker    *
+ * thread of route_nets_in_parallel.  The heap itself is allocated by        *
+ * alloc_route_structs.                                                      */
 
-static struct s_linked_f_pointer *rr_modified_head = NULL;
-static struct s_linked_f_pointer *linked_f_pointer_free_head = NULL;
+static t_route_context shared_route_context = {NULL, 0, 0, 0, 0,
+       NODE_ARENA_INITIALIZER (sizeof (struct s_heap)),
+       NODE_ARENA_INITIALIZER (sizeof (struct s_trace)), NULL,
+       NODE_ARENA_INITIALIZER (sizeof (struct s_linked_f_pointer)), NULL,
+       NULL, NULL};
+
+/* Context of the maze router search being done by the current thread. */
+
+ROUTE_THREAD_LOCAL t_route_context *route_context = &shared_route_context;
 
 
 
@@ -81,8 +90,10 @@ static void load_route_bb (int bb_factor);
 
 static struct s_trace *alloc_trace_data (void);
 static void add_to_heap (struct s_heap *hptr);
+static void sift_down_four_ary_heap (struct s_heap *hptr);
 static struct s_heap *alloc_heap_data (void);
 static struct s_linked_f_pointer *alloc_linked_f_pointer (void);
+static void reset_node_alloc_stats (void);
 
 static t_ivec **alloc_and_load_clb_opins_used_locally (t_subblock_data
         subblock_data);
@@ -237,12 +248,19 @@ boolean try_route (int width_fac, struct s_router_opts router_opts, struct
 
  free_rr_graph ();
 
-/* Set up the routing resource graph defined by this FPGA architecture. */
-
- build_rr_graph (router_opts.route_type, det_routing_arch, segment_inf,
-                 timing_inf, router_opts.base_cost_type);
- free_rr_graph_internals (router_opts.route_type, det_routing_arch, segment_inf,
-                 timing_inf, router_opts.base_cost_type);
+/* Set up the routing resource graph defined by this FPGA architecture.  *
+ * The graph only depends on the architecture, grid size and width_fac,  *
+ * so load it from the rr_graph cache if it has been built before.       */
+
+ if (!g_rr_graph_cache.load (width_fac, router_opts.route_type,
+          det_routing_arch, segment_inf, router_opts.base_cost_type)) {
+    build_rr_graph (router_opts.route_type, det_routing_arch, segment_inf,
+                    timing_inf, router_opts.base_cost_type);
+    free_rr_graph_internals (router_opts.route_type, det_routing_arch,
+                    segment_inf, timing_inf, router_opts.base_cost_type);
+    g_rr_graph_cache.save (width_fac, router_opts.route_type,
+          det_routing_arch, router_opts.base_cost_type);
+ }
 
 /* Allocate and load some additional rr_graph information needed only by *
  * the router.                                                           */
@@ -251,16 +269,41 @@ boolean try_route (int width_fac, struct s_router_opts router_opts, struct
 
  init_route_structs (router_opts.bb_factor);
 
+ set_heap_type (router_opts.heap_type);
+ rr_graph_layout = router_opts.rr_graph_layout;
+ reset_heap_stats ();
+ reset_node_alloc_stats ();
+
  g_route_state = RouteState();
  clock_gettime(CLOCK_REALTIME, &g_route_state.start);
- if (router_opts.router_algorithm == BREADTH_FIRST)
-    success = try_breadth_first_route (router_opts, clb_opins_used_locally);
 
- else    /* TIMING_DRIVEN route */
-    success = try_timing_driven_route (router_opts, net_slack, net_delay,
-                clb_opins_used_locally);
+/* If the router throws, free the structures that the next call checks are *
+ * gone, so that the caller may catch the error and keep routing.          */
+
+ try {
+    if (router_opts.router_algorithm == BREADTH_FIRST)
+       success = try_breadth_first_route (router_opts,
+                   clb_opins_used_locally);
+
+    else    /* TIMING_DRIVEN route */
+       success = try_timing_driven_route (router_opts, net_slack, net_delay,
+                   clb_opins_used_locally);
+ }
+ catch (...) {
+    reset_path_costs ();
+    empty_heap ();
+    if (router_opts.router_algorithm != BREADTH_FIRST)
+       free_route_tree_timing_structs ();
+    free_rr_node_route_structs ();
+    reset_route_arenas ();
+    throw;
+ }
  clock_gettime(CLOCK_REALTIME, &g_route_state.end);
  g_route_state.success = success;
+ get_heap_stats (&g_route_state.heap_pushes, &g_route_state.heap_pops);
+ get_node_alloc_stats (&g_route_state.node_allocs,
+       &g_route_state.arena_chunk_allocs, &g_route_state.arena_bytes);
+ reset_route_arenas ();
  g_route_state.width_fac = width_fac;
 
  if(success) {
@@ -268,6 +311,9 @@ boolean try_route (int width_fac, struct s_router_opts router_opts, struct
     g_route_result.success_channel_widths.push_back(width_fac);
     get_num_bends_and_length(g_route_state.bends, g_route_state.wire_lengths,
                              g_route_state.segments);
+    if (router_opts.export_traceback)
+       get_traceback_arrays (g_route_state.trace_net_offsets,
+             g_route_state.trace_nodes, g_route_state.trace_switches);
  } else {
      g_route_result.failure_channel_widths.push_back(width_fac);
  }
@@ -294,6 +340,140 @@ boolean feasible_routing (void) {
 }
 
 
+void set_route_iteration_callback (t_route_iteration_callback callback,
+        void *data) {
+
+/* Sets the function called with g_route_state after each Pathfinder        *
+ * iteration (NULL for none).  See record_routing_iteration.                */
+
+ route_iteration_callback = callback;
+ route_iteration_callback_data = data;
+}
+
+
+boolean record_routing_iteration (float pres_fac, boolean feasible) {
+
+/* Appends the number of overused rr_nodes, and their total overuse         *
+ * (occupancy in excess of capacity), the pres_fac used and the time taken  *
+ * so far to the routing statistics of the current route, then passes them  *
+ * to the routing iteration callback (if any).  Called once per Pathfinder  *
+ * iteration, with the occupancy arrays up to date.  Returns FALSE if the   *
+ * callback cancelled the route, TRUE otherwise.  A feasible routing has    *
+ * already succeeded, so the callback cannot cancel it.                     */
+
+ int inode, num_overused_nodes, total_overuse;
+ timespec now;
+
+ num_overused_nodes = 0;
+ total_overuse = 0;
+
+ for (inode=0;inode<num_rr_nodes;inode++) {
+    if (rr_node[inode].occ > rr_node[inode].capacity) {
+       num_overused_nodes++;
+       total_overuse += rr_node[inode].occ - rr_node[inode].capacity;
+    }
+ }
+
+ clock_gettime (CLOCK_REALTIME, &now);
+ g_route_state.overused_nodes.push_back (num_overused_nodes);
+ g_route_state.total_overuse.push_back (total_overuse);
+ g_route_state.pres_facs.push_back (pres_fac);
+ g_route_state.iteration_times.push_back (now.tv_sec -
+       g_route_state.start.tv_sec + (now.tv_nsec -
+       g_route_state.start.tv_nsec) * 1e-9);
+
+ if (route_iteration_callback != NULL &&
+       !route_iteration_callback (g_route_state,
+       route_iteration_callback_data) && !feasible) {
+    g_route_state.cancelled = true;
+    g_route_state.abort_reason = "cancelled by the routing iteration callback";
+    my_printf ("Routing cancelled after %d routing iterations.\n",
+          (int) g_route_state.overused_nodes.size ());
+    return (FALSE);
+ }
+
+ return (TRUE);
+}
+
+
+boolean should_abort_routing (struct s_router_opts *router_opts, int itry) {
+
+/* Decides, from the total overuse recorded by record_routing_iteration for *
+ * iterations 1..itry, whether routing iteration itry failed badly enough  *
+ * that the router should give up on this channel width without running   *
+ * all max_router_iterations (see route_abort).  If so, records why in     *
+ * g_route_state and returns TRUE.                                         */
+
+ int i, window, best_before, best_in_window;
+ float slope, iterations_needed;
+ std::vector<unsigned int> &overuse = g_route_state.total_overuse;
+ char reason[BUFSIZE];
+
+ window = router_opts->abort_iterations;
+ if (router_opts->route_abort == ABORT_NEVER || window < 1 || itry <= window
+       || itry >= router_opts->max_router_iterations)
+    return (FALSE);
+
+/* overuse[i] is the total overuse after iteration i+1. */
+
+ if (router_opts->route_abort == ABORT_STALLED) {
+    best_before = overuse[0];
+    for (i=1;i<itry-window;i++)
+       best_before = my_min (best_before, (int) overuse[i]);
+    best_in_window = overuse[itry-window];
+    for (i=itry-window+1;i<itry;i++)
+       best_in_window = my_min (best_in_window, (int) overuse[i]);
+
+    if (best_in_window < best_before)
+       return (FALSE);
+
+    sprintf (reason, "total overuse has not improved in %d iterations",
+          window);
+ }
+
+ else {    /* ABORT_EXTRAPOLATED */
+    slope = ((float) overuse[itry-1] - (float) overuse[itry-1-window]) /
+          window;
+
+    if (slope < 0.) {
+       iterations_needed = overuse[itry-1] / -slope;
+       if (itry + iterations_needed <= router_opts->max_router_iterations)
+          return (FALSE);
+
+       sprintf (reason, "total overuse would need %d more iterations to "
+             "reach zero", (int) ceil (iterations_needed));
+    }
+    else {
+       sprintf (reason, "total overuse has not fallen in %d iterations",
+             window);
+    }
+ }
+
+ g_route_state.abort_reason = reason;
+ my_printf ("Routing aborted after %d routing iterations:  %s.\n", itry,
+       reason);
+ return (TRUE);
+}
+
+
+boolean net_uses_overused_node (int inet) {
+
+/* Returns TRUE if the current routing (traceback) of net inet uses any     *
+ * rr_node whose occupancy exceeds its capacity.                            */
+
+ struct s_trace *tptr;
+ int inode;
+
+ for (tptr=trace_head[inet];tptr!=NULL;tptr=tptr->next) {
+    inode = tptr->index;
+    if (rr_node[inode].occ > rr_node[inode].capacity)
+       return (TRUE);
+ }
+
+ return (FALSE);
+}
+
+
 void pathfinder_update_one_cost (struct s_trace *route_segment_start,
       int add_or_sub, float pres_fac) {
 
@@ -391,15 +571,14 @@ void init_route_structs (int bb_factor) {
 /* Check that things that should have been emptied after the last routing *
  * really were.                                                           */
 
- if (rr_modified_head != NULL) {
-    printf ("Error in init_route_structs.  List of modified rr nodes is \n"
-            "not empty.\n");
-    exit (1);
+ if (route_context->rr_modified_head != NULL) {
+    throw InternalError (Formatter () << "Error in init_route_structs.  "
+          "List of modified rr nodes is not empty.");
  }
 
- if (heap_tail != 1) {
-    printf ("Error in init_route_structs.  Heap is not empty.\n");
-    exit (1);
+ if (route_context->heap_tail != 1) {
+    throw InternalError (Formatter () << "Error in init_route_structs.  "
+          "Heap is not empty.");
  }
 }
 
@@ -431,10 +610,9 @@ struct s_trace *update_traceback (struct s_heap *hptr, int inet) {
 #ifdef DEBUG
    rr_type = rr_node[inode].type;
    if (rr_type != SINK) {
-      printf("Error in update_traceback.  Expected type = SINK (%d).\n",
-         SINK);
-      my_printf("Got type = %d while tracing back net %d.\n", rr_type, inet);
-      exit(1);
+      throw InternalError (Formatter () << "Error in update_traceback.  "
+            "Expected type = SINK (" << SINK << ").  Got type = " << rr_type
+            << " while tracing back net " << inet << ".");
    }
 #endif
 
@@ -480,40 +658,18 @@ void reset_path_costs (void) {
 /* The routine sets the path_cost to HUGE_FLOAT for all channel segments   *
  * touched by previous routing phases.                                     */
 
- struct s_linked_f_pointer *mod_ptr;
-#ifdef DEBUG
- int num_mod_ptrs;
-#endif
-
-/* The traversal method below is slightly painful to make it faster. */
+ struct s_linked_f_pointer *mod_ptr, *next_ptr;
 
- if (rr_modified_head != NULL) {
-    mod_ptr = rr_modified_head;
+/* Reset the modified list and put all the elements back in the free list. */
 
-#ifdef DEBUG
-    num_mod_ptrs = 1;
-#endif
-
-    while (mod_ptr->next != NULL) {
-       *(mod_ptr->fptr) = HUGE_FLOAT;
-       mod_ptr = mod_ptr->next;
-#ifdef DEBUG
-       num_mod_ptrs++;
-#endif
-    }
-    *(mod_ptr->fptr) = HUGE_FLOAT;   /* Do last one. */
-
-/* Reset the modified list and put all the elements back in the free   *
- * list.                                                               */
-
-    mod_ptr->next = linked_f_pointer_free_head;
-    linked_f_pointer_free_head = rr_modified_head;
-    rr_modified_head = NULL;
-
-#ifdef DEBUG
-    num_linked_f_pointer_allocated -= num_mod_ptrs;
-#endif
+ mod_ptr = route_context->rr_modified_head;
+ while (mod_ptr != NULL) {
+    *(mod_ptr->fptr) = HUGE_FLOAT;
+    next_ptr = mod_ptr->next;
+    free_arena_node (&route_context->linked_f_pointer_arena, mod_ptr);
+    mod_ptr = next_ptr;
  }
+ route_context->rr_modified_head = NULL;
 }
 
 
@@ -525,7 +681,7 @@ float get_rr_cong_cost (int inode) {
  float cost;
 
  cost_index = rr_node[inode].cost_index;
- cost = rr_indexed_data[cost_index].base_cost *
+ cost = get_route_indexed_data()[cost_index].base_cost *
                  rr_node_route_inf[inode].acc_cost *
                 rr_node_route_inf[inode].pres_cost;
  return (cost);
@@ -606,11 +762,11 @@ t_ivec **alloc_route_structs (t_subblock_data subblock_data) {
  trace_tail = (struct s_trace **) my_malloc (num_nets *
     sizeof(struct s_trace *));
 
- heap_size = nx*ny;
- heap = (struct s_heap **) my_malloc (heap_size *
-    sizeof (struct s_heap *));
- heap--;   /* heap stores from [1..heap_size] */
- heap_tail = 1;
+ route_context->heap_size = nx*ny;
+ route_context->heap = (struct s_heap **) my_malloc (
+    route_context->heap_size * sizeof (struct s_heap *));
+ route_context->heap--;   /* heap stores from [1..heap_size] */
+ route_context->heap_tail = 1;
 
  route_bb = (struct s_bb *) my_malloc (num_nets * sizeof (struct s_bb));
 
@@ -726,6 +882,10 @@ void free_trace_structs (void) {
   free(trace_tail);
   trace_head = NULL;
   trace_tail = NULL;
+
+  /* The traceback arena can only be rewound once no routing is left. */
+
+  reset_node_arena (&route_context->trace_arena);
 }
 
 void free_route_structs (t_ivec **clb_opins_used_locally) {
@@ -733,17 +893,13 @@ void free_route_structs (t_ivec **clb_opins_used_locally) {
 /* Frees the temporary storage needed only during the routing.  The  *
  * final routing result is not freed.                                */
 
- free (heap + 1);
+ free (route_context->heap + 1);
  free (route_bb);
 
- heap = NULL;         /* Defensive coding:  crash hard if I use these. */
+ route_context->heap = NULL; /* Defensive coding:  crash hard if I use these. */
  route_bb = NULL;
 
  free_ivec_matrix (clb_opins_used_locally, 0, num_blocks-1, 0, num_class-1);
-
-/* NB:  Should use my chunk_malloc for tptr, hptr, and mod_ptr structures. *
- * I could free everything except the tptrs at the end then.               */
-
 }
 
 
@@ -766,9 +922,9 @@ void alloc_and_load_rr_node_route_structs (void) {
  int inode;
 
  if (rr_node_route_inf != NULL) {
-    printf ("Error in alloc_and_load_rr_node_route_structs:  \n"
-            "old rr_node_route_inf array exists.\n");
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "alloc_and_load_rr_node_route_structs:  old rr_node_route_inf "
+          "array exists.");
  }
 
  rr_node_route_inf = (t_rr_node_route_inf *) my_malloc
@@ -866,9 +1022,170 @@ void add_to_mod_list (float *fptr) {
 
 /* Add this element to the start of the modified list. */
 
- mod_ptr->next = rr_modified_head;
+ mod_ptr->next = route_context->rr_modified_head;
  mod_ptr->fptr = fptr;
- rr_modified_head = mod_ptr;
+ route_context->rr_modified_head = mod_ptr;
+}
+
+
+void set_heap_type (enum e_heap_type type) {
+
+/* Selects the arrangement of the heap used by node_to_heap and            *
+ * get_heap_head.  Must only be called while the heap is empty.            */
+
+ heap_type = type;
+}
+
+
+void reset_heap_stats (void) {
+ route_context->num_heap_pushes = 0;
+ route_context->num_heap_pops = 0;
+}
+
+
+void get_heap_stats (long long *pushes, long long *pops) {
+
+/* Returns the number of heap insertions and removals since the last call *
+ * to reset_heap_stats.                                                   */
+
+ *pushes = route_context->num_heap_pushes;
+ *pops = route_context->num_heap_pops;
+}
+
+
+static void reset_node_alloc_stats (void) {
+ reset_node_arena_stats (&route_context->heap_arena);
+ reset_node_arena_stats (&route_context->trace_arena);
+ reset_node_arena_stats (&route_context->linked_f_pointer_arena);
+}
+
+
+void get_node_alloc_stats (long long *node_allocs, long long *chunk_allocs,
+        long long *arena_bytes) {
+
+/* Returns the number of heap, traceback and linked_f_pointer structures   *
+ * allocated and the number of arena chunks malloced since the last call   *
+ * to reset_node_alloc_stats, and the number of bytes the arenas own.      */
+
+ *node_allocs = route_context->heap_arena.num_allocs +
+       route_context->trace_arena.num_allocs +
+       route_context->linked_f_pointer_arena.num_allocs;
+ *chunk_allocs = route_context->heap_arena.num_chunk_allocs +
+       route_context->trace_arena.num_chunk_allocs +
+       route_context->linked_f_pointer_arena.num_chunk_allocs;
+ *arena_bytes = get_node_arena_bytes (&route_context->heap_arena) +
+       get_node_arena_bytes (&route_context->trace_arena) +
+       get_node_arena_bytes (&route_context->linked_f_pointer_arena);
+}
+
+
+void reset_route_arenas (void) {
+
+/* Rewinds the heap and linked_f_pointer arenas at the end of a routing    *
+ * attempt, so that the next attempt carves its structures from the same   *
+ * chunks, in order, rather than from a free list scattered by this one.   *
+ * Only done once the heap and the list of modified path costs are empty.  */
+
+ reset_node_arena (&route_context->heap_arena);
+ reset_node_arena (&route_context->linked_f_pointer_arena);
+}
+
+
+void free_route_arenas (void) {
+
+/* Frees the chunks of the heap and linked_f_pointer arenas, and those of  *
+ * the traceback arena if no traceback is left.                            */
+
+ if (route_context->heap_arena.num_live == 0)
+    free_node_arena (&route_context->heap_arena);
+ if (route_context->linked_f_pointer_arena.num_live == 0)
+    free_node_arena (&route_context->linked_f_pointer_arena);
+ if (route_context->trace_arena.num_live == 0)
+    free_node_arena (&route_context->trace_arena);
+}
+
+
+t_route_context *alloc_route_context (void) {
+
+/* Allocates a route context with an empty heap, of the same initial size  *
+ * as the heap allocated by alloc_route_structs, and its own copy of the   *
+ * current rr_indexed_data.                                                */
+
+ t_route_context *context;
+
+ context = (t_route_context *) my_calloc (1, sizeof (t_route_context));
+ context->heap_size = nx*ny;
+ context->heap = (struct s_heap **) my_malloc (context->heap_size *
+    sizeof (struct s_heap *));
+ context->heap--;   /* heap stores from [1..heap_size] */
+ context->heap_tail = 1;
+
+ init_node_arena (&context->heap_arena, sizeof (struct s_heap));
+ init_node_arena (&context->trace_arena, sizeof (struct s_trace));
+ init_node_arena (&context->linked_f_pointer_arena, sizeof (struct
+       s_linked_f_pointer));
+ context->heap_arena.parent = &shared_route_context.heap_arena;
+ context->trace_arena.parent = &shared_route_context.trace_arena;
+ context->linked_f_pointer_arena.parent =
+       &shared_route_context.linked_f_pointer_arena;
+
+ context->rr_indexed_data = (t_rr_indexed_data *) my_malloc (
+       num_rr_indexed_data * sizeof (t_rr_indexed_data));
+ memcpy (context->rr_indexed_data, rr_indexed_data, num_rr_indexed_data *
+       sizeof (t_rr_indexed_data));
+
+ return (context);
+}
+
+
+void set_route_context (t_route_context *context) {
+
+/* Makes the calling thread route with context, or with the shared context *
+ * if context is NULL.                                                     */
+
+ if (context == NULL)
+    route_context = &shared_route_context;
+ else
+    route_context = context;
+}
+
+
+void free_route_context (t_route_context *context) {
+
+/* Frees a context allocated by alloc_route_context.  The context must not *
+ * be in use by any thread, its heap must be empty and its route tree free *
+ * lists must already have been freed.  Its arenas are merged into those   *
+ * of the shared context (the chunks of its heap and linked_f_pointer      *
+ * arenas as spare chunks, since nothing refers to their structures once   *
+ * the context is freed, even if a net it was routing threw), and its heap *
+ * statistics are added to those of the shared context.                    */
+
+ context->heap_arena.num_live = 0;
+ context->linked_f_pointer_arena.num_live = 0;
+ reset_node_arena (&context->heap_arena);
+ reset_node_arena (&context->linked_f_pointer_arena);
+ merge_node_arena (&shared_route_context.heap_arena, &context->heap_arena);
+ merge_node_arena (&shared_route_context.trace_arena, &context->trace_arena);
+ merge_node_arena (&shared_route_context.linked_f_pointer_arena,
+       &context->linked_f_pointer_arena);
+
+ shared_route_context.num_heap_pushes += context->num_heap_pushes;
+ shared_route_context.num_heap_pops += context->num_heap_pops;
+
+ free (context->heap + 1);
+ free (context->rr_indexed_data);
+ free (context);
+}
+
+
+t_rr_indexed_data *get_route_indexed_data (void) {
+
+/* Returns the rr_indexed_data whose base costs are used (and set) by the  *
+ * current route context.                                                  */
+
+ if (route_context->rr_indexed_data != NULL)
+    return (route_context->rr_indexed_data);
+ return (rr_indexed_data);
 }
 
 
@@ -877,19 +1194,43 @@ static void add_to_heap (struct s_heap *hptr) {
 /* Adds an item to the heap, expanding the heap if necessary.             */
 
  int ito, ifrom;
- struct s_heap *temp_ptr;
+ struct s_heap *temp_ptr, **heap;
+ t_route_context *context;
+
+ context = route_context;
+
+ if (context->heap_tail > context->heap_size ) {          /* Heap is full */
+    context->heap_size *= 2;
+    context->heap = (struct s_heap **)my_realloc ((void *)(context->heap + 1),
+       context->heap_size * sizeof (struct s_heap *));
+    context->heap--;     /* heap goes from [1..heap_size] */
+ }
+
+ heap = context->heap;
+ context->num_heap_pushes++;
+
+ if (heap_type == FOUR_ARY_HEAP) {
 
- if (heap_tail > heap_size ) {          /* Heap is full */
-    heap_size *= 2;
-    heap = (struct s_heap **)my_realloc ((void *)(heap + 1), heap_size *
-       sizeof (struct s_heap *));
-    heap--;     /* heap goes from [1..heap_size] */
+/* In the 4-ary heap, the children of slot i are slots 4i-2 .. 4i+1, so    *
+ * the parent of slot i is slot (i+2)/4.  Parents are moved down into the  *
+ * hole left by the new item, rather than swapped with it.                 */
+
+    ifrom = context->heap_tail;
+    context->heap_tail++;
+    ito = (ifrom + 2) / 4;
+    while ((ito >= 1) && (hptr->cost < heap[ito]->cost)) {
+       heap[ifrom] = heap[ito];
+       ifrom = ito;
+       ito = (ifrom + 2) / 4;
+    }
+    heap[ifrom] = hptr;
+    return;
  }
 
- heap[heap_tail] = hptr;
- ifrom = heap_tail;
+ heap[context->heap_tail] = hptr;
+ ifrom = context->heap_tail;
  ito = ifrom/2;
- heap_tail++;
+ context->heap_tail++;
 
  while ((ito >= 1) && (heap[ifrom]->cost < heap[ito]->cost)) {
     temp_ptr = heap[ito];
@@ -901,6 +1242,39 @@ static void add_to_heap (struct s_heap *hptr) {
 }
 
 
+static void sift_down_four_ary_heap (struct s_heap *hptr) {
+
+/* Refills slot 1 of the 4-ary heap (which has just had its smallest item  *
+ * removed) by moving the smallest child up into the hole until hptr (the  *
+ * item removed from the end of the heap) can be placed there.             */
+
+ int ihole, ichild, ilast, i, heap_tail;
+ struct s_heap *min_child, **heap;
+
+ heap = route_context->heap;
+ heap_tail = route_context->heap_tail;
+ ihole = 1;
+ ichild = 2;
+
+ while (ichild < heap_tail) {
+    ilast = my_min (ichild + 3, heap_tail - 1);
+    min_child = heap[ichild];
+    for (i=ichild+1;i<=ilast;i++) {
+       if (heap[i]->cost < min_child->cost) {
+          min_child = heap[i];
+          ichild = i;
+       }
+    }
+    if (min_child->cost >= hptr->cost)
+       break;
+    heap[ihole] = min_child;
+    ihole = ichild;
+    ichild = 4 * ihole - 2;
+ }
+ heap[ihole] = hptr;
+}
+
+
 struct s_heap *get_heap_head (void) {
 
 /* Returns a pointer to the smallest element on the heap, or NULL if the     *
@@ -908,25 +1282,36 @@ struct s_heap *get_heap_head (void) {
  * returned -- they are just skipped over.                                   */
 
  int ito, ifrom;
- struct s_heap *heap_head, *temp_ptr;
+ struct s_heap *heap_head, *temp_ptr, **heap;
+ t_route_context *context;
+
+ context = route_context;
+ heap = context->heap;
 
  do {
-    if (heap_tail == 1) {    /* Empty heap. */
+    if (context->heap_tail == 1) {    /* Empty heap. */
        my_printf("Empty heap occurred in get_heap_head.\n");
        my_printf("Some blocks are impossible to connect in this architecture.\n");
        return (NULL);
     }
 
     heap_head = heap[1];                /* Smallest element. */
+    context->num_heap_pops++;
+
+    if (heap_type == FOUR_ARY_HEAP) {
+       context->heap_tail--;
+       sift_down_four_ary_heap (heap[context->heap_tail]);
+       continue;
+    }
 
     /* Now fix up the heap */
 
-    heap_tail--;
-    heap[1] = heap[heap_tail];
+    context->heap_tail--;
+    heap[1] = heap[context->heap_tail];
     ifrom = 1;
     ito = 2*ifrom;
 
-    while (ito < heap_tail) {
+    while (ito < context->heap_tail) {
        if (heap[ito+1]->cost < heap[ito]->cost)
           ito++;
        if (heap[ito]->cost > heap[ifrom]->cost)
@@ -948,49 +1333,19 @@ void empty_heap (void) {
 
  int i;
 
- for (i=1;i<heap_tail;i++)
-    free_heap_data (heap[i]);
+ for (i=1;i<route_context->heap_tail;i++)
+    free_heap_data (route_context->heap[i]);
 
- heap_tail = 1;
+ route_context->heap_tail = 1;
 }
 
-#define NCHUNK 200  /* # of various structs malloced at a time. */
-
-
 static struct s_heap *alloc_heap_data (void) {
-
- int i;
- struct s_heap *temp_ptr;
-
- if (heap_free_head == NULL) {   /* No elements on the free list */
-    heap_free_head = (struct s_heap *) my_malloc (NCHUNK *
-       sizeof(struct s_heap));
-
-/* If I want to free this memory, I have to store the original pointer *
- * somewhere.  Not worthwhile right now -- if you need more memory     *
- * for post-routing stages, look into it.                              */
-
-    for (i=0;i<NCHUNK-1;i++)
-       (heap_free_head + i)->u.next = heap_free_head + i + 1;
-    (heap_free_head + NCHUNK - 1)->u.next = NULL;
- }
-
- temp_ptr = heap_free_head;
- heap_free_head = heap_free_head->u.next;
-#ifdef DEBUG
-    num_heap_allocated++;
-#endif
- return (temp_ptr);
+ return ((struct s_heap *) alloc_arena_node (&route_context->heap_arena));
 }
 
 
 void free_heap_data (struct s_heap *hptr) {
-
- hptr->u.next = heap_free_head;
- heap_free_head = hptr;
-#ifdef DEBUG
-    num_heap_allocated--;
-#endif
+ free_arena_node (&route_context->heap_arena, hptr);
 }
 
 
@@ -1001,8 +1356,10 @@ void invalidate_heap_entries (int sink_node, int ipin_node) {
  * and even then only in rare circumstances.                                */
 
  int i;
+ struct s_heap **heap;
 
- for (i=1;i<heap_tail;i++) {
+ heap = route_context->heap;
+ for (i=1;i<route_context->heap_tail;i++) {
     if (heap[i]->index == sink_node && heap[i]->u.prev_node == ipin_node)
        heap[i]->index = OPEN;    /* Invalid. */
  }
@@ -1010,28 +1367,7 @@ void invalidate_heap_entries (int sink_node, int ipin_node) {
 
 
 static struct s_trace *alloc_trace_data (void) {
-
- int i;
- struct s_trace *temp_ptr;
-
- if (trace_free_head == NULL) {   /* No elements on the free list */
-    trace_free_head = (struct s_trace *) my_malloc (NCHUNK *
-       sizeof(struct s_trace));
-
-/* If I want to free this memory, I have to store the original pointer *
- * somewhere.  Not worthwhile right now -- if you need more memory     *
- * for post-routing stages, look into it.                              */
-
-    for (i=0;i<NCHUNK-1;i++)
-       (trace_free_head + i)->next = trace_free_head + i + 1;
-    (trace_free_head + NCHUNK-1)->next = NULL;
- }
- temp_ptr = trace_free_head;
- trace_free_head = trace_free_head->next;
-#ifdef DEBUG
-    num_trace_allocated++;
-#endif
- return (temp_ptr);
+ return ((struct s_trace *) alloc_arena_node (&route_context->trace_arena));
 }
 
 
@@ -1039,11 +1375,7 @@ static void free_trace_data (struct s_trace *tptr) {
 
 /* Puts the traceback structure pointed to by tptr on the free list. */
 
- tptr->next = trace_free_head;
- trace_free_head = tptr;
-#ifdef DEBUG
-    num_trace_allocated--;
-#endif
+ free_arena_node (&route_context->trace_arena, tptr);
 }
 
 
@@ -1052,33 +1384,8 @@ static struct s_linked_f_pointer *alloc_linked_f_pointer (void) {
 /* This routine returns a linked list element with a float pointer as *
  * the node data.                                                     */
 
- int i;
- struct s_linked_f_pointer *temp_ptr;
-
- if (linked_f_pointer_free_head == NULL) {
-    /* No elements on the free list */
-    linked_f_pointer_free_head = (struct s_linked_f_pointer *)
-        my_malloc (NCHUNK * sizeof(struct s_linked_f_pointer));
-
-/* If I want to free this memory, I have to store the original pointer *
- * somewhere.  Not worthwhile right now -- if you need more memory     *
- * for post-routing stages, look into it.                              */
-
-    for (i=0;i<NCHUNK-1;i++) {
-       (linked_f_pointer_free_head + i)->next = linked_f_pointer_free_head
-                          + i + 1;
-    }
-    (linked_f_pointer_free_head + NCHUNK-1)->next = NULL;
- }
-
- temp_ptr = linked_f_pointer_free_head;
- linked_f_pointer_free_head = linked_f_pointer_free_head->next;
-
-#ifdef DEBUG
-    num_linked_f_pointer_allocated++;
-#endif
-
- return (temp_ptr);
+ return ((struct s_linked_f_pointer *) alloc_arena_node (
+       &route_context->linked_f_pointer_arena));
 }
 
 
@@ -1139,9 +1446,9 @@ void print_route (char *route_file) {
              break;
 
           default:
-             printf ("Error in print_route:  Unexpected traceback element "
-                     "type: %d (%s).\n", rr_type, name_type[rr_type]);
-             exit (1);
+             throw InternalError (Formatter () << "Error in print_route:  "
+                   "Unexpected traceback element type: " << rr_type << " ("
+                   << name_type[rr_type] << ").");
              break;
           }
 
@@ -1182,10 +1489,11 @@ void print_route (char *route_file) {
 
 #ifdef DEBUG
    fp = my_fopen ("mem.echo","w",0);
-   fprintf(fp, "\nNum_heap_allocated: %d   Num_trace_allocated: %d\n",
-      num_heap_allocated, num_trace_allocated);
-   fprintf(fp, "Num_linked_f_pointer_allocated: %d\n",
-      num_linked_f_pointer_allocated);
+   fprintf(fp, "\nNum_heap_allocated: %ld   Num_trace_allocated: %ld\n",
+      route_context->heap_arena.num_live,
+      route_context->trace_arena.num_live);
+   fprintf(fp, "Num_linked_f_pointer_allocated: %ld\n",
+      route_context->linked_f_pointer_arena.num_live);
    fclose (fp);
 #endif
 
@@ -49,10 +49,49 @@ typedef struct {int prev_node; float pres_cost; float acc_cost; float
 
 
 
+/* Compilers that support thread-local storage use it for the current route *
+ * context, so that several threads can route nets at the same time.        */
+
+#define ROUTE_THREAD_LOCAL __thread __attribute__ ((tls_model ("initial-exec")))
+
+typedef struct s_route_context {struct s_heap **heap; int heap_size; int
+      heap_tail; long long num_heap_pushes; long long num_heap_pops;
+      t_node_arena heap_arena; t_node_arena trace_arena; struct
+      s_linked_f_pointer *rr_modified_head; t_node_arena
+      linked_f_pointer_arena; struct s_rt_node *rt_node_free_list; struct
+      s_linked_rt_edge *rt_edge_free_list; t_rr_indexed_data
+      *rr_indexed_data; } t_route_context;
+
+/* The state of the maze router that belongs to the search for one net.     *
+ * Each thread routing nets at the same time as others uses its own context *
+ * (see route_parallel.cpp); all other routing uses one shared context.     *
+ *                                                                          *
+ * heap:  The heap, indexed from [1..heap_size].                            *
+ * heap_size:  Number of slots in the heap array.                           *
+ * heap_tail:  Index of the first unused slot in the heap array.            *
+ * num_heap_pushes, num_heap_pops:  Number of entries added to and removed  *
+ *              from the heap (including invalid entries that were skipped) *
+ *              since the last call to reset_heap_stats.                    *
+ * heap_arena, trace_arena, linked_f_pointer_arena:  Arenas the heap,       *
+ *              traceback and linked_f_pointer structures are allocated     *
+ *              from.  The heap and linked_f_pointer arenas are reset at    *
+ *              the end of each routing attempt; the traceback arena only   *
+ *              once every traceback has been freed, since the routing      *
+ *              outlives the attempt (see free_trace_structs).              *
+ * rr_modified_head:  List of the path costs modified by the current search.*
+ * rt_node_free_list, rt_edge_free_list:  Free lists of the route tree      *
+ *              structures of the timing-driven router.                     *
+ * rr_indexed_data:  Copy of rr_indexed_data whose base costs are set for   *
+ *              the net being routed by this context, or NULL to use (and   *
+ *              set) the base costs in the global rr_indexed_data.          */
+
+
 /**************** Variables shared by all route_files ***********************/
 
 extern t_rr_node_route_inf *rr_node_route_inf;       /* [0..num_rr_nodes-1] */
 extern struct s_bb *route_bb;                        /* [0..num_nets-1]     */
+extern ROUTE_THREAD_LOCAL t_route_context *route_context;
+extern enum e_rr_graph_layout rr_graph_layout;
 
 /******* Subroutines in route_common used only by other router modules ******/
 
@@ -78,6 +117,19 @@ void add_to_mod_list (float *fptr);
 
 struct s_heap *get_heap_head (void); 
 
+void set_heap_type (enum e_heap_type type);
+
+void reset_heap_stats (void);
+
+void get_heap_stats (long long *pushes, long long *pops);
+
+void get_node_alloc_stats (long long *node_allocs, long long *chunk_allocs,
+        long long *arena_bytes);
+
+void reset_route_arenas (void);
+
+void free_route_arenas (void);
+
 void empty_heap (void); 
 
 void free_heap_data (struct s_heap *hptr); 
@@ -92,5 +144,19 @@ void alloc_and_load_rr_node_route_structs (void);
 
 void free_trace_structs(void);
 
+t_route_context *alloc_route_context (void);
+
+void set_route_context (t_route_context *context);
+
+void free_route_context (t_route_context *context);
+
+t_rr_indexed_data *get_route_indexed_data (void);
+
+boolean net_uses_overused_node (int inet);
+
+boolean record_routing_iteration (float pres_fac, boolean feasible);
+
+boolean should_abort_routing (struct s_router_opts *router_opts, int itry);
+
 void reserve_locally_used_opins (float pres_fac, boolean rip_up_local_opins,
           t_ivec **clb_opins_used_locally);
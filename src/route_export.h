@@ -27,3 +27,11 @@ void restore_routing (struct s_trace **best_routing, t_ivec
 void get_serial_num (void);
 
 void print_route (char *name);
+
+class RouteState;
+
+typedef bool (*t_route_iteration_callback) (const RouteState &state,
+        void *data);
+
+void set_route_iteration_callback (t_route_iteration_callback callback,
+        void *data);
@@ -0,0 +1,174 @@
+#include <stdio.h>
+#include <string.h>
+#include <vector>
+#include "util.h"
+#include "vpr_types.h"
+#include "globals.h"
+#include "route_file.h"
+
+
+/******************** Subroutines local to this module **********************/
+
+static void put_varint (std::vector<unsigned char> &data, unsigned long long
+      value);
+
+static void put_signed_varint (std::vector<unsigned char> &data, long long
+      value);
+
+static void put_string (std::vector<unsigned char> &data, char *string);
+
+static void write_padded (FILE *fp, void *data, size_t size);
+
+
+/************************ Subroutine definitions ****************************/
+
+static void put_varint (std::vector<unsigned char> &data, unsigned long long
+      value) {
+
+/* Appends value to data as an unsigned LEB128 varint. */
+
+ while (value >= 0x80) {
+    data.push_back ((unsigned char) (value | 0x80));
+    value >>= 7;
+ }
+ data.push_back ((unsigned char) value);
+}
+
+
+static void put_signed_varint (std::vector<unsigned char> &data, long long
+      value) {
+
+/* Appends value to data as a zigzag encoded varint, so that values of     *
+ * small magnitude take one byte whatever their sign.                      */
+
+ put_varint (data, ((unsigned long long) value << 1) ^ (unsigned long long)
+       (value >> 63));
+}
+
+
+static void put_string (std::vector<unsigned char> &data, char *string) {
+
+/* Appends the length of string, then its bytes, to data. */
+
+ size_t length;
+
+ length = strlen (string);
+ put_varint (data, length);
+ data.insert (data.end (), string, string + length);
+}
+
+
+static void write_padded (FILE *fp, void *data, size_t size) {
+
+/* Writes size bytes of data to fp, followed by enough zeros to end at a   *
+ * multiple of 8 bytes.                                                    */
+
+ static const char zeros[8] = {0, 0, 0, 0, 0, 0, 0, 0};
+
+ if (size > 0)
+    fwrite (data, 1, size, fp);
+ if (size % 8 != 0)
+    fwrite (zeros, 1, 8 - size % 8, fp);
+}
+
+
+void print_route_binary (char *route_file) {
+
+/* Writes the routing to file route_file in the binary format described   *
+ * in route_file.h.                                                        */
+
+ int inet, inode, ipin, bnum, blk_pin, iclass, num_nodes, index, prev_index;
+ int *node_index;
+ struct s_trace *tptr;
+ t_route_file_header header;
+ t_route_file_node node;
+ std::vector<t_route_file_node> nodes;
+ std::vector<long long> net_offsets (num_nets + 1);
+ std::vector<unsigned char> data, trace;
+ FILE *fp;
+
+/* Number the rr_nodes used by the routing in order of rr_node index. */
+
+ node_index = (int *) my_malloc (num_rr_nodes * sizeof (int));
+ for (inode=0;inode<num_rr_nodes;inode++)
+    node_index[inode] = OPEN;
+
+ for (inet=0;inet<num_nets;inet++)
+    for (tptr=trace_head[inet];tptr!=NULL;tptr=tptr->next)
+       node_index[tptr->index] = 0;
+
+ num_nodes = 0;
+ for (inode=0;inode<num_rr_nodes;inode++) {
+    if (node_index[inode] == OPEN)
+       continue;
+
+    node.inode = inode;
+    node.xlow = rr_node[inode].xlow;
+    node.xhigh = rr_node[inode].xhigh;
+    node.ylow = rr_node[inode].ylow;
+    node.yhigh = rr_node[inode].yhigh;
+    node.ptc_num = rr_node[inode].ptc_num;
+    node.type = (char) rr_node[inode].type;
+    node.is_pad = (clb[node.xlow][node.ylow].type != CLB);
+    nodes.push_back (node);
+    node_index[inode] = num_nodes++;
+ }
+
+ for (inet=0;inet<num_nets;inet++) {
+    net_offsets[inet] = data.size ();
+    put_string (data, net[inet].name);
+    put_varint (data, is_global[inet] ? 1 : 0);
+
+    if (is_global[inet] == FALSE) {
+       trace.clear ();
+       prev_index = 0;
+       for (tptr=trace_head[inet];tptr!=NULL;tptr=tptr->next) {
+          index = node_index[tptr->index];
+          put_signed_varint (trace, index - prev_index);
+          prev_index = index;
+       }
+       put_varint (data, trace.size ());
+       data.insert (data.end (), trace.begin (), trace.end ());
+    }
+
+    else {    /* Global net.  Never routed. */
+       put_varint (data, net[inet].num_pins);
+       for (ipin=0;ipin<net[inet].num_pins;ipin++) {
+          bnum = net[inet].blocks[ipin];
+          if (block[bnum].type == CLB) {
+             blk_pin = net[inet].blk_pin[ipin];
+             iclass = clb_pin_class[blk_pin];
+          }
+          else {              /* IO pad */
+             iclass = OPEN;   /* Class not relevant */
+          }
+
+          put_string (data, block[bnum].name);
+          put_varint (data, bnum);
+          put_varint (data, block[bnum].x);
+          put_varint (data, block[bnum].y);
+          put_signed_varint (data, iclass);
+       }
+    }
+ }
+ net_offsets[num_nets] = data.size ();
+ free (node_index);
+
+ memset (&header, 0, sizeof (header));
+ strncpy (header.magic, ROUTE_FILE_MAGIC, 8);
+ header.version = ROUTE_FILE_VERSION;
+ header.nx = nx;
+ header.ny = ny;
+ header.num_nets = num_nets;
+ header.num_nodes = num_nodes;
+ header.net_data_size = data.size ();
+
+ fp = my_fopen (route_file, "wb", 0);
+ write_padded (fp, &header, sizeof (header));
+ write_padded (fp, nodes.empty () ? NULL : &nodes[0], nodes.size () *
+       sizeof (t_route_file_node));
+ write_padded (fp, &net_offsets[0], net_offsets.size () * sizeof (long
+       long));
+ write_padded (fp, data.empty () ? NULL : &data[0], data.size ());
+ fclose (fp);
+}
@@ -0,0 +1,45 @@
+#ifndef ROUTE_FILE_INCLUDED    /* Only include once. */
+#define ROUTE_FILE_INCLUDED 1
+
+#define ROUTE_FILE_MAGIC "CYVPRRTE"
+#define ROUTE_FILE_VERSION 1
+
+typedef struct {char magic[8]; int version; int nx; int ny; int num_nets;
+      int num_nodes; int padding; long long net_data_size;
+      } t_route_file_header;
+
+typedef struct {int inode; short xlow; short xhigh; short ylow; short yhigh;
+      short ptc_num; char type; char is_pad; } t_route_file_node;
+
+/* Binary routing file written by print_route_binary, as a compact and much *
+ * faster to write alternative to the text file written by print_route.    *
+ * The file holds the following sections, each starting at a multiple of   *
+ * 8 bytes (padded with zeros), so that the fixed-size sections can be     *
+ * read directly from a memory-mapped file:                                *
+ *                                                                          *
+ *  - A t_route_file_header.  magic and version identify the format.  nx   *
+ *    and ny are the size of the logic block array.                        *
+ *  - num_nodes t_route_file_node records, one for each rr_node used by    *
+ *    the routing, in order of rr_node index (inode).  type holds a        *
+ *    t_rr_type, and is_pad is 1 if the node is on an IO pad rather than a *
+ *    logic block.  The other fields are copies of those of rr_node.       *
+ *  - num_nets+1 long long offsets of the record of each net into the net  *
+ *    data, with a final entry for its size (net_data_size).               *
+ *  - The net data: a record for each net, made of unsigned LEB128 varints *
+ *    (7 bits per byte, least significant first, high bit set on all but   *
+ *    the last byte).  Signed values are zigzag encoded first.  Each       *
+ *    record holds the length and bytes of the net name, and whether the   *
+ *    net is global.  A routed net then holds the size in bytes of its     *
+ *    traceback, followed by one varint for each traceback element: the    *
+ *    signed difference between the index of its node into the node       *
+ *    records and that of the previous element (or 0, for the first).  A   *
+ *    global net, which is never routed, holds its number of pins, then    *
+ *    for each pin the length and bytes of its block name, the block       *
+ *    index, x and y, and the (signed) pin class.                          *
+ *                                                                          *
+ * The file holds everything needed to rewrite it in the text format of   *
+ * print_route (see cyvpr.result.route_file).                              */
+
+void print_route_binary (char *route_file);
+
+#endif
@@ -0,0 +1,300 @@
+#include <stdio.h>
+#include <pthread.h>
+#include <exception>
+#include "util.h"
+#include "vpr_types.h"
+#include "globals.h"
+#include "route_common.h"
+#include "route_tree_timing.h"
+#include "route_parallel.h"
+
+/* This module lets the routers route the nets of one Pathfinder iteration  *
+ * on several threads.  The maze router only looks at (and only changes the *
+ * occupancy and costs of) rr_nodes that overlap the route_bb of the net    *
+ * being routed, so two nets can be routed at the same time if no rr_node   *
+ * overlaps both of their bounding boxes.  Nets are routed level by level   *
+ * (see t_route_schedule), so the routing is the same as the routing found  *
+ * by routing the nets one after another, whatever the number of threads.   */
+
+
+/********************** Types local to this module ***************************/
+
+typedef struct s_parallel_route {t_route_schedule *schedule; boolean
+      (*route_net) (int inet, void *net_data); int *next_net;
+      pthread_mutex_t start_lock; pthread_barrier_t barrier; volatile int
+      failed; pthread_mutex_t error_lock; std::exception_ptr error;}
+      t_parallel_route;
+
+/* State shared by all the threads routing one iteration.                   *
+ * route_net:  Routes one net with the data of the calling thread.          *
+ *             Returns FALSE if the net cannot be routed.                   *
+ * next_net:  [0..num_levels-1].  Index (within its level) of the next net  *
+ *            of each level to be routed.                                   *
+ * start_lock:  Held by the calling thread until all the threads have been  *
+ *              created, so the barrier can be resized if some could not.   *
+ * barrier:  Stops threads from starting a level before the previous level  *
+ *           has been completely routed.                                    *
+ * failed:  Has any net been found to be unroutable (or thrown an error)?   *
+ * error:  First exception thrown while routing a net, rethrown by the      *
+ *         calling thread once all the threads are done.                   */
+
+typedef struct s_route_worker {t_parallel_route *parallel_route; void
+      *net_data; t_route_context *context; pthread_t thread;} t_route_worker;
+
+/* One thread routing nets.  context is the route context of the thread,    *
+ * or NULL for the calling thread, which uses the shared context.           */
+
+
+/********************** Subroutines local to this module *********************/
+
+static int get_max_rr_node_span (void);
+
+static void *route_levels (void *arg);
+
+
+
+/************************** Subroutine definitions ***************************/
+
+t_route_schedule *alloc_and_load_route_schedule (void) {
+
+/* Groups the non-global nets into levels, using their current route_bb.   *
+ * The level of a net is one more than the highest level of the lower-     *
+ * numbered nets that conflict with it.  Two nets conflict if an rr_node   *
+ * could overlap both of their bounding boxes, i.e. if the gaps between    *
+ * their bounding boxes in x and in y are both no larger than the longest  *
+ * rr_node.  The highest level of the nets conflicting with each location  *
+ * is kept in a grid, so each net only needs to look at its own bounding   *
+ * box.  The number of nets in each level is recorded in the routing       *
+ * statistics of the current route (g_route_state.nets_per_level).        */
+
+ int inet, ilevel, span, x, y, xmin, xmax, ymin, ymax, index;
+ int *net_level, *num_nets_in_level, **grid_level;
+ t_route_schedule *schedule;
+
+ span = get_max_rr_node_span ();
+ grid_level = (int **) alloc_matrix (0, nx+1, 0, ny+1, sizeof (int));
+ for (x=0;x<=nx+1;x++)
+    for (y=0;y<=ny+1;y++)
+       grid_level[x][y] = -1;
+
+ net_level = (int *) my_malloc (num_nets * sizeof (int));
+ schedule = (t_route_schedule *) my_malloc (sizeof (t_route_schedule));
+ schedule->num_levels = 0;
+
+ for (inet=0;inet<num_nets;inet++) {
+    net_level[inet] = OPEN;
+    if (is_global[inet])
+       continue;
+
+    ilevel = 0;
+    for (x=route_bb[inet].xmin;x<=route_bb[inet].xmax;x++)
+       for (y=route_bb[inet].ymin;y<=route_bb[inet].ymax;y++)
+          ilevel = my_max (ilevel, grid_level[x][y] + 1);
+    net_level[inet] = ilevel;
+    schedule->num_levels = my_max (schedule->num_levels, ilevel + 1);
+
+ /* Any later net whose bounding box comes within span of this one's must *
+  * be routed after it.                                                   */
+
+    xmin = my_max (route_bb[inet].xmin - span, 0);
+    xmax = my_min (route_bb[inet].xmax + span, nx+1);
+    ymin = my_max (route_bb[inet].ymin - span, 0);
+    ymax = my_min (route_bb[inet].ymax + span, ny+1);
+    for (x=xmin;x<=xmax;x++)
+       for (y=ymin;y<=ymax;y++)
+          grid_level[x][y] = my_max (grid_level[x][y], ilevel);
+ }
+
+ free_matrix (grid_level, 0, nx+1, 0, sizeof (int));
+
+/* Sort the nets by level (counting sort, so each level stays in net order). */
+
+ num_nets_in_level = (int *) my_calloc (schedule->num_levels + 1,
+       sizeof (int));
+ for (inet=0;inet<num_nets;inet++)
+    if (net_level[inet] != OPEN)
+       num_nets_in_level[net_level[inet]]++;
+
+ schedule->level_start = (int *) my_malloc ((schedule->num_levels + 1) *
+       sizeof (int));
+ schedule->level_start[0] = 0;
+ g_route_state.nets_per_level.clear ();
+ for (ilevel=0;ilevel<schedule->num_levels;ilevel++) {
+    schedule->level_start[ilevel+1] = schedule->level_start[ilevel] +
+          num_nets_in_level[ilevel];
+    g_route_state.nets_per_level.push_back (num_nets_in_level[ilevel]);
+    num_nets_in_level[ilevel] = 0;
+ }
+
+ schedule->level_nets = (int *) my_malloc (my_max (1,
+       schedule->level_start[schedule->num_levels]) * sizeof (int));
+ for (inet=0;inet<num_nets;inet++) {
+    ilevel = net_level[inet];
+    if (ilevel != OPEN) {
+       index = schedule->level_start[ilevel] + num_nets_in_level[ilevel];
+       schedule->level_nets[index] = inet;
+       num_nets_in_level[ilevel]++;
+    }
+ }
+
+ free (num_nets_in_level);
+ free (net_level);
+ return (schedule);
+}
+
+
+void free_route_schedule (t_route_schedule *schedule) {
+
+ free (schedule->level_start);
+ free (schedule->level_nets);
+ free (schedule);
+}
+
+
+static int get_max_rr_node_span (void) {
+
+/* Returns the largest number of grid units spanned by any rr_node in x or *
+ * in y (e.g. one less than the length of the longest segment).            */
+
+ int inode, span;
+
+ span = 0;
+ for (inode=0;inode<num_rr_nodes;inode++) {
+    span = my_max (span, rr_node[inode].xhigh - rr_node[inode].xlow);
+    span = my_max (span, rr_node[inode].yhigh - rr_node[inode].ylow);
+ }
+
+ return (span);
+}
+
+
+boolean route_nets_in_parallel (t_route_schedule *schedule, int num_threads,
+       boolean (*route_net) (int inet, void *net_data), void **thread_data) {
+
+/* Routes every net in schedule once by calling route_net, on num_threads   *
+ * threads (including the calling thread).  thread_data[0..num_threads-1]   *
+ * is passed to route_net by each thread; the calling thread uses           *
+ * thread_data[0].  The other threads each route with their own route      *
+ * context, whose base costs start from the current rr_indexed_data.        *
+ * Returns FALSE if any net could not be routed, TRUE otherwise.  If        *
+ * routing a net throws an exception, the first one is rethrown once all    *
+ * the threads have stopped.                                                */
+
+ int ithread, num_created;
+ t_parallel_route parallel_route;
+ t_route_worker *workers;
+
+ num_threads = my_max (num_threads, 1);
+
+ parallel_route.schedule = schedule;
+ parallel_route.route_net = route_net;
+ parallel_route.next_net = (int *) my_calloc (my_max (1,
+       schedule->num_levels), sizeof (int));
+ parallel_route.failed = FALSE;
+ pthread_mutex_init (&parallel_route.start_lock, NULL);
+ pthread_mutex_init (&parallel_route.error_lock, NULL);
+
+ workers = (t_route_worker *) my_malloc (num_threads *
+       sizeof (t_route_worker));
+
+ for (ithread=0;ithread<num_threads;ithread++) {
+    workers[ithread].parallel_route = &parallel_route;
+    workers[ithread].net_data = thread_data[ithread];
+    if (ithread == 0)
+       workers[ithread].context = NULL;
+    else
+       workers[ithread].context = alloc_route_context ();
+ }
+
+ /* The threads wait for start_lock before using the barrier, so if a      *
+  * thread cannot be created, the nets are routed on the threads that were. */
+
+ pthread_mutex_lock (&parallel_route.start_lock);
+ for (num_created=1;num_created<num_threads;num_created++) {
+    if (pthread_create (&workers[num_created].thread, NULL, route_levels,
+             &workers[num_created]) != 0) {
+       my_printf ("Warning in route_nets_in_parallel:  could not create "
+               "router thread %d.  Routing on %d threads.\n", num_created,
+               num_created);
+       break;
+    }
+ }
+ pthread_barrier_init (&parallel_route.barrier, NULL, num_created);
+ pthread_mutex_unlock (&parallel_route.start_lock);
+
+ route_levels (&workers[0]);
+
+ for (ithread=1;ithread<num_threads;ithread++) {
+    if (ithread < num_created)
+       pthread_join (workers[ithread].thread, NULL);
+    free_route_context (workers[ithread].context);
+ }
+
+ pthread_barrier_destroy (&parallel_route.barrier);
+ pthread_mutex_destroy (&parallel_route.start_lock);
+ pthread_mutex_destroy (&parallel_route.error_lock);
+ free (parallel_route.next_net);
+ free (workers);
+
+ if (parallel_route.error)
+    std::rethrow_exception (parallel_route.error);
+
+ return (parallel_route.failed ? FALSE : TRUE);
+}
+
+
+static void *route_levels (void *arg) {
+
+/* Thread body of route_nets_in_parallel.  Takes nets from each level in   *
+ * turn until the level is empty, then waits for the other threads to      *
+ * finish the level.  An exception thrown while routing a net is kept for  *
+ * the calling thread, since it cannot leave this thread.                  */
+
+ int ilevel, inet, index, num_nets_in_level;
+ t_route_worker *worker;
+ t_parallel_route *parallel_route;
+ t_route_schedule *schedule;
+
+ worker = (t_route_worker *) arg;
+ parallel_route = worker->parallel_route;
+ schedule = parallel_route->schedule;
+
+ pthread_mutex_lock (&parallel_route->start_lock);
+ pthread_mutex_unlock (&parallel_route->start_lock);
+
+ if (worker->context != NULL)
+    set_route_context (worker->context);
+
+ for (ilevel=0;ilevel<schedule->num_levels;ilevel++) {
+    num_nets_in_level = schedule->level_start[ilevel+1] -
+          schedule->level_start[ilevel];
+
+    while (!parallel_route->failed) {
+       index = __sync_fetch_and_add (&parallel_route->next_net[ilevel], 1);
+       if (index >= num_nets_in_level)
+          break;
+
+       inet = schedule->level_nets[schedule->level_start[ilevel] + index];
+       try {
+          if (!parallel_route->route_net (inet, worker->net_data))
+             parallel_route->failed = TRUE;
+       }
+       catch (...) {
+          pthread_mutex_lock (&parallel_route->error_lock);
+          if (!parallel_route->error)
+             parallel_route->error = std::current_exception ();
+          pthread_mutex_unlock (&parallel_route->error_lock);
+          parallel_route->failed = TRUE;
+       }
+    }
+
+    pthread_barrier_wait (&parallel_route->barrier);
+ }
+
+ if (worker->context != NULL) {
+    free_route_tree_free_lists ();
+    set_route_context (NULL);
+ }
+
+ return (NULL);
+}
@@ -0,0 +1,26 @@
+/*********** Types and subroutines exported by route_parallel.cpp ***********/
+
+typedef struct s_route_schedule {int num_levels; int *level_start; int
+      *level_nets;} t_route_schedule;
+
+/* Order in which the non-global nets can be routed concurrently, while     *
+ * giving exactly the same routing as routing them one after another in    *
+ * order of net number.  Nets are grouped into levels:  two nets whose      *
+ * routing could use (or change the cost of) the same rr_node are in       *
+ * different levels, and the lower-numbered net is in the lower level.     *
+ * The nets of one level can therefore be routed in any order (or at the   *
+ * same time), as long as all the nets of the previous levels are routed   *
+ * first.                                                                  *
+ *                                                                         *
+ * num_levels:  Number of levels.                                          *
+ * level_start:  [0..num_levels].  The nets of level ilevel are            *
+ *               level_nets[level_start[ilevel]..level_start[ilevel+1]-1]. *
+ * level_nets:  Non-global nets, sorted by level, then by net number.      */
+
+
+t_route_schedule *alloc_and_load_route_schedule (void);
+
+void free_route_schedule (t_route_schedule *schedule);
+
+boolean route_nets_in_parallel (t_route_schedule *schedule, int num_threads,
+       boolean (*route_net) (int inet, void *net_data), void **thread_data);
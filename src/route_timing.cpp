@@ -5,15 +5,44 @@
 #include "globals.h"
 #include "route_export.h"
 #include "route_common.h"
+#include "rr_graph_csr.h"
 #include "route_tree_timing.h"
 #include "route_timing.h"
+#include "route_parallel.h"
 #include "heapsort.h"
 #include "path_delay.h"
 #include "net_delay.h"
+#include "VprError.hpp"
+
+
+/********************** Types local to route_timing.c ************************/
+
+typedef struct s_timing_net_data {int itry; float pres_fac; float T_crit;
+      struct s_router_opts *router_opts; float **net_slack; float
+      **net_delay; float *routed_criticality; float *pin_criticality; int
+      *sink_order; t_rt_node **rt_node_of_sink; int num_nets_routed;}
+      t_timing_net_data;
+
+/* Everything one thread needs to route a net with timing_driven_route_net *
+ * (see timing_driven_route_net_data).  When the nets are routed in        *
+ * parallel (see route_parallel.c), each thread has its own                *
+ * pin_criticality, sink_order and rt_node_of_sink.                        *
+ * routed_criticality:  [0..num_nets-1].  Largest sink criticality of each *
+ *                      net when it was last routed.  Shared by threads.   *
+ * num_nets_routed:  Number of nets this thread has routed (rather than    *
+ *                   skipped) in the current iteration.                    */
 
 
 /******************** Subroutines local to route_timing.c ********************/
 
+static boolean timing_driven_route_net_data (int inet, void *net_data);
+
+static float get_net_criticality (int inet, float *net_slack, float T_crit,
+        float max_criticality, float criticality_exp);
+
+static void alloc_timing_driven_net_arrays (float **pin_criticality_ptr,
+            int **sink_order_ptr, t_rt_node ***rt_node_of_sink_ptr);
+
 static int get_max_pins_per_net (void);
 
 static void add_route_tree_to_heap (t_rt_node *rt_node, int target_node,
@@ -23,6 +52,10 @@ static void timing_driven_expand_neighbours (struct s_heap *current, int inet,
           float bend_cost, float criticality_fac, int target_node, float
           astar_fac);
 
+static void timing_driven_expand_csr_neighbours (struct s_heap *current, int
+          inet, float bend_cost, float criticality_fac, int target_node,
+          float astar_fac);
+
 static float get_timing_driven_expected_cost (int inode, int target_node,
               float criticality_fac, float R_upstream);
 
@@ -43,16 +76,59 @@ boolean try_timing_driven_route (struct s_router_opts router_opts, float
  * must have already been allocated, and net_delay must have been allocated. *
  * Returns TRUE if the routing succeeds, FALSE otherwise.                    */
 
- int itry, inet, ipin;
- boolean success, is_routable, rip_up_local_opins;
+ int itry, inet, ipin, ithread, last_net, num_nets_routed;
+ boolean success, is_routable, rip_up_local_opins, keep_routing;
  float *pin_criticality;        /* [1..max_pins_per_net-1]. */
  int *sink_order;               /* [1..max_pins_per_net-1]. */
  t_rt_node **rt_node_of_sink;   /* [1..max_pins_per_net-1]. */
  float T_crit, pres_fac;
+ float *routed_criticality;     /* [0..num_nets-1]. */
+ t_route_schedule *schedule;
+ t_timing_net_data *net_data;   /* [0..route_threads-1]. */
+ void **thread_data;            /* [0..route_threads-1]. */
 
  alloc_timing_driven_route_structs (&pin_criticality, &sink_order,
              &rt_node_of_sink);
 
+ routed_criticality = (float *) my_calloc (num_nets, sizeof (float));
+
+/* Each thread routing nets has its own copy of the per-net arrays; nets   *
+ * are routed on several threads only if more than one is requested.       */
+
+ net_data = (t_timing_net_data *) my_malloc (router_opts.route_threads *
+       sizeof (t_timing_net_data));
+ thread_data = (void **) my_malloc (router_opts.route_threads *
+       sizeof (void *));
+
+ for (ithread=0;ithread<router_opts.route_threads;ithread++) {
+    net_data[ithread].router_opts = &router_opts;
+    net_data[ithread].net_slack = net_slack;
+    net_data[ithread].net_delay = net_delay;
+    net_data[ithread].routed_criticality = routed_criticality;
+    if (ithread == 0) {    /* The calling thread uses the arrays above. */
+       net_data[ithread].pin_criticality = pin_criticality;
+       net_data[ithread].sink_order = sink_order;
+       net_data[ithread].rt_node_of_sink = rt_node_of_sink;
+    }
+    else {
+       alloc_timing_driven_net_arrays (&net_data[ithread].pin_criticality,
+             &net_data[ithread].sink_order,
+             &net_data[ithread].rt_node_of_sink);
+    }
+    thread_data[ithread] = &net_data[ithread];
+ }
+
+ schedule = NULL;
+ last_net = OPEN;
+
+ if (router_opts.route_threads > 1) {
+    schedule = alloc_and_load_route_schedule ();
+
+    for (inet=0;inet<num_nets;inet++)
+       if (is_global[inet] == FALSE)
+          last_net = inet;
+ }
+
 /* First do one routing iteration ignoring congestion and marking all sinks  *
  * on each net as critical to get reasonable net delay estimates.            */
 
@@ -69,29 +145,54 @@ boolean try_timing_driven_route (struct s_router_opts router_opts, float
 
  T_crit = 1.;
  pres_fac = router_opts.first_iter_pres_fac;  /* Typically 0 -> ignore cong. */
+ success = FALSE;
 
  for (itry=1;itry<=router_opts.max_router_iterations;itry++) {
 
-    for (inet=0;inet<num_nets;inet++) {
-       if (is_global[inet] == FALSE) {    /* Skip global nets. */
+    for (ithread=0;ithread<router_opts.route_threads;ithread++) {
+       net_data[ithread].itry = itry;
+       net_data[ithread].pres_fac = pres_fac;
+       net_data[ithread].T_crit = T_crit;
+       net_data[ithread].num_nets_routed = 0;
+    }
+
+    if (schedule != NULL) {
+       is_routable = route_nets_in_parallel (schedule,
+                  router_opts.route_threads, timing_driven_route_net_data,
+                  thread_data);
 
-          is_routable = timing_driven_route_net (inet, pres_fac,
-                  router_opts.max_criticality, router_opts.criticality_exp,
-                  router_opts.astar_fac, router_opts.bend_cost,
-                  net_slack[inet], pin_criticality, sink_order,
-                  rt_node_of_sink, T_crit, net_delay[inet]);
+      /* Leave the base costs set for the last net, as routing the nets in *
+       * order would.                                                      */
 
-         /* Impossible to route? (disconnected rr_graph) */
+       if (is_routable && last_net != OPEN)
+          update_rr_base_costs (last_net, 0.);
+    }
 
-          if (!is_routable) {
-             my_printf ("Routing failed.\n");
-             free_timing_driven_route_structs (pin_criticality, sink_order,
-                          rt_node_of_sink);
-             return (FALSE);
+    else {
+       is_routable = TRUE;
+       for (inet=0;inet<num_nets;inet++) {
+          if (is_global[inet] == FALSE) {    /* Skip global nets. */
+             is_routable = timing_driven_route_net_data (inet, &net_data[0]);
+             if (!is_routable)
+                break;
           }
        }
     }
 
+   /* Impossible to route? (disconnected rr_graph) */
+
+    if (!is_routable)
+       break;
+
+    num_nets_routed = 0;
+    for (ithread=0;ithread<router_opts.route_threads;ithread++)
+       num_nets_routed += net_data[ithread].num_nets_routed;
+    g_route_state.nets_rerouted.push_back (num_nets_routed);
+
+    if (router_opts.incremental_reroute)
+       my_printf ("Routing iteration %d rerouted %d nets.\n", itry,
+               num_nets_routed);
+
    /* Make sure any CLB OPINs used up by subblocks being hooked directly     *
     * to them are reserved for that purpose.                                 */
 
@@ -116,17 +217,19 @@ boolean try_timing_driven_route (struct s_router_opts router_opts, float
     g_route_state.critical_path_delay = T_crit;
 
     success = feasible_routing ();
+    keep_routing = record_routing_iteration (pres_fac, success);
 
     if (success) {
        my_printf("Successfully routed after %d routing iterations.\n", itry);
-       free_timing_driven_route_structs (pin_criticality, sink_order,
-                     rt_node_of_sink);
 #ifdef DEBUG
        timing_driven_check_net_delays (net_delay);
 #endif
-       return (TRUE);
+       break;
     }
 
+    if (!keep_routing || should_abort_routing (&router_opts, itry))
+       break;
+
     if (itry == 1) {
        pres_fac = router_opts.initial_pres_fac;
        pathfinder_update_cost (pres_fac, 0.);  /* Acc_fac=0 for first iter. */
@@ -137,10 +240,84 @@ boolean try_timing_driven_route (struct s_router_opts router_opts, float
     }
  }
 
- my_printf ("Routing failed.\n");
+ if (!success)
+    my_printf ("Routing failed.\n");
+
+ if (schedule != NULL)
+    free_route_schedule (schedule);
+ for (ithread=1;ithread<router_opts.route_threads;ithread++) {
+    free (net_data[ithread].pin_criticality + 1);   /* Starts at index 1. */
+    free (net_data[ithread].sink_order + 1);
+    free (net_data[ithread].rt_node_of_sink + 1);
+ }
+ free (net_data);
+ free (thread_data);
+ free (routed_criticality);
  free_timing_driven_route_structs (pin_criticality, sink_order,
                   rt_node_of_sink);
- return (FALSE);
+ return (success);
+}
+
+
+static boolean timing_driven_route_net_data (int inet, void *net_data) {
+
+/* Routes net inet with the router options, slacks and arrays in net_data *
+ * (a t_timing_net_data), unless the router is only rerouting the nets    *
+ * that need it and this net does not.  Returns FALSE only if the net     *
+ * cannot be routed.  Called for every non-global net of each iteration,  *
+ * possibly by route_nets_in_parallel.                                    */
+
+ t_timing_net_data *data;
+ struct s_router_opts *router_opts;
+ float criticality;
+
+ data = (t_timing_net_data *) net_data;
+ router_opts = data->router_opts;
+
+ criticality = get_net_criticality (inet, data->net_slack[inet],
+       data->T_crit, router_opts->max_criticality,
+       router_opts->criticality_exp);
+
+/* After the first iteration, an incremental router only rips up nets     *
+ * that use an overused rr_node, or whose criticality has changed by more *
+ * than reroute_crit_change since they were last routed.                  */
+
+ if (router_opts->incremental_reroute && data->itry > 1 &&
+       !net_uses_overused_node (inet) &&
+       (router_opts->reroute_crit_change < 0. ||
+        fabs (criticality - data->routed_criticality[inet]) <=
+        router_opts->reroute_crit_change))
+    return (TRUE);
+
+ data->routed_criticality[inet] = criticality;
+ data->num_nets_routed++;
+
+ return (timing_driven_route_net (inet, data->pres_fac,
+           router_opts->max_criticality, router_opts->criticality_exp,
+           router_opts->astar_fac, router_opts->bend_cost,
+           data->net_slack[inet], data->pin_criticality, data->sink_order,
+           data->rt_node_of_sink, data->T_crit, data->net_delay[inet]));
+}
+
+
+static float get_net_criticality (int inet, float *net_slack, float T_crit,
+        float max_criticality, float criticality_exp) {
+
+/* Returns the largest criticality of any sink of net inet, computed the  *
+ * same way as in timing_driven_route_net.                                */
+
+ int ipin;
+ float pin_crit, largest_criticality;
+
+ largest_criticality = 0.;
+ for (ipin=1;ipin<net[inet].num_pins;ipin++) {
+    pin_crit = my_max(max_criticality - net_slack[ipin] / T_crit, 0.);
+    pin_crit = pow (pin_crit, criticality_exp);
+    pin_crit = my_min(pin_crit, max_criticality);
+    largest_criticality = my_max (largest_criticality, pin_crit);
+ }
+
+ return (largest_criticality);
 }
 
 
@@ -149,6 +326,17 @@ void alloc_timing_driven_route_structs (float **pin_criticality_ptr,
 
 /* Allocates all the structures needed only by the timing-driven router.   */
 
+ alloc_timing_driven_net_arrays (pin_criticality_ptr, sink_order_ptr,
+             rt_node_of_sink_ptr);
+ alloc_route_tree_timing_structs ();
+}
+
+
+static void alloc_timing_driven_net_arrays (float **pin_criticality_ptr,
+            int **sink_order_ptr, t_rt_node ***rt_node_of_sink_ptr) {
+
+/* Allocates the arrays used by timing_driven_route_net to route one net.  */
+
  int max_pins_per_net;
  float *pin_criticality;
  int *sink_order;
@@ -165,8 +353,6 @@ void alloc_timing_driven_route_structs (float **pin_criticality_ptr,
  rt_node_of_sink = (t_rt_node **) my_malloc ((max_pins_per_net - 1) *
                                   sizeof (t_rt_node *));
  *rt_node_of_sink_ptr = rt_node_of_sink - 1;
-
- alloc_route_tree_timing_structs ();
 }
 
 
@@ -293,7 +479,11 @@ boolean timing_driven_route_net (int inet, float pres_fac, float
           if (old_tcost > 0.99 * HUGE_FLOAT)   /* First time touched. */
              add_to_mod_list (&rr_node_route_inf[inode].path_cost);
 
-          timing_driven_expand_neighbours (current, inet, bend_cost,
+          if (rr_graph_layout == RR_GRAPH_CSR)
+             timing_driven_expand_csr_neighbours (current, inet, bend_cost,
+                    target_criticality, target_node, astar_fac);
+          else
+             timing_driven_expand_neighbours (current, inet, bend_cost,
                     target_criticality, target_node, astar_fac);
        }
 
@@ -451,6 +641,88 @@ static void timing_driven_expand_neighbours (struct s_heap *current, int inet,
 }
 
 
+static void timing_driven_expand_csr_neighbours (struct s_heap *current, int
+          inet, float bend_cost, float criticality_fac, int target_node,
+          float astar_fac) {
+
+/* Same as timing_driven_expand_neighbours, but walks the compact copy of   *
+ * the rr_graph in rr_csr, so the edges of current and the fields of its    *
+ * neighbours are read from a few contiguous arrays rather than from the    *
+ * rr_node structures and their separately allocated edge arrays.           */
+
+ int iedge, first_edge, last_edge, to_node, inode, iswitch, target_x,
+     target_y;
+ short from_type, to_type;
+ float new_tot_cost, old_back_pcost, new_back_pcost, R_upstream;
+ float new_R_upstream, Tdel, cong_cost;
+ struct s_bb *bb;
+ t_rr_node_box *to_box;
+ t_rr_indexed_data *indexed_data;
+
+ inode = current->index;
+ old_back_pcost = current->backward_path_cost;
+ R_upstream = current->R_upstream;
+ first_edge = rr_csr.edge_start[inode];
+ last_edge = rr_csr.edge_start[inode+1];
+ from_type = rr_csr.type[inode];
+
+ target_x = rr_csr.box[target_node].xhigh;
+ target_y = rr_csr.box[target_node].yhigh;
+ bb = &route_bb[inet];
+ indexed_data = get_route_indexed_data ();
+
+ for (iedge=first_edge;iedge<last_edge;iedge++) {
+    to_node = rr_csr.edge_sink[iedge];
+    to_box = &rr_csr.box[to_node];
+
+    if (   to_box->xhigh < bb->xmin || to_box->xlow > bb->xmax  ||
+           to_box->yhigh < bb->ymin || to_box->ylow > bb->ymax    )
+       continue;      /* Node is outside (expanded) bounding box. */
+
+/* Prune away IPINs that lead to blocks other than the target one. */
+
+    to_type = rr_csr.type[to_node];
+    if (to_type == IPIN && (to_box->xhigh != target_x ||
+                            to_box->yhigh != target_y))
+       continue;
+
+/* Same costs as get_rr_cong_cost and timing_driven_expand_neighbours. */
+
+    cong_cost = indexed_data[rr_csr.cost_index[to_node]].base_cost *
+                rr_node_route_inf[to_node].acc_cost *
+                rr_node_route_inf[to_node].pres_cost;
+    new_back_pcost = old_back_pcost + (1. - criticality_fac) * cong_cost;
+
+    iswitch = rr_csr.edge_switch[iedge];
+    if (switch_inf[iswitch].buffered) {
+       new_R_upstream = switch_inf[iswitch].R;
+    }
+    else {
+       new_R_upstream = R_upstream + switch_inf[iswitch].R;
+    }
+
+    Tdel = rr_csr.C[to_node] * (new_R_upstream + 0.5 * rr_csr.R[to_node]);
+    Tdel += switch_inf[iswitch].Tdel;
+    new_R_upstream += rr_csr.R[to_node];
+    new_back_pcost += criticality_fac * Tdel;
+
+    if (bend_cost != 0.) {
+       if ((from_type == CHANX && to_type == CHANY) ||
+              (from_type == CHANY && to_type == CHANX))
+          new_back_pcost += bend_cost;
+    }
+
+    new_tot_cost = new_back_pcost + astar_fac *
+                      get_timing_driven_expected_cost (to_node, target_node,
+                                            criticality_fac, new_R_upstream);
+
+    node_to_heap (to_node, new_tot_cost, inode, iedge - first_edge,
+                  new_back_pcost, new_R_upstream);
+
+ }  /* End for all neighbours */
+}
+
+
 static float get_timing_driven_expected_cost (int inode, int target_node,
               float criticality_fac, float R_upstream) {
 
@@ -461,37 +733,39 @@ static float get_timing_driven_expected_cost (int inode, int target_node,
  t_rr_type rr_type;
  int cost_index, ortho_cost_index, num_segs_same_dir, num_segs_ortho_dir;
  float expected_cost, cong_cost, Tdel;
+ t_rr_indexed_data *indexed_data;
 
+ indexed_data = get_route_indexed_data ();   /* Base costs for this net. */
  rr_type = rr_node[inode].type;
 
  if (rr_type == CHANX || rr_type == CHANY) {
     num_segs_same_dir = get_expected_segs_to_target (inode, target_node,
                          &num_segs_ortho_dir);
     cost_index = rr_node[inode].cost_index;
-    ortho_cost_index = rr_indexed_data[cost_index].ortho_cost_index;
+    ortho_cost_index = indexed_data[cost_index].ortho_cost_index;
 
-    cong_cost = num_segs_same_dir * rr_indexed_data[cost_index].base_cost +
-              num_segs_ortho_dir * rr_indexed_data[ortho_cost_index].base_cost;
-    cong_cost += rr_indexed_data[IPIN_COST_INDEX].base_cost +
-                 rr_indexed_data[SINK_COST_INDEX].base_cost;
+    cong_cost = num_segs_same_dir * indexed_data[cost_index].base_cost +
+              num_segs_ortho_dir * indexed_data[ortho_cost_index].base_cost;
+    cong_cost += indexed_data[IPIN_COST_INDEX].base_cost +
+                 indexed_data[SINK_COST_INDEX].base_cost;
 
-    Tdel = num_segs_same_dir * rr_indexed_data[cost_index].T_linear +
-           num_segs_ortho_dir * rr_indexed_data[ortho_cost_index].T_linear +
+    Tdel = num_segs_same_dir * indexed_data[cost_index].T_linear +
+           num_segs_ortho_dir * indexed_data[ortho_cost_index].T_linear +
            num_segs_same_dir * num_segs_same_dir *
-           rr_indexed_data[cost_index].T_quadratic +
+           indexed_data[cost_index].T_quadratic +
            num_segs_ortho_dir * num_segs_ortho_dir *
-           rr_indexed_data[ortho_cost_index].T_quadratic +
-           R_upstream * (num_segs_same_dir * rr_indexed_data[cost_index].C_load
-             + num_segs_ortho_dir * rr_indexed_data[ortho_cost_index].C_load);
+           indexed_data[ortho_cost_index].T_quadratic +
+           R_upstream * (num_segs_same_dir * indexed_data[cost_index].C_load
+             + num_segs_ortho_dir * indexed_data[ortho_cost_index].C_load);
 
-    Tdel += rr_indexed_data[IPIN_COST_INDEX].T_linear;
+    Tdel += indexed_data[IPIN_COST_INDEX].T_linear;
 
     expected_cost = criticality_fac * Tdel + (1. - criticality_fac) * cong_cost;
     return (expected_cost);
  }
 
  else if (rr_type == IPIN) {   /* Change if you're allowing route-throughs */
-    return (rr_indexed_data[SINK_COST_INDEX].base_cost);
+    return (indexed_data[SINK_COST_INDEX].base_cost);
  }
 
  else {       /* Change this if you want to investigate route-throughs */
@@ -611,20 +885,23 @@ static void update_rr_base_costs (int inet, float largest_criticality) {
 
  float fanout, factor;
  int index;
+ t_rr_indexed_data *indexed_data;
 
  fanout = net[inet].num_pins - 1.;
  factor = sqrt (fanout);
 /* factor = fanout; */
 /* factor = 1.;    */
 
+ indexed_data = get_route_indexed_data ();
+
  for (index=CHANX_COST_INDEX_START;index<num_rr_indexed_data;index++) {
-    if (rr_indexed_data[index].T_quadratic > 0.) {  /* pass transistor */
-       rr_indexed_data[index].base_cost =
-             rr_indexed_data[index].saved_base_cost * factor;
+    if (indexed_data[index].T_quadratic > 0.) {  /* pass transistor */
+       indexed_data[index].base_cost =
+             indexed_data[index].saved_base_cost * factor;
     }
     else {
-       rr_indexed_data[index].base_cost =
-             rr_indexed_data[index].saved_base_cost;
+       indexed_data[index].base_cost =
+             indexed_data[index].saved_base_cost;
     }
  }
 }
@@ -648,21 +925,21 @@ static void timing_driven_check_net_delays (float **net_delay) {
     for (ipin=1;ipin<net[inet].num_pins;ipin++) {
        if (net_delay_check[inet][ipin] == 0.) { /* Should be only GLOBAL nets */
           if (net_delay_check[inet][ipin] != 0.) {
-             printf ("Error in timing_driven_check_net_delays: net %d pin %d."
-                     "\tIncremental calc. net_delay is %g, but from scratch "
-                     "net delay is %g.\n", inet, ipin, net_delay[inet][ipin],
-                     net_delay_check[inet][ipin]);
-             exit (1);
+             throw InternalError (Formatter () << "Error in "
+                   "timing_driven_check_net_delays: net " << inet << " pin "
+                   << ipin << ". Incremental calc. net_delay is "
+                   << net_delay[inet][ipin] << ", but from scratch net "
+                   "delay is " << net_delay_check[inet][ipin] << ".");
           }
        }
        else {
           if (fabs (1. - net_delay[inet][ipin] / net_delay_check[inet][ipin])
                           > ERROR_TOL) {
-             printf ("Error in timing_driven_check_net_delays: net %d pin %d."
-                     "\tIncremental calc. net_delay is %g, but from scratch "
-                     "net delay is %g.\n", inet, ipin, net_delay[inet][ipin],
-                     net_delay_check[inet][ipin]);
-             exit (1);
+             throw InternalError (Formatter () << "Error in "
+                   "timing_driven_check_net_delays: net " << inet << " pin "
+                   << ipin << ". Incremental calc. net_delay is "
+                   << net_delay[inet][ipin] << ", but from scratch net "
+                   "delay is " << net_delay_check[inet][ipin] << ".");
           }
        }
     }
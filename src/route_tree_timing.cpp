@@ -4,6 +4,7 @@
 #include "globals.h"
 #include "route_common.h"
 #include "route_tree_timing.h"
+#include "VprError.hpp"
 
 /* This module keeps track of the partial routing tree for timing-driven     *
  * routing.  The normal traceback structure doesn't provide enough info      *
@@ -24,10 +25,9 @@
 
 static t_rt_node **rr_node_to_rt_node = NULL;   /* [0..num_rr_nodes-1] */
 
-/* Frees lists for fast addition and deletion of nodes and edges. */
-
-static t_rt_node *rt_node_free_list = NULL;
-static t_linked_rt_edge *rt_edge_free_list = NULL;
+/* The free lists for fast addition and deletion of nodes and edges are kept *
+ * in the route_context of each thread (rt_node_free_list and               *
+ * rt_edge_free_list).                                                       */
 
 
 
@@ -59,11 +59,10 @@ void alloc_route_tree_timing_structs (void) {
 
 /* Allocates any structures needed to build the routing trees. */
 
- if (rr_node_to_rt_node != NULL || rt_node_free_list != NULL ||
-          rt_node_free_list != NULL) {
-    printf ("Error in alloc_route_tree_timing_structs: old structures "
-            "already exist.\n");
-    exit (1);
+ if (rr_node_to_rt_node != NULL || route_context->rt_node_free_list != NULL
+          || route_context->rt_edge_free_list != NULL) {
+    throw InternalError (Formatter () << "Error in "
+          "alloc_route_tree_timing_structs: old structures already exist.");
  }
 
  rr_node_to_rt_node = (t_rt_node **) my_malloc (num_rr_nodes * 
@@ -75,14 +74,23 @@ void free_route_tree_timing_structs (void) {
 
 /* Frees the structures needed to build routing trees, and really frees      *
  * (i.e. calls free) all the data on the free lists.                         */
- 
- t_rt_node *rt_node, *next_node;
- t_linked_rt_edge *rt_edge, *next_edge;
 
  free (rr_node_to_rt_node);
  rr_node_to_rt_node = NULL;
 
- rt_node = rt_node_free_list;
+ free_route_tree_free_lists ();
+}
+
+
+void free_route_tree_free_lists (void) {
+
+/* Really frees (i.e. calls free) all the data on the free lists of the      *
+ * current route context.                                                    */
+
+ t_rt_node *rt_node, *next_node;
+ t_linked_rt_edge *rt_edge, *next_edge;
+
+ rt_node = route_context->rt_node_free_list;
 
  while (rt_node != NULL) {
     next_node = rt_node->u.next;
@@ -90,9 +98,9 @@ void free_route_tree_timing_structs (void) {
     rt_node = next_node;
  }
 
- rt_node_free_list = NULL;
+ route_context->rt_node_free_list = NULL;
 
- rt_edge = rt_edge_free_list;
+ rt_edge = route_context->rt_edge_free_list;
  
  while (rt_edge != NULL) {
     next_edge = rt_edge->next;
@@ -100,7 +108,7 @@ void free_route_tree_timing_structs (void) {
     rt_edge = next_edge;
  }
 
- rt_edge_free_list = NULL;
+ route_context->rt_edge_free_list = NULL;
 }
 
 
@@ -111,10 +119,10 @@ static t_rt_node *alloc_rt_node (void) {
  
  t_rt_node *rt_node;
  
- rt_node = rt_node_free_list;
+ rt_node = route_context->rt_node_free_list;
  
  if (rt_node != NULL) {
-    rt_node_free_list = rt_node->u.next;
+    route_context->rt_node_free_list = rt_node->u.next;
  }
  else {
     rt_node = (t_rt_node *) my_malloc (sizeof (t_rt_node));
@@ -128,8 +136,8 @@ static void free_rt_node (t_rt_node *rt_node) {
  
 /* Adds rt_node to the proper free list.          */
  
- rt_node->u.next = rt_node_free_list;
- rt_node_free_list = rt_node;
+ rt_node->u.next = route_context->rt_node_free_list;
+ route_context->rt_node_free_list = rt_node;
 }
  
  
@@ -140,10 +148,10 @@ static t_linked_rt_edge *alloc_linked_rt_edge (void) {
  
  t_linked_rt_edge *linked_rt_edge;
  
- linked_rt_edge = rt_edge_free_list;
+ linked_rt_edge = route_context->rt_edge_free_list;
  
  if (linked_rt_edge != NULL) {
-    rt_edge_free_list = linked_rt_edge->next;
+    route_context->rt_edge_free_list = linked_rt_edge->next;
  }
  else {
     linked_rt_edge = (t_linked_rt_edge *) my_malloc (sizeof
@@ -158,8 +166,8 @@ static void free_linked_rt_edge (t_linked_rt_edge *rt_edge) {
  
 /* Adds the rt_edge to the rt_edge free list.                       */
  
- rt_edge->next = rt_edge_free_list;
- rt_edge_free_list = rt_edge;
+ rt_edge->next = route_context->rt_edge_free_list;
+ route_context->rt_edge_free_list = rt_edge;
 }
 
 
@@ -243,10 +251,9 @@ static t_rt_node *add_path_to_route_tree (struct s_heap *hptr, t_rt_node
  
 #ifdef DEBUG
  if (rr_node[inode].type != SINK) {
-    printf ("Error in add_path_to_route_tree.  Expected type = SINK (%d).\n", 
-             SINK);
-    my_printf ("Got type = %d.", rr_node[inode].type);
-    exit (1);
+    throw InternalError (Formatter () << "Error in add_path_to_route_tree.  "
+          "Expected type = SINK (" << SINK << ").  Got type = "
+          << rr_node[inode].type << ".");
  }
 #endif
  
@@ -388,9 +395,9 @@ static void load_new_path_R_upstream (t_rt_node *start_of_new_path_rt_node) {
 
 #ifdef DEBUG
     if (linked_rt_edge->next != NULL) {
-       printf ("Error in load_new_path_R_upstream: new routing addition is\n"
-               "a tree (not a path).\n");
-       exit (1);
+       throw InternalError (Formatter () << "Error in "
+             "load_new_path_R_upstream: new routing addition is a tree (not "
+             "a path).");
     }
 #endif
 
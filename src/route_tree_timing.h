@@ -50,6 +50,8 @@ void alloc_route_tree_timing_structs (void);
 
 void free_route_tree_timing_structs (void);
 
+void free_route_tree_free_lists (void);
+
 t_rt_node *init_route_tree_to_source (int inet);
 
 void free_route_tree (t_rt_node *rt_node);
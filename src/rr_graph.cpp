@@ -10,7 +10,9 @@
 #include "check_rr_graph.h"
 #include "rr_graph_timing_params.h"
 #include "rr_graph_indexed_data.h"
+#include "rr_graph_csr.h"
 #include <assert.h>
+#include "VprError.hpp"
 
 
 /******************* Variables local to this module. ***********************/
@@ -125,6 +127,60 @@ int get_nodes_per_chan() {
   return (rr_graph_internal_vars.nodes_per_chan);
 }
 
+void *alloc_rr_graph_chunk (size_t size) {
+
+/* Allocates size bytes in the same chunk list as the rr_graph edges, so   *
+ * the memory is released by free_rr_graph.  Used to load a cached graph.  */
+
+ return (my_chunk_malloc (size, &rr_mem_chunk_list_head, &chunk_bytes_avail,
+         &chunk_next_avail_mem));
+}
+
+
+int load_rr_graph_terminals (enum e_route_type route_type, struct
+         s_det_routing_arch det_routing_arch, t_segment_inf *segment_inf) {
+
+/* Allocates and loads the placement-dependent rr_graph structures          *
+ * (net_rr_terminals and rr_clb_source) for an rr_graph that was loaded     *
+ * rather than built, e.g. from the rr_graph cache.  The rr_node indices    *
+ * are only needed while these are loaded, so they are freed again before   *
+ * returning.  Returns the number of rr_nodes implied by the indices, which *
+ * must match num_rr_nodes for the loaded graph to be valid.                */
+
+ int nodes_per_clb, nodes_per_pad, nodes_per_chan, num_nodes;
+ int **rr_node_indices;
+ t_seg_details *seg_details_x, *seg_details_y;
+
+ nodes_per_clb = num_class + pins_per_clb;
+ nodes_per_pad = 4 * io_rat;
+
+ if (route_type == GLOBAL) {
+    nodes_per_chan = 1;
+ }
+ else {
+    nodes_per_chan = chan_width_x[0];
+ }
+
+ seg_details_x = alloc_and_load_seg_details (nodes_per_chan, segment_inf,
+                 det_routing_arch.num_segment, nx);
+ seg_details_y = alloc_and_load_seg_details (nodes_per_chan, segment_inf,
+                 det_routing_arch.num_segment, ny);
+
+ rr_node_indices = alloc_and_load_rr_node_indices (nodes_per_clb,
+         nodes_per_pad, nodes_per_chan, seg_details_x, seg_details_y);
+ num_nodes = rr_node_indices[nx+1][ny+1];
+
+ alloc_net_rr_terminals ();
+ load_net_rr_terminals (rr_node_indices, nodes_per_chan);
+ alloc_and_load_rr_clb_source (rr_node_indices, nodes_per_chan);
+
+ free_seg_details (seg_details_x, nodes_per_chan);
+ free_seg_details (seg_details_y, nodes_per_chan);
+ free_rr_node_indices (rr_node_indices);
+
+ return (num_nodes);
+}
+
 void build_rr_graph (enum e_route_type route_type, struct s_det_routing_arch
          det_routing_arch, t_segment_inf *segment_inf, t_timing_inf
          timing_inf, enum e_base_cost_type base_cost_type) {
@@ -255,6 +311,7 @@ void build_rr_graph (enum e_route_type route_type, struct s_det_routing_arch
 
 /* dump_rr_graph ("rr_graph.echo");  */
  check_rr_graph (route_type, det_routing_arch.num_switch);
+ alloc_and_load_rr_graph_csr ();
 
  rr_graph_internal_vars.clb_opin_to_tracks = clb_opin_to_tracks;
  rr_graph_internal_vars.clb_ipin_to_tracks = clb_ipin_to_tracks;
@@ -330,10 +387,10 @@ static void alloc_and_load_rr_graph (int **rr_node_indices,
  * allocated as I fill in the graph.                                    */
 
  if (rr_mem_chunk_list_head != NULL) {
-    printf("Error in alloc_and_load_rr_graph:  rr_mem_chunk_list_head = %p.\n",
-            rr_mem_chunk_list_head);
-    my_printf("Expected NULL.  It appears an old rr_graph has not been freed.\n");
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "alloc_and_load_rr_graph:  rr_mem_chunk_list_head = "
+          << rr_mem_chunk_list_head << ".  Expected NULL.  It appears an "
+          "old rr_graph has not been freed.");
  }
 
  alloc_net_rr_terminals ();
@@ -384,10 +441,9 @@ static void alloc_and_load_rr_graph (int **rr_node_indices,
        }
 
        else if (clb[i][j].type != ILLEGAL) {
-          printf ("Error in alloc_and_load_rr_graph.\n"
-                  "Block at (%d, %d) has unknown type (%d).\n", i, j,
-                   clb[i][j].type);
-          exit (1);
+          throw InternalError (Formatter () << "Error in "
+                "alloc_and_load_rr_graph.  Block at (" << i << ", " << j
+                << ") has unknown type (" << clb[i][j].type << ").");
        }
 
     }
@@ -404,6 +460,8 @@ void free_rr_graph (void) {
  * a routing graph exists and can be freed.  Hence, you can call this   *
  * routine even if you're not sure of whether a rr_graph exists or not. */
 
+ free_rr_graph_csr ();
+
  if (rr_mem_chunk_list_head == NULL)   /* Nothing to free. */
     return;
 
@@ -531,8 +589,8 @@ static int which_io_block (int iblk) {
 
 
  if (block[iblk].type != INPAD && block[iblk].type != OUTPAD) {
-    printf ("Error in which_io_block:  block %d is not an IO block.\n", iblk);
-    exit (1);
+    throw InternalError (Formatter () << "Error in which_io_block:  block "
+          << iblk << " is not an IO block.");
  }
 
  for (ipad=0;ipad<clb[i][j].occ;ipad++) {
@@ -544,9 +602,8 @@ static int which_io_block (int iblk) {
  }
 
  if (ifound < 0) {
-    printf ("Error in which_io_block:  block %d not found in clb array.\n",
-             iblk);
-    exit (1);
+    throw InternalError (Formatter () << "Error in which_io_block:  block "
+          << iblk << " not found in clb array.");
  }
 
  return (ifound);
@@ -1447,8 +1504,8 @@ static int track_side (int clb_side) {
     return (LEFT);
 
  default:
-    printf("Error:  unexpected clb_side (%d) in track_side.\n", clb_side);
-    exit (1);
+    throw InternalError (Formatter () << "Error:  unexpected clb_side ("
+          << clb_side << ") in track_side.");
  }
 }
 
@@ -14,4 +14,8 @@ void load_net_rr_terminals (int **rr_node_indices,
           int nodes_per_chan);
 int **get_rr_node_indices(void);
 int get_nodes_per_chan(void);
+void *alloc_rr_graph_chunk (size_t size);
+int load_rr_graph_terminals (enum e_route_type route_type,
+         struct s_det_routing_arch det_routing_arch,
+         t_segment_inf *segment_inf);
 
@@ -5,6 +5,7 @@
 #include "rr_graph2.h"
 #include "rr_graph_sbox.h"
 #include <assert.h>
+#include "VprError.hpp"
 
 
 /* Variables below are the global variables shared only amongst the rr_graph *
@@ -332,9 +333,8 @@ int get_clb_opin_connections (int ***clb_opin_to_tracks, int ipin, int i, int
  }
 
  if (num_conn == 0) {
-    printf ("Error:  clb output pin %d at (%d,%d) does not connect to any "
-            "tracks.\n", ipin, i, j);
-    exit (1);
+    throw InternalError (Formatter () << "Error:  clb output pin " << ipin
+          << " at (" << i << "," << j << ") does not connect to any tracks.");
  }
 
  *edge_list_ptr = edge_list_head;
@@ -383,9 +383,9 @@ int get_pad_opin_connections (int **pads_to_tracks, int ipad, int i, int j,
     seg_details = seg_details_y;
  }
  else {
-    printf ("Error in get_pad_opin_connections:  requested IO block at "
-            "(%d,%d) does not exist.\n", i, j);
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "get_pad_opin_connections:  requested IO block at (" << i << ","
+          << j << ") does not exist.");
  }
 
  edge_list_head = *edge_list_ptr;
@@ -409,9 +409,8 @@ int get_pad_opin_connections (int **pads_to_tracks, int ipad, int i, int j,
  }
 
  if (num_conn == 0) {
-    printf ("Error:  INPAD %d at (%d,%d) does not connect to any "
-            "tracks.\n", ipad, i, j);
-    exit (1);
+    throw InternalError (Formatter () << "Error:  INPAD " << ipad << " at ("
+          << i << "," << j << ") does not connect to any tracks.");
  }
 
  *edge_list_ptr = edge_list_head;
@@ -483,9 +482,8 @@ int **alloc_and_load_rr_node_indices (int nodes_per_clb,
        }
 
        else if (clb[i][j].type != ILLEGAL) {
-          printf("Error in alloc_and_load_rr_node_indices.  Unexpected clb"
-                 " type.\n");
-          exit (1);
+          throw InternalError (Formatter () << "Error in "
+                "alloc_and_load_rr_node_indices.  Unexpected clb type.");
        }
     }
  }
@@ -643,10 +641,9 @@ int get_rr_node_index (int i, int j, t_rr_type rr_type, int ioff,
        return (index);
 
     default:
-       printf ("Error:  Bad rr_node passed to get_rr_node_index.\n"
-               "Request for type %d number %d at (%d, %d).\n", rr_type,
-               ioff, i, j);
-       exit (1);
+       throw InternalError (Formatter () << "Error:  Bad rr_node passed to "
+             "get_rr_node_index.  Request for type " << rr_type << " number "
+             << ioff << " at (" << i << ", " << j << ").");
     }
     break;
 
@@ -686,17 +683,16 @@ int get_rr_node_index (int i, int j, t_rr_type rr_type, int ioff,
        return (index);
 
     default:
-       printf ("Error:  Bad rr_node passed to get_rr_node_index.\n"
-               "Request for type %d number %d at (%d, %d).\n", rr_type,
-               ioff, i, j);
-       exit (1);
+       throw InternalError (Formatter () << "Error:  Bad rr_node passed to "
+             "get_rr_node_index.  Request for type " << rr_type << " number "
+             << ioff << " at (" << i << ", " << j << ").");
     }
     break;
 
  default:
-    printf("Error in get_rr_node_index:  unexpected block type (%d) at "
-           "(%d, %d).\nrr_type: %d.\n", clb[i][j].type, i, j, rr_type);
-    exit (1);
+    throw InternalError (Formatter () << "Error in get_rr_node_index:  "
+          "unexpected block type (" << clb[i][j].type << ") at (" << i
+          << ", " << j << ").  rr_type: " << rr_type << ".");
  }
 }
 
@@ -749,9 +745,8 @@ int get_xtrack_to_clb_ipin_edges (int tr_istart, int tr_iend, int tr_j,
     clb_j = tr_j + 1;
  }
  else {
-    printf ("Error in get_xtrack_to_clb_ipin_edges:  Unknown iside: %d.\n",
-            iside);
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "get_xtrack_to_clb_ipin_edges:  Unknown iside: " << iside << ".");
  }
 
  edge_list_head = *edge_list_ptr;
@@ -797,9 +792,8 @@ int get_ytrack_to_clb_ipin_edges (int tr_jstart, int tr_jend, int tr_i,
     clb_i = tr_i + 1;
  }
  else {
-    printf ("Error in get_ytrack_to_clb_ipin_edges:  Unknown iside: %d.\n",
-            iside);
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "get_ytrack_to_clb_ipin_edges:  Unknown iside: " << iside << ".");
  }
 
  edge_list_head = *edge_list_ptr;
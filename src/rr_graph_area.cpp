@@ -5,6 +5,7 @@
 #include "globals.h"
 #include "rr_graph_util.h"
 #include "rr_graph_area.h"
+#include "VprError.hpp"
 
 
 /************************ Subroutines local to this module *******************/
@@ -179,10 +180,10 @@ void count_routing_transistors (int num_switch, float R_minW_nmos,
              break;
 
           default:
-             printf ("Error in count_routing_transistors:  Unexpected \n"
-                  "connection from node %d (type %d) to node %d (type %d).\n",
-                  from_node, from_rr_type, to_node, to_rr_type);
-             exit (1);
+             throw InternalError (Formatter () << "Error in "
+                   "count_routing_transistors:  Unexpected connection from "
+                   "node " << from_node << " (type " << from_rr_type << ") "
+                   "to node " << to_node << " (type " << to_rr_type << ").");
              break;
 
           }   /* End switch on to_rr_type. */
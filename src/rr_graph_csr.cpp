@@ -0,0 +1,111 @@
+#include <string.h>
+#include "util.h"
+#include "vpr_types.h"
+#include "globals.h"
+#include "rr_graph_csr.h"
+
+
+/****************** Variables shared by all route_files *********************/
+
+t_rr_graph_csr rr_csr = {0, 0, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+      NULL, NULL};
+
+
+/************************ Subroutine definitions ****************************/
+
+void alloc_and_load_rr_graph_csr (void) {
+
+/* Builds rr_csr from the routing resource graph in rr_node, freeing any  *
+ * old copy first.  Called whenever rr_node is built or loaded.            */
+
+ int inode, iedge, num_edges;
+
+ free_rr_graph_csr ();
+
+ num_edges = 0;
+ for (inode=0;inode<num_rr_nodes;inode++)
+    num_edges += rr_node[inode].num_edges;
+
+ rr_csr.num_nodes = num_rr_nodes;
+ rr_csr.num_edges = num_edges;
+ rr_csr.edge_start = (int *) my_malloc ((num_rr_nodes + 1) * sizeof (int));
+ rr_csr.edge_sink = (int *) my_malloc (my_max (num_edges, 1) *
+       sizeof (int));
+ rr_csr.edge_switch = (short *) my_malloc (my_max (num_edges, 1) *
+       sizeof (short));
+ rr_csr.box = (t_rr_node_box *) my_malloc (num_rr_nodes *
+       sizeof (t_rr_node_box));
+ rr_csr.type = (short *) my_malloc (num_rr_nodes * sizeof (short));
+ rr_csr.cost_index = (short *) my_malloc (num_rr_nodes * sizeof (short));
+ rr_csr.R = (float *) my_malloc (num_rr_nodes * sizeof (float));
+ rr_csr.C = (float *) my_malloc (num_rr_nodes * sizeof (float));
+ rr_csr.num_refs = (int *) my_malloc (sizeof (int));
+ *rr_csr.num_refs = 1;
+
+ iedge = 0;
+ for (inode=0;inode<num_rr_nodes;inode++) {
+    rr_csr.edge_start[inode] = iedge;
+    num_edges = rr_node[inode].num_edges;
+    if (num_edges > 0) {
+       memcpy (rr_csr.edge_sink + iedge, rr_node[inode].edges,
+             num_edges * sizeof (int));
+       memcpy (rr_csr.edge_switch + iedge, rr_node[inode].switches,
+             num_edges * sizeof (short));
+       iedge += num_edges;
+    }
+
+    rr_csr.box[inode].xlow = rr_node[inode].xlow;
+    rr_csr.box[inode].xhigh = rr_node[inode].xhigh;
+    rr_csr.box[inode].ylow = rr_node[inode].ylow;
+    rr_csr.box[inode].yhigh = rr_node[inode].yhigh;
+    rr_csr.type[inode] = rr_node[inode].type;
+    rr_csr.cost_index[inode] = rr_node[inode].cost_index;
+    rr_csr.R[inode] = rr_node[inode].R;
+    rr_csr.C[inode] = rr_node[inode].C;
+ }
+ rr_csr.edge_start[num_rr_nodes] = iedge;
+}
+
+
+void free_rr_graph_csr (void) {
+
+/* Releases rr_csr, if it has been allocated.  Its arrays are only freed   *
+ * if no copy made by hold_rr_graph_csr still holds them.                  */
+
+ release_rr_graph_csr (&rr_csr);
+}
+
+
+void hold_rr_graph_csr (t_rr_graph_csr *csr) {
+
+/* Copies rr_csr into csr, and keeps the arrays they share from being      *
+ * freed with the rr_graph until release_rr_graph_csr (csr) is called.     *
+ * Once the rr_graph is freed or rebuilt, the arrays of csr no longer      *
+ * change.  csr is left empty if there is no rr_graph.                     */
+
+ *csr = rr_csr;
+ if (csr->num_refs != NULL)
+    __sync_add_and_fetch (csr->num_refs, 1);
+}
+
+
+void release_rr_graph_csr (t_rr_graph_csr *csr) {
+
+/* Empties csr (rr_csr or a copy made by hold_rr_graph_csr), freeing the   *
+ * arrays it shares with the other copies if it is the last of them.       */
+
+ if (csr->num_refs != NULL && __sync_sub_and_fetch (csr->num_refs, 1) ==
+       0) {
+    free (csr->edge_start);
+    free (csr->edge_sink);
+    free (csr->edge_switch);
+    free (csr->box);
+    free (csr->type);
+    free (csr->cost_index);
+    free (csr->R);
+    free (csr->C);
+    free (csr->num_refs);
+ }
+
+ memset (csr, 0, sizeof (t_rr_graph_csr));
+}
@@ -0,0 +1,52 @@
+#ifndef RR_GRAPH_CSR_INCLUDED    /* Only include once. */
+#define RR_GRAPH_CSR_INCLUDED 1
+
+typedef struct {short xlow; short xhigh; short ylow; short yhigh;
+      } t_rr_node_box;
+
+/* Coordinates of the ends of a routing resource node (see t_rr_node). */
+
+typedef struct {int num_nodes; int num_edges; int *edge_start; int
+      *edge_sink; short *edge_switch; t_rr_node_box *box; short *type;
+      short *cost_index; float *R; float *C; int *num_refs; }
+      t_rr_graph_csr;
+
+/* Compact (compressed sparse row) copy of the routing resource graph in     *
+ * rr_node, with each field in its own array, so that the maze router only   *
+ * brings the fields it uses into the cache as it expands the neighbours of  *
+ * a node.  Every array is indexed by rr_node index [0..num_nodes-1], except *
+ * for the edge arrays.                                                      *
+ *                                                                           *
+ * num_nodes, num_edges:  Number of rr_nodes and of edges between them.      *
+ * edge_start[0..num_nodes]:  The edges leaving node inode are               *
+ *             [edge_start[inode]..edge_start[inode+1]-1], in the order of   *
+ *             rr_node[inode].edges.                                         *
+ * edge_sink[0..num_edges-1], edge_switch[0..num_edges-1]:  Node each edge   *
+ *             leads to, and the switch it uses.                             *
+ * box, type, cost_index, R, C:  Copies of the fields of rr_node.            *
+ *             type holds a t_rr_type.                                       *
+ * num_refs:  Number of copies of this structure (rr_csr and those made by   *
+ *             hold_rr_graph_csr) sharing its arrays, which are freed when   *
+ *             the last of them is released.                                 *
+ *                                                                           *
+ * Only the fields read as the neighbours of a node are expanded are         *
+ * copied.  The capacity and occupancy of each node stay in rr_node, and its *
+ * congestion costs in rr_node_route_inf, whichever layout the router walks. */
+
+
+/**************** Variables shared by all route_files ***********************/
+
+extern t_rr_graph_csr rr_csr;
+
+
+/****** Subroutines in rr_graph_csr.cpp used outside that file **************/
+
+void alloc_and_load_rr_graph_csr (void);
+
+void free_rr_graph_csr (void);
+
+void hold_rr_graph_csr (t_rr_graph_csr *csr);
+
+void release_rr_graph_csr (t_rr_graph_csr *csr);
+
+#endif
@@ -1,6 +1,7 @@
 #include "util.h"
 #include "vpr_types.h"
 #include "rr_graph_sbox.h"
+#include "VprError.hpp"
 
 
 /* Switch box:                                                             *
@@ -214,10 +215,10 @@ static int get_simple_switch_block_track (enum e_side from_side, enum e_side
 
 
  if (to_track == SBOX_ERROR) {
-    printf("Error in get_simple_switch_block_track.  Unexpected connection.\n"
-           "from_side: %d  to_side: %d  switch_block_type: %d.\n", from_side,
-           to_side, switch_block_type);
-    exit (1);
+    throw InternalError (Formatter () << "Error in "
+          "get_simple_switch_block_track.  Unexpected connection.  "
+          "from_side: " << from_side << "  to_side: " << to_side
+          << "  switch_block_type: " << switch_block_type << ".");
  }
 
  return (to_track);
@@ -267,8 +268,8 @@ static enum e_side get_sbox_side (int get_i, int get_j, t_rr_type get_type,
  }
 
  else {
-    printf ("Error in get_sbox_side.  Unexpected get_type: %d.\n", get_type);
-    exit (1);
+    throw InternalError (Formatter () << "Error in get_sbox_side.  "
+          "Unexpected get_type: " << get_type << ".");
  }
 
  return (side);
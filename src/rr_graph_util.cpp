@@ -2,6 +2,7 @@
 #include "vpr_types.h"
 #include "globals.h"
 #include "rr_graph_util.h"
+#include "VprError.hpp"
 
 
 
@@ -101,9 +102,8 @@ int seg_index_of_sblock (int from_node, int to_node) {
        }
     }
     else {
-       printf ("Error in seg_index_of_sblock:  to_node %d is of type %d.\n",
-               to_node, to_rr_type);
-       exit (1);
+       throw InternalError (Formatter () << "Error in seg_index_of_sblock:  "
+             "to_node " << to_node << " is of type " << to_rr_type << ".");
     }
  }    /* End from_rr_type is CHANX */
 
@@ -120,15 +120,13 @@ int seg_index_of_sblock (int from_node, int to_node) {
        } 
     } 
     else { 
-       printf ("Error in seg_index_of_sblock:  to_node %d is of type %d.\n", 
-               to_node, to_rr_type);
-       exit (1); 
+       throw InternalError (Formatter () << "Error in seg_index_of_sblock:  "
+             "to_node " << to_node << " is of type " << to_rr_type << ".");
     }
  }    /* End from_rr_type is CHANY */
 
  else {
-    printf ("Error in seg_index_of_sblock:  from_node %d is of type %d.\n", 
-            from_node, from_rr_type);
-    exit (1); 
+    throw InternalError (Formatter () << "Error in seg_index_of_sblock:  "
+          "from_node " << from_node << " is of type " << from_rr_type << ".");
  }
 }
@@ -398,3 +398,28 @@ void get_num_bends_and_length(std::vector<unsigned int> &bends,
         segments[i] = segments_i;
     }
 }
+
+
+void get_traceback_arrays(std::vector<unsigned int> &net_offsets,
+                          std::vector<int> &nodes,
+                          std::vector<short> &switches) {
+    /* Flattens the traceback of every net into nodes (rr_node index) and
+     * switches (switch type to the next element, OPEN after a SINK), with
+     * the elements of net i at [net_offsets[i], net_offsets[i + 1]).
+     * Global nets are not routed, so they have no elements. */
+    size_t net_count = num_nets;
+    struct s_trace *tptr;
+
+    net_offsets.resize(net_count + 1);
+    nodes.clear();
+    switches.clear();
+
+    for (size_t i = 0; i < net_count; i++) {
+        net_offsets[i] = nodes.size();
+        for (tptr = trace_head[i]; tptr != NULL; tptr = tptr->next) {
+            nodes.push_back(tptr->index);
+            switches.push_back(tptr->iswitch);
+        }
+    }
+    net_offsets[net_count] = nodes.size();
+}
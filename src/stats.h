@@ -14,4 +14,8 @@ void get_num_bends_and_length(std::vector<unsigned int> &bends,
                               std::vector<unsigned int> &wire_lengths,
                               std::vector<unsigned int> &segments);
 
+void get_traceback_arrays(std::vector<unsigned int> &net_offsets,
+                          std::vector<int> &nodes,
+                          std::vector<short> &switches);
+
 #endif
@@ -15,6 +15,12 @@ float **timing_place_crit;  /*available externally*/
 static struct s_linked_vptr *timing_place_crit_chunk_list_head;
 static struct s_linked_vptr *net_delay_chunk_list_head;
 
+/* net_delay and net_slack of the most recent call to                    *
+ * alloc_lookups_and_criticalities, so free_leftover_lookups_and_        *
+ * criticalities can free them without the caller's pointers.            */
+static float **lookups_net_delay = NULL;
+static float **lookups_net_slack = NULL;
+
 
 /******** prototypes ******************/
 static float **alloc_crit (struct s_linked_vptr **chunk_list_head_ptr);
@@ -128,6 +134,8 @@ void alloc_lookups_and_criticalities(t_chan_width_dist chan_width_dist,
 
   timing_place_crit = alloc_crit (&timing_place_crit_chunk_list_head);
 
+  lookups_net_delay = *net_delay;
+  lookups_net_slack = *net_slack;
 }
 
 /**************************************/
@@ -135,9 +143,24 @@ void free_lookups_and_criticalities(float ***net_delay, float ***net_slack){
 
   free(timing_place_crit);
   free_crit (&timing_place_crit_chunk_list_head);
+  timing_place_crit = NULL;
 
   free_timing_graph(*net_slack);
   free_net_delay (*net_delay, &net_delay_chunk_list_head);
 
+  free_place_lookup_structs();
+
+  lookups_net_delay = NULL;
+  lookups_net_slack = NULL;
+}
+/**************************************/
+void free_leftover_lookups_and_criticalities(void){
+
+  /* Frees the lookups, criticalities and timing graph allocated by a     *
+   * placement that never freed them _(e.g., one interrupted by an        *
+   * exception)_, if any.                                                 */
+
+  if (timing_place_crit != NULL)
+    free_lookups_and_criticalities(&lookups_net_delay, &lookups_net_slack);
 }
 /**************************************/
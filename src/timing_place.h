@@ -13,6 +13,8 @@ void load_criticalities(struct s_placer_opts placer_opts,
 
 void free_lookups_and_criticalities(float ***net_delay, float ***net_slack);
 
+void free_leftover_lookups_and_criticalities(void);
+
 void print_sink_delays(char *fname);
 extern float **timing_place_crit;
 
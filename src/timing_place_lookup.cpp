@@ -11,6 +11,7 @@
 #include "timing_place_lookup.h"
 #include "rr_graph.h"
 #include "route_export.h"
+#include "VprError.hpp"
 
 
 /*this file contains routines that generate the array containing*/
@@ -98,6 +99,8 @@ static void free_and_reset_internal_structures(struct s_net *original_net,
 					int original_num_nets,
 					int original_num_blocks);
 
+static int get_lookup_width_fac (struct s_router_opts router_opts);
+
 static void setup_chan_width (struct s_router_opts router_opts,
 		       t_chan_width_dist chan_width_dist);
 
@@ -188,7 +191,8 @@ static int  get_first_pin(enum e_pin_type pintype) {
     else
       currpin += class_inf[i].num_pins;
   }
-  exit(0); /*should never hit this line*/
+  throw InternalError (Formatter () << "Error in get_first_pin:  no "
+        "non-global pin of type " << pintype << ".");
 }
 
 /**************************************/
@@ -321,21 +325,22 @@ static void free_and_reset_internal_structures(struct s_net *original_net,
 
 }
 /**************************************/
-static void setup_chan_width (struct s_router_opts router_opts,
-		       t_chan_width_dist chan_width_dist) {
+static int get_lookup_width_fac (struct s_router_opts router_opts) {
   /*we give plenty of tracks, this increases routability for the */
   /*lookup table generation */
 
-  int width_fac;
-
   if (router_opts.fixed_channel_width == NO_FIXED_CHANNEL_WIDTH)
-    width_fac = 4 * pins_per_clb; /*this is 2x the value that binary search starts*/
-                                  /*this should be enough to allow most pins to   */
-                                  /*connect to tracks in the architecture */
+    return (4 * pins_per_clb); /*this is 2x the value that binary search starts*/
+                               /*this should be enough to allow most pins to   */
+                               /*connect to tracks in the architecture */
   else
-    width_fac = router_opts.fixed_channel_width;
+    return (router_opts.fixed_channel_width);
+}
+/**************************************/
+static void setup_chan_width (struct s_router_opts router_opts,
+		       t_chan_width_dist chan_width_dist) {
 
-  init_chan(width_fac, chan_width_dist);
+  init_chan(get_lookup_width_fac(router_opts), chan_width_dist);
 }
 /**************************************/
 static void alloc_routing_structs (struct s_router_opts router_opts,
@@ -354,6 +359,9 @@ static void alloc_routing_structs (struct s_router_opts router_opts,
 
   clb_opins_used_locally = alloc_route_structs(subblock_data);
 
+  set_heap_type(router_opts.heap_type);
+  rr_graph_layout = router_opts.rr_graph_layout;
+
   free_rr_graph();
   build_rr_graph (router_opts.route_type, det_routing_arch, segment_inf,
 		  timing_inf, router_opts.base_cost_type);
@@ -927,6 +935,16 @@ void compute_delay_lookup_tables(struct s_router_opts router_opts,
   static int original_num_blocks;
   static int longest_length;
 
+  string cache_key;
+
+  /*the lookup tables only depend on the architecture, grid size, channel */
+  /*width and router options, so they may already be in the cache         */
+  cache_key = g_place_delay_cache.key(get_lookup_width_fac(router_opts),
+				      router_opts);
+  if (g_place_delay_cache.restore(cache_key)) {
+    my_printf("Restored the placement delay lookup matrices from the cache.\n");
+    return;
+  }
 
 
   alloc_and_assign_internal_structures(&original_net,
@@ -950,6 +968,8 @@ void compute_delay_lookup_tables(struct s_router_opts router_opts,
 
   free_and_reset_internal_structures(original_net, original_block,
 				     original_num_nets, original_num_blocks);
+
+  g_place_delay_cache.save(cache_key);
 }
 
 /**************************************/
@@ -183,6 +183,226 @@ void free_chunk_memory (struct s_linked_vptr *chunk_ptr_head) {
 }
 
 
+void init_node_arena (t_node_arena *arena, size_t node_size) {
+
+/* Sets up an empty arena of nodes of node_size bytes.  No memory is       *
+ * allocated until the first node is.                                      */
+
+ t_node_arena empty_arena = NODE_ARENA_INITIALIZER (my_max (node_size,
+       sizeof (void *)));
+
+ *arena = empty_arena;
+}
+
+
+static void lock_node_arena (t_node_arena *arena) {
+ while (__sync_lock_test_and_set (&arena->lock, 1))
+    ;
+}
+
+
+static void unlock_node_arena (t_node_arena *arena) {
+ __sync_lock_release (&arena->lock);
+}
+
+
+static struct s_linked_vptr *take_spare_chunk (t_node_arena *arena) {
+
+/* Unlinks the first spare chunk of arena and returns it, or returns NULL  *
+ * if arena has no spare chunk.                                            */
+
+ struct s_linked_vptr *chunk;
+
+ lock_node_arena (arena);
+ if (arena->current_chunk == NULL) {
+    chunk = arena->chunk_head;
+    if (chunk != NULL)
+       arena->chunk_head = chunk->next;
+ }
+ else {
+    chunk = arena->current_chunk->next;
+    if (chunk != NULL)
+       arena->current_chunk->next = chunk->next;
+ }
+ if (chunk != NULL)
+    arena->num_chunks--;
+ unlock_node_arena (arena);
+ return (chunk);
+}
+
+
+void *alloc_arena_node (t_node_arena *arena) {
+
+/* Returns a node from the free list of arena if it has one, or else the   *
+ * next uncarved node of its current chunk.  A chunk is only malloced when *
+ * every chunk the arena owns has been used since the last reset, and its  *
+ * parent (if any) has no spare chunk.                                     */
+
+ void *node;
+ struct s_linked_vptr *next_chunk;
+
+ arena->num_allocs++;
+ arena->num_live++;
+
+ if (arena->free_head != NULL) {
+    node = arena->free_head;
+    arena->free_head = *(void **) node;
+    return (node);
+ }
+
+ if (arena->nodes_avail == 0) {
+    lock_node_arena (arena);
+    if (arena->current_chunk == NULL)
+       next_chunk = arena->chunk_head;
+    else
+       next_chunk = arena->current_chunk->next;
+
+    if (next_chunk == NULL) {      /* Out of chunks.  Take or malloc one. */
+       if (arena->parent != NULL)
+          next_chunk = take_spare_chunk (arena->parent);
+       if (next_chunk == NULL) {
+          next_chunk = (struct s_linked_vptr *) my_malloc (sizeof (struct
+                s_linked_vptr));
+          next_chunk->data_vptr = my_malloc (arena->nodes_per_chunk *
+                arena->node_size);
+          arena->num_chunk_allocs++;
+       }
+       next_chunk->next = NULL;
+       if (arena->current_chunk == NULL)
+          arena->chunk_head = next_chunk;
+       else
+          arena->current_chunk->next = next_chunk;
+       arena->num_chunks++;
+    }
+
+    arena->current_chunk = next_chunk;
+    arena->next_node = (char *) next_chunk->data_vptr;
+    arena->nodes_avail = arena->nodes_per_chunk;
+    unlock_node_arena (arena);
+ }
+
+ node = arena->next_node;
+ arena->next_node += arena->node_size;
+ arena->nodes_avail--;
+ return (node);
+}
+
+
+void free_arena_node (t_node_arena *arena, void *node) {
+
+/* Puts node on the free list of arena.  The node may have been allocated *
+ * from another arena that will be merged into this one.                  */
+
+ *(void **) node = arena->free_head;
+ arena->free_head = node;
+ arena->num_live--;
+}
+
+
+boolean reset_node_arena (t_node_arena *arena) {
+
+/* Returns every node of arena to it at once, so that nodes are carved     *
+ * from the start of its first chunk again, without freeing the chunks.    *
+ * Only done if all the nodes handed out have been freed; returns TRUE if  *
+ * the arena was reset.                                                    */
+
+ if (arena->num_live != 0)
+    return (FALSE);
+
+ arena->current_chunk = NULL;
+ arena->next_node = NULL;
+ arena->nodes_avail = 0;
+ arena->free_head = NULL;
+ return (TRUE);
+}
+
+
+void reset_node_arena_stats (t_node_arena *arena) {
+ arena->num_allocs = 0;
+ arena->num_chunk_allocs = 0;
+}
+
+
+size_t get_node_arena_bytes (t_node_arena *arena) {
+
+/* Returns the number of bytes of node storage owned by arena. */
+
+ return (arena->num_chunks * arena->nodes_per_chunk * arena->node_size);
+}
+
+
+void merge_node_arena (t_node_arena *into, t_node_arena *from) {
+
+/* Moves the chunks, free nodes and statistics of from (an arena of nodes  *
+ * of the same size) into the arena into, and leaves from empty.  The      *
+ * chunks from has carved nodes out of are put before the current chunk   *
+ * of into, since they may hold live nodes that must not be carved again  *
+ * until into is reset; its spare chunks become spare chunks of into.      *
+ * Neither arena may be in use by another thread.                          */
+
+ struct s_linked_vptr *used_head, *used_tail, *spare_head, *spare_tail;
+ void *node;
+
+ if (from->current_chunk == NULL) {
+    used_head = used_tail = NULL;
+    spare_head = from->chunk_head;
+ }
+ else {
+    used_head = from->chunk_head;
+    used_tail = from->current_chunk;
+    spare_head = used_tail->next;
+ }
+
+ if (used_head != NULL) {
+    used_tail->next = into->chunk_head;
+    into->chunk_head = used_head;
+    if (into->current_chunk == NULL) {
+       into->current_chunk = used_tail;
+       into->nodes_avail = 0;
+    }
+ }
+
+ if (spare_head != NULL) {
+    spare_tail = spare_head;
+    while (spare_tail->next != NULL)
+       spare_tail = spare_tail->next;
+    if (into->current_chunk == NULL) {
+       spare_tail->next = into->chunk_head;
+       into->chunk_head = spare_head;
+    }
+    else {
+       spare_tail->next = into->current_chunk->next;
+       into->current_chunk->next = spare_head;
+    }
+ }
+ into->num_chunks += from->num_chunks;
+
+ if (from->free_head != NULL) {
+    node = from->free_head;
+    while (*(void **) node != NULL)
+       node = *(void **) node;
+    *(void **) node = into->free_head;
+    into->free_head = from->free_head;
+ }
+
+ into->num_live += from->num_live;
+ into->num_allocs += from->num_allocs;
+ into->num_chunk_allocs += from->num_chunk_allocs;
+
+ init_node_arena (from, from->node_size);
+}
+
+
+void free_node_arena (t_node_arena *arena) {
+
+/* Frees all the chunks of arena, and with them every node allocated from *
+ * it.  The arena is left empty, and may be used again.                   */
+
+ free_chunk_memory (arena->chunk_head);
+ init_node_arena (arena, arena->node_size);
+}
+
+
 struct s_linked_vptr *insert_in_vptr_list (struct s_linked_vptr *head,
               void *vptr_to_add) {
 
@@ -38,6 +38,45 @@ struct s_ivec {int nelem; int *list;};
 typedef struct s_ivec t_ivec;
 
 
+/* Arena of fixed-size nodes, handed out from large chunks by bumping a     *
+ * pointer and recycled through an intrusive free list.                     *
+ * node_size:  Size of each node, rounded up to keep nodes aligned.         *
+ * nodes_per_chunk:  Number of nodes carved out of each chunk.              *
+ * chunk_head, current_chunk:  List of the chunks owned by the arena, and   *
+ *              the chunk nodes are being carved from (NULL before the      *
+ *              first chunk is used).  Chunks after current_chunk are       *
+ *              spare, and are reused after a reset before new ones are     *
+ *              malloced.                                                   *
+ * next_node, nodes_avail:  Next uncarved node of current_chunk, and the    *
+ *              number of nodes left in it.                                 *
+ * free_head:  Free list of nodes returned by free_arena_node.  The link    *
+ *              is stored in the first bytes of each free node.             *
+ * parent:  Arena (used by another thread) to take spare chunks from before *
+ *              mallocing new ones, or NULL.                                *
+ * lock:  Guards the chunk list against an arena taking spare chunks.       *
+ * num_live:  Number of nodes handed out and not yet freed.                 *
+ * num_chunks:  Number of chunks owned by the arena.                        *
+ * num_allocs, num_chunk_allocs:  Number of nodes handed out and number of  *
+ *              chunks malloced since the last call to                      *
+ *              reset_node_arena_stats.                                     */
+
+typedef struct s_node_arena {size_t node_size; int nodes_per_chunk; struct
+      s_linked_vptr *chunk_head; struct s_linked_vptr *current_chunk; char
+      *next_node; int nodes_avail; void *free_head; struct s_node_arena
+      *parent; int lock; long num_live; int num_chunks; long long
+      num_allocs; long long num_chunk_allocs; } t_node_arena;
+
+/* Static initializer of an empty arena of nodes of size bytes (which must  *
+ * be at least the size of a pointer, to hold the free list link).          */
+
+#define NODE_ARENA_CHUNK_SIZE 32768
+#define NODE_ARENA_NODE_SIZE(size) (((size) + sizeof (long) - 1) / \
+      sizeof (long) * sizeof (long))
+#define NODE_ARENA_INITIALIZER(size) {NODE_ARENA_NODE_SIZE (size), \
+      NODE_ARENA_CHUNK_SIZE / NODE_ARENA_NODE_SIZE (size), NULL, NULL, NULL, \
+      0, NULL, NULL, 0, 0, 0, 0, 0}
+
+
 /************************ Memory allocation routines *************************/
 
 void *my_calloc (size_t nelem, size_t size);
@@ -49,6 +88,22 @@ void *my_chunk_malloc (size_t size, struct s_linked_vptr **chunk_ptr_head,
 
 void free_chunk_memory (struct s_linked_vptr *chunk_ptr_head);
 
+void init_node_arena (t_node_arena *arena, size_t node_size);
+
+void *alloc_arena_node (t_node_arena *arena);
+
+void free_arena_node (t_node_arena *arena, void *node);
+
+boolean reset_node_arena (t_node_arena *arena);
+
+void reset_node_arena_stats (t_node_arena *arena);
+
+size_t get_node_arena_bytes (t_node_arena *arena);
+
+void merge_node_arena (t_node_arena *into, t_node_arena *from);
+
+void free_node_arena (t_node_arena *arena);
+
 
 /******************* Linked list, matrix and vector utilities ****************/
 
@@ -191,7 +191,8 @@ struct s_placer_opts {enum e_place_algorithm place_algorithm;
        boolean enable_timing_computations;
        int inner_loop_recompute_divider;
        float td_place_exp_first;
-       float td_place_exp_last;};
+       float td_place_exp_last;
+       float start_t; float start_rlim;};
 
 /* Various options for the placer.                                           *
  * place_algorithm:  BOUNDING_BOX_PLACE or NET_TIMING_DRIVEN_PLACE, or       *
@@ -221,12 +222,23 @@ struct s_placer_opts {enum e_place_algorithm place_algorithm;
  *               criticalities is done.                                      *
  * td_place_exp_first: exponent that is used on the timing_driven criticlity *
  *               it is the value that the exponent starts at.                *
- * td_place_exp_last: value that the criticality exponent will be at the end */
+ * td_place_exp_last: value that the criticality exponent will be at the end *
+ * start_t: if non-negative, the anneal starts at this temperature rather    *
+ *          than at one found by trying random moves (or init_t).            *
+ * start_rlim: if positive, the range limit the anneal starts with, rather   *
+ *             than the whole chip.                                          *
+ * When the anneal starts from an existing placement (a refinement) rather   *
+ * than a random one, start_t and start_rlim default to low values, so only  *
+ * the end of the anneal is run (see try_place).                             */
 
 
 enum e_route_type {GLOBAL, DETAILED};
 enum e_router_algorithm {BREADTH_FIRST, TIMING_DRIVEN};
 enum e_base_cost_type {INTRINSIC_DELAY, DELAY_NORMALIZED, DEMAND_ONLY};
+enum e_heap_type {BINARY_HEAP, FOUR_ARY_HEAP};
+enum e_rr_graph_layout {RR_GRAPH_STRUCTS, RR_GRAPH_CSR};
+enum e_route_file_format {ROUTE_FILE_TEXT, ROUTE_FILE_BINARY};
+enum e_route_abort {ABORT_NEVER, ABORT_STALLED, ABORT_EXTRAPOLATED};
 #define NO_FIXED_CHANNEL_WIDTH -1
 
 struct s_router_opts {float first_iter_pres_fac; float initial_pres_fac;
@@ -234,7 +246,12 @@ struct s_router_opts {float first_iter_pres_fac; float initial_pres_fac;
    int max_router_iterations; int bb_factor; enum e_route_type route_type;
    int fixed_channel_width; enum e_router_algorithm router_algorithm;
    enum e_base_cost_type base_cost_type; float astar_fac;
-   float max_criticality; float criticality_exp;};
+   float max_criticality; float criticality_exp;
+   enum e_heap_type heap_type; enum e_rr_graph_layout rr_graph_layout;
+   int route_threads;
+   boolean incremental_reroute; float reroute_crit_change;
+   enum e_route_abort route_abort; int abort_iterations;
+   boolean export_traceback; enum e_route_file_format route_file_format;};
 
 /* All the parameters controlling the router's operation are in this        *
  * structure.                                                               *
@@ -263,6 +280,38 @@ struct s_router_opts {float first_iter_pres_fac; float initial_pres_fac;
  *                 of each node.  DELAY_NORMALIZED -> base_cost = "demand"  *
  *                 x average delay to route past 1 CLB.  DEMAND_ONLY ->     *
  *                 expected demand of this node (old breadth-first costs).  *
+ * heap_type:  Priority queue used by the maze router.  BINARY_HEAP is the  *
+ *             original binary heap.  FOUR_ARY_HEAP is a 4-ary heap, which  *
+ *             is shallower, so fewer entries are moved on each insertion.  *
+ * rr_graph_layout:  Copy of the routing resource graph walked by the maze  *
+ *                   router as it expands the neighbours of a node.         *
+ *                   RR_GRAPH_STRUCTS walks the rr_node structures.         *
+ *                   RR_GRAPH_CSR walks the compact arrays of rr_csr (see   *
+ *                   rr_graph_csr.cpp).  The routing does not depend on the *
+ *                   layout.                                                *
+ * route_threads:  Number of threads used to route the nets of each         *
+ *                 Pathfinder iteration.  Nets whose bounding boxes are far *
+ *                 enough apart are routed at the same time.  The routing   *
+ *                 does not depend on the number of threads.                *
+ * incremental_reroute:  If TRUE, after the first Pathfinder iteration only *
+ *                       the nets using an overused rr_node are ripped up   *
+ *                       and rerouted; the other nets keep their routing.   *
+ * route_abort:  When to give up on a channel width before                  *
+ *               max_router_iterations.  ABORT_NEVER never gives up.        *
+ *               ABORT_STALLED gives up if the total overuse has not        *
+ *               improved in the last abort_iterations iterations.          *
+ *               ABORT_EXTRAPOLATED gives up if, at the rate it fell over   *
+ *               the last abort_iterations iterations, the total overuse    *
+ *               would not reach zero within max_router_iterations.         *
+ * abort_iterations:  Number of iterations considered by route_abort.       *
+ * export_traceback:  If TRUE, the final traceback of each net is copied     *
+ *                    into the RouteState of each successful route (see     *
+ *                    get_traceback_arrays), e.g., to pass the routing to   *
+ *                    Python without printing routed.out.                   *
+ * route_file_format:  Format of the routing written to the route file.     *
+ *                     ROUTE_FILE_TEXT is the text written by print_route.  *
+ *                     ROUTE_FILE_BINARY is the much faster to write binary *
+ *                     format of print_route_binary (see route_file.h).     *
  *                                                                          *
  * The following parameters are used only by the timing-driven router.      *
  *                                                                          *
@@ -274,7 +323,11 @@ struct s_router_opts {float first_iter_pres_fac; float initial_pres_fac;
  * max_criticality: The maximum criticality factor (from 0 to 1) any sink   *
  *                  will ever have (i.e. clip criticality to this number).  *
  * criticality_exp: Set criticality to (path_length(sink) / longest_path) ^ *
- *                  criticality_exp (then clip to max_criticality).         */
+ *                  criticality_exp (then clip to max_criticality).         *
+ * reroute_crit_change:  With incremental_reroute, also reroute the nets    *
+ *                       whose largest sink criticality has changed by more *
+ *                       than this since they were last routed.  Negative   *
+ *                       values disable this.                               */
 
 
 enum e_switch_block_type {SUBSET, WILTON, UNIVERSAL};
@@ -0,0 +1,53 @@
+import tempfile
+import time
+
+from path import path
+
+from cyvpr.bisect import KaryLowerBoundFinder, LowerBoundBisectFinder
+
+
+def test_kary_lower_bound():
+    evaluate = lambda value: value >= 37
+
+    expected = LowerBoundBisectFinder(evaluate=evaluate).start(10)
+    assert(expected == 37)
+    for k in (1, 2, 3, 8):
+        finder = KaryLowerBoundFinder(k=k, evaluate=evaluate)
+        assert(finder.start(10) == expected)
+        assert(all(result == (value >= 37)
+                   for value, result in finder.history))
+
+
+def test_kary_known_good():
+    finder = KaryLowerBoundFinder(k=3, known_good=50,
+                                  evaluate=lambda value: value >= 50)
+    assert(finder.start(40) == 50)
+
+
+def test_kary_cancel():
+    done_dir = path(tempfile.mkdtemp(prefix='kary-cancel-'))
+
+    def evaluate(value):
+        # Successful evaluations take longer for larger values, so the
+        # evaluation of 40 finishes well before those of 80 and 160.
+        if value >= 37:
+            time.sleep(0.1 * (value - 36))
+            result = True
+        else:
+            result = False
+        # Record each evaluation that runs to completion.
+        done_dir.joinpath(str(value)).touch()
+        return result
+
+    finder = KaryLowerBoundFinder(k=3, evaluate=evaluate)
+    try:
+        assert(finder.start(40) == 37)
+        assert(80 in finder.cancelled)
+        assert(160 in finder.cancelled)
+        # Cancelled workers are terminated before reporting a result.
+        assert(not done_dir.joinpath('80').exists())
+        assert(not done_dir.joinpath('160').exists())
+        assert(all(value not in finder.cancelled
+                   for value, result in finder.history))
+    finally:
+        done_dir.rmtree()
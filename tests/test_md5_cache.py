@@ -0,0 +1,60 @@
+import hashlib
+import os
+import shutil
+import tempfile
+
+from path import path
+from cyvpr.Main import (cMain, md5_cache_info, set_md5_cache_path,
+                        clear_md5_cache)
+import cyvpr
+
+
+def _init(net, arch):
+    m = cMain()
+    m.init([net, arch, 'placed.out', 'routed.out', '-place_only', '-nodisp'])
+    return m
+
+
+def test_md5_cache():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    temp_dir = path(tempfile.mkdtemp(prefix='md5-cache-'))
+    try:
+        net = temp_dir.joinpath('e64-4lut.net')
+        shutil.copy(data_root.joinpath('e64-4lut.net'), net)
+        set_md5_cache_path(None)
+        clear_md5_cache()
+
+        m = _init(net, arch)
+        assert(m.file_md5s['net'] ==
+               hashlib.md5(open(net, 'rb').read()).hexdigest())
+        # The placement file is an output, so it is not hashed.
+        assert(m.file_md5s['placed'] == '')
+        assert(md5_cache_info()['misses'] == 2)
+        assert(md5_cache_info()['hits'] == 0)
+
+        m = _init(net, arch)
+        assert(md5_cache_info()['misses'] == 2)
+        assert(md5_cache_info()['hits'] == 2)
+
+        # Changing the modification time invalidates the cached hash.
+        stat = os.stat(net)
+        os.utime(net, (stat.st_atime, stat.st_mtime + 1))
+        _init(net, arch)
+        assert(md5_cache_info()['misses'] == 3)
+
+        # Hashes are reloaded from the on-disk cache.
+        cache_path = temp_dir.joinpath('md5-cache.txt')
+        set_md5_cache_path(cache_path)
+        clear_md5_cache()
+        _init(net, arch)
+        assert(cache_path.isfile())
+        clear_md5_cache()
+        set_md5_cache_path(cache_path)
+        assert(md5_cache_info()['size'] == 2)
+        _init(net, arch)
+        assert(md5_cache_info()['hits'] == 2)
+        assert(md5_cache_info()['misses'] == 0)
+    finally:
+        set_md5_cache_path(None)
+        temp_dir.rmtree()
@@ -0,0 +1,84 @@
+import os
+import resource
+
+import pytest
+from path import path
+from cyvpr.Main import cMain
+import cyvpr
+
+
+def max_rss_kb():
+    # On Linux, `ru_maxrss` is the high-water mark of the resident set size,
+    # in kilobytes.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def test_reset():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+
+    with cMain() as m:
+        m.place(net, arch, 'placed.out', fast=True)
+        assert(m.block_count > 0)
+        m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                route_chan_width=20)
+        assert(len(m.most_recent_route_states()) == 1)
+    assert(m.block_count == 0)
+    assert(m.most_recent_route_states() == [])
+
+    # The same instance may be used again after it has been reset.
+    state, block_positions = m.place(net, arch, 'placed.out', fast=True)
+    assert(len(block_positions) == m.block_count)
+    m.reset()
+
+
+def test_reset_after_error():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+
+    def fail(*args):
+        raise RuntimeError, 'stop'
+
+    # An exception raised in the middle of a placement or a routing may leave
+    # the timing graph allocated, which `reset` frees.
+    with pytest.raises(RuntimeError):
+        m.place(net, arch, 'placed.out', fast=True, stats_callback=fail)
+    m.reset()
+    m.place(net, arch, 'placed.out', fast=True)
+    with pytest.raises(RuntimeError):
+        m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                route_chan_width=20, iteration_callback=fail)
+    m.reset()
+    state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                    route_chan_width=20)
+    assert(state['states'][-1].success)
+    m.reset()
+
+
+def test_bounded_memory():
+    '''
+    Repeated place and route cycles in one process must not grow its memory.
+
+    Set `CYVPR_RSS_CYCLES` _(e.g., to 1000)_ to run a longer campaign.
+    '''
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    cycles = int(os.environ.get('CYVPR_RSS_CYCLES', 40))
+    warm_up_cycles = 10
+
+    m = cMain()
+    for i in xrange(warm_up_cycles + cycles):
+        if i == warm_up_cycles:
+            warm_rss = max_rss_kb()
+        m.place(net, arch, 'placed.out', fast=True)
+        m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                route_chan_width=12)
+    m.reset()
+
+    # Allow for some growth of the Python heap, but far less than leaking
+    # any of the netlist, placement or routing structures each cycle.
+    assert(max_rss_kb() - warm_rss < 1024)
@@ -0,0 +1,125 @@
+import struct
+import tempfile
+
+import numpy as np
+from path import path
+from cyvpr.Main import (cMain, netlist_cache_info,
+                        set_netlist_cache_write_enabled,
+                        set_parse_cache_enabled, compiled_netlist_path)
+from cyvpr.bin.compile_netlists import compile_netlist
+import cyvpr
+
+
+def test_netlist_cache():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    temp_dir = path(tempfile.mkdtemp(prefix='netlist-cache-'))
+    net = temp_dir.joinpath('e64-4lut.net')
+    data_root.joinpath('e64-4lut.net').copy(net)
+    assert(compiled_netlist_path(net) == temp_dir.joinpath('e64-4lut.netc'))
+    try:
+        # Writing compiled netlists is disabled by default, so nothing is
+        # written next to the netlist.
+        assert(netlist_cache_info()['enabled'])
+        assert(not netlist_cache_info()['write_enabled'])
+        set_parse_cache_enabled(False)
+        m = cMain()
+        place_state, expected = m.place(net, arch, 'placed.out', seed=1,
+                                        fast=True)
+        assert(not temp_dir.files('*.netc'))
+
+        set_netlist_cache_write_enabled(True)
+        results = []
+        for i in xrange(2):
+            m = cMain()
+            place_state, block_positions = m.place(net, arch, 'placed.out',
+                                                   seed=1, fast=True)
+            results.append(block_positions)
+        info = netlist_cache_info()
+        assert(info['misses'] == 1)
+        assert(info['stores'] == 1)
+        assert(info['hits'] == 1)
+        assert(len(temp_dir.files('*.netc')) == 1)
+        # Placements of loaded netlists must match placements of parsed
+        # netlists.
+        for block_positions in results:
+            assert(np.array_equal(block_positions, expected))
+        assert(m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                       route_chan_width=16)['states'][-1].success)
+
+        # Changing the netlist file invalidates its compiled netlist.
+        with open(net, 'a') as f:
+            f.write('\n# Comment.\n')
+        m = cMain()
+        place_state, block_positions = m.place(net, arch, 'placed.out',
+                                               seed=1, fast=True)
+        assert(np.array_equal(block_positions, expected))
+        info = netlist_cache_info()
+        assert(info['misses'] == 2)
+        assert(info['stores'] == 2)
+    finally:
+        set_parse_cache_enabled(True)
+        set_netlist_cache_write_enabled(False)
+        temp_dir.rmtree()
+
+
+def test_compiled_netlist_loaded_by_default():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    temp_dir = path(tempfile.mkdtemp(prefix='netlist-cache-'))
+    net = temp_dir.joinpath('e64-4lut.net')
+    data_root.joinpath('e64-4lut.net').copy(net)
+    try:
+        assert(compile_netlist(net, arch))
+        compiled = compiled_netlist_path(net)
+        mtime = compiled.mtime
+        # `compile_netlist` restores the default cache settings.
+        info = netlist_cache_info()
+        assert(info['enabled'])
+        assert(not info['write_enabled'])
+
+        set_parse_cache_enabled(False)
+        m = cMain()
+        m.init([net, arch, 'placed.out', 'routed.out', '-route_only',
+                '-nodisp'])
+        m.reset()
+        info = netlist_cache_info()
+        assert(info['hits'] == 1)
+        assert(info['stores'] == 0)
+        # Loading the compiled netlist writes no new files.
+        assert(sorted(temp_dir.files()) == sorted([net, compiled]))
+        assert(compiled.mtime == mtime)
+    finally:
+        set_parse_cache_enabled(True)
+        temp_dir.rmtree()
+
+
+def test_corrupt_compiled_netlist():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    temp_dir = path(tempfile.mkdtemp(prefix='netlist-cache-'))
+    net = temp_dir.joinpath('e64-4lut.net')
+    data_root.joinpath('e64-4lut.net').copy(net)
+    try:
+        assert(compile_netlist(net, arch))
+        # Overwrite the string pool _(the last section, padded to 8 bytes)_,
+        # so that no name is NUL-terminated, leaving the header intact.
+        compiled = compiled_netlist_path(net)
+        data = compiled.bytes()
+        string_pool_size = struct.unpack_from('i', data, 96)[0]
+        start = len(data) - ((string_pool_size + 7) & ~7)
+        compiled.write_bytes(data[:start] + 'x' * string_pool_size +
+                             data[start + string_pool_size:])
+
+        # The corrupt compiled netlist is ignored, and the netlist parsed.
+        set_parse_cache_enabled(False)
+        m = cMain()
+        m.init([net, arch, 'placed.out', 'routed.out', '-route_only',
+                '-nodisp'])
+        m.reset()
+        info = netlist_cache_info()
+        assert(info['hits'] == 0)
+        assert(info['misses'] == 1)
+    finally:
+        set_parse_cache_enabled(True)
+        temp_dir.rmtree()
@@ -0,0 +1,61 @@
+import cPickle as pickle
+import tempfile
+
+from path import path
+import numpy as np
+from cyvpr.Main import cMain, RoutingSession
+from cyvpr.parallel import place_many, min_channel_width
+import cyvpr
+
+
+def test_place_many():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    seeds = [3, 1, 2]
+    results = place_many(net, arch, seeds, workers=2, fast=True)
+    assert(len(results) == len(seeds))
+    for place_state, block_positions in results:
+        assert(block_positions.shape == (404, 3))
+        assert(len(place_state.stats) > 0)
+    # Placements with different seeds should differ.
+    assert(not np.array_equal(results[0][1], results[1][1]))
+
+    streamed = sorted(place_many(net, arch, seeds, workers=2, fast=True,
+                                 stream=True))
+    assert([seed for seed, state, positions in streamed] == sorted(seeds))
+    for (seed, state, positions) in streamed:
+        expected = results[seeds.index(seed)][1]
+        assert(np.array_equal(positions, expected))
+
+
+def test_place_state_pickle():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    (place_state, block_positions), = place_many(net, arch, [0], workers=1,
+                                                 fast=True)
+    state = pickle.loads(pickle.dumps(place_state, -1))
+    assert(state.start == place_state.start)
+    assert(state.placer_opts.place_algorithm ==
+           place_state.placer_opts.place_algorithm)
+    assert([s.temperature for s in state.stats] ==
+           [s.temperature for s in place_state.stats])
+
+
+def test_min_channel_width():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    output_dir = path(tempfile.mkdtemp(prefix='placed-'))
+    try:
+        placed_path = output_dir.joinpath('placed.out')
+        cMain().place(net, arch, placed_path, seed=0, fast=True)
+        width, finder = min_channel_width(net, arch, placed_path, k=3,
+                                          fast=True)
+        with RoutingSession(net, arch, placed_path, fast=True) as session:
+            assert(session.route(width).success)
+            assert(not session.route(width - 1).success)
+    finally:
+        output_dir.rmtree()
+    assert((width, True) in finder.history)
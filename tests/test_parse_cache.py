@@ -0,0 +1,37 @@
+import numpy as np
+from path import path
+from cyvpr.Main import (cMain, parse_cache_info, set_parse_cache_enabled,
+                        clear_parse_cache)
+import cyvpr
+
+
+def test_parse_cache():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    try:
+        set_parse_cache_enabled(False)
+        m = cMain()
+        place_state, expected = m.place(net, arch, 'placed.out', seed=1,
+                                        fast=True)
+
+        set_parse_cache_enabled(True)
+        clear_parse_cache()
+        results = []
+        for i in xrange(2):
+            m = cMain()
+            place_state, block_positions = m.place(net, arch, 'placed.out',
+                                                   seed=1, fast=True)
+            results.append(block_positions)
+        assert(parse_cache_info()['misses'] == 1)
+        assert(parse_cache_info()['hits'] == 1)
+        assert(parse_cache_info()['size'] == 1)
+        # Placements of restored inputs must match placements of parsed
+        # inputs.
+        for block_positions in results:
+            assert(np.array_equal(block_positions, expected))
+        assert(m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                       route_chan_width=16)['states'][-1].success)
+    finally:
+        set_parse_cache_enabled(True)
+        clear_parse_cache()
@@ -0,0 +1,63 @@
+from path import path
+import numpy as np
+import pytest
+from cyvpr.Main import cMain
+import cyvpr
+
+
+def test_refine():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    place_state, block_positions = m.place(net, arch, 'placed.out', fast=True)
+
+    # By default, only the low-temperature end of an anneal is run, starting
+    # from the given placement.
+    state, refined_positions = m.refine(net, arch, block_positions)
+    assert(refined_positions.shape == block_positions.shape)
+    assert(0 < len(state.stats) < len(place_state.stats))
+    assert(state.stats[0].temperature < place_state.stats[0].temperature)
+    assert(state.stats[0].radius_limit == 3)
+    assert(state.stats[-1].mean_bounding_box_cost <=
+           1.01 * place_state.stats[-1].mean_bounding_box_cost)
+
+    state, refined_positions = m.refine(net, arch, block_positions,
+                                        start_temperature=0.5, rlim=2)
+    assert(state.placer_opts.start_t == 0.5)
+    assert(state.stats[0].temperature == 0.5)
+    assert(state.stats[0].radius_limit == 2)
+
+    with pytest.raises(ValueError):
+        m.refine(net, arch, block_positions[:-1])
+
+
+def test_place_stats_callback():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+
+    temperatures = []
+    state, block_positions = m.place(
+        net, arch, 'placed.out', stats_callback=lambda stats:
+        temperatures.append(stats.temperature))
+    assert(temperatures == [s.temperature for s in state.stats])
+
+    # Returning `False` stops the anneal, keeping the current placement, as
+    # does any other false value except `None` _(e.g., `numpy.False_`)_.
+    stats_seen = []
+
+    def stop_after_3(stats):
+        stats_seen.append(stats)
+        return np.bool_(len(stats_seen) < 3)
+    state, block_positions = m.place(net, arch, 'placed.out',
+                                     stats_callback=stop_after_3)
+    assert(len(state.stats) == 3)
+    assert(state.stats[-1].temperature == stats_seen[-1].temperature)
+    assert(len(block_positions) == len(m.extract_block_positions()))
+
+    def fail(stats):
+        raise RuntimeError, 'stop'
+    with pytest.raises(RuntimeError):
+        m.place(net, arch, 'placed.out', stats_callback=fail)
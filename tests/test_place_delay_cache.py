@@ -0,0 +1,50 @@
+import tempfile
+
+import numpy as np
+from path import path
+from cyvpr.Main import (cMain, place_delay_cache_info,
+                        set_place_delay_cache_enabled,
+                        set_place_delay_cache_dir, clear_place_delay_cache)
+import cyvpr
+
+
+def test_place_delay_cache():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    cache_dir = path(tempfile.mkdtemp(prefix='place-delay-cache-'))
+
+    def place():
+        m = cMain()
+        place_state, block_positions = m.place(
+            net, arch, 'placed.out', place_algorithm='path_timing_driven',
+            seed=1, fast=True)
+        return block_positions
+
+    try:
+        set_place_delay_cache_enabled(False)
+        expected = place()
+
+        set_place_delay_cache_enabled(True)
+        set_place_delay_cache_dir(cache_dir)
+        clear_place_delay_cache()
+        results = [place(), place()]
+        assert(place_delay_cache_info()['misses'] == 1)
+        assert(place_delay_cache_info()['hits'] == 1)
+        assert(len(cache_dir.files('*.pdl')) == 1)
+
+        # Matrices are loaded from disk once the in-memory cache is cleared.
+        clear_place_delay_cache()
+        results.append(place())
+        assert(place_delay_cache_info()['misses'] == 0)
+        assert(place_delay_cache_info()['hits'] == 1)
+
+        # Placements using cached matrices must match placements using
+        # computed matrices.
+        for block_positions in results:
+            assert(np.array_equal(block_positions, expected))
+    finally:
+        set_place_delay_cache_enabled(True)
+        set_place_delay_cache_dir(None)
+        clear_place_delay_cache()
+        cache_dir.rmtree()
@@ -0,0 +1,80 @@
+import hashlib
+import re
+import tempfile
+
+from path import path
+from cyvpr.Main import (cMain, set_netlist_cache_enabled,
+                        set_parse_cache_enabled)
+import cyvpr
+
+
+# Block and net names of `e64-4lut.net`, in the order assigned by the
+# line-buffered netlist reader that the memory-mapped tokenizer replaced.
+E64_NET_COUNT = 339
+E64_BLOCK_COUNT = 404
+E64_BLOCK_NAMES_MD5 = '85615b7fcfa8c2f387de98ad0c3b813c'
+E64_NET_NAMES_MD5 = '5200a52de9069aaf55c0b1746c0aec0b'
+
+
+def place_and_route(net, arch):
+    '''
+    Place _(with a fixed seed)_ and route `net`, returning the block table
+    written to the placement file, the routing file and the net and block
+    counts.
+    '''
+    m = cMain()
+    m.place(net, arch, 'placed.out', seed=1, fast=True)
+    state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                    route_chan_width=20)['states'][-1]
+    assert(state.success)
+    # Skip the header, which names the netlist file.
+    blocks = path('placed.out').lines()[1:]
+    return blocks, path('routed.out').text(), m.net_count, m.block_count
+
+
+def test_read_netlist():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    text = data_root.joinpath('e64-4lut.net').text()
+    temp_dir = path(tempfile.mkdtemp(prefix='read-netlist-'))
+
+    variants = {
+        # Every `pinlist` is continued on the next line.
+        'continued': text.replace('pinlist: ', 'pinlist: \\\n'),
+        # Whole-line comments, and trailing comments on every input.
+        'comments': '# Leading comment.\n' +
+            re.sub(r'(?m)^(\.input \S+)$', r'\1  # Trailing comment.',
+                   text).replace('\n\n', '\n# Comment line.\n\n'),
+        'no_final_newline': text.rstrip('\n'),
+        # Lines longer than the 300 character buffer of the old reader.
+        'long_lines': ('#' * 400 + '\n' +
+                       text.replace('pinlist: ', 'pinlist:' + ' ' * 400)),
+    }
+
+    try:
+        # Parse each netlist, rather than loading it from a cache.
+        set_parse_cache_enabled(False)
+        set_netlist_cache_enabled(False)
+
+        net = temp_dir.joinpath('e64-4lut.net')
+        net.write_text(text)
+        expected = place_and_route(net, arch)
+        blocks, routing, net_count, block_count = expected
+        assert(net_count == E64_NET_COUNT)
+        assert(block_count == E64_BLOCK_COUNT)
+        block_names = [line.split()[0] for line in blocks
+                       if line.strip() and not line.startswith('#')][1:]
+        net_names = re.findall(r'(?m)^Net \d+ \((.*?)\)', routing)
+        assert(hashlib.md5('\n'.join(block_names)).hexdigest() ==
+               E64_BLOCK_NAMES_MD5)
+        assert(hashlib.md5('\n'.join(net_names)).hexdigest() ==
+               E64_NET_NAMES_MD5)
+
+        for name, variant_text in sorted(variants.items()):
+            net = temp_dir.joinpath('%s.net' % name)
+            net.write_text(variant_text)
+            assert(place_and_route(net, arch) == expected), name
+    finally:
+        set_parse_cache_enabled(True)
+        set_netlist_cache_enabled(True)
+        temp_dir.rmtree()
@@ -1,5 +1,9 @@
+import cPickle as pickle
+
 from path import path
-from cyvpr.Main import cMain
+import numpy as np
+import pytest
+from cyvpr.Main import cMain, RoutingSession
 import cyvpr
 
 
@@ -8,16 +12,468 @@ def test_route():
     arch = data_root.joinpath('4lut_sanitized.arch')
     net = data_root.joinpath('e64-4lut.net')
     m = cMain()
-    block_positions = m.place(net, arch, 'placed.out')
+    place_state, block_positions = m.place(net, arch, 'placed.out')
     assert(len(block_positions) == m.block_count)
+    assert(block_positions.dtype == np.uint32)
+    assert(np.array_equal(cMain().read_placement(net, arch, 'placed.out'),
+                          block_positions))
     routed_data = m.route(net, arch, 'placed.out', 'routed.out')
     state = [s for s in routed_data['states'] if s.success][-1]
     assert(len(state.wire_lengths) == m.net_count)
     assert(len(state.bends) == m.net_count)
     assert(len(state.segments) == m.net_count)
+    assert(state.wire_lengths.dtype == np.uint32)
+    # The arrays wrap the vectors of the state, rather than copies.
+    assert(state.wire_lengths.base is not None)
+    assert(state.wire_lengths is state.wire_lengths)
+    # The views are read-only.
+    assert(not state.wire_lengths.flags.writeable)
+    with pytest.raises(ValueError):
+        state.bends[0] = 0
     return routed_data
 
 
+def test_routing_session():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    m.place(net, arch, 'placed.out')
+    with RoutingSession(net, arch, 'placed.out') as session:
+        states = [session.route(w) for w in (4, 8, 16)]
+    assert([s.width_fac for s in states] == [4, 8, 16])
+    assert(states[-1].success)
+    assert(len(states[-1].wire_lengths) == session.vpr_main.net_count)
+    assert(session.result.success_channel_widths ==
+           [s.width_fac for s in states if s.success])
+
+
+def test_route_placement():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    place_state, block_positions = m.place(net, arch, 'placed.out', fast=True)
+    from_file = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                        route_chan_width=16)
+    from_array = m.route_placement(net, arch, block_positions, 'routed.out',
+                                   fast=True, route_chan_width=16)
+    assert(from_array['states'][-1].success)
+    assert(np.array_equal(from_file['states'][-1].wire_lengths,
+                          from_array['states'][-1].wire_lengths))
+    assert(np.array_equal(m.extract_block_positions(), block_positions))
+
+    with pytest.raises(ValueError):
+        m.route_placement(net, arch, block_positions[:-1], 'routed.out')
+    # Place two blocks at the same location.
+    overlapping = block_positions.copy()
+    clb_indexes = [i for i, p in enumerate(block_positions) if p[2] == 0]
+    overlapping[clb_indexes[1]] = overlapping[clb_indexes[0]]
+    with pytest.raises(RuntimeError):
+        m.route_placement(net, arch, overlapping, 'routed.out', fast=True,
+                          route_chan_width=16)
+
+
+def test_heap_type():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+    for heap_type in ('binary', '4ary'):
+        state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                        route_chan_width=16, heap_type=heap_type)['states'][-1]
+        assert(state.success)
+        assert(state.router_opts.heap_type == heap_type)
+        assert(state.heap_pushes > 0)
+        assert(0 < state.heap_pops <= state.heap_pushes)
+    with pytest.raises(ValueError):
+        m.router_opts.heap_type = 'fibonacci'
+
+
+def test_rr_graph_layout():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+    for timing_driven in (True, False):
+        # The routing must not depend on the layout of the rr-graph walked
+        # by the router.
+        states = [m.route(net, arch, 'placed.out', 'routed.out',
+                          timing_driven=timing_driven, fast=True,
+                          route_chan_width=8,
+                          rr_graph_layout=rr_graph_layout)['states'][-1]
+                  for rr_graph_layout in ('structs', 'csr')]
+        assert([s.router_opts.rr_graph_layout for s in states] ==
+               ['structs', 'csr'])
+        assert(states[0].success == states[1].success)
+        assert(states[0].heap_pushes == states[1].heap_pushes)
+        assert(states[0].heap_pops == states[1].heap_pops)
+        assert(np.array_equal(states[0].wire_lengths, states[1].wire_lengths))
+        assert(np.array_equal(states[0].overused_nodes,
+                              states[1].overused_nodes))
+        if timing_driven:
+            assert(states[0].critical_path_delay ==
+                   states[1].critical_path_delay)
+    with pytest.raises(ValueError):
+        m.router_opts.rr_graph_layout = 'linked'
+
+
+def test_node_arenas():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    # The arenas are freed by `reset` _(and kept otherwise, even by other
+    # instances)_, so the first route of each job must allocate its chunks,
+    # which the second route reuses.
+    m.reset()
+    for i in xrange(2):
+        with m:
+            m.place(net, arch, 'placed.out', fast=True)
+            states = [m.route(net, arch, 'placed.out', 'routed.out',
+                              fast=True, route_chan_width=12)['states'][-1]
+                      for j in xrange(2)]
+        for state in states:
+            # Every heap entry is allocated from an arena.
+            assert(state.node_allocs >= state.heap_pushes > 0)
+            assert(state.arena_bytes > 0)
+        assert(states[0].arena_chunk_allocs > 0)
+        assert(states[1].node_allocs == states[0].node_allocs)
+        assert(states[1].arena_chunk_allocs == 0)
+        assert(states[1].arena_bytes == states[0].arena_bytes)
+
+
+def test_route_threads():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+    for timing_driven in (True, False):
+        # Route at a tight width, so that several PathFinder iterations are
+        # needed.  The routing must not depend on the number of threads.
+        states = [m.route(net, arch, 'placed.out', 'routed.out',
+                          timing_driven=timing_driven, fast=True,
+                          route_chan_width=6,
+                          route_threads=route_threads)['states'][-1]
+                  for route_threads in (1, 4)]
+        assert([s.router_opts.route_threads for s in states] == [1, 4])
+        assert(states[0].success == states[1].success)
+        assert(states[0].heap_pushes == states[1].heap_pushes)
+        assert(states[0].heap_pops == states[1].heap_pops)
+        assert(np.array_equal(states[0].wire_lengths, states[1].wire_lengths))
+        assert(np.array_equal(states[0].bends, states[1].bends))
+        if timing_driven:
+            assert(states[0].critical_path_delay ==
+                   states[1].critical_path_delay)
+        # Only nets routed on several threads are grouped into levels, each
+        # holding at least one net.
+        assert(len(states[0].nets_per_level) == 0)
+        assert(len(states[1].nets_per_level) > 0)
+        assert((states[1].nets_per_level > 0).all())
+        assert(states[1].nets_per_level.sum() <= m.net_count)
+    with pytest.raises(ValueError):
+        m.router_opts.route_threads = 0
+
+
+
+def test_incremental_reroute():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+    for timing_driven in (True, False):
+        # Every non-global net is routed in each PathFinder iteration, unless
+        # only the nets using overused resources are rerouted.
+        full, incremental = [
+            m.route(net, arch, 'placed.out', 'routed.out',
+                    timing_driven=timing_driven, fast=True,
+                    route_chan_width=6,
+                    incremental_reroute=incremental_reroute)['states'][-1]
+            for incremental_reroute in (False, True)]
+        assert(not full.router_opts.incremental_reroute)
+        assert(incremental.router_opts.incremental_reroute)
+        assert(len(full.nets_rerouted) > 1)
+        assert((full.nets_rerouted == full.nets_rerouted[0]).all())
+        assert(incremental.nets_rerouted[0] == full.nets_rerouted[0])
+        assert((incremental.nets_rerouted[1:] <
+                incremental.nets_rerouted[0]).all())
+        state = m.route(net, arch, 'placed.out', 'routed.out',
+                        timing_driven=timing_driven, fast=True,
+                        route_chan_width=16, incremental_reroute=True,
+                        reroute_crit_change=0.1)['states'][-1]
+        assert(state.success)
+        assert(len(state.nets_rerouted) >= 1)
+
+
+def test_route_abort():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+
+    def route(width, route_abort):
+        return m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                       route_chan_width=width, route_abort=route_abort,
+                       abort_iterations=3)['states'][-1]
+
+    # The overuse is recorded after every PathFinder iteration.
+    state = route(4, 'never')
+    assert(not state.success)
+    assert(state.abort_reason == '')
+    assert(len(state.total_overuse) == state.router_opts.max_router_iterations)
+    assert(len(state.overused_nodes) == len(state.total_overuse))
+    assert((state.overused_nodes > 0).all())
+    assert((state.total_overuse >= state.overused_nodes).all())
+
+    # A channel width that is far too narrow is given up on early.
+    for route_abort in ('stalled', 'extrapolated'):
+        state = route(4, route_abort)
+        assert(state.router_opts.route_abort == route_abort)
+        assert(not state.success)
+        assert(state.abort_reason)
+        assert(len(state.total_overuse) <
+               state.router_opts.max_router_iterations)
+
+        state = route(16, route_abort)
+        assert(state.success)
+        assert(state.abort_reason == '')
+        assert(state.total_overuse[-1] == 0)
+    with pytest.raises(ValueError):
+        m.router_opts.route_abort = 'sometimes'
+
+
+def test_iteration_callback():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+
+    # The callback sees the route in progress after each iteration.
+    seen = []
+
+    def record(state):
+        seen.append(state.iterations[-1])
+    state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                    route_chan_width=4, iteration_callback=record)['states'][-1]
+    iterations = state.iterations
+    assert(not state.cancelled)
+    assert(len(iterations) == state.router_opts.max_router_iterations)
+    assert((iterations.iteration == np.arange(1, len(iterations) + 1)).all())
+    assert((iterations.overused_nodes == state.overused_nodes).all())
+    assert((iterations.nets_rerouted == state.nets_rerouted).all())
+    assert((np.diff(iterations.seconds) >= 0).all())
+    assert(iterations.pres_fac[1] == state.router_opts.initial_pres_fac)
+    assert([r.iteration for r in seen] == list(iterations.iteration))
+
+    # The iterations survive pickling _(e.g., to return a route state from a
+    # worker process)_.
+    loaded = pickle.loads(pickle.dumps(state, -1))
+    assert((loaded.iterations == iterations).all())
+    assert((loaded.overused_nodes == state.overused_nodes).all())
+    assert((loaded.total_overuse == state.total_overuse).all())
+    assert((loaded.nets_rerouted == state.nets_rerouted).all())
+
+    # Returning `False` cancels the route, as does any other false value
+    # except `None` _(e.g., `numpy.False_`)_.
+    def cancel_after_2(state):
+        return np.bool_(len(state.iterations) < 2)
+    state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                    route_chan_width=4,
+                    iteration_callback=cancel_after_2)['states'][-1]
+    assert(state.cancelled)
+    assert(not state.success)
+    assert(state.abort_reason)
+    assert(len(state.iterations) == 2)
+
+    # A cancelled route also ends the binary search over channel widths.
+    states = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                     iteration_callback=lambda state: False)['states']
+    assert(len(states) == 1)
+    assert(states[0].cancelled)
+
+    # A route that has found a feasible routing cannot be cancelled, so the
+    # search keeps each successful routing and writes the best one.
+    routed = path('routed.out')
+    if routed.exists():
+        routed.remove()
+    states = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                     iteration_callback=lambda state:
+                     state.overused_nodes[-1] != 0)['states']
+    assert(not any(s.cancelled for s in states))
+    assert(any(s.success for s in states))
+    assert(routed.exists())
+
+    def fail(state):
+        raise RuntimeError, 'stop'
+    with pytest.raises(RuntimeError):
+        m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                route_chan_width=16, iteration_callback=fail)
+
+
+def test_errors_raise():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    m = cMain()
+
+    # Invalid options and input files raise `ValueError`, rather than exiting.
+    with pytest.raises(ValueError):
+        m.init([net, arch, 'placed.out', 'routed.out', '-no_such_flag'])
+
+    bad_net = path('bad.net')
+    bad_net.write_text(net.text().replace('.clb', '.not_a_block', 1))
+    try:
+        with pytest.raises(ValueError):
+            m.place(bad_net, arch, 'placed.out', fast=True)
+    finally:
+        bad_net.remove()
+
+    # The same process can still place and route afterwards.
+    m.place(net, arch, 'placed.out', fast=True)
+    state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                    route_chan_width=20)
+    assert(state['states'][-1].success)
+
+    # A placement file with an out-of-range block location raises
+    # `ValueError`, after the timing lookups have been allocated.
+    lines = path('placed.out').lines()
+    name = lines[-1].split()[0]
+    lines[-1] = '%s\t999\t999\t0\n' % name
+    bad_placed = path('bad_placed.out')
+    bad_placed.write_lines(lines, linesep='')
+    try:
+        with pytest.raises(ValueError):
+            m.route(net, arch, bad_placed, 'routed.out', fast=True,
+                    route_chan_width=20)
+    finally:
+        bad_placed.remove()
+
+    # Routing a valid placement still succeeds.
+    state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                    route_chan_width=20)
+    assert(state['states'][-1].success)
+
+
+def test_rr_graph():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+    m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+            route_chan_width=20)
+    graph = m.rr_graph()
+    num_nodes = len(graph['type'])
+    assert(num_nodes > 0)
+    for key in ('xlow', 'xhigh', 'ylow', 'yhigh', 'capacity', 'occ',
+                'cost_index', 'R', 'C'):
+        assert(len(graph[key]) == num_nodes)
+    assert(len(graph['edge_start']) == num_nodes + 1)
+    assert(graph['edge_start'][-1] == len(graph['edge_sink']))
+    assert(len(graph['edge_switch']) == len(graph['edge_sink']))
+    assert((graph['xlow'] <= graph['xhigh']).all())
+    assert((graph['ylow'] <= graph['yhigh']).all())
+    assert(graph['cost_index'].max() < len(graph['base_cost']))
+    assert(graph['occ'].sum() > 0)
+    assert((graph['occ'] <= graph['capacity']).all())
+
+    # The arrays are read-only views of the graph.
+    assert(not graph['occ'].flags.writeable)
+    with pytest.raises(ValueError):
+        graph['occ'][0] = 0
+
+    # After a binary search over channel widths, the graph is rebuilt for
+    # the best routing found, which the occupancies must reflect.
+    states = m.route(net, arch, 'placed.out', 'routed.out',
+                     fast=True)['states']
+    assert(any(s.success for s in states))
+    graph = m.rr_graph()
+    assert(graph['occ'].sum() > 0)
+    assert((graph['occ'] <= graph['capacity']).all())
+
+    # The arrays remain valid after VPR has freed the graph.
+    occ = graph['occ'].copy()
+    m.reset()
+    assert((graph['occ'] == occ).all())
+    assert(graph['edge_start'][-1] == len(graph['edge_sink']))
+
+
+def test_export_traceback():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+    state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                    route_chan_width=20)['states'][-1]
+    assert(state.success)
+    assert(len(state.trace_nodes) == 0)
+
+    state = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                    route_chan_width=20, export_traceback=True)['states'][-1]
+    assert(state.router_opts.export_traceback)
+    offsets = state.trace_net_offsets
+    nodes = state.trace_nodes
+    switches = state.trace_switches
+    assert(len(offsets) == m.net_count + 1)
+    assert(offsets[-1] == len(nodes) == len(switches))
+    assert((np.diff(offsets) >= 0).all())
+
+    # Each branch of a net ends at a `SINK` node, after which the switch type
+    # is `OPEN`.
+    SINK = 1
+    node_types = m.rr_graph()['type'][nodes]
+    assert(((node_types == SINK) == (switches == -1)).all())
+    for i in xrange(m.net_count):
+        if offsets[i + 1] > offsets[i]:
+            assert(switches[offsets[i + 1] - 1] == -1)
+
+    # The traceback survives pickling _(e.g., to return a route state from a
+    # worker process)_.
+    loaded = pickle.loads(pickle.dumps(state, -1))
+    assert(np.array_equal(loaded.trace_net_offsets, offsets))
+    assert(np.array_equal(loaded.trace_nodes, nodes))
+    assert(np.array_equal(loaded.trace_switches, switches))
+
+
+def test_binary_route_file():
+    from cyvpr.result.route_file import RouteFile
+
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+
+    m = cMain()
+    m.place(net, arch, 'placed.out', fast=True)
+    m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+            route_chan_width=20)
+    state = m.route(net, arch, 'placed.out', 'routed.bin', fast=True,
+                    route_chan_width=20, export_traceback=True,
+                    route_file_format='binary')['states'][-1]
+    assert(state.router_opts.route_file_format == 'binary')
+
+    with RouteFile('routed.bin') as routing:
+        assert(len(routing) == m.net_count)
+        offsets = state.trace_net_offsets
+        for i in xrange(len(routing)):
+            nodes = routing.net(i).nodes['inode']
+            assert((nodes == state.trace_nodes[offsets[i]:
+                                               offsets[i + 1]]).all())
+
+        # The binary file converts to exactly the text written by VPR.
+        routing.write_text('routed-converted.out')
+    assert(path('routed-converted.out').bytes() ==
+           path('routed.out').bytes())
+
+
 if __name__ == '__main__':
     routed_data = test_route()
     state = [s for s in routed_data['states'] if s.success][-1]
@@ -0,0 +1,39 @@
+import tempfile
+
+import numpy as np
+from path import path
+from cyvpr.Main import cMain, rr_graph_cache_info, set_rr_graph_cache_dir
+import cyvpr
+
+
+def test_rr_graph_cache():
+    data_root = path(cyvpr.get_data_root()[0])
+    arch = data_root.joinpath('4lut_sanitized.arch')
+    net = data_root.joinpath('e64-4lut.net')
+    cache_dir = path(tempfile.mkdtemp(prefix='rr-graph-cache-'))
+    try:
+        m = cMain()
+        m.place(net, arch, 'placed.out', seed=1, fast=True)
+        expected = m.route(net, arch, 'placed.out', 'routed.out', fast=True,
+                           route_chan_width=16)['states'][-1]
+
+        set_rr_graph_cache_dir(cache_dir)
+        states = []
+        for i in xrange(2):
+            m = cMain()
+            states.append(m.route(net, arch, 'placed.out', 'routed.out',
+                                  fast=True,
+                                  route_chan_width=16)['states'][-1])
+        info = rr_graph_cache_info()
+        assert(info['misses'] == 1)
+        assert(info['stores'] == 1)
+        assert(info['hits'] == 1)
+        assert(len(cache_dir.files('*.rrg')) == 1)
+        # Routing on a loaded graph must match routing on a built graph.
+        for state in states:
+            assert(state.success == expected.success)
+            assert(np.array_equal(state.bends, expected.bends))
+            assert(np.array_equal(state.wire_lengths, expected.wire_lengths))
+    finally:
+        set_rr_graph_cache_dir(None)
+        cache_dir.rmtree()